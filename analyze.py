@@ -34,7 +34,7 @@ except ImportError:
     pass
 
 from src.csv_parser import ingest_folder
-from src.db import get_conn, get_or_create_tournament, get_active_weights, get_all_players
+from src.db import connection, get_conn, get_or_create_tournament, get_active_weights, get_all_players
 from src.models.composite import compute_composite
 from src.odds import fetch_odds_api, load_manual_odds, get_best_odds
 from src.value import find_value_bets
@@ -45,7 +45,7 @@ from src.player_normalizer import normalize_name
 def _run_calibration_dashboard():
     """Print calibration dashboard: Brier, wins/losses by market, CLV, blend trajectory."""
     from src.learning import compute_calibration
-    from src.db import get_conn, get_calibration_data
+    from src.db import iter_calibration_data
 
     print("\n" + "=" * 60)
     print("  CALIBRATION DASHBOARD")
@@ -63,9 +63,8 @@ def _run_calibration_dashboard():
         print(f"ROI: {roi_info.get('roi_pct', 0):.1f}% ({roi_info['total_bets']} bets)")
 
     # Wins/losses by market (from calibration data)
-    data = get_calibration_data()
     by_market = {}
-    for d in data or []:
+    for d in iter_calibration_data():
         bt = d.get("bet_type", "unknown")
         if bt not in by_market:
             by_market[bt] = {"wins": 0, "losses": 0}
@@ -89,12 +88,11 @@ def _run_calibration_dashboard():
 
     # Blend trajectory (last 5 per bet_type)
     try:
-        conn = get_conn()
-        rows = conn.execute(
-            """SELECT bet_type, dg_weight, model_weight, brier_blended, created_at
-               FROM blend_history ORDER BY id DESC LIMIT 30"""
-        ).fetchall()
-        conn.close()
+        with connection() as conn:
+            rows = conn.execute(
+                """SELECT bet_type, dg_weight, model_weight, brier_blended, created_at
+                   FROM blend_history ORDER BY id DESC LIMIT 30"""
+            ).fetchall()
         if rows:
             print("\nBlend history (recent):")
             for r in rows[:10]:
@@ -39,7 +39,7 @@ from src import config
 from src.csv_parser import ingest_folder, classify_file_type, detect_data_mode, detect_round_window
 from src.db import (
     get_or_create_tournament, get_active_weights, get_all_players,
-    get_conn, init_db, store_results, store_picks,
+    connection, get_conn, init_db, store_results, store_picks,
     list_completed_snapshot_events,
     build_completed_snapshot_section,
     get_latest_snapshot_section,
@@ -489,31 +489,30 @@ def _latest_output_artifact(output_type: str) -> dict | None:
 
 
 def _latest_graded_tournament_summary() -> dict | None:
-    conn = get_conn()
-    row = conn.execute(
-        """
-        SELECT
-            t.id,
-            t.name,
-            t.course,
-            t.year,
-            t.event_id,
-            COUNT(DISTINCT r.id) AS results_count,
-            COUNT(DISTINCT p.id) AS picks_count,
-            COUNT(DISTINCT po.id) AS graded_pick_count,
-            COALESCE(SUM(COALESCE(po.model_hit, po.hit)), 0) AS hits,
-            ROUND(COALESCE(SUM(po.profit), 0), 2) AS total_profit,
-            MAX(po.entered_at) AS last_graded_at
-        FROM tournaments t
-        JOIN results r ON r.tournament_id = t.id
-        LEFT JOIN picks p ON p.tournament_id = t.id
-        LEFT JOIN pick_outcomes po ON po.pick_id = p.id
-        GROUP BY t.id, t.name, t.course, t.year, t.event_id
-        ORDER BY COALESCE(MAX(po.entered_at), MAX(r.entered_at)) DESC, t.id DESC
-        LIMIT 1
-        """
-    ).fetchone()
-    conn.close()
+    with connection() as conn:
+        row = conn.execute(
+            """
+            SELECT
+                t.id,
+                t.name,
+                t.course,
+                t.year,
+                t.event_id,
+                COUNT(DISTINCT r.id) AS results_count,
+                COUNT(DISTINCT p.id) AS picks_count,
+                COUNT(DISTINCT po.id) AS graded_pick_count,
+                COALESCE(SUM(COALESCE(po.model_hit, po.hit)), 0) AS hits,
+                ROUND(COALESCE(SUM(po.profit), 0), 2) AS total_profit,
+                MAX(po.entered_at) AS last_graded_at
+            FROM tournaments t
+            JOIN results r ON r.tournament_id = t.id
+            LEFT JOIN picks p ON p.tournament_id = t.id
+            LEFT JOIN pick_outcomes po ON po.pick_id = p.id
+            GROUP BY t.id, t.name, t.course, t.year, t.event_id
+            ORDER BY COALESCE(MAX(po.entered_at), MAX(r.entered_at)) DESC, t.id DESC
+            LIMIT 1
+            """
+        ).fetchone()
     return dict(row) if row else None
 
 
@@ -721,149 +720,148 @@ async def get_grading_history(
     elif src == "lab":
         pick_where = " AND p.source IN ('lab_sandbox', 'lab_sandbox_candidate') "
 
-    conn = get_conn()
-    rows = conn.execute(
-        f"""
-        SELECT
-            t.id,
-            t.name,
-            t.course,
-            t.year,
-            COALESCE(
-                NULLIF(TRIM(COALESCE(t.event_id, '')), ''),
-                (
-                    SELECT r2.event_id
-                    FROM rounds r2
-                    WHERE r2.event_name = t.name
-                      AND (t.year IS NULL OR r2.year = t.year)
-                      AND r2.event_id IS NOT NULL
-                      AND TRIM(r2.event_id) != ''
-                    ORDER BY r2.event_completed DESC
-                    LIMIT 1
-                )
-            ) AS event_id,
-            COUNT(DISTINCT r.id) AS results_count,
-            (
-                SELECT COUNT(*)
-                FROM picks p2
-                WHERE p2.tournament_id = t.id {pick_where.replace("p.", "p2.")}
-            ) AS picks_count,
-            (
-                SELECT COUNT(*)
-                FROM picks p3
-                JOIN pick_outcomes po3 ON po3.pick_id = p3.id
-                WHERE p3.tournament_id = t.id {pick_where.replace("p.", "p3.")}
-            ) AS graded_pick_count,
-            (
-                SELECT COALESCE(SUM(po4.hit), 0)
-                FROM picks p4
-                JOIN pick_outcomes po4 ON po4.pick_id = p4.id
-                WHERE p4.tournament_id = t.id {pick_where.replace("p.", "p4.")}
-            ) AS hits,
-            (
-                SELECT ROUND(COALESCE(SUM(
-                    CASE
-                        WHEN po5.profit IS NOT NULL AND COALESCE(po5.stake, 0) != 0 THEN po5.profit / po5.stake
-                        ELSE COALESCE(po5.profit, 0)
-                    END
-                ), 0), 2)
-                FROM picks p5
-                JOIN pick_outcomes po5 ON po5.pick_id = p5.id
-                WHERE p5.tournament_id = t.id {pick_where.replace("p.", "p5.")}
-            ) AS total_profit,
-            (
-                SELECT MAX(po6.entered_at)
-                FROM picks p6
-                JOIN pick_outcomes po6 ON po6.pick_id = p6.id
-                WHERE p6.tournament_id = t.id {pick_where.replace("p.", "p6.")}
-            ) AS last_graded_at
-        FROM tournaments t
-        LEFT JOIN results r ON r.tournament_id = t.id
-        WHERE EXISTS (
-            SELECT 1 FROM picks px
-            JOIN pick_outcomes pox ON pox.pick_id = px.id
-            WHERE px.tournament_id = t.id {pick_where.replace("p.", "px.")}
-        )
-        GROUP BY t.id
-        ORDER BY COALESCE(
-            (
-                SELECT MAX(po7.entered_at)
-                FROM picks p7
-                JOIN pick_outcomes po7 ON po7.pick_id = p7.id
-                WHERE p7.tournament_id = t.id {pick_where.replace("p.", "p7.")}
-            ),
-            MAX(r.entered_at)
-        ) DESC, t.id DESC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    overall_picks: list[dict] = []
-    tournaments = []
-    for row in rows:
-        picks = conn.execute(
+    with connection() as conn:
+        rows = conn.execute(
             f"""
             SELECT
-                p.id,
-                p.model_variant,
-                p.source,
-                p.bet_type,
-                p.market_type,
-                p.player_key,
-                p.player_display,
-                p.opponent_key,
-                p.opponent_display,
-                p.market_odds,
-                p.market_book,
-                p.model_prob,
-                p.ev,
-                p.reasoning,
-                po.hit AS hit,
-                po.hit AS bet_hit,
-                po.model_hit,
-                po.actual_finish,
-                po.odds_decimal,
-                po.stake,
-                ROUND(COALESCE(po.profit, 0), 2) AS profit,
-                po.entered_at AS graded_at
-            FROM picks p
-            JOIN pick_outcomes po ON po.pick_id = p.id
-            WHERE p.tournament_id = ? {pick_where}
-            ORDER BY po.entered_at, p.id
+                t.id,
+                t.name,
+                t.course,
+                t.year,
+                COALESCE(
+                    NULLIF(TRIM(COALESCE(t.event_id, '')), ''),
+                    (
+                        SELECT r2.event_id
+                        FROM rounds r2
+                        WHERE r2.event_name = t.name
+                          AND (t.year IS NULL OR r2.year = t.year)
+                          AND r2.event_id IS NOT NULL
+                          AND TRIM(r2.event_id) != ''
+                        ORDER BY r2.event_completed DESC
+                        LIMIT 1
+                    )
+                ) AS event_id,
+                COUNT(DISTINCT r.id) AS results_count,
+                (
+                    SELECT COUNT(*)
+                    FROM picks p2
+                    WHERE p2.tournament_id = t.id {pick_where.replace("p.", "p2.")}
+                ) AS picks_count,
+                (
+                    SELECT COUNT(*)
+                    FROM picks p3
+                    JOIN pick_outcomes po3 ON po3.pick_id = p3.id
+                    WHERE p3.tournament_id = t.id {pick_where.replace("p.", "p3.")}
+                ) AS graded_pick_count,
+                (
+                    SELECT COALESCE(SUM(po4.hit), 0)
+                    FROM picks p4
+                    JOIN pick_outcomes po4 ON po4.pick_id = p4.id
+                    WHERE p4.tournament_id = t.id {pick_where.replace("p.", "p4.")}
+                ) AS hits,
+                (
+                    SELECT ROUND(COALESCE(SUM(
+                        CASE
+                            WHEN po5.profit IS NOT NULL AND COALESCE(po5.stake, 0) != 0 THEN po5.profit / po5.stake
+                            ELSE COALESCE(po5.profit, 0)
+                        END
+                    ), 0), 2)
+                    FROM picks p5
+                    JOIN pick_outcomes po5 ON po5.pick_id = p5.id
+                    WHERE p5.tournament_id = t.id {pick_where.replace("p.", "p5.")}
+                ) AS total_profit,
+                (
+                    SELECT MAX(po6.entered_at)
+                    FROM picks p6
+                    JOIN pick_outcomes po6 ON po6.pick_id = p6.id
+                    WHERE p6.tournament_id = t.id {pick_where.replace("p.", "p6.")}
+                ) AS last_graded_at
+            FROM tournaments t
+            LEFT JOIN results r ON r.tournament_id = t.id
+            WHERE EXISTS (
+                SELECT 1 FROM picks px
+                JOIN pick_outcomes pox ON pox.pick_id = px.id
+                WHERE px.tournament_id = t.id {pick_where.replace("p.", "px.")}
+            )
+            GROUP BY t.id
+            ORDER BY COALESCE(
+                (
+                    SELECT MAX(po7.entered_at)
+                    FROM picks p7
+                    JOIN pick_outcomes po7 ON po7.pick_id = p7.id
+                    WHERE p7.tournament_id = t.id {pick_where.replace("p.", "p7.")}
+                ),
+                MAX(r.entered_at)
+            ) DESC, t.id DESC
+            LIMIT ?
             """,
-            (row["id"],),
+            (limit,),
         ).fetchall()
-        pick_payloads = []
-        for pick in picks:
-            unit_profit = _one_unit_profit(dict(pick))
-            profit = unit_profit
-            outcome = "win" if int(pick["hit"] or 0) == 1 else ("push" if profit == 0 else "loss")
-            pick_payloads.append({
-                **dict(pick),
-                "profit": round(profit, 2),
-                "outcome": outcome,
+        overall_picks: list[dict] = []
+        tournaments = []
+        for row in rows:
+            picks = conn.execute(
+                f"""
+                SELECT
+                    p.id,
+                    p.model_variant,
+                    p.source,
+                    p.bet_type,
+                    p.market_type,
+                    p.player_key,
+                    p.player_display,
+                    p.opponent_key,
+                    p.opponent_display,
+                    p.market_odds,
+                    p.market_book,
+                    p.model_prob,
+                    p.ev,
+                    p.reasoning,
+                    po.hit AS hit,
+                    po.hit AS bet_hit,
+                    po.model_hit,
+                    po.actual_finish,
+                    po.odds_decimal,
+                    po.stake,
+                    ROUND(COALESCE(po.profit, 0), 2) AS profit,
+                    po.entered_at AS graded_at
+                FROM picks p
+                JOIN pick_outcomes po ON po.pick_id = p.id
+                WHERE p.tournament_id = ? {pick_where}
+                ORDER BY po.entered_at, p.id
+                """,
+                (row["id"],),
+            ).fetchall()
+            pick_payloads = []
+            for pick in picks:
+                unit_profit = _one_unit_profit(dict(pick))
+                profit = unit_profit
+                outcome = "win" if int(pick["hit"] or 0) == 1 else ("push" if profit == 0 else "loss")
+                pick_payloads.append({
+                    **dict(pick),
+                    "profit": round(profit, 2),
+                    "outcome": outcome,
+                })
+            record_picks = _dedupe_record_picks(pick_payloads)
+            variant_stats: dict[str, dict[str, float | int]] = {}
+            for pick in record_picks:
+                variant = str(pick.get("model_variant") or "baseline")
+                stat = variant_stats.setdefault(variant, {"picks": 0, "hits": 0, "profit": 0.0})
+                stat["picks"] += 1
+                stat["hits"] += int(pick.get("hit") or 0)
+                stat["profit"] = round(float(stat["profit"]) + float(pick.get("profit") or 0), 2)
+            event_summary = _build_record_summary(record_picks)
+            overall_picks.extend(record_picks)
+            tournaments.append({
+                **dict(row),
+                "picks_count": event_summary["combined"]["picks"],
+                "graded_pick_count": event_summary["combined"]["picks"],
+                "hits": event_summary["combined"]["wins"],
+                "total_profit": event_summary["combined"]["profit"],
+                "market_stats": event_summary,
+                "variant_stats": variant_stats,
+                "picks": record_picks,
             })
-        record_picks = _dedupe_record_picks(pick_payloads)
-        variant_stats: dict[str, dict[str, float | int]] = {}
-        for pick in record_picks:
-            variant = str(pick.get("model_variant") or "baseline")
-            stat = variant_stats.setdefault(variant, {"picks": 0, "hits": 0, "profit": 0.0})
-            stat["picks"] += 1
-            stat["hits"] += int(pick.get("hit") or 0)
-            stat["profit"] = round(float(stat["profit"]) + float(pick.get("profit") or 0), 2)
-        event_summary = _build_record_summary(record_picks)
-        overall_picks.extend(record_picks)
-        tournaments.append({
-            **dict(row),
-            "picks_count": event_summary["combined"]["picks"],
-            "graded_pick_count": event_summary["combined"]["picks"],
-            "hits": event_summary["combined"]["wins"],
-            "total_profit": event_summary["combined"]["profit"],
-            "market_stats": event_summary,
-            "variant_stats": variant_stats,
-            "picks": record_picks,
-        })
-    conn.close()
     return {"tournaments": tournaments, "summary": _build_record_summary(overall_picks)}
 
 
@@ -894,82 +892,81 @@ async def post_lab_log_displayed_picks(request: Request):
 @app.get("/api/track-record")
 async def get_track_record(limit: int = 20):
     """Return graded event history with individual pick results for the track record page."""
-    conn = get_conn()
-    events = conn.execute(
-        """
-        SELECT
-            t.id, t.name, t.course, t.year, t.event_id,
-            COUNT(DISTINCT po.id) AS graded_pick_count,
-            COALESCE(SUM(COALESCE(po.model_hit, po.hit)), 0) AS hits,
-            COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 1 THEN 1 ELSE 0 END), 0) AS wins,
-            COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 0 AND po.profit = 0 THEN 1 ELSE 0 END), 0) AS pushes,
-            COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 0 AND po.profit != 0 THEN 1 ELSE 0 END), 0) AS losses,
-            ROUND(COALESCE(SUM(po.profit), 0), 2) AS total_profit,
-            MAX(po.entered_at) AS last_graded_at
-        FROM tournaments t
-        JOIN pick_outcomes po ON po.pick_id IN (SELECT id FROM picks WHERE tournament_id = t.id)
-        JOIN picks p ON p.id = po.pick_id
-        GROUP BY t.id
-        ORDER BY MAX(po.entered_at) DESC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    result = []
-    for event in events:
-        picks = conn.execute(
+    with connection() as conn:
+        events = conn.execute(
             """
             SELECT
-                p.model_variant,
-                p.source,
-                p.player_key,
-                p.player_display,
-                p.opponent_key,
-                p.opponent_display,
-                p.market_odds,
-                p.market_book,
-                p.bet_type,
-                p.model_prob,
-                p.ev,
-                p.reasoning,
-                po.hit AS hit,
-                po.hit AS bet_hit,
-                po.model_hit,
-                po.actual_finish,
-                po.odds_decimal,
-                po.stake,
-                ROUND(po.profit, 2) AS profit,
-                po.entered_at AS graded_at
-            FROM picks p
-            JOIN pick_outcomes po ON po.pick_id = p.id
-            WHERE p.tournament_id = ?
-            ORDER BY po.entered_at
+                t.id, t.name, t.course, t.year, t.event_id,
+                COUNT(DISTINCT po.id) AS graded_pick_count,
+                COALESCE(SUM(COALESCE(po.model_hit, po.hit)), 0) AS hits,
+                COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 1 THEN 1 ELSE 0 END), 0) AS wins,
+                COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 0 AND po.profit = 0 THEN 1 ELSE 0 END), 0) AS pushes,
+                COALESCE(SUM(CASE WHEN COALESCE(po.model_hit, po.hit) = 0 AND po.profit != 0 THEN 1 ELSE 0 END), 0) AS losses,
+                ROUND(COALESCE(SUM(po.profit), 0), 2) AS total_profit,
+                MAX(po.entered_at) AS last_graded_at
+            FROM tournaments t
+            JOIN pick_outcomes po ON po.pick_id IN (SELECT id FROM picks WHERE tournament_id = t.id)
+            JOIN picks p ON p.id = po.pick_id
+            GROUP BY t.id
+            ORDER BY MAX(po.entered_at) DESC
+            LIMIT ?
             """,
-            (event["id"],),
+            (limit,),
         ).fetchall()
-        pick_payloads = []
-        for pick in picks:
-            payload = dict(pick)
-            profit = _one_unit_profit(payload)
-            hit = int(payload.get("hit") or 0)
-            payload["profit"] = round(profit, 2)
-            payload["outcome"] = "win" if hit == 1 else ("push" if profit == 0 else "loss")
-            pick_payloads.append(payload)
-        record_picks = _dedupe_record_picks(pick_payloads)
-        event_summary = _build_record_summary(record_picks)
-        combined = event_summary["combined"]
-        result.append({
-            **dict(event),
-            "graded_pick_count": combined["picks"],
-            "hits": combined["wins"],
-            "wins": combined["wins"],
-            "pushes": combined["pushes"],
-            "losses": combined["losses"],
-            "total_profit": combined["profit"],
-            "market_stats": event_summary,
-            "picks": record_picks,
-        })
-    conn.close()
+        result = []
+        for event in events:
+            picks = conn.execute(
+                """
+                SELECT
+                    p.model_variant,
+                    p.source,
+                    p.player_key,
+                    p.player_display,
+                    p.opponent_key,
+                    p.opponent_display,
+                    p.market_odds,
+                    p.market_book,
+                    p.bet_type,
+                    p.model_prob,
+                    p.ev,
+                    p.reasoning,
+                    po.hit AS hit,
+                    po.hit AS bet_hit,
+                    po.model_hit,
+                    po.actual_finish,
+                    po.odds_decimal,
+                    po.stake,
+                    ROUND(po.profit, 2) AS profit,
+                    po.entered_at AS graded_at
+                FROM picks p
+                JOIN pick_outcomes po ON po.pick_id = p.id
+                WHERE p.tournament_id = ?
+                ORDER BY po.entered_at
+                """,
+                (event["id"],),
+            ).fetchall()
+            pick_payloads = []
+            for pick in picks:
+                payload = dict(pick)
+                profit = _one_unit_profit(payload)
+                hit = int(payload.get("hit") or 0)
+                payload["profit"] = round(profit, 2)
+                payload["outcome"] = "win" if hit == 1 else ("push" if profit == 0 else "loss")
+                pick_payloads.append(payload)
+            record_picks = _dedupe_record_picks(pick_payloads)
+            event_summary = _build_record_summary(record_picks)
+            combined = event_summary["combined"]
+            result.append({
+                **dict(event),
+                "graded_pick_count": combined["picks"],
+                "hits": combined["wins"],
+                "wins": combined["wins"],
+                "pushes": combined["pushes"],
+                "losses": combined["losses"],
+                "total_profit": combined["profit"],
+                "market_stats": event_summary,
+                "picks": record_picks,
+            })
     return {"events": result}
 
 
@@ -1425,18 +1422,17 @@ async def get_player_profile(player_key: str, tournament_id: int, course_num: in
 
     field_size = db.get_tournament_field_size(tournament_id)
 
-    conn = get_conn()
-    linked_bets = conn.execute(
-        """
-        SELECT bet_type, player_display, opponent_display, market_odds, ev, confidence, reasoning
-        FROM picks
-        WHERE tournament_id = ?
-          AND (player_key = ? OR opponent_key = ?)
-        ORDER BY ev DESC, id DESC
-        """,
-        (tournament_id, player_key, player_key),
-    ).fetchall()
-    conn.close()
+    with db.read_connection() as conn:
+        linked_bets = conn.execute(
+            """
+            SELECT bet_type, player_display, opponent_display, market_odds, ev, confidence, reasoning
+            FROM picks
+            WHERE tournament_id = ?
+              AND (player_key = ? OR opponent_key = ?)
+            ORDER BY ev DESC, id DESC
+            """,
+            (tournament_id, player_key, player_key),
+        ).fetchall()
     linked_bets_payload = [dict(row) for row in linked_bets][:20]
 
     player_display = None
@@ -1453,8 +1449,8 @@ async def get_player_profile(player_key: str, tournament_id: int, course_num: in
         "player_key": player_key,
         "player_display": player_display,
         "current_metrics": metrics_by_category,
-        "recent_rounds": recent_rounds,
-        "course_history": course_history,
+        "recent_rounds": [dict(r) for r in recent_rounds],
+        "course_history": [dict(r) for r in course_history],
         "linked_bets": linked_bets_payload,
         "header": _build_profile_header(
             metrics_by_category_window,
@@ -1497,9 +1493,8 @@ async def home():
 
 @app.get("/api/tournaments")
 async def list_tournaments():
-    conn = get_conn()
-    rows = conn.execute("SELECT * FROM tournaments ORDER BY id DESC").fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute("SELECT * FROM tournaments ORDER BY id DESC").fetchall()
     return [dict(r) for r in rows]
 
 
@@ -1985,12 +1980,11 @@ async def run_analysis(
         tournament_id = get_or_create_tournament(tournament, course or None)
 
         # Check for duplicate imports
-        conn = get_conn()
-        existing = conn.execute(
-            "SELECT filename FROM csv_imports WHERE tournament_id = ?", (tournament_id,)
-        ).fetchall()
-        existing_names = {r["filename"] for r in existing}
-        conn.close()
+        with connection() as conn:
+            existing = conn.execute(
+                "SELECT filename FROM csv_imports WHERE tournament_id = ?", (tournament_id,)
+            ).fetchall()
+            existing_names = {r["filename"] for r in existing}
 
         # Filter out already-imported files
         new_files = [f for f in saved if f not in existing_names]
@@ -3121,21 +3115,20 @@ async def get_autoresearch_runs(scope: str = "global", limit: int = 20):
     from src.db import ensure_initialized
     ensure_initialized()
     try:
-        conn = get_conn()
-        rows = conn.execute(
-            """
-            SELECT id, name, hypothesis, source, scope, status, years_json, theory_metadata_json,
-                   summary_metrics_json, guardrail_results_json, artifact_markdown_path,
-                   created_at, evaluated_at
-            FROM research_proposals
-            WHERE scope = ?
-              AND status IN ('evaluated', 'approved', 'rejected', 'converted')
-            ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
-            LIMIT ?
-            """,
-            (scope, limit),
-        ).fetchall()
-        conn.close()
+        with connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, name, hypothesis, source, scope, status, years_json, theory_metadata_json,
+                       summary_metrics_json, guardrail_results_json, artifact_markdown_path,
+                       created_at, evaluated_at
+                FROM research_proposals
+                WHERE scope = ?
+                  AND status IN ('evaluated', 'approved', 'rejected', 'converted')
+                ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
+                LIMIT ?
+                """,
+                (scope, limit),
+            ).fetchall()
 
         runs = []
         for row in rows:
@@ -3233,23 +3226,22 @@ async def get_autoresearch_best_candidates(scope: str = "global", limit: int = B
         from backtester.strategy import StrategyConfig
 
         cap = min(max(1, limit), BEST_CANDIDATES_MAX)
-        conn = get_conn()
-        rows = conn.execute(
-            """
-            SELECT id, name, hypothesis, source, strategy_config_json,
-                   summary_metrics_json, guardrail_results_json, theory_metadata_json,
-                   artifact_markdown_path
-            FROM research_proposals
-            WHERE scope = ?
-              AND status IN ('evaluated', 'approved', 'converted')
-              AND summary_metrics_json IS NOT NULL
-              AND guardrail_results_json IS NOT NULL
-            ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
-            LIMIT ?
-            """,
-            (scope, 200),
-        ).fetchall()
-        conn.close()
+        with connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, name, hypothesis, source, strategy_config_json,
+                       summary_metrics_json, guardrail_results_json, theory_metadata_json,
+                       artifact_markdown_path
+                FROM research_proposals
+                WHERE scope = ?
+                  AND status IN ('evaluated', 'approved', 'converted')
+                  AND summary_metrics_json IS NOT NULL
+                  AND guardrail_results_json IS NOT NULL
+                ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
+                LIMIT ?
+                """,
+                (scope, 200),
+            ).fetchall()
         # Pool is "most recently evaluated" so newly evaluated (often better) proposals
         # compete for top 3 by ROI; sort below picks best by weighted_roi_pct/clv/score.
 
@@ -3328,30 +3320,29 @@ async def reset_autoresearch_state():
             )
             prediction_lane_preserved = True
 
-        conn = get_conn()
-        output_dir = Path(_output_dir_absolute())
-        research_dir = output_dir / "research"
-        archive_root = research_dir / "archive" / datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        archive_root.mkdir(parents=True, exist_ok=False)
+        with connection() as conn:
+            output_dir = Path(_output_dir_absolute())
+            research_dir = output_dir / "research"
+            archive_root = research_dir / "archive" / datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+            archive_root.mkdir(parents=True, exist_ok=False)
 
-        archived_tables = {
-            "research_proposals": _fetch_table_rows(conn, "research_proposals"),
-            "proposal_reviews": _fetch_table_rows(conn, "proposal_reviews"),
-            "research_model_registry": _fetch_table_rows(conn, "research_model_registry"),
-        }
-        for table_name, rows in archived_tables.items():
-            _write_json_file(archive_root / "db" / f"{table_name}.json", rows)
+            archived_tables = {
+                "research_proposals": _fetch_table_rows(conn, "research_proposals"),
+                "proposal_reviews": _fetch_table_rows(conn, "proposal_reviews"),
+                "research_model_registry": _fetch_table_rows(conn, "research_model_registry"),
+            }
+            for table_name, rows in archived_tables.items():
+                _write_json_file(archive_root / "db" / f"{table_name}.json", rows)
 
-        archived_files = _archive_active_research_files(output_dir, archive_root)
-        archived_settings_path = _archive_autoresearch_settings_file(archive_root)
+            archived_files = _archive_active_research_files(output_dir, archive_root)
+            archived_settings_path = _archive_autoresearch_settings_file(archive_root)
 
-        if _table_has_column(conn, "live_model_registry", "source_research_registry_id"):
-            conn.execute("UPDATE live_model_registry SET source_research_registry_id = NULL WHERE source_research_registry_id IS NOT NULL")
-        conn.execute("DELETE FROM research_model_registry")
-        conn.execute("DELETE FROM proposal_reviews")
-        conn.execute("DELETE FROM research_proposals")
-        conn.commit()
-        conn.close()
+            if _table_has_column(conn, "live_model_registry", "source_research_registry_id"):
+                conn.execute("UPDATE live_model_registry SET source_research_registry_id = NULL WHERE source_research_registry_id IS NOT NULL")
+            conn.execute("DELETE FROM research_model_registry")
+            conn.execute("DELETE FROM proposal_reviews")
+            conn.execute("DELETE FROM research_proposals")
+            conn.commit()
 
         reset_optimizer_state()
 
@@ -3390,9 +3381,8 @@ async def enter_results(request: Request):
     if not tournament_name or not results_list:
         return JSONResponse({"error": "Need tournament and results"}, status_code=400)
 
-    conn = get_conn()
-    row = conn.execute("SELECT id FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
-    conn.close()
+    with connection() as conn:
+        row = conn.execute("SELECT id FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
 
     if not row:
         return JSONResponse({"error": f"Tournament '{tournament_name}' not found"}, status_code=404)
@@ -3452,24 +3442,23 @@ async def enter_results(request: Request):
 @app.get("/api/dashboard")
 async def get_dashboard():
     """Get performance dashboard data."""
-    conn = get_conn()
-    tournaments = conn.execute("SELECT * FROM tournaments ORDER BY id DESC").fetchall()
-
-    tournament_data = []
-    for t in tournaments:
-        picks = conn.execute("SELECT COUNT(*) as c FROM picks WHERE tournament_id = ?", (t["id"],)).fetchone()["c"]
-        results = conn.execute("SELECT COUNT(*) as c FROM results WHERE tournament_id = ?", (t["id"],)).fetchone()["c"]
-        outcomes = conn.execute(
-            "SELECT COUNT(*) as total, SUM(COALESCE(po.model_hit, po.hit)) as hits FROM pick_outcomes po JOIN picks p ON po.pick_id = p.id WHERE p.tournament_id = ?",
-            (t["id"],)
-        ).fetchone()
-        tournament_data.append({
-            "id": t["id"], "name": t["name"], "course": t["course"],
-            "picks": picks, "results": results,
-            "outcomes": outcomes["total"] or 0,
-            "hits": outcomes["hits"] or 0,
-        })
-    conn.close()
+    with connection() as conn:
+        tournaments = conn.execute("SELECT * FROM tournaments ORDER BY id DESC").fetchall()
+
+        tournament_data = []
+        for t in tournaments:
+            picks = conn.execute("SELECT COUNT(*) as c FROM picks WHERE tournament_id = ?", (t["id"],)).fetchone()["c"]
+            results = conn.execute("SELECT COUNT(*) as c FROM results WHERE tournament_id = ?", (t["id"],)).fetchone()["c"]
+            outcomes = conn.execute(
+                "SELECT COUNT(*) as total, SUM(COALESCE(po.model_hit, po.hit)) as hits FROM pick_outcomes po JOIN picks p ON po.pick_id = p.id WHERE p.tournament_id = ?",
+                (t["id"],)
+            ).fetchone()
+            tournament_data.append({
+                "id": t["id"], "name": t["name"], "course": t["course"],
+                "picks": picks, "results": results,
+                "outcomes": outcomes["total"] or 0,
+                "hits": outcomes["hits"] or 0,
+            })
 
     analysis = analyze_pick_performance()
     weights = get_current_weights()
@@ -3756,9 +3745,8 @@ async def ai_post_review(request: Request):
     if not tournament_name:
         return JSONResponse({"error": "Tournament name required."}, status_code=400)
 
-    conn = get_conn()
-    row = conn.execute("SELECT * FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
-    conn.close()
+    with connection() as conn:
+        row = conn.execute("SELECT * FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
     if not row:
         return JSONResponse({"error": f"Tournament '{tournament_name}' not found."}, status_code=404)
 
@@ -3797,9 +3785,8 @@ async def post_tournament_learn_endpoint(request: Request):
     if not tournament_name:
         return JSONResponse({"error": "Tournament name required."}, status_code=400)
 
-    conn = get_conn()
-    row = conn.execute("SELECT id FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
-    conn.close()
+    with connection() as conn:
+        row = conn.execute("SELECT id FROM tournaments WHERE name = ?", (tournament_name,)).fetchone()
     if not row:
         return JSONResponse({"error": f"Tournament '{tournament_name}' not found."}, status_code=404)
 
@@ -3881,7 +3868,7 @@ async def get_memories(topic: str = None):
     """Get AI brain memories, optionally filtered by topic."""
     from src.db import get_ai_memories, get_all_ai_memory_topics
     topics = [topic] if topic else None
-    memories = get_ai_memories(topics=topics)
+    memories = [dict(m) for m in get_ai_memories(topics=topics)]
     all_topics = get_all_ai_memory_topics()
     return {"memories": memories, "topics": all_topics}
 
@@ -3947,37 +3934,37 @@ async def get_active_strategy():
 @app.get("/api/agent-status")
 async def get_agent_status():
     """Get research agent status."""
-    conn = get_conn()
-    try:
-        pending = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='pending'").fetchone()[0]
-        running = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='running'").fetchone()[0]
-        completed = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='completed'").fetchone()[0]
-        promoted = conn.execute("SELECT COUNT(*) FROM experiments WHERE promoted=1").fetchone()[0]
-        outliers = conn.execute("SELECT COUNT(*) FROM outlier_investigations").fetchone()[0]
-        weather_hours = conn.execute("SELECT COUNT(*) FROM tournament_weather").fetchone()[0]
-        return {
-            "experiments": {"pending": pending, "running": running, "completed": completed, "promoted": promoted},
-            "outlier_investigations": outliers,
-            "weather_data_hours": weather_hours,
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    with connection() as conn:
+        try:
+            pending = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='pending'").fetchone()[0]
+            running = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='running'").fetchone()[0]
+            completed = conn.execute("SELECT COUNT(*) FROM experiments WHERE status='completed'").fetchone()[0]
+            promoted = conn.execute("SELECT COUNT(*) FROM experiments WHERE promoted=1").fetchone()[0]
+            outliers = conn.execute("SELECT COUNT(*) FROM outlier_investigations").fetchone()[0]
+            weather_hours = conn.execute("SELECT COUNT(*) FROM tournament_weather").fetchone()[0]
+            return {
+                "experiments": {"pending": pending, "running": running, "completed": completed, "promoted": promoted},
+                "outlier_investigations": outliers,
+                "weather_data_hours": weather_hours,
+            }
+        except Exception as e:
+            return {"error": str(e)}
 
 
 @app.get("/api/outlier-investigations")
 async def list_outlier_investigations():
     """Get recent outlier investigations."""
-    conn = get_conn()
-    try:
-        rows = conn.execute("""
-            SELECT event_id, year, player_key, predicted_rank, actual_finish,
-                   delta, root_cause, actionable, ai_explanation, created_at
-            FROM outlier_investigations
-            ORDER BY created_at DESC LIMIT 30
-        """).fetchall()
-        return {"investigations": [dict(r) for r in rows]}
-    except Exception:
-        return {"investigations": []}
+    with connection() as conn:
+        try:
+            rows = conn.execute("""
+                SELECT event_id, year, player_key, predicted_rank, actual_finish,
+                       delta, root_cause, actionable, ai_explanation, created_at
+                FROM outlier_investigations
+                ORDER BY created_at DESC LIMIT 30
+            """).fetchall()
+            return {"investigations": [dict(r) for r in rows]}
+        except Exception:
+            return {"investigations": []}
 
 
 
@@ -4302,29 +4289,28 @@ async def get_player_standalone_profile(player_key: str):
 async def search_players(q: str = ""):
     """Search players by name from the rounds database."""
     from src import db as src_db
-    conn = src_db.get_conn()
-    if q.strip():
-        rows = conn.execute(
-            """
-            SELECT DISTINCT player_key, player_name as player_display
-            FROM rounds
-            WHERE lower(player_name) LIKE lower(?)
-               OR lower(player_key) LIKE lower(?)
-            ORDER BY player_name
-            LIMIT 40
-            """,
-            (f"%{q}%", f"%{q}%"),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            """
-            SELECT DISTINCT player_key, player_name as player_display
-            FROM rounds
-            ORDER BY player_name
-            LIMIT 200
-            """,
-        ).fetchall()
-    conn.close()
+    with src_db.connection() as conn:
+        if q.strip():
+            rows = conn.execute(
+                """
+                SELECT DISTINCT player_key, player_name as player_display
+                FROM rounds
+                WHERE lower(player_name) LIKE lower(?)
+                   OR lower(player_key) LIKE lower(?)
+                ORDER BY player_name
+                LIMIT 40
+                """,
+                (f"%{q}%", f"%{q}%"),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                """
+                SELECT DISTINCT player_key, player_name as player_display
+                FROM rounds
+                ORDER BY player_name
+                LIMIT 200
+                """,
+            ).fetchall()
     return {"players": [dict(r) for r in rows]}
 
 
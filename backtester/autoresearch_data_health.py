@@ -22,50 +22,49 @@ def validate_autoresearch_data_health(
     params = src_config.get_autoresearch_guardrail_params()
     min_bets_required = int(params.get("min_bets", 30))
 
-    conn = db.get_conn()
-    pit_rows = 0
-    odds_rows = 0
-    matchup_rows = 0
-    if years:
-        ph = ",".join("?" * len(years))
-        pit_rows = conn.execute(
-            f"SELECT COUNT(*) AS c FROM pit_rolling_stats WHERE year IN ({ph})",
-            years,
-        ).fetchone()["c"]
-        odds_rows = conn.execute(
-            f"SELECT COUNT(*) AS c FROM historical_odds WHERE year IN ({ph})",
-            years,
-        ).fetchone()["c"]
-        matchup_rows = conn.execute(
-            f"SELECT COUNT(*) AS c FROM historical_matchup_odds WHERE year IN ({ph})",
-            years,
-        ).fetchone()["c"]
-    else:
-        pit_rows = conn.execute("SELECT COUNT(*) AS c FROM pit_rolling_stats").fetchone()["c"]
-        odds_rows = conn.execute("SELECT COUNT(*) AS c FROM historical_odds").fetchone()["c"]
-        matchup_rows = conn.execute("SELECT COUNT(*) AS c FROM historical_matchup_odds").fetchone()["c"]
+    with db.connection() as conn:
+        pit_rows = 0
+        odds_rows = 0
+        matchup_rows = 0
+        if years:
+            ph = ",".join("?" * len(years))
+            pit_rows = conn.execute(
+                f"SELECT COUNT(*) AS c FROM pit_rolling_stats WHERE year IN ({ph})",
+                years,
+            ).fetchone()["c"]
+            odds_rows = conn.execute(
+                f"SELECT COUNT(*) AS c FROM historical_odds WHERE year IN ({ph})",
+                years,
+            ).fetchone()["c"]
+            matchup_rows = conn.execute(
+                f"SELECT COUNT(*) AS c FROM historical_matchup_odds WHERE year IN ({ph})",
+                years,
+            ).fetchone()["c"]
+        else:
+            pit_rows = conn.execute("SELECT COUNT(*) AS c FROM pit_rolling_stats").fetchone()["c"]
+            odds_rows = conn.execute("SELECT COUNT(*) AS c FROM historical_odds").fetchone()["c"]
+            matchup_rows = conn.execute("SELECT COUNT(*) AS c FROM historical_matchup_odds").fetchone()["c"]
 
-    live_picks_tournaments = 0
-    tournaments_in_years = 0
-    if years:
-        ph = ",".join("?" * len(years))
-        live_picks_tournaments = conn.execute(
-            f"""
-            SELECT COUNT(DISTINCT p.tournament_id) AS c FROM picks p
-            JOIN tournaments t ON t.id = p.tournament_id
-            WHERE t.year IN ({ph})
-            """,
-            years,
-        ).fetchone()["c"]
-        tournaments_in_years = conn.execute(
-            f"SELECT COUNT(*) AS c FROM tournaments WHERE year IN ({ph})",
-            years,
-        ).fetchone()["c"]
-    else:
-        live_picks_tournaments = conn.execute(
-            "SELECT COUNT(DISTINCT tournament_id) AS c FROM picks"
-        ).fetchone()["c"]
-    conn.close()
+        live_picks_tournaments = 0
+        tournaments_in_years = 0
+        if years:
+            ph = ",".join("?" * len(years))
+            live_picks_tournaments = conn.execute(
+                f"""
+                SELECT COUNT(DISTINCT p.tournament_id) AS c FROM picks p
+                JOIN tournaments t ON t.id = p.tournament_id
+                WHERE t.year IN ({ph})
+                """,
+                years,
+            ).fetchone()["c"]
+            tournaments_in_years = conn.execute(
+                f"SELECT COUNT(*) AS c FROM tournaments WHERE year IN ({ph})",
+                years,
+            ).fetchone()["c"]
+        else:
+            live_picks_tournaments = conn.execute(
+                "SELECT COUNT(DISTINCT tournament_id) AS c FROM picks"
+            ).fetchone()["c"]
 
     warnings: list[str] = []
     if event_count < 3:
@@ -32,21 +32,21 @@ logger = logging.getLogger("backfill")
 
 def _is_done(table_name: str, event_id: str, year: int) -> bool:
     """Check if a (table, event, year) has already been backfilled."""
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT 1 FROM backfill_progress WHERE table_name=? AND event_id=? AND year=? AND status='done'",
-        (table_name, str(event_id), year),
-    ).fetchone()
-    return row is not None
+    with db.connection() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM backfill_progress WHERE table_name=? AND event_id=? AND year=? AND status='done'",
+            (table_name, str(event_id), year),
+        ).fetchone()
+        return row is not None
 
 
 def _mark_done(table_name: str, event_id: str, year: int):
-    conn = db.get_conn()
-    conn.execute(
-        "INSERT OR REPLACE INTO backfill_progress(table_name, event_id, year, status) VALUES(?,?,?,?)",
-        (table_name, str(event_id), year, "done"),
-    )
-    conn.commit()
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO backfill_progress(table_name, event_id, year, status) VALUES(?,?,?,?)",
+            (table_name, str(event_id), year, "done"),
+        )
+        conn.commit()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -88,15 +88,14 @@ def _events_from_rounds(tour: str, year: int) -> list[dict]:
     where get-schedule returns a 400 error. Uses event_completed
     dates from rounds to estimate tournament windows for weather.
     """
-    conn = db.get_conn()
-    rows = conn.execute("""
-        SELECT DISTINCT event_id, event_name, course_num, course_name,
-               event_completed
-        FROM rounds
-        WHERE year = ? AND tour = ?
-        ORDER BY event_completed
-    """, (year, tour)).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute("""
+            SELECT DISTINCT event_id, event_name, course_num, course_name,
+                   event_completed
+            FROM rounds
+            WHERE year = ? AND tour = ?
+            ORDER BY event_completed
+        """, (year, tour)).fetchall()
 
     events = []
     for r in rows:
@@ -128,30 +127,30 @@ def _events_from_rounds(tour: str, year: int) -> list[dict]:
 
 def _store_event_info(events: list[dict], year: int):
     """Store event metadata in historical_event_info."""
-    conn = db.get_conn()
-    for ev in events:
-        if not isinstance(ev, dict):
-            continue
-        event_id = str(ev.get("event_id", ev.get("id", "")))
-        if not event_id:
-            continue
-        conn.execute("""
-            INSERT OR REPLACE INTO historical_event_info
-            (event_id, year, event_name, course_id, course_name, tour,
-             start_date, end_date, latitude, longitude)
-            VALUES (?,?,?,?,?,?,?,?,?,?)
-        """, (
-            event_id, year,
-            ev.get("event_name", ev.get("name", "")),
-            str(ev.get("course_key", ev.get("course_id", ""))),
-            ev.get("course", ev.get("course_name", "")),
-            ev.get("tour", "pga"),
-            ev.get("start_date", ev.get("date", "")),
-            ev.get("end_date", ""),
-            _safe_float(ev.get("latitude")),
-            _safe_float(ev.get("longitude")),
-        ))
-    conn.commit()
+    with db.connection() as conn:
+        for ev in events:
+            if not isinstance(ev, dict):
+                continue
+            event_id = str(ev.get("event_id", ev.get("id", "")))
+            if not event_id:
+                continue
+            conn.execute("""
+                INSERT OR REPLACE INTO historical_event_info
+                (event_id, year, event_name, course_id, course_name, tour,
+                 start_date, end_date, latitude, longitude)
+                VALUES (?,?,?,?,?,?,?,?,?,?)
+            """, (
+                event_id, year,
+                ev.get("event_name", ev.get("name", "")),
+                str(ev.get("course_key", ev.get("course_id", ""))),
+                ev.get("course", ev.get("course_name", "")),
+                ev.get("tour", "pga"),
+                ev.get("start_date", ev.get("date", "")),
+                ev.get("end_date", ""),
+                _safe_float(ev.get("latitude")),
+                _safe_float(ev.get("longitude")),
+            ))
+        conn.commit()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -199,55 +198,55 @@ def backfill_predictions(event_id: str, year: int, tour: str = "pga") -> int:
         return 0
 
     # Store both model types: baseline_history_fit (preferred) and baseline
-    conn = db.get_conn()
-    count = 0
-
-    for model_type in ["baseline_history_fit", "baseline"]:
-        players = data.get(model_type, [])
-        if not players:
-            continue
+    with db.connection() as conn:
+        count = 0
 
-        for p in players:
-            if not isinstance(p, dict):
-                continue
-            dg_id = p.get("dg_id")
-            if not dg_id:
+        for model_type in ["baseline_history_fit", "baseline"]:
+            players = data.get(model_type, [])
+            if not players:
                 continue
 
-            # Archive returns decimal odds — convert to probabilities
-            win_prob = _decimal_odds_to_prob(p.get("win"))
-            top5_prob = _decimal_odds_to_prob(p.get("top_5"))
-            top10_prob = _decimal_odds_to_prob(p.get("top_10"))
-            top20_prob = _decimal_odds_to_prob(p.get("top_20"))
-            make_cut_prob = _decimal_odds_to_prob(p.get("make_cut"))
+            for p in players:
+                if not isinstance(p, dict):
+                    continue
+                dg_id = p.get("dg_id")
+                if not dg_id:
+                    continue
 
-            try:
-                conn.execute("""
-                    INSERT OR REPLACE INTO historical_predictions
-                    (event_id, year, player_dg_id, player_name, win_prob, top5_prob,
-                     top10_prob, top20_prob, make_cut_prob, model_type,
-                     actual_finish)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?)
-                """, (
-                    str(event_id), year, dg_id,
-                    p.get("player_name", ""),
-                    round(win_prob, 6) if win_prob else None,
-                    round(top5_prob, 6) if top5_prob else None,
-                    round(top10_prob, 6) if top10_prob else None,
-                    round(top20_prob, 6) if top20_prob else None,
-                    round(make_cut_prob, 6) if make_cut_prob else None,
-                    model_type,
-                    p.get("fin_text"),
-                ))
-                count += 1
-            except Exception:
-                pass
+                # Archive returns decimal odds — convert to probabilities
+                win_prob = _decimal_odds_to_prob(p.get("win"))
+                top5_prob = _decimal_odds_to_prob(p.get("top_5"))
+                top10_prob = _decimal_odds_to_prob(p.get("top_10"))
+                top20_prob = _decimal_odds_to_prob(p.get("top_20"))
+                make_cut_prob = _decimal_odds_to_prob(p.get("make_cut"))
 
-    conn.commit()
+                try:
+                    conn.execute("""
+                        INSERT OR REPLACE INTO historical_predictions
+                        (event_id, year, player_dg_id, player_name, win_prob, top5_prob,
+                         top10_prob, top20_prob, make_cut_prob, model_type,
+                         actual_finish)
+                        VALUES (?,?,?,?,?,?,?,?,?,?,?)
+                    """, (
+                        str(event_id), year, dg_id,
+                        p.get("player_name", ""),
+                        round(win_prob, 6) if win_prob else None,
+                        round(top5_prob, 6) if top5_prob else None,
+                        round(top10_prob, 6) if top10_prob else None,
+                        round(top20_prob, 6) if top20_prob else None,
+                        round(make_cut_prob, 6) if make_cut_prob else None,
+                        model_type,
+                        p.get("fin_text"),
+                    ))
+                    count += 1
+                except Exception:
+                    pass
 
-    if count > 0:
-        _mark_done(table, event_id, year)
-    return count
+        conn.commit()
+
+        if count > 0:
+            _mark_done(table, event_id, year)
+        return count
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -292,53 +291,53 @@ def backfill_odds(event_id: str, year: int, tour: str = "pga") -> int:
         "make_cut": "make_cut",
     }
 
-    conn = db.get_conn()
-    total = 0
-
-    for model_type in ["baseline_history_fit", "baseline"]:
-        players = data.get(model_type, [])
-        book_label = "DG-CH" if model_type == "baseline_history_fit" else "DG-Base"
+    with db.connection() as conn:
+        total = 0
 
-        for p in players:
-            if not isinstance(p, dict):
-                continue
-            dg_id = p.get("dg_id")
-            name = p.get("player_name", "")
-            if not dg_id:
-                continue
+        for model_type in ["baseline_history_fit", "baseline"]:
+            players = data.get(model_type, [])
+            book_label = "DG-CH" if model_type == "baseline_history_fit" else "DG-Base"
 
-            for dg_field, market_name in market_fields.items():
-                decimal_odds = p.get(dg_field)
-                if decimal_odds is None:
+            for p in players:
+                if not isinstance(p, dict):
                     continue
-                try:
-                    decimal_odds = float(decimal_odds)
-                    if decimal_odds <= 1.0:
-                        continue
-                    # Convert decimal odds to American for storage consistency
-                    american = int((decimal_odds - 1.0) * 100)
-                except (TypeError, ValueError):
+                dg_id = p.get("dg_id")
+                name = p.get("player_name", "")
+                if not dg_id:
                     continue
 
-                try:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO historical_odds
-                        (event_id, year, player_dg_id, player_name, market, book,
-                         close_line, outcome)
-                        VALUES (?,?,?,?,?,?,?,?)
-                    """, (
-                        str(event_id), year, dg_id, name,
-                        market_name, book_label, american, None,
-                    ))
-                    total += 1
-                except Exception:
-                    pass
+                for dg_field, market_name in market_fields.items():
+                    decimal_odds = p.get(dg_field)
+                    if decimal_odds is None:
+                        continue
+                    try:
+                        decimal_odds = float(decimal_odds)
+                        if decimal_odds <= 1.0:
+                            continue
+                        # Convert decimal odds to American for storage consistency
+                        american = int((decimal_odds - 1.0) * 100)
+                    except (TypeError, ValueError):
+                        continue
+
+                    try:
+                        conn.execute("""
+                            INSERT OR REPLACE INTO historical_odds
+                            (event_id, year, player_dg_id, player_name, market, book,
+                             close_line, outcome)
+                            VALUES (?,?,?,?,?,?,?,?)
+                        """, (
+                            str(event_id), year, dg_id, name,
+                            market_name, book_label, american, None,
+                        ))
+                        total += 1
+                    except Exception:
+                        pass
 
-    conn.commit()
+        conn.commit()
 
-    if total > 0:
-        _mark_done(table, event_id, year)
-    return total
+        if total > 0:
+            _mark_done(table, event_id, year)
+        return total
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -428,43 +427,43 @@ def backfill_weather(event_id: str, year: int,
     if not times:
         return 0
 
-    conn = db.get_conn()
-    count = 0
-    for i, ts in enumerate(times):
-        # ts format: "2024-01-18T06:00"
-        try:
-            dt = datetime.strptime(ts, "%Y-%m-%dT%H:%M")
-        except ValueError:
-            continue
-        try:
-            conn.execute("""
-                INSERT OR REPLACE INTO tournament_weather
-                (event_id, year, date, hour,
-                 temperature_c, wind_speed_kmh, wind_gusts_kmh,
-                 wind_direction, precipitation_mm,
-                 humidity_pct, cloud_cover_pct, pressure_hpa)
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
-            """, (
-                str(event_id), year,
-                dt.strftime("%Y-%m-%d"), dt.hour,
-                _get_idx(hourly, "temperature_2m", i),
-                _get_idx(hourly, "wind_speed_10m", i),
-                _get_idx(hourly, "wind_gusts_10m", i),
-                _get_idx(hourly, "wind_direction_10m", i),
-                _get_idx(hourly, "precipitation", i),
-                _get_idx(hourly, "relative_humidity_2m", i),
-                _get_idx(hourly, "cloud_cover", i),
-                _get_idx(hourly, "surface_pressure", i),
-            ))
-            count += 1
-        except Exception:
-            pass
-    conn.commit()
+    with db.connection() as conn:
+        count = 0
+        for i, ts in enumerate(times):
+            # ts format: "2024-01-18T06:00"
+            try:
+                dt = datetime.strptime(ts, "%Y-%m-%dT%H:%M")
+            except ValueError:
+                continue
+            try:
+                conn.execute("""
+                    INSERT OR REPLACE INTO tournament_weather
+                    (event_id, year, date, hour,
+                     temperature_c, wind_speed_kmh, wind_gusts_kmh,
+                     wind_direction, precipitation_mm,
+                     humidity_pct, cloud_cover_pct, pressure_hpa)
+                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?)
+                """, (
+                    str(event_id), year,
+                    dt.strftime("%Y-%m-%d"), dt.hour,
+                    _get_idx(hourly, "temperature_2m", i),
+                    _get_idx(hourly, "wind_speed_10m", i),
+                    _get_idx(hourly, "wind_gusts_10m", i),
+                    _get_idx(hourly, "wind_direction_10m", i),
+                    _get_idx(hourly, "precipitation", i),
+                    _get_idx(hourly, "relative_humidity_2m", i),
+                    _get_idx(hourly, "cloud_cover", i),
+                    _get_idx(hourly, "surface_pressure", i),
+                ))
+                count += 1
+            except Exception:
+                pass
+        conn.commit()
 
-    if count > 0:
-        _mark_done(table, event_id, year)
-        _compute_weather_summary(event_id, year)
-    return count
+        if count > 0:
+            _mark_done(table, event_id, year)
+            _compute_weather_summary(event_id, year)
+        return count
 
 
 def _get_idx(hourly: dict, key: str, i: int):
@@ -482,82 +481,82 @@ def _compute_weather_summary(event_id: str, year: int):
     Assumes tournament rounds on Thursday-Sunday (offset from start_date).
     Calculates AM/PM wave splits for wind advantage detection.
     """
-    conn = db.get_conn()
-    rows = conn.execute("""
-        SELECT date, hour, wind_speed_kmh, wind_gusts_kmh,
-               precipitation_mm, temperature_c
-        FROM tournament_weather
-        WHERE event_id=? AND year=?
-        ORDER BY date, hour
-    """, (str(event_id), year)).fetchall()
-
-    if not rows:
-        return
-
-    # Group by date
-    by_date = {}
-    for r in rows:
-        d = r[0]
-        if d not in by_date:
-            by_date[d] = []
-        by_date[d].append(r)
-
-    dates = sorted(by_date.keys())
-    # Skip first date (practice day buffer)
-    round_dates = dates[1:5] if len(dates) > 4 else dates[:4]
-
-    for round_num, date in enumerate(round_dates, 1):
-        day_rows = by_date.get(date, [])
-        if not day_rows:
-            continue
-
-        winds = [r[2] for r in day_rows if r[2] is not None]
-        gusts = [r[3] for r in day_rows if r[3] is not None]
-        precips = [r[4] for r in day_rows if r[4] is not None]
-        temps = [r[5] for r in day_rows if r[5] is not None]
-
-        # AM wave (6-11), PM wave (12-17) for tee time advantage
-        am_winds = [r[2] for r in day_rows if r[1] in range(6, 12) and r[2] is not None]
-        pm_winds = [r[2] for r in day_rows if r[1] in range(12, 18) and r[2] is not None]
-
-        avg_wind = sum(winds) / len(winds) if winds else None
-        max_gust = max(gusts) if gusts else None
-        total_precip = sum(precips) if precips else None
-        avg_temp = sum(temps) / len(temps) if temps else None
-        am_wave_wind = sum(am_winds) / len(am_winds) if am_winds else None
-        pm_wave_wind = sum(pm_winds) / len(pm_winds) if pm_winds else None
-
-        # Simple conditions rating: 0 = perfect, 100 = brutal
-        rating = 0.0
-        if avg_wind and avg_wind > 15:
-            rating += min(40, (avg_wind - 15) * 3)
-        if max_gust and max_gust > 40:
-            rating += min(20, (max_gust - 40) * 2)
-        if total_precip and total_precip > 0:
-            rating += min(30, total_precip * 10)
-        if avg_temp and avg_temp < 10:
-            rating += min(10, (10 - avg_temp) * 2)
-
-        try:
-            conn.execute("""
-                INSERT OR REPLACE INTO tournament_weather_summary
-                (event_id, year, round_num, avg_wind_kmh, max_gust_kmh,
-                 total_precip_mm, avg_temp_c, am_wave_wind, pm_wave_wind,
-                 conditions_rating)
-                VALUES (?,?,?,?,?,?,?,?,?,?)
-            """, (
-                str(event_id), year, round_num,
-                round(avg_wind, 1) if avg_wind else None,
-                round(max_gust, 1) if max_gust else None,
-                round(total_precip, 1) if total_precip else None,
-                round(avg_temp, 1) if avg_temp else None,
-                round(am_wave_wind, 1) if am_wave_wind else None,
-                round(pm_wave_wind, 1) if pm_wave_wind else None,
-                round(rating, 1),
-            ))
-        except Exception:
-            pass
-    conn.commit()
+    with db.connection() as conn:
+        rows = conn.execute("""
+            SELECT date, hour, wind_speed_kmh, wind_gusts_kmh,
+                   precipitation_mm, temperature_c
+            FROM tournament_weather
+            WHERE event_id=? AND year=?
+            ORDER BY date, hour
+        """, (str(event_id), year)).fetchall()
+
+        if not rows:
+            return
+
+        # Group by date
+        by_date = {}
+        for r in rows:
+            d = r[0]
+            if d not in by_date:
+                by_date[d] = []
+            by_date[d].append(r)
+
+        dates = sorted(by_date.keys())
+        # Skip first date (practice day buffer)
+        round_dates = dates[1:5] if len(dates) > 4 else dates[:4]
+
+        for round_num, date in enumerate(round_dates, 1):
+            day_rows = by_date.get(date, [])
+            if not day_rows:
+                continue
+
+            winds = [r[2] for r in day_rows if r[2] is not None]
+            gusts = [r[3] for r in day_rows if r[3] is not None]
+            precips = [r[4] for r in day_rows if r[4] is not None]
+            temps = [r[5] for r in day_rows if r[5] is not None]
+
+            # AM wave (6-11), PM wave (12-17) for tee time advantage
+            am_winds = [r[2] for r in day_rows if r[1] in range(6, 12) and r[2] is not None]
+            pm_winds = [r[2] for r in day_rows if r[1] in range(12, 18) and r[2] is not None]
+
+            avg_wind = sum(winds) / len(winds) if winds else None
+            max_gust = max(gusts) if gusts else None
+            total_precip = sum(precips) if precips else None
+            avg_temp = sum(temps) / len(temps) if temps else None
+            am_wave_wind = sum(am_winds) / len(am_winds) if am_winds else None
+            pm_wave_wind = sum(pm_winds) / len(pm_winds) if pm_winds else None
+
+            # Simple conditions rating: 0 = perfect, 100 = brutal
+            rating = 0.0
+            if avg_wind and avg_wind > 15:
+                rating += min(40, (avg_wind - 15) * 3)
+            if max_gust and max_gust > 40:
+                rating += min(20, (max_gust - 40) * 2)
+            if total_precip and total_precip > 0:
+                rating += min(30, total_precip * 10)
+            if avg_temp and avg_temp < 10:
+                rating += min(10, (10 - avg_temp) * 2)
+
+            try:
+                conn.execute("""
+                    INSERT OR REPLACE INTO tournament_weather_summary
+                    (event_id, year, round_num, avg_wind_kmh, max_gust_kmh,
+                     total_precip_mm, avg_temp_c, am_wave_wind, pm_wave_wind,
+                     conditions_rating)
+                    VALUES (?,?,?,?,?,?,?,?,?,?)
+                """, (
+                    str(event_id), year, round_num,
+                    round(avg_wind, 1) if avg_wind else None,
+                    round(max_gust, 1) if max_gust else None,
+                    round(total_precip, 1) if total_precip else None,
+                    round(avg_temp, 1) if avg_temp else None,
+                    round(am_wave_wind, 1) if am_wave_wind else None,
+                    round(pm_wave_wind, 1) if pm_wave_wind else None,
+                    round(rating, 1),
+                ))
+            except Exception:
+                pass
+        conn.commit()
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -575,66 +574,65 @@ def upsert_course(course_id: str, course_name: str,
     sg_ott_importance, sg_app_importance, sg_arg_importance, sg_putt_importance,
     historical_scoring_avg, ai_course_profile, elevation_m
     """
-    conn = db.get_conn()
-
-    existing = conn.execute(
-        "SELECT id FROM course_encyclopedia WHERE course_id = ?",
-        (course_id,)
-    ).fetchone()
-
-    if existing:
-        sets = []
-        vals = []
-        for key, val in kwargs.items():
-            if val is not None:
-                sets.append(f"{key} = ?")
-                vals.append(val)
-        if latitude is not None:
-            sets.append("latitude = ?")
-            vals.append(latitude)
-        if longitude is not None:
-            sets.append("longitude = ?")
-            vals.append(longitude)
-        if course_name:
-            sets.append("course_name = ?")
-            vals.append(course_name)
-        sets.append("updated_at = datetime('now')")
-        if sets:
-            vals.append(course_id)
-            conn.execute(
-                f"UPDATE course_encyclopedia SET {', '.join(sets)} WHERE course_id = ?",
-                vals,
-            )
-    else:
-        conn.execute("""
-            INSERT INTO course_encyclopedia
-            (course_id, course_name, latitude, longitude,
-             elevation_m, grass_type_fairway, grass_type_greens,
-             green_speed, fairway_width, yardage, par,
-             prevailing_wind, course_type,
-             sg_ott_importance, sg_app_importance,
-             sg_arg_importance, sg_putt_importance,
-             historical_scoring_avg, ai_course_profile)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """, (
-            course_id, course_name, latitude, longitude,
-            kwargs.get("elevation_m"),
-            kwargs.get("grass_type_fairway"),
-            kwargs.get("grass_type_greens"),
-            kwargs.get("green_speed"),
-            kwargs.get("fairway_width"),
-            kwargs.get("yardage"),
-            kwargs.get("par"),
-            kwargs.get("prevailing_wind"),
-            kwargs.get("course_type"),
-            kwargs.get("sg_ott_importance"),
-            kwargs.get("sg_app_importance"),
-            kwargs.get("sg_arg_importance"),
-            kwargs.get("sg_putt_importance"),
-            kwargs.get("historical_scoring_avg"),
-            kwargs.get("ai_course_profile"),
-        ))
-    conn.commit()
+    with db.connection() as conn:
+        existing = conn.execute(
+            "SELECT id FROM course_encyclopedia WHERE course_id = ?",
+            (course_id,)
+        ).fetchone()
+
+        if existing:
+            sets = []
+            vals = []
+            for key, val in kwargs.items():
+                if val is not None:
+                    sets.append(f"{key} = ?")
+                    vals.append(val)
+            if latitude is not None:
+                sets.append("latitude = ?")
+                vals.append(latitude)
+            if longitude is not None:
+                sets.append("longitude = ?")
+                vals.append(longitude)
+            if course_name:
+                sets.append("course_name = ?")
+                vals.append(course_name)
+            sets.append("updated_at = datetime('now')")
+            if sets:
+                vals.append(course_id)
+                conn.execute(
+                    f"UPDATE course_encyclopedia SET {', '.join(sets)} WHERE course_id = ?",
+                    vals,
+                )
+        else:
+            conn.execute("""
+                INSERT INTO course_encyclopedia
+                (course_id, course_name, latitude, longitude,
+                 elevation_m, grass_type_fairway, grass_type_greens,
+                 green_speed, fairway_width, yardage, par,
+                 prevailing_wind, course_type,
+                 sg_ott_importance, sg_app_importance,
+                 sg_arg_importance, sg_putt_importance,
+                 historical_scoring_avg, ai_course_profile)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """, (
+                course_id, course_name, latitude, longitude,
+                kwargs.get("elevation_m"),
+                kwargs.get("grass_type_fairway"),
+                kwargs.get("grass_type_greens"),
+                kwargs.get("green_speed"),
+                kwargs.get("fairway_width"),
+                kwargs.get("yardage"),
+                kwargs.get("par"),
+                kwargs.get("prevailing_wind"),
+                kwargs.get("course_type"),
+                kwargs.get("sg_ott_importance"),
+                kwargs.get("sg_app_importance"),
+                kwargs.get("sg_arg_importance"),
+                kwargs.get("sg_putt_importance"),
+                kwargs.get("historical_scoring_avg"),
+                kwargs.get("ai_course_profile"),
+            ))
+        conn.commit()
 
 
 def build_courses_from_events():
@@ -642,18 +640,18 @@ def build_courses_from_events():
     Build course encyclopedia entries from historical_event_info table.
     Populates stub entries that can be enriched later by AI or manual input.
     """
-    conn = db.get_conn()
-    events = conn.execute("""
-        SELECT DISTINCT course_id, course_name, latitude, longitude
-        FROM historical_event_info
-        WHERE course_id IS NOT NULL AND course_id != ''
-    """).fetchall()
+    with db.connection() as conn:
+        events = conn.execute("""
+            SELECT DISTINCT course_id, course_name, latitude, longitude
+            FROM historical_event_info
+            WHERE course_id IS NOT NULL AND course_id != ''
+        """).fetchall()
 
-    for ev in events:
-        cid, cname, lat, lon = ev
-        if cid:
-            upsert_course(cid, cname, latitude=lat, longitude=lon)
-    logger.info("Built %d course stubs from event history", len(events))
+        for ev in events:
+            cid, cname, lat, lon = ev
+            if cid:
+                upsert_course(cid, cname, latitude=lat, longitude=lon)
+        logger.info("Built %d course stubs from event history", len(events))
 
 
 def _load_course_coords() -> dict:
@@ -662,13 +660,12 @@ def _load_course_coords() -> dict:
     Returns {course_id: (latitude, longitude)}.
     """
     try:
-        conn = db.get_conn()
-        rows = conn.execute("""
-            SELECT course_id, latitude, longitude
-            FROM course_encyclopedia
-            WHERE latitude IS NOT NULL AND longitude IS NOT NULL
-        """).fetchall()
-        conn.close()
+        with db.connection() as conn:
+            rows = conn.execute("""
+                SELECT course_id, latitude, longitude
+                FROM course_encyclopedia
+                WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            """).fetchall()
         return {str(r[0]): (r[1], r[2]) for r in rows}
     except Exception:
         return {}
@@ -169,28 +169,27 @@ def assert_checkpoint_temporal_integrity(event_id: str, year: int, as_of_date: s
 
     This guard verifies contract behavior for checkpoint mode.
     """
-    conn = db.get_conn()
-    row = conn.execute(
-        """
-        SELECT MAX(
-            CASE
-                WHEN p.rounds_used > (
-                    SELECT COUNT(*)
-                    FROM rounds r
-                    WHERE r.player_key = p.player_key
-                      AND r.sg_total IS NOT NULL
-                      AND r.event_completed < ?
-                )
-                THEN 1
-                ELSE 0
-            END
-        ) AS has_leakage
-        FROM pit_rolling_stats p
-        WHERE p.event_id = ? AND p.year = ?
-        """,
-        (as_of_date, str(event_id), int(year)),
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            """
+            SELECT MAX(
+                CASE
+                    WHEN p.rounds_used > (
+                        SELECT COUNT(*)
+                        FROM rounds r
+                        WHERE r.player_key = p.player_key
+                          AND r.sg_total IS NOT NULL
+                          AND r.event_completed < ?
+                    )
+                    THEN 1
+                    ELSE 0
+                END
+            ) AS has_leakage
+            FROM pit_rolling_stats p
+            WHERE p.event_id = ? AND p.year = ?
+            """,
+            (as_of_date, str(event_id), int(year)),
+        ).fetchone()
     has_leakage = int(row["has_leakage"] or 0) if row else 0
     if has_leakage:
         raise ValueError(
@@ -55,17 +55,16 @@ def _strategy_from_json(strategy_config_json: str | None) -> StrategyConfig | No
 
 
 def _current_row(table: str, scope: str) -> dict[str, Any] | None:
-    conn = db.get_conn()
-    row = conn.execute(
-        f"""
-        SELECT * FROM {table}
-        WHERE scope = ? AND is_current = 1
-        ORDER BY created_at DESC, id DESC
-        LIMIT 1
-        """,
-        (scope,),
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            f"""
+            SELECT * FROM {table}
+            WHERE scope = ? AND is_current = 1
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1
+            """,
+            (scope,),
+        ).fetchone()
     return dict(row) if row else None
 
 
@@ -92,22 +91,20 @@ def evaluate_live_promotion_gates(scope: str = "global") -> PromotionGateResult:
 
     calibration = compute_calibration()
     clv = compute_clv_summary()
-    conn = db.get_conn()
-    prediction_rows = conn.execute(
-        """
-        SELECT bet_type, model_prob, actual_outcome, profit
-        FROM prediction_log
-        WHERE model_prob IS NOT NULL AND actual_outcome IS NOT NULL
-        """
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        prediction_rows = conn.execute(
+            """
+            SELECT bet_type, model_prob, actual_outcome, profit
+            FROM prediction_log
+            WHERE model_prob IS NOT NULL AND actual_outcome IS NOT NULL
+            """
+        ).fetchall()
 
     total_bets = int((calibration.get("roi") or {}).get("total_bets", 0) if isinstance(calibration, dict) else 0)
     avg_clv_pct = clv.get("avg_clv_pct")
 
-    clv_conn = db.get_conn()
-    clv_rows = clv_conn.execute("SELECT clv_pct FROM clv_log WHERE clv_pct IS NOT NULL").fetchall()
-    clv_conn.close()
+    with db.connection() as clv_conn:
+        clv_rows = clv_conn.execute("SELECT clv_pct FROM clv_log WHERE clv_pct IS NOT NULL").fetchall()
     clv_hit_rate = 0.0
     if clv_rows:
         positive = sum(1 for row in clv_rows if (row["clv_pct"] or 0) > 0)
@@ -176,27 +173,26 @@ def set_research_champion(
     theory_metadata: dict[str, Any] | None = None,
     notes: str | None = None,
 ) -> dict[str, Any]:
-    conn = db.get_conn()
-    conn.execute("UPDATE research_model_registry SET is_current = 0 WHERE scope = ?", (scope,))
-    cursor = conn.execute(
-        """
-        INSERT INTO research_model_registry (
-            scope, strategy_config_json, source, proposal_id,
-            theory_metadata_json, notes, is_current
-        ) VALUES (?, ?, ?, ?, ?, ?, 1)
-        """,
-        (
-            scope,
-            strategy.to_json(),
-            source,
-            proposal_id,
-            json.dumps(theory_metadata, sort_keys=True) if theory_metadata is not None else None,
-            notes,
-        ),
-    )
-    conn.commit()
-    row_id = cursor.lastrowid
-    conn.close()
+    with db.connection() as conn:
+        conn.execute("UPDATE research_model_registry SET is_current = 0 WHERE scope = ?", (scope,))
+        cursor = conn.execute(
+            """
+            INSERT INTO research_model_registry (
+                scope, strategy_config_json, source, proposal_id,
+                theory_metadata_json, notes, is_current
+            ) VALUES (?, ?, ?, ?, ?, ?, 1)
+            """,
+            (
+                scope,
+                strategy.to_json(),
+                source,
+                proposal_id,
+                json.dumps(theory_metadata, sort_keys=True) if theory_metadata is not None else None,
+                notes,
+            ),
+        )
+        conn.commit()
+        row_id = cursor.lastrowid
     return {"id": row_id, "strategy": strategy, "scope": scope}
 
 
@@ -225,28 +221,27 @@ def set_live_weekly_model(
     replaced_live_registry_id: int | None = None,
 ) -> dict[str, Any]:
     current = get_live_weekly_model_record(scope)
-    conn = db.get_conn()
-    conn.execute("UPDATE live_model_registry SET is_current = 0 WHERE scope = ?", (scope,))
-    cursor = conn.execute(
-        """
-        INSERT INTO live_model_registry (
-            scope, strategy_config_json, source_research_registry_id,
-            promoted_by, action, notes, replaced_live_registry_id, is_current
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-        """,
-        (
-            scope,
-            strategy.to_json(),
-            source_research_registry_id,
-            promoted_by,
-            action,
-            notes,
-            replaced_live_registry_id if replaced_live_registry_id is not None else (current["id"] if current else None),
-        ),
-    )
-    conn.commit()
-    row_id = cursor.lastrowid
-    conn.close()
+    with db.connection() as conn:
+        conn.execute("UPDATE live_model_registry SET is_current = 0 WHERE scope = ?", (scope,))
+        cursor = conn.execute(
+            """
+            INSERT INTO live_model_registry (
+                scope, strategy_config_json, source_research_registry_id,
+                promoted_by, action, notes, replaced_live_registry_id, is_current
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+            """,
+            (
+                scope,
+                strategy.to_json(),
+                source_research_registry_id,
+                promoted_by,
+                action,
+                notes,
+                replaced_live_registry_id if replaced_live_registry_id is not None else (current["id"] if current else None),
+            ),
+        )
+        conn.commit()
+        row_id = cursor.lastrowid
     return {"id": row_id, "strategy": strategy, "scope": scope}
 
 
@@ -303,17 +298,16 @@ def rollback_live_weekly_model(
     promoted_by: str = "manual",
     notes: str | None = None,
 ) -> dict[str, Any]:
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT * FROM live_model_registry
-        WHERE scope = ?
-        ORDER BY created_at DESC, id DESC
-        LIMIT 2
-        """,
-        (scope,),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT * FROM live_model_registry
+            WHERE scope = ?
+            ORDER BY created_at DESC, id DESC
+            LIMIT 2
+            """,
+            (scope,),
+        ).fetchall()
     if len(rows) < 2:
         raise ValueError("No previous live model exists to roll back to")
     current = dict(rows[0])
@@ -32,81 +32,80 @@ def find_outliers(event_id: str, year: int,
 
     Returns list of outlier dicts with prediction/result info.
     """
-    conn = db.get_conn()
-
-    # Get predictions for this event
-    preds = conn.execute("""
-        SELECT player_dg_id, player_name, win_prob, top5_prob,
-               top10_prob, top20_prob, make_cut_prob
-        FROM historical_predictions
-        WHERE event_id = ? AND year = ?
-    """, (str(event_id), year)).fetchall()
-
-    if not preds:
-        return []
-
-    # Get round data for actual finishes
-    finishes = conn.execute("""
-        SELECT DISTINCT player_key, fin_text
-        FROM rounds
-        WHERE event_id = ? AND year = ?
-    """, (str(event_id), year)).fetchall()
-
-    finish_by_key = {}
-    for f in finishes:
-        pkey, fin_text = f
-        if not fin_text:
-            continue
-        fin_upper = fin_text.strip().upper()
-        pos = None
-        if fin_upper in ("CUT", "MC"):
-            pos = 999
-        elif fin_upper in ("WD", "W/D", "DQ"):
-            pos = 998
-        else:
-            try:
-                pos = int(fin_upper.replace("T", ""))
-            except ValueError:
-                pass
-        if pos is not None:
-            finish_by_key[pkey] = {"position": pos, "text": fin_text}
-
-    # Rank predictions by win probability (best expected rank)
-    pred_sorted = sorted(preds, key=lambda p: -(p[2] or 0))
-    outliers = []
-
-    for rank, pred in enumerate(pred_sorted, 1):
-        dg_id, name, win_p, t5_p, t10_p, t20_p, mc_p = pred
-        pkey = normalize_name(name)
-        actual = finish_by_key.get(pkey)
-        if not actual:
-            continue
-
-        actual_pos = actual["position"]
-
-        # Expected rank = predicted rank based on win probability ordering
-        predicted_rank = rank
-        delta = abs(actual_pos - predicted_rank)
-
-        if delta >= threshold:
-            outliers.append({
-                "event_id": event_id,
-                "year": year,
-                "player_key": pkey,
-                "player_name": name,
-                "dg_id": dg_id,
-                "predicted_rank": predicted_rank,
-                "actual_finish": actual_pos,
-                "finish_text": actual["text"],
-                "delta": delta,
-                "direction": "underperformed" if actual_pos > predicted_rank else "overperformed",
-                "win_prob": win_p,
-                "top10_prob": t10_p,
-                "make_cut_prob": mc_p,
-            })
-
-    outliers.sort(key=lambda x: -x["delta"])
-    return outliers
+    with db.connection() as conn:
+        # Get predictions for this event
+        preds = conn.execute("""
+            SELECT player_dg_id, player_name, win_prob, top5_prob,
+                   top10_prob, top20_prob, make_cut_prob
+            FROM historical_predictions
+            WHERE event_id = ? AND year = ?
+        """, (str(event_id), year)).fetchall()
+
+        if not preds:
+            return []
+
+        # Get round data for actual finishes
+        finishes = conn.execute("""
+            SELECT DISTINCT player_key, fin_text
+            FROM rounds
+            WHERE event_id = ? AND year = ?
+        """, (str(event_id), year)).fetchall()
+
+        finish_by_key = {}
+        for f in finishes:
+            pkey, fin_text = f
+            if not fin_text:
+                continue
+            fin_upper = fin_text.strip().upper()
+            pos = None
+            if fin_upper in ("CUT", "MC"):
+                pos = 999
+            elif fin_upper in ("WD", "W/D", "DQ"):
+                pos = 998
+            else:
+                try:
+                    pos = int(fin_upper.replace("T", ""))
+                except ValueError:
+                    pass
+            if pos is not None:
+                finish_by_key[pkey] = {"position": pos, "text": fin_text}
+
+        # Rank predictions by win probability (best expected rank)
+        pred_sorted = sorted(preds, key=lambda p: -(p[2] or 0))
+        outliers = []
+
+        for rank, pred in enumerate(pred_sorted, 1):
+            dg_id, name, win_p, t5_p, t10_p, t20_p, mc_p = pred
+            pkey = normalize_name(name)
+            actual = finish_by_key.get(pkey)
+            if not actual:
+                continue
+
+            actual_pos = actual["position"]
+
+            # Expected rank = predicted rank based on win probability ordering
+            predicted_rank = rank
+            delta = abs(actual_pos - predicted_rank)
+
+            if delta >= threshold:
+                outliers.append({
+                    "event_id": event_id,
+                    "year": year,
+                    "player_key": pkey,
+                    "player_name": name,
+                    "dg_id": dg_id,
+                    "predicted_rank": predicted_rank,
+                    "actual_finish": actual_pos,
+                    "finish_text": actual["text"],
+                    "delta": delta,
+                    "direction": "underperformed" if actual_pos > predicted_rank else "overperformed",
+                    "win_prob": win_p,
+                    "top10_prob": t10_p,
+                    "make_cut_prob": mc_p,
+                })
+
+        outliers.sort(key=lambda x: -x["delta"])
+        return outliers
 
 
 def gather_context(outlier: dict) -> dict:
@@ -115,95 +114,95 @@ def gather_context(outlier: dict) -> dict:
 
     Pulls weather, equipment changes, intel events, and course history.
     """
-    conn = db.get_conn()
-    context = {}
-
-    event_id = outlier["event_id"]
-    year = outlier["year"]
-    player_key = outlier["player_key"]
-
-    # Weather conditions during tournament
-    weather = conn.execute("""
-        SELECT round_num, avg_wind_kmh, max_gust_kmh,
-               total_precip_mm, conditions_rating
-        FROM tournament_weather_summary
-        WHERE event_id = ? AND year = ?
-        ORDER BY round_num
-    """, (str(event_id), year)).fetchall()
-
-    if weather:
-        context["weather"] = [
-            {
-                "round": w[0], "avg_wind_kmh": w[1],
-                "max_gust_kmh": w[2], "precip_mm": w[3],
-                "conditions_rating": w[4],
-            }
-            for w in weather
-        ]
-        avg_rating = sum(w[4] for w in weather if w[4]) / len(weather) if weather else 0
-        context["weather_severity"] = "calm" if avg_rating < 15 else "moderate" if avg_rating < 35 else "severe"
-
-    # Equipment changes near event date
-    equip = conn.execute("""
-        SELECT change_date, category, old_equipment, new_equipment,
-               ai_impact_assessment, performance_delta_sg
-        FROM equipment_changes
-        WHERE player_key = ?
-        ORDER BY change_date DESC
-        LIMIT 5
-    """, (player_key,)).fetchall()
-
-    if equip:
-        context["equipment_changes"] = [
-            {
-                "date": e[0], "category": e[1],
-                "old": e[2], "new": e[3],
-                "impact": e[4], "sg_delta": e[5],
-            }
-            for e in equip
-        ]
-
-    # Intel events around tournament time
-    intel = conn.execute("""
-        SELECT title, snippet, source, category,
-               ai_summary, relevance_score
-        FROM intel_events
-        WHERE player_key = ?
-        ORDER BY relevance_score DESC
-        LIMIT 5
-    """, (player_key,)).fetchall()
-
-    if intel:
-        context["intel"] = [
-            {
-                "title": i[0], "snippet": i[1],
-                "source": i[2], "category": i[3],
-                "summary": i[4], "relevance": i[5],
-            }
-            for i in intel
-        ]
-
-    # Player's historical SG stats at this course (from rounds data)
-    course_history = conn.execute("""
-        SELECT round_num, score, sg_total, sg_ott, sg_app,
-               sg_arg, sg_putt
-        FROM rounds
-        WHERE event_id = ? AND year = ? AND player_key = ?
-        ORDER BY round_num
-    """, (str(event_id), year, player_key)).fetchall()
-
-    if course_history:
-        context["round_scores"] = [
-            {
-                "round": r[0], "score": r[1],
-                "sg_total": r[2], "sg_ott": r[3],
-                "sg_app": r[4], "sg_arg": r[5],
-                "sg_putt": r[6],
-            }
-            for r in course_history
-        ]
+    with db.connection() as conn:
+        context = {}
+
+        event_id = outlier["event_id"]
+        year = outlier["year"]
+        player_key = outlier["player_key"]
+
+        # Weather conditions during tournament
+        weather = conn.execute("""
+            SELECT round_num, avg_wind_kmh, max_gust_kmh,
+                   total_precip_mm, conditions_rating
+            FROM tournament_weather_summary
+            WHERE event_id = ? AND year = ?
+            ORDER BY round_num
+        """, (str(event_id), year)).fetchall()
+
+        if weather:
+            context["weather"] = [
+                {
+                    "round": w[0], "avg_wind_kmh": w[1],
+                    "max_gust_kmh": w[2], "precip_mm": w[3],
+                    "conditions_rating": w[4],
+                }
+                for w in weather
+            ]
+            avg_rating = sum(w[4] for w in weather if w[4]) / len(weather) if weather else 0
+            context["weather_severity"] = "calm" if avg_rating < 15 else "moderate" if avg_rating < 35 else "severe"
+
+        # Equipment changes near event date
+        equip = conn.execute("""
+            SELECT change_date, category, old_equipment, new_equipment,
+                   ai_impact_assessment, performance_delta_sg
+            FROM equipment_changes
+            WHERE player_key = ?
+            ORDER BY change_date DESC
+            LIMIT 5
+        """, (player_key,)).fetchall()
+
+        if equip:
+            context["equipment_changes"] = [
+                {
+                    "date": e[0], "category": e[1],
+                    "old": e[2], "new": e[3],
+                    "impact": e[4], "sg_delta": e[5],
+                }
+                for e in equip
+            ]
+
+        # Intel events around tournament time
+        intel = conn.execute("""
+            SELECT title, snippet, source, category,
+                   ai_summary, relevance_score
+            FROM intel_events
+            WHERE player_key = ?
+            ORDER BY relevance_score DESC
+            LIMIT 5
+        """, (player_key,)).fetchall()
+
+        if intel:
+            context["intel"] = [
+                {
+                    "title": i[0], "snippet": i[1],
+                    "source": i[2], "category": i[3],
+                    "summary": i[4], "relevance": i[5],
+                }
+                for i in intel
+            ]
+
+        # Player's historical SG stats at this course (from rounds data)
+        course_history = conn.execute("""
+            SELECT round_num, score, sg_total, sg_ott, sg_app,
+                   sg_arg, sg_putt
+            FROM rounds
+            WHERE event_id = ? AND year = ? AND player_key = ?
+            ORDER BY round_num
+        """, (str(event_id), year, player_key)).fetchall()
+
+        if course_history:
+            context["round_scores"] = [
+                {
+                    "round": r[0], "score": r[1],
+                    "sg_total": r[2], "sg_ott": r[3],
+                    "sg_app": r[4], "sg_arg": r[5],
+                    "sg_putt": r[6],
+                }
+                for r in course_history
+            ]
 
-    return context
+        return context
 
 
 def investigate_with_ai(outlier: dict, context: dict) -> dict:
@@ -273,34 +272,33 @@ Analyze this prediction miss and respond in valid JSON:
 
 def store_investigation(outlier: dict, context: dict, analysis: dict):
     """Store a completed outlier investigation in the database."""
-    conn = db.get_conn()
-
-    weather_str = json.dumps(context.get("weather", []), default=str)
-    has_equip = 1 if context.get("equipment_changes") else 0
-    intel_str = json.dumps(context.get("intel", []), default=str)
-
-    try:
-        conn.execute("""
-            INSERT OR REPLACE INTO outlier_investigations
-            (event_id, year, player_key, predicted_rank, actual_finish,
-             delta, weather_conditions, equipment_change_nearby,
-             intel_context, ai_explanation, root_cause, actionable,
-             suggested_model_change)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-        """, (
-            str(outlier["event_id"]), outlier["year"],
-            outlier["player_key"],
-            outlier["predicted_rank"], outlier["actual_finish"],
-            outlier["delta"],
-            weather_str, has_equip, intel_str,
-            analysis.get("ai_explanation", ""),
-            analysis.get("root_cause", "unknown"),
-            1 if analysis.get("actionable") else 0,
-            analysis.get("suggested_model_change"),
-        ))
-        conn.commit()
-    except Exception as e:
-        logger.error("Failed to store investigation: %s", e)
+    with db.connection() as conn:
+        weather_str = json.dumps(context.get("weather", []), default=str)
+        has_equip = 1 if context.get("equipment_changes") else 0
+        intel_str = json.dumps(context.get("intel", []), default=str)
+
+        try:
+            conn.execute("""
+                INSERT OR REPLACE INTO outlier_investigations
+                (event_id, year, player_key, predicted_rank, actual_finish,
+                 delta, weather_conditions, equipment_change_nearby,
+                 intel_context, ai_explanation, root_cause, actionable,
+                 suggested_model_change)
+                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """, (
+                str(outlier["event_id"]), outlier["year"],
+                outlier["player_key"],
+                outlier["predicted_rank"], outlier["actual_finish"],
+                outlier["delta"],
+                weather_str, has_equip, intel_str,
+                analysis.get("ai_explanation", ""),
+                analysis.get("root_cause", "unknown"),
+                1 if analysis.get("actionable") else 0,
+                analysis.get("suggested_model_change"),
+            ))
+            conn.commit()
+        except Exception as e:
+            logger.error("Failed to store investigation: %s", e)
 
 
 def investigate_event(event_id: str, year: int,
@@ -48,6 +48,7 @@ def compute_pit_form(event_id: str, year: int) -> dict:
           AND sg_total IS NOT NULL
         ORDER BY window ASC
     """, (str(event_id), year)).fetchall()
+    conn.close()
 
     if not rows:
         return {}
@@ -234,6 +235,7 @@ def compute_pit_course_fit(event_id: str, year: int) -> dict:
         FROM pit_course_stats
         WHERE event_id = ? AND year = ?
     """, (str(event_id), year)).fetchall()
+    conn.close()
 
     if not rows:
         return {}
@@ -345,6 +347,7 @@ def compute_pit_momentum(event_id: str, year: int) -> dict:
           AND sg_total_rank IS NOT NULL
         ORDER BY window ASC
     """, (str(event_id), year)).fetchall()
+    conn.close()
 
     if not rows:
         return {}
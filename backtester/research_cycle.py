@@ -264,20 +264,19 @@ def get_current_baseline_metrics(scope: str = "global") -> dict[str, Any]:
     """
     from src import db
 
-    conn = db.get_conn()
-    row = conn.execute(
-        """
-        SELECT guardrail_results_json
-        FROM research_proposals
-        WHERE scope = ?
-          AND status IN ('evaluated', 'approved', 'converted')
-          AND guardrail_results_json IS NOT NULL
-        ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
-        LIMIT 1
-        """,
-        (scope,),
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            """
+            SELECT guardrail_results_json
+            FROM research_proposals
+            WHERE scope = ?
+              AND status IN ('evaluated', 'approved', 'converted')
+              AND guardrail_results_json IS NOT NULL
+            ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
+            LIMIT 1
+            """,
+            (scope,),
+        ).fetchone()
     if not row or not row["guardrail_results_json"]:
         return {"weighted_roi_pct": None, "weighted_clv_avg": None}
     try:
@@ -303,22 +302,21 @@ def _get_global_best_proposal_for_iteration(
     """
     from src import db
 
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT id, name, strategy_config_json, theory_metadata_json,
-               summary_metrics_json, guardrail_results_json
-        FROM research_proposals
-        WHERE scope = ?
-          AND status IN ('evaluated', 'approved', 'converted')
-          AND summary_metrics_json IS NOT NULL
-          AND guardrail_results_json IS NOT NULL
-        ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
-        LIMIT ?
-        """,
-        (scope, pool_limit),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, name, strategy_config_json, theory_metadata_json,
+                   summary_metrics_json, guardrail_results_json
+            FROM research_proposals
+            WHERE scope = ?
+              AND status IN ('evaluated', 'approved', 'converted')
+              AND summary_metrics_json IS NOT NULL
+              AND guardrail_results_json IS NOT NULL
+            ORDER BY COALESCE(evaluated_at, created_at) DESC, id DESC
+            LIMIT ?
+            """,
+            (scope, pool_limit),
+        ).fetchall()
 
     candidates: list[dict[str, Any]] = []
     for row in rows:
@@ -350,6 +350,7 @@ def replay_event(
 
         if not pit_rows:
             if "matchup" not in strategy.markets:
+                conn.close()
                 return []
             players = []
             scores = []
@@ -529,6 +530,7 @@ def replay_event(
         )
         bets.extend(matchup_bets)
 
+    conn.close()
     return bets
 
 
@@ -849,6 +851,7 @@ def simulate_strategy(strategy: StrategyConfig,
                 result.errors.append(f"{eid}/{year}: {e}")
                 logger.warning("Replay failed for %s/%s: %s", eid, year, e)
 
+    conn.close()
     result.compute_metrics()
     return result
 
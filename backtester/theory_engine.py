@@ -153,18 +153,17 @@ def _get_recent_results_context(limit: int = 10) -> str:
     """Query recent evaluated proposals for context in the prompt."""
     try:
         from src import db
-        conn = db.get_conn()
-        rows = conn.execute(
-            """
-            SELECT name, summary_metrics_json, guardrail_results_json, strategy_config_json
-            FROM research_proposals
-            WHERE summary_metrics_json IS NOT NULL
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
-        conn.close()
+        with db.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT name, summary_metrics_json, guardrail_results_json, strategy_config_json
+                FROM research_proposals
+                WHERE summary_metrics_json IS NOT NULL
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
         if not rows:
             return "No prior results available."
         lines = []
@@ -184,11 +183,10 @@ def _get_existing_strategy_hashes() -> set[str]:
     """Return hashes of already-evaluated strategy configs to avoid duplicates."""
     try:
         from src import db
-        conn = db.get_conn()
-        rows = conn.execute(
-            "SELECT DISTINCT strategy_config_json FROM research_proposals WHERE strategy_config_json IS NOT NULL"
-        ).fetchall()
-        conn.close()
+        with db.connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT strategy_config_json FROM research_proposals WHERE strategy_config_json IS NOT NULL"
+            ).fetchall()
         return {hashlib.md5(r["strategy_config_json"].encode()).hexdigest() for r in rows}
     except Exception:
         return set()
@@ -191,26 +191,25 @@ def compute_blended_score(
 
 
 def load_historical_events(years: list[int] | None = None) -> list[dict[str, Any]]:
-    conn = db.get_conn()
-    params: list[Any] = []
-    where = ""
-    if years:
-        placeholders = ",".join("?" for _ in years)
-        where = f"WHERE year IN ({placeholders})"
-        params.extend(years)
-
-    rows = conn.execute(
-        f"""
-        SELECT event_id, year, MAX(event_name) AS event_name, MIN(event_completed) AS event_date
-        FROM rounds
-        {where}
-        GROUP BY event_id, year
-        HAVING event_id IS NOT NULL AND event_date IS NOT NULL
-        ORDER BY event_date ASC, year ASC, event_id ASC
-        """,
-        params,
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        params: list[Any] = []
+        where = ""
+        if years:
+            placeholders = ",".join("?" for _ in years)
+            where = f"WHERE year IN ({placeholders})"
+            params.extend(years)
+
+        rows = conn.execute(
+            f"""
+            SELECT event_id, year, MAX(event_name) AS event_name, MIN(event_completed) AS event_date
+            FROM rounds
+            {where}
+            GROUP BY event_id, year
+            HAVING event_id IS NOT NULL AND event_date IS NOT NULL
+            ORDER BY event_date ASC, year ASC, event_id ASC
+            """,
+            params,
+        ).fetchall()
 
     return [
         {
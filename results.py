@@ -134,11 +134,10 @@ def main():
     args = parser.parse_args()
 
     # Get tournament
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT id FROM tournaments WHERE name = ?", (args.tournament,)
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            "SELECT id FROM tournaments WHERE name = ?", (args.tournament,)
+        ).fetchone()
 
     if not row:
         print(f"Tournament '{args.tournament}' not found. Run analyze.py first.")
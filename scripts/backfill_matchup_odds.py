@@ -112,51 +112,50 @@ def store_matchup_batch(matchups: list[dict], event_id: str, year: int, book: st
     if not matchups:
         return 0
 
-    conn = db.get_conn()
-    inserted = 0
-    for m in matchups:
-        p1_name = m.get("p1_name") or m.get("p1_player_name")
-        p2_name = m.get("p2_name") or m.get("p2_player_name")
-        p1_id = m.get("p1_dg_id")
-        p2_id = m.get("p2_dg_id")
-        if not p1_name or not p2_name or p1_id is None or p2_id is None:
-            continue
-        try:
-            cursor = conn.execute(
-                """INSERT OR IGNORE INTO historical_matchup_odds
-                   (event_id, year, bet_type, p1_dg_id, p1_name, p2_dg_id, p2_name,
-                    book, p1_open, p1_close, p2_open, p2_close,
-                    p1_outcome, p2_outcome, p1_outcome_text, p2_outcome_text,
-                    tie_rule, open_time, close_time)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    event_id, year,
-                    m.get("bet_type", ""),
-                    p1_id,
-                    p1_name,
-                    p2_id,
-                    p2_name,
-                    book,
-                    str(m.get("p1_open", "")) if m.get("p1_open") is not None else None,
-                    str(m.get("p1_close", "")) if m.get("p1_close") is not None else None,
-                    str(m.get("p2_open", "")) if m.get("p2_open") is not None else None,
-                    str(m.get("p2_close", "")) if m.get("p2_close") is not None else None,
-                    m.get("p1_outcome"),
-                    m.get("p2_outcome"),
-                    m.get("p1_outcome_text"),
-                    m.get("p2_outcome_text"),
-                    m.get("tie_rule"),
-                    m.get("open_time"),
-                    m.get("close_time"),
-                ),
-            )
-            if cursor.rowcount and cursor.rowcount > 0:
-                inserted += int(cursor.rowcount)
-        except Exception as e:
-            logger.debug("Insert error for matchup in %s/%d: %s", event_id, year, e)
-
-    conn.commit()
-    conn.close()
+    with db.connection() as conn:
+        inserted = 0
+        for m in matchups:
+            p1_name = m.get("p1_name") or m.get("p1_player_name")
+            p2_name = m.get("p2_name") or m.get("p2_player_name")
+            p1_id = m.get("p1_dg_id")
+            p2_id = m.get("p2_dg_id")
+            if not p1_name or not p2_name or p1_id is None or p2_id is None:
+                continue
+            try:
+                cursor = conn.execute(
+                    """INSERT OR IGNORE INTO historical_matchup_odds
+                       (event_id, year, bet_type, p1_dg_id, p1_name, p2_dg_id, p2_name,
+                        book, p1_open, p1_close, p2_open, p2_close,
+                        p1_outcome, p2_outcome, p1_outcome_text, p2_outcome_text,
+                        tie_rule, open_time, close_time)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        event_id, year,
+                        m.get("bet_type", ""),
+                        p1_id,
+                        p1_name,
+                        p2_id,
+                        p2_name,
+                        book,
+                        str(m.get("p1_open", "")) if m.get("p1_open") is not None else None,
+                        str(m.get("p1_close", "")) if m.get("p1_close") is not None else None,
+                        str(m.get("p2_open", "")) if m.get("p2_open") is not None else None,
+                        str(m.get("p2_close", "")) if m.get("p2_close") is not None else None,
+                        m.get("p1_outcome"),
+                        m.get("p2_outcome"),
+                        m.get("p1_outcome_text"),
+                        m.get("p2_outcome_text"),
+                        m.get("tie_rule"),
+                        m.get("open_time"),
+                        m.get("close_time"),
+                    ),
+                )
+                if cursor.rowcount and cursor.rowcount > 0:
+                    inserted += int(cursor.rowcount)
+            except Exception as e:
+                logger.debug("Insert error for matchup in %s/%d: %s", event_id, year, e)
+
+        conn.commit()
     return inserted
 
 
@@ -9,7 +9,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.db import get_conn
+from src.db import connection
 from src import config
 from src.value import model_score_to_prob, compute_ev
 from src.portfolio import enforce_diversification
@@ -89,13 +89,12 @@ def did_hit(player_key: str, bet_type: str) -> bool:
 
 
 def load_dg_probs() -> dict:
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT player_key, metric_name, metric_value FROM metrics "
-        "WHERE tournament_id = ? AND metric_category = 'sim'",
-        (TOURNAMENT_ID,),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            "SELECT player_key, metric_name, metric_value FROM metrics "
+            "WHERE tournament_id = ? AND metric_category = 'sim'",
+            (TOURNAMENT_ID,),
+        ).fetchall()
 
     probs = {}
     for r in rows:
@@ -128,14 +127,13 @@ def load_dg_probs() -> dict:
 
 
 def load_predictions() -> list[dict]:
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT player_key, bet_type, model_prob, dg_prob, "
-        "market_implied_prob, odds_decimal "
-        "FROM prediction_log WHERE tournament_id = ?",
-        (TOURNAMENT_ID,),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            "SELECT player_key, bet_type, model_prob, dg_prob, "
+            "market_implied_prob, odds_decimal "
+            "FROM prediction_log WHERE tournament_id = ?",
+            (TOURNAMENT_ID,),
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -12,7 +12,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.db import get_conn
+from src.db import connection
 from src import config
 from src.portfolio import enforce_diversification
 
@@ -91,13 +91,12 @@ def did_hit(player_key: str, bet_type: str) -> bool:
 
 def load_dg_probs_filtered() -> dict:
     """Load DG sim probs, filtered to confirmed field and renormalized."""
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT player_key, metric_name, metric_value FROM metrics "
-        "WHERE tournament_id = ? AND metric_category = 'sim'",
-        (TOURNAMENT_ID,),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            "SELECT player_key, metric_name, metric_value FROM metrics "
+            "WHERE tournament_id = ? AND metric_category = 'sim'",
+            (TOURNAMENT_ID,),
+        ).fetchall()
 
     all_probs: dict[str, dict] = {}
     for r in rows:
@@ -170,27 +169,25 @@ def load_dg_probs_filtered() -> dict:
 
 def load_pre_tournament_predictions() -> list[dict]:
     """Load ONLY pre-tournament predictions (Feb 26 timestamp)."""
-    conn = get_conn()
-
-    # Show all timestamps for context
-    ts_rows = conn.execute(
-        "SELECT DISTINCT substr(created_at, 1, 10) as dt, COUNT(*) as cnt "
-        "FROM prediction_log WHERE tournament_id = ? GROUP BY dt ORDER BY dt",
-        (TOURNAMENT_ID,),
-    ).fetchall()
-    print("  Prediction log timestamps:")
-    for r in ts_rows:
-        label = "← USING" if r["dt"] == PRE_TOURNAMENT_DATE else ("← SKIPPED (in-play)" if r["dt"] > PRE_TOURNAMENT_DATE else "← SKIPPED (early)")
-        print(f"    {r['dt']}: {r['cnt']} entries {label}")
-
-    rows = conn.execute(
-        """SELECT player_key, bet_type, model_prob, dg_prob,
-                  market_implied_prob, odds_decimal
-           FROM prediction_log
-           WHERE tournament_id = ? AND created_at LIKE ?""",
-        (TOURNAMENT_ID, PRE_TOURNAMENT_DATE + "%"),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        # Show all timestamps for context
+        ts_rows = conn.execute(
+            "SELECT DISTINCT substr(created_at, 1, 10) as dt, COUNT(*) as cnt "
+            "FROM prediction_log WHERE tournament_id = ? GROUP BY dt ORDER BY dt",
+            (TOURNAMENT_ID,),
+        ).fetchall()
+        print("  Prediction log timestamps:")
+        for r in ts_rows:
+            label = "← USING" if r["dt"] == PRE_TOURNAMENT_DATE else ("← SKIPPED (in-play)" if r["dt"] > PRE_TOURNAMENT_DATE else "← SKIPPED (early)")
+            print(f"    {r['dt']}: {r['cnt']} entries {label}")
+
+        rows = conn.execute(
+            """SELECT player_key, bet_type, model_prob, dg_prob,
+                      market_implied_prob, odds_decimal
+               FROM prediction_log
+               WHERE tournament_id = ? AND created_at LIKE ?""",
+            (TOURNAMENT_ID, PRE_TOURNAMENT_DATE + "%"),
+        ).fetchall()
     print(f"  Using {len(rows)} pre-tournament predictions from {PRE_TOURNAMENT_DATE}")
     return [dict(r) for r in rows]
 
@@ -19,30 +19,29 @@ from src import db
 
 def main() -> None:
     db.ensure_initialized()
-    conn = db.get_conn()
+    with db.connection() as conn:
+        rows = conn.execute(
+            "SELECT id, scope, source, is_current, strategy_config_json FROM research_model_registry WHERE is_current = 1"
+        ).fetchall()
 
-    rows = conn.execute(
-        "SELECT id, scope, source, is_current, strategy_config_json FROM research_model_registry WHERE is_current = 1"
-    ).fetchall()
+        if not rows:
+            print("No active research champion found. Strategy already uses default.")
+            return
 
-    if not rows:
-        print("No active research champion found. Strategy already uses default.")
-        return
+        for row in rows:
+            print(f"Clearing research champion id={row['id']} scope={row['scope']} source={row['source']}")
 
-    for row in rows:
-        print(f"Clearing research champion id={row['id']} scope={row['scope']} source={row['source']}")
+        conn.execute("UPDATE research_model_registry SET is_current = 0 WHERE is_current = 1")
 
-    conn.execute("UPDATE research_model_registry SET is_current = 0 WHERE is_current = 1")
+        live_rows = conn.execute(
+            "SELECT id, is_current FROM live_model_registry WHERE is_current = 1"
+        ).fetchall()
+        if live_rows:
+            print(f"Also clearing {len(live_rows)} live_model_registry row(s).")
+            conn.execute("UPDATE live_model_registry SET is_current = 0 WHERE is_current = 1")
 
-    live_rows = conn.execute(
-        "SELECT id, is_current FROM live_model_registry WHERE is_current = 1"
-    ).fetchall()
-    if live_rows:
-        print(f"Also clearing {len(live_rows)} live_model_registry row(s).")
-        conn.execute("UPDATE live_model_registry SET is_current = 0 WHERE is_current = 1")
-
-    conn.commit()
-    print("Done. Strategy will now resolve to default StrategyConfig (40/40/20, 5% EV).")
+        conn.commit()
+        print("Done. Strategy will now resolve to default StrategyConfig (40/40/20, 5% EV).")
 
 
 if __name__ == "__main__":
@@ -42,17 +42,16 @@ def _american_to_implied(price) -> float:
 
 def compute_matchup_clv():
     """Compute CLV from historical matchup odds (open vs close)."""
-    conn = db.get_conn()
-    rows = conn.execute("""
-        SELECT event_id, year, bet_type,
-               p1_name, p2_name,
-               p1_open, p1_close, p2_open, p2_close,
-               p1_outcome_text, p2_outcome_text
-        FROM historical_matchup_odds
-        WHERE p1_open IS NOT NULL AND p1_close IS NOT NULL
-          AND p2_open IS NOT NULL AND p2_close IS NOT NULL
-    """).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute("""
+            SELECT event_id, year, bet_type,
+                   p1_name, p2_name,
+                   p1_open, p1_close, p2_open, p2_close,
+                   p1_outcome_text, p2_outcome_text
+            FROM historical_matchup_odds
+            WHERE p1_open IS NOT NULL AND p1_close IS NOT NULL
+              AND p2_open IS NOT NULL AND p2_close IS NOT NULL
+        """).fetchall()
 
     total = 0
     positive_clv = 0
@@ -93,14 +92,13 @@ def compute_matchup_clv():
 
 def compute_placement_clv():
     """Compute CLV from historical outright odds (open vs close)."""
-    conn = db.get_conn()
-    rows = conn.execute("""
-        SELECT event_id, year, player_name, market,
-               open_line, close_line
-        FROM historical_odds
-        WHERE open_line IS NOT NULL AND close_line IS NOT NULL
-    """).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute("""
+            SELECT event_id, year, player_name, market,
+                   open_line, close_line
+            FROM historical_odds
+            WHERE open_line IS NOT NULL AND close_line IS NOT NULL
+        """).fetchall()
 
     total = 0
     clv_values = []
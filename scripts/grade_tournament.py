@@ -126,27 +126,23 @@ def resolve_tournament(event_name: str = None, event_id: str = None, year: int =
     if year is None:
         year = datetime.now().year
 
-    conn = db.get_conn()
-
-    if event_id:
-        row = conn.execute(
-            "SELECT id, name, event_id, year FROM tournaments WHERE event_id = ? AND year = ?",
-            (str(event_id), year),
-        ).fetchone()
-        if row:
-            conn.close()
-            return dict(row)
-
-    if event_name:
-        row = conn.execute(
-            "SELECT id, name, event_id, year FROM tournaments WHERE name LIKE ? AND year = ?",
-            (f"%{event_name}%", year),
-        ).fetchone()
-        if row:
-            conn.close()
-            return dict(row)
-
-    conn.close()
+    with db.connection() as conn:
+        if event_id:
+            row = conn.execute(
+                "SELECT id, name, event_id, year FROM tournaments WHERE event_id = ? AND year = ?",
+                (str(event_id), year),
+            ).fetchone()
+            if row:
+                return dict(row)
+
+        if event_name:
+            row = conn.execute(
+                "SELECT id, name, event_id, year FROM tournaments WHERE name LIKE ? AND year = ?",
+                (f"%{event_name}%", year),
+            ).fetchone()
+            if row:
+                return dict(row)
+
     return None
 
 
@@ -301,17 +297,16 @@ def grade_tournament(
         print(f"  Removed {dedupe_result['removed']} duplicate pick row(s); kept {dedupe_result['kept']}")
 
     # Clear unlocked outcomes so scoring reflects deduped pick rows.
-    conn = db.get_conn()
-    conn.execute(
-        """
-        DELETE FROM pick_outcomes
-        WHERE COALESCE(outcome_locked, 0) = 0
-          AND pick_id IN (SELECT id FROM picks WHERE tournament_id = ?)
-        """,
-        (tournament_id,),
-    )
-    conn.commit()
-    conn.close()
+    with db.connection() as conn:
+        conn.execute(
+            """
+            DELETE FROM pick_outcomes
+            WHERE COALESCE(outcome_locked, 0) = 0
+              AND pick_id IN (SELECT id FROM picks WHERE tournament_id = ?)
+            """,
+            (tournament_id,),
+        )
+        conn.commit()
 
     # 6. Score picks (respect locked outcomes unless force_audit)
     print("  Scoring picks...")
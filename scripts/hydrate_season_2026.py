@@ -118,15 +118,14 @@ def hydrate_event(
         stats["lab_candidates"] = len([r for r in lab_rows if (r.get("ev") or 0) > 0])
         return stats
 
-    conn = db.get_conn()
-    tid = tournament_id or _ensure_tournament(
-        conn,
-        name=name,
-        event_id=event_id,
-        year=year,
-        course=course,
-    )
-    conn.close()
+    with db.connection() as conn:
+        tid = tournament_id or _ensure_tournament(
+            conn,
+            name=name,
+            event_id=event_id,
+            year=year,
+            course=course,
+        )
 
     stats["dashboard_backfilled"] = backfill_completed_market_rows_into_picks(
         event_id,
@@ -168,9 +167,8 @@ def main() -> int:
 
     db.ensure_initialized()
     dry_run = not args.apply
-    conn = db.get_conn()
-    events = _events_with_inventory(conn, args.year)
-    conn.close()
+    with db.connection() as conn:
+        events = _events_with_inventory(conn, args.year)
 
     if args.event_ids:
         allowed = {str(eid) for eid in args.event_ids}
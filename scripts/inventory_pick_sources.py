@@ -31,55 +31,53 @@ def _count_table(conn, table: str, where: str = "", params: tuple = ()) -> int:
 
 def build_manifest() -> dict:
     db.ensure_initialized()
-    conn = db.get_conn()
-
-    track = {}
-    if TRACK_RECORD.is_file():
-        with open(TRACK_RECORD, encoding="utf-8") as f:
-            track = json.load(f)
-
-    events: list[dict] = []
-    for ev in track.get("events") or []:
-        name = str(ev.get("name") or "")
-        picks = ev.get("picks") or []
-        tier = "A_authoritative" if picks else "A_rollup_only"
-        events.append({
-            "name": name,
-            "authority_tier": tier,
-            "trackRecord_picks": len(picks),
-            "trackRecord_record": ev.get("record"),
-            "profit_units": ev.get("profit_units"),
-            "picks_detail_missing": len(picks) == 0,
-        })
-
-    manifest = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "tables": {
-            "picks": _count_table(conn, "picks"),
-            "pick_outcomes": _count_table(conn, "pick_outcomes"),
-            "pick_ledger": _count_table(conn, "pick_ledger"),
-            "market_prediction_rows": _count_table(conn, "market_prediction_rows"),
-            "live_snapshot_history": _count_table(conn, "live_snapshot_history"),
-            "pre_teeoff_frozen": _count_table(conn, "pre_teeoff_frozen"),
-        },
-        "trackRecord_headline": track.get("headline"),
-        "events": events,
-    }
+    with db.connection() as conn:
+        track = {}
+        if TRACK_RECORD.is_file():
+            with open(TRACK_RECORD, encoding="utf-8") as f:
+                track = json.load(f)
+
+        events: list[dict] = []
+        for ev in track.get("events") or []:
+            name = str(ev.get("name") or "")
+            picks = ev.get("picks") or []
+            tier = "A_authoritative" if picks else "A_rollup_only"
+            events.append({
+                "name": name,
+                "authority_tier": tier,
+                "trackRecord_picks": len(picks),
+                "trackRecord_record": ev.get("record"),
+                "profit_units": ev.get("profit_units"),
+                "picks_detail_missing": len(picks) == 0,
+            })
+
+        manifest = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "tables": {
+                "picks": _count_table(conn, "picks"),
+                "pick_outcomes": _count_table(conn, "pick_outcomes"),
+                "pick_ledger": _count_table(conn, "pick_ledger"),
+                "market_prediction_rows": _count_table(conn, "market_prediction_rows"),
+                "live_snapshot_history": _count_table(conn, "live_snapshot_history"),
+                "pre_teeoff_frozen": _count_table(conn, "pre_teeoff_frozen"),
+            },
+            "trackRecord_headline": track.get("headline"),
+            "events": events,
+        }
+
+        try:
+            rows = conn.execute(
+                """
+                SELECT event_id, COUNT(*) AS c, MIN(generated_at) AS first_at, MAX(generated_at) AS last_at
+                FROM market_prediction_rows
+                GROUP BY event_id
+                ORDER BY last_at DESC
+                """
+            ).fetchall()
+            manifest["market_prediction_rows_by_event"] = [dict(r) for r in rows]
+        except Exception:
+            manifest["market_prediction_rows_by_event"] = []
 
-    try:
-        rows = conn.execute(
-            """
-            SELECT event_id, COUNT(*) AS c, MIN(generated_at) AS first_at, MAX(generated_at) AS last_at
-            FROM market_prediction_rows
-            GROUP BY event_id
-            ORDER BY last_at DESC
-            """
-        ).fetchall()
-        manifest["market_prediction_rows_by_event"] = [dict(r) for r in rows]
-    except Exception:
-        manifest["market_prediction_rows_by_event"] = []
-
-    conn.close()
     return manifest
 
 
@@ -90,31 +90,30 @@ def main() -> int:
         pass
 
     db.ensure_initialized()
-    conn = db.get_conn()
-    if args.all:
-        rows = conn.execute(
-            """
-            SELECT DISTINCT event_id, event_name
-            FROM rounds
-            WHERE year = ? AND event_id IS NOT NULL AND TRIM(event_id) != ''
-            ORDER BY event_name
-            """,
-            (args.year,),
-        ).fetchall()
-    else:
-        event_ids = args.event_ids or ["32"]
-        placeholders = ",".join("?" for _ in event_ids)
-        rows = conn.execute(
-            f"""
-            SELECT DISTINCT event_id, event_name
-            FROM rounds
-            WHERE year = ? AND event_id IN ({placeholders})
-            """,
-            (args.year, *event_ids),
-        ).fetchall()
-
-    report = [reconcile_event(conn, event_id=str(row["event_id"]), year=args.year, name=str(row["event_name"])) for row in rows]
-    conn.close()
+    with db.connection() as conn:
+        if args.all:
+            rows = conn.execute(
+                """
+                SELECT DISTINCT event_id, event_name
+                FROM rounds
+                WHERE year = ? AND event_id IS NOT NULL AND TRIM(event_id) != ''
+                ORDER BY event_name
+                """,
+                (args.year,),
+            ).fetchall()
+        else:
+            event_ids = args.event_ids or ["32"]
+            placeholders = ",".join("?" for _ in event_ids)
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT event_id, event_name
+                FROM rounds
+                WHERE year = ? AND event_id IN ({placeholders})
+                """,
+                (args.year, *event_ids),
+            ).fetchall()
+
+        report = [reconcile_event(conn, event_id=str(row["event_id"]), year=args.year, name=str(row["event_name"])) for row in rows]
     print(json.dumps(report, indent=2))
     failures = [row for row in report if not row["ok"] and row["tournament_id"]]
     return 1 if failures else 0
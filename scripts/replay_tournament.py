@@ -29,32 +29,31 @@ def main() -> int:
         db.DB_PATH = args.db_path
     db.ensure_initialized()
 
-    conn = db.get_conn()
-    t = conn.execute(
-        "SELECT id, name, year, date FROM tournaments WHERE id = ?",
-        (args.tournament_id,),
-    ).fetchone()
-    if not t:
-        print(f"Tournament id={args.tournament_id} not found", file=sys.stderr)
-        return 2
-
-    picks = conn.execute(
-        """
-        SELECT bet_type, player_key, opponent_key, model_prob, ev, market_odds, source
-        FROM picks WHERE tournament_id = ?
-        ORDER BY bet_type, player_key
-        """,
-        (args.tournament_id,),
-    ).fetchall()
-    preds = conn.execute(
-        """
-        SELECT bet_type, player_key, model_prob, market_implied_prob, odds_timing
-        FROM prediction_log WHERE tournament_id = ?
-        ORDER BY bet_type, player_key
-        """,
-        (args.tournament_id,),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        t = conn.execute(
+            "SELECT id, name, year, date FROM tournaments WHERE id = ?",
+            (args.tournament_id,),
+        ).fetchone()
+        if not t:
+            print(f"Tournament id={args.tournament_id} not found", file=sys.stderr)
+            return 2
+
+        picks = conn.execute(
+            """
+            SELECT bet_type, player_key, opponent_key, model_prob, ev, market_odds, source
+            FROM picks WHERE tournament_id = ?
+            ORDER BY bet_type, player_key
+            """,
+            (args.tournament_id,),
+        ).fetchall()
+        preds = conn.execute(
+            """
+            SELECT bet_type, player_key, model_prob, market_implied_prob, odds_timing
+            FROM prediction_log WHERE tournament_id = ?
+            ORDER BY bet_type, player_key
+            """,
+            (args.tournament_id,),
+        ).fetchall()
 
     lines = [
         f"# Replay report: {t['name']} ({t['year']})",
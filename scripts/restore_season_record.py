@@ -73,115 +73,112 @@ def import_track_record(*, dry_run: bool = True) -> dict:
 
     source_hash = _file_hash(TRACK_RECORD)
     stats = {"events": 0, "picks_imported": 0, "skipped": 0, "errors": []}
-    conn = db.get_conn()
-
-    for event in data.get("events") or []:
-        picks = event.get("picks") or []
-        if not picks:
-            continue
-        name = str(event.get("name") or "")
-        event_id = _resolve_event_id(conn, name)
-        if not event_id:
-            stats["errors"].append({"event": name, "error": "unresolved_event_id"})
-            continue
-        tid = _ensure_tournament(
-            conn,
-            name=name,
-            event_id=event_id,
-            year=2026,
-            course=event.get("course"),
-        )
-        stats["events"] += 1
-
-        for p in picks:
-            player_key = normalize_name(str(p.get("pick") or ""))
-            opponent_key = normalize_name(str(p.get("opponent") or ""))
-            odds = normalize_american_odds(p.get("odds"))
-            pick_key = compute_pick_key(
+    with db.connection() as conn:
+        for event in data.get("events") or []:
+            picks = event.get("picks") or []
+            if not picks:
+                continue
+            name = str(event.get("name") or "")
+            event_id = _resolve_event_id(conn, name)
+            if not event_id:
+                stats["errors"].append({"event": name, "error": "unresolved_event_id"})
+                continue
+            tid = _ensure_tournament(
+                conn,
+                name=name,
                 event_id=event_id,
-                lane="cockpit",
-                section="upcoming",
-                phase="pre_tournament",
-                bet_type="matchup",
-                player_key=player_key,
-                opponent_key=opponent_key,
-                book="",
-                odds=odds,
-                snapshot_id=SNAPSHOT_ID,
+                year=2026,
+                course=event.get("course"),
             )
-            pick_row = {
-                "tournament_id": tid,
-                "model_variant": "baseline",
-                "source": "cockpit",
-                "bet_type": "matchup",
-                "player_key": player_key,
-                "player_display": str(p.get("pick") or ""),
-                "opponent_key": opponent_key,
-                "opponent_display": str(p.get("opponent") or ""),
-                "market_odds": odds,
-                "market_book": "",
-                "ev": 0.01,
-                "reasoning": f"recovered_from:trackRecord.json;hash={source_hash}",
-            }
-            ledger_row = {
-                "pick_key": pick_key,
-                "event_id": event_id,
-                "event_name": name,
-                "tournament_id": tid,
-                "year": 2026,
-                "phase": "pre_tournament",
-                "section": "upcoming",
-                "lane": "cockpit",
-                "lifecycle": "recovered",
-                "bet_type": "matchup",
-                "market_family": "matchup",
-                "market_type": "matchup",
-                "player_key": player_key,
-                "player_display": pick_row["player_display"],
-                "opponent_key": opponent_key,
-                "opponent_display": pick_row["opponent_display"],
-                "book": "",
-                "odds": odds,
-                "model_prob": None,
-                "implied_prob": None,
-                "ev": 0.01,
-                "is_value": 1,
-                "model_variant": "baseline",
-                "model_config_hash": None,
-                "snapshot_id": SNAPSHOT_ID,
-                "generated_at": "2026-01-01T00:00:00+00:00",
-                "source_origin": "restore",
-                "payload_json": json.dumps(p),
-            }
-            if dry_run:
+            stats["events"] += 1
+
+            for p in picks:
+                player_key = normalize_name(str(p.get("pick") or ""))
+                opponent_key = normalize_name(str(p.get("opponent") or ""))
+                odds = normalize_american_odds(p.get("odds"))
+                pick_key = compute_pick_key(
+                    event_id=event_id,
+                    lane="cockpit",
+                    section="upcoming",
+                    phase="pre_tournament",
+                    bet_type="matchup",
+                    player_key=player_key,
+                    opponent_key=opponent_key,
+                    book="",
+                    odds=odds,
+                    snapshot_id=SNAPSHOT_ID,
+                )
+                pick_row = {
+                    "tournament_id": tid,
+                    "model_variant": "baseline",
+                    "source": "cockpit",
+                    "bet_type": "matchup",
+                    "player_key": player_key,
+                    "player_display": str(p.get("pick") or ""),
+                    "opponent_key": opponent_key,
+                    "opponent_display": str(p.get("opponent") or ""),
+                    "market_odds": odds,
+                    "market_book": "",
+                    "ev": 0.01,
+                    "reasoning": f"recovered_from:trackRecord.json;hash={source_hash}",
+                }
+                ledger_row = {
+                    "pick_key": pick_key,
+                    "event_id": event_id,
+                    "event_name": name,
+                    "tournament_id": tid,
+                    "year": 2026,
+                    "phase": "pre_tournament",
+                    "section": "upcoming",
+                    "lane": "cockpit",
+                    "lifecycle": "recovered",
+                    "bet_type": "matchup",
+                    "market_family": "matchup",
+                    "market_type": "matchup",
+                    "player_key": player_key,
+                    "player_display": pick_row["player_display"],
+                    "opponent_key": opponent_key,
+                    "opponent_display": pick_row["opponent_display"],
+                    "book": "",
+                    "odds": odds,
+                    "model_prob": None,
+                    "implied_prob": None,
+                    "ev": 0.01,
+                    "is_value": 1,
+                    "model_variant": "baseline",
+                    "model_config_hash": None,
+                    "snapshot_id": SNAPSHOT_ID,
+                    "generated_at": "2026-01-01T00:00:00+00:00",
+                    "source_origin": "restore",
+                    "payload_json": json.dumps(p),
+                }
+                if dry_run:
+                    stats["picks_imported"] += 1
+                    continue
+                insert_authoritative_pick_outcome(
+                    tournament_id=tid,
+                    pick_row=pick_row,
+                    ledger_row=ledger_row,
+                    result=str(p.get("result") or ""),
+                    profit=float(p.get("pl") or 0),
+                    grading_authority="trackRecord_json",
+                    notes=f"recovered_from:trackRecord.json;hash={source_hash}",
+                )
                 stats["picks_imported"] += 1
-                continue
-            insert_authoritative_pick_outcome(
-                tournament_id=tid,
-                pick_row=pick_row,
-                ledger_row=ledger_row,
-                result=str(p.get("result") or ""),
-                profit=float(p.get("pl") or 0),
-                grading_authority="trackRecord_json",
-                notes=f"recovered_from:trackRecord.json;hash={source_hash}",
-            )
-            stats["picks_imported"] += 1
 
-    conn.close()
     return stats
 
 
 def import_market_ticks(*, dry_run: bool = True, limit: int = 10000) -> dict:
     """Tier B: import tick inventory into ledger only (no grading)."""
     db.ensure_initialized()
-    conn = db.get_conn()
-    event_ids = [
-        str(r["event_id"])
-        for r in conn.execute(
-            "SELECT DISTINCT event_id FROM market_prediction_rows WHERE event_id IS NOT NULL"
-        ).fetchall()
-    ]
-    conn.close()
+    with db.connection() as conn:
+        event_ids = [
+            str(r["event_id"])
+            for r in conn.execute(
+                "SELECT DISTINCT event_id FROM market_prediction_rows WHERE event_id IS NOT NULL"
+            ).fetchall()
+        ]
     total = 0
     for eid in event_ids:
         rows = db.get_completed_market_prediction_rows_for_event(eid, source="dashboard", limit=limit)
@@ -220,20 +217,19 @@ def main() -> int:
     if args.grade_unscored and args.apply:
         from scripts.grade_tournament import grade_tournament
 
-        conn = db.get_conn()
-        events = conn.execute(
-            """
-            SELECT DISTINCT t.event_id, t.year, t.id, t.name
-            FROM tournaments t
-            WHERE t.year = 2026 AND t.event_id IS NOT NULL
-              AND NOT EXISTS (
-                SELECT 1 FROM pick_outcomes po
-                JOIN picks p ON p.id = po.pick_id
-                WHERE p.tournament_id = t.id AND COALESCE(po.outcome_locked, 0) = 1
-              )
-            """
-        ).fetchall()
-        conn.close()
+        with db.connection() as conn:
+            events = conn.execute(
+                """
+                SELECT DISTINCT t.event_id, t.year, t.id, t.name
+                FROM tournaments t
+                WHERE t.year = 2026 AND t.event_id IS NOT NULL
+                  AND NOT EXISTS (
+                    SELECT 1 FROM pick_outcomes po
+                    JOIN picks p ON p.id = po.pick_id
+                    WHERE p.tournament_id = t.id AND COALESCE(po.outcome_locked, 0) = 1
+                  )
+                """
+            ).fetchall()
         for ev in events:
             print(f"Grading unscored event {ev['name']} ({ev['event_id']})")
             grade_tournament(
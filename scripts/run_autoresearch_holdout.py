@@ -33,20 +33,19 @@ def _now_iso() -> str:
 
 def _select_holdout_events(count: int) -> list[dict[str, Any]]:
     pilot = resolve_recent_signature_event()
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT event_id, year, event_name, start_date
-        FROM historical_event_info
-        WHERE event_id IS NOT NULL
-          AND start_date IS NOT NULL
-          AND NOT (event_id = ? AND year = ?)
-        ORDER BY start_date DESC, year DESC
-        LIMIT 20
-        """,
-        (pilot.event_id, pilot.year),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT event_id, year, event_name, start_date
+            FROM historical_event_info
+            WHERE event_id IS NOT NULL
+              AND start_date IS NOT NULL
+              AND NOT (event_id = ? AND year = ?)
+            ORDER BY start_date DESC, year DESC
+            LIMIT 20
+            """,
+            (pilot.event_id, pilot.year),
+        ).fetchall()
     selected = []
     for row in rows:
         if len(selected) >= count:
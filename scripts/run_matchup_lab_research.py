@@ -538,57 +538,56 @@ def _window_metadata(windows: dict[str, list[dict[str, Any]]]) -> dict[str, Any]
 
 
 def _run_pit_audit(windows: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
-    conn = db.get_conn()
-    event_rows: list[dict[str, Any]] = []
-    fail_count = 0
-    for window_name, events in windows.items():
-        for event in events:
-            event_id = str(event["event_id"])
-            year = int(event["year"])
-            event_date = str(event.get("event_date") or "")
-            has_leakage = False
-            leakage_error = None
-            try:
-                assert_checkpoint_temporal_integrity(event_id, year, event_date)
-            except Exception as exc:  # pragma: no cover - safety net
-                has_leakage = True
-                leakage_error = str(exc)
-                fail_count += 1
-
-            pit_stats = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS pit_players,
-                    SUM(
-                        CASE
-                            WHEN rounds_used > (
-                                SELECT COUNT(*)
-                                FROM rounds r
-                                WHERE r.player_key = p.player_key
-                                  AND r.sg_total IS NOT NULL
-                                  AND r.event_completed < ?
-                            )
-                            THEN 1 ELSE 0
-                        END
-                    ) AS leakage_players
-                FROM pit_rolling_stats p
-                WHERE p.event_id = ? AND p.year = ?
-                """,
-                (event_date, event_id, year),
-            ).fetchone()
-            event_rows.append(
-                {
-                    "window": window_name,
-                    "event_id": event_id,
-                    "year": year,
-                    "event_date": event_date,
-                    "pit_players": int(pit_stats["pit_players"] or 0) if pit_stats else 0,
-                    "leakage_players": int(pit_stats["leakage_players"] or 0) if pit_stats else 0,
-                    "assert_checkpoint_temporal_integrity_passed": not has_leakage,
-                    "leakage_error": leakage_error,
-                }
-            )
-    conn.close()
+    with db.connection() as conn:
+        event_rows: list[dict[str, Any]] = []
+        fail_count = 0
+        for window_name, events in windows.items():
+            for event in events:
+                event_id = str(event["event_id"])
+                year = int(event["year"])
+                event_date = str(event.get("event_date") or "")
+                has_leakage = False
+                leakage_error = None
+                try:
+                    assert_checkpoint_temporal_integrity(event_id, year, event_date)
+                except Exception as exc:  # pragma: no cover - safety net
+                    has_leakage = True
+                    leakage_error = str(exc)
+                    fail_count += 1
+
+                pit_stats = conn.execute(
+                    """
+                    SELECT
+                        COUNT(*) AS pit_players,
+                        SUM(
+                            CASE
+                                WHEN rounds_used > (
+                                    SELECT COUNT(*)
+                                    FROM rounds r
+                                    WHERE r.player_key = p.player_key
+                                      AND r.sg_total IS NOT NULL
+                                      AND r.event_completed < ?
+                                )
+                                THEN 1 ELSE 0
+                            END
+                        ) AS leakage_players
+                    FROM pit_rolling_stats p
+                    WHERE p.event_id = ? AND p.year = ?
+                    """,
+                    (event_date, event_id, year),
+                ).fetchone()
+                event_rows.append(
+                    {
+                        "window": window_name,
+                        "event_id": event_id,
+                        "year": year,
+                        "event_date": event_date,
+                        "pit_players": int(pit_stats["pit_players"] or 0) if pit_stats else 0,
+                        "leakage_players": int(pit_stats["leakage_players"] or 0) if pit_stats else 0,
+                        "assert_checkpoint_temporal_integrity_passed": not has_leakage,
+                        "leakage_error": leakage_error,
+                    }
+                )
     return {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "window_contract": {
@@ -604,30 +603,29 @@ def _run_pit_audit(windows: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
 
 
 def _run_full_slate_coverage_audit(windows: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
-    conn = db.get_conn()
-    window_event_keys = {
-        (str(event["event_id"]), int(event["year"]))
-        for events in windows.values()
-        for event in events
-    }
-    source_rows = conn.execute(
-        """
-        SELECT
-            event_id,
-            year,
-            book,
-            bet_type AS market,
-            COUNT(*) AS matchup_rows,
-            SUM(CASE WHEN p1_close IS NULL AND p1_open IS NULL THEN 1 ELSE 0 END) AS missing_p1_odds,
-            SUM(CASE WHEN p2_close IS NULL AND p2_open IS NULL THEN 1 ELSE 0 END) AS missing_p2_odds,
-            SUM(CASE WHEN p1_outcome_text IS NULL OR TRIM(p1_outcome_text) = '' THEN 1 ELSE 0 END) AS missing_p1_outcome,
-            SUM(CASE WHEN p2_outcome_text IS NULL OR TRIM(p2_outcome_text) = '' THEN 1 ELSE 0 END) AS missing_p2_outcome
-        FROM historical_matchup_odds
-        GROUP BY event_id, year, book, market
-        ORDER BY year, event_id, book, market
-        """
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        window_event_keys = {
+            (str(event["event_id"]), int(event["year"]))
+            for events in windows.values()
+            for event in events
+        }
+        source_rows = conn.execute(
+            """
+            SELECT
+                event_id,
+                year,
+                book,
+                bet_type AS market,
+                COUNT(*) AS matchup_rows,
+                SUM(CASE WHEN p1_close IS NULL AND p1_open IS NULL THEN 1 ELSE 0 END) AS missing_p1_odds,
+                SUM(CASE WHEN p2_close IS NULL AND p2_open IS NULL THEN 1 ELSE 0 END) AS missing_p2_odds,
+                SUM(CASE WHEN p1_outcome_text IS NULL OR TRIM(p1_outcome_text) = '' THEN 1 ELSE 0 END) AS missing_p1_outcome,
+                SUM(CASE WHEN p2_outcome_text IS NULL OR TRIM(p2_outcome_text) = '' THEN 1 ELSE 0 END) AS missing_p2_outcome
+            FROM historical_matchup_odds
+            GROUP BY event_id, year, book, market
+            ORDER BY year, event_id, book, market
+            """
+        ).fetchall()
 
     baseline = _baseline_strategy()
     replay_rows = []
@@ -22,18 +22,17 @@ TOLERANCE = 0.01
 
 
 def _resolve_event_id(event_name: str, year: int = 2026) -> str | None:
-    conn = db.get_conn()
-    needle = event_name.strip().lower()
-    rows = conn.execute(
-        """
-        SELECT DISTINCT event_id, event_name FROM rounds
-        WHERE year = ? AND LOWER(event_name) LIKE ?
-        ORDER BY event_completed DESC
-        LIMIT 5
-        """,
-        (year, f"%{needle}%"),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        needle = event_name.strip().lower()
+        rows = conn.execute(
+            """
+            SELECT DISTINCT event_id, event_name FROM rounds
+            WHERE year = ? AND LOWER(event_name) LIKE ?
+            ORDER BY event_completed DESC
+            LIMIT 5
+            """,
+            (year, f"%{needle}%"),
+        ).fetchall()
     if not rows:
         return None
     if len(rows) == 1:
@@ -53,19 +52,18 @@ def _pick_identity(pick: str, opponent: str, odds: str) -> tuple[str, str, str]:
 
 
 def _db_picks_for_event(tournament_id: int) -> list[dict]:
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT p.player_display, p.opponent_display, p.player_key, p.opponent_key,
-               p.market_odds, po.hit, po.profit, po.grading_authority, po.outcome_locked
-        FROM picks p
-        LEFT JOIN pick_outcomes po ON po.pick_id = p.id
-        WHERE p.tournament_id = ? AND p.bet_type = 'matchup'
-        ORDER BY p.id ASC
-        """,
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT p.player_display, p.opponent_display, p.player_key, p.opponent_key,
+                   p.market_odds, po.hit, po.profit, po.grading_authority, po.outcome_locked
+            FROM picks p
+            LEFT JOIN pick_outcomes po ON po.pick_id = p.id
+            WHERE p.tournament_id = ? AND p.bet_type = 'matchup'
+            ORDER BY p.id ASC
+            """,
+            (tournament_id,),
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -106,12 +104,11 @@ def verify(baseline_path: Path) -> dict:
         if not event_id:
             mismatches.append({"event": name, "error": "event_id_not_resolved"})
             continue
-        conn = db.get_conn()
-        t_row = conn.execute(
-            "SELECT id FROM tournaments WHERE event_id = ? AND year = 2026",
-            (event_id,),
-        ).fetchone()
-        conn.close()
+        with db.connection() as conn:
+            t_row = conn.execute(
+                "SELECT id FROM tournaments WHERE event_id = ? AND year = 2026",
+                (event_id,),
+            ).fetchone()
         if not t_row:
             mismatches.append({"event": name, "error": "tournament_not_in_db", "event_id": event_id})
             continue
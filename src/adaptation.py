@@ -210,14 +210,13 @@ def get_adaptation_state(market_type: str, min_bets: int = 15) -> dict:
 def log_ai_adjustment(tournament_id: int, player_key: str,
                       adjustment_value: float, reasoning: str = None):
     """Log a single AI adjustment to the database."""
-    conn = db.get_conn()
-    conn.execute(
-        "INSERT INTO ai_adjustments (tournament_id, player_key, adjustment_value, reasoning) "
-        "VALUES (?, ?, ?, ?)",
-        (tournament_id, player_key, adjustment_value, reasoning),
-    )
-    conn.commit()
-    conn.close()
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT INTO ai_adjustments (tournament_id, player_key, adjustment_value, reasoning) "
+            "VALUES (?, ?, ?, ?)",
+            (tournament_id, player_key, adjustment_value, reasoning),
+        )
+        conn.commit()
 
 
 def evaluate_ai_adjustments(tournament_id: int) -> dict:
@@ -232,22 +231,19 @@ def evaluate_ai_adjustments(tournament_id: int) -> dict:
 
     Returns summary dict.
     """
-    conn = db.get_conn()
-
-    adjustments = conn.execute(
-        "SELECT * FROM ai_adjustments WHERE tournament_id = ?",
-        (tournament_id,),
-    ).fetchall()
+    with db.connection() as conn:
+        adjustments = conn.execute(
+            "SELECT * FROM ai_adjustments WHERE tournament_id = ?",
+            (tournament_id,),
+        ).fetchall()
 
-    if not adjustments:
-        conn.close()
-        return {"total": 0, "helpful": 0, "harmful": 0, "inconclusive": 0}
+        if not adjustments:
+            return {"total": 0, "helpful": 0, "harmful": 0, "inconclusive": 0}
 
-    results = conn.execute(
-        "SELECT player_key, finish_position FROM results WHERE tournament_id = ?",
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+        results = conn.execute(
+            "SELECT player_key, finish_position FROM results WHERE tournament_id = ?",
+            (tournament_id,),
+        ).fetchall()
 
     finish_map = {r["player_key"]: r["finish_position"] for r in results if r["player_key"]}
 
@@ -280,13 +276,12 @@ def evaluate_ai_adjustments(tournament_id: int) -> dict:
             inconclusive += 1
             was_helpful = None
 
-        conn2 = db.get_conn()
-        conn2.execute(
-            "UPDATE ai_adjustments SET was_helpful = ?, actual_delta = ? WHERE id = ?",
-            (was_helpful, finish, adj["id"]),
-        )
-        conn2.commit()
-        conn2.close()
+        with db.connection() as conn2:
+            conn2.execute(
+                "UPDATE ai_adjustments SET was_helpful = ?, actual_delta = ? WHERE id = ?",
+                (was_helpful, finish, adj["id"]),
+            )
+            conn2.commit()
 
     return {
         "total": len(adjustments),
@@ -306,20 +301,18 @@ def get_ai_adjustment_config() -> dict:
     - After 10+ tournaments AND 50+ adjustments with net_effect < 0: cap ±2
     - After 5 more tournaments still negative: disabled entirely
     """
-    conn = db.get_conn()
-
-    tournament_count = conn.execute(
-        "SELECT COUNT(DISTINCT tournament_id) as cnt FROM ai_adjustments"
-    ).fetchone()
-    total_tournaments = tournament_count["cnt"] if tournament_count else 0
-
-    stats = conn.execute(
-        "SELECT COUNT(*) as total, "
-        "SUM(CASE WHEN was_helpful = 1 THEN 1 ELSE 0 END) as helpful, "
-        "SUM(CASE WHEN was_helpful = 0 THEN 1 ELSE 0 END) as harmful "
-        "FROM ai_adjustments WHERE was_helpful IS NOT NULL"
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        tournament_count = conn.execute(
+            "SELECT COUNT(DISTINCT tournament_id) as cnt FROM ai_adjustments"
+        ).fetchone()
+        total_tournaments = tournament_count["cnt"] if tournament_count else 0
+
+        stats = conn.execute(
+            "SELECT COUNT(*) as total, "
+            "SUM(CASE WHEN was_helpful = 1 THEN 1 ELSE 0 END) as helpful, "
+            "SUM(CASE WHEN was_helpful = 0 THEN 1 ELSE 0 END) as harmful "
+            "FROM ai_adjustments WHERE was_helpful IS NOT NULL"
+        ).fetchone()
 
     total = stats["total"] if stats and stats["total"] else 0
     helpful_count = stats["helpful"] if stats and stats["helpful"] else 0
@@ -731,25 +731,27 @@ Review this tournament's results against your predictions and decisions.
 
     result = _call_ai(SYSTEM_PROMPT, user_prompt, POST_REVIEW_SCHEMA)
 
-    db.store_ai_decision(
-        tournament_id, "post_review",
-        f"Tournament: {tournament_name}, Scoring: {scoring_ctx[:200]}",
-        json.dumps(result),
-    )
+    # The review and its learnings land in one commit.
+    with db.transaction():
+        db.store_ai_decision(
+            tournament_id, "post_review",
+            f"Tournament: {tournament_name}, Scoring: {scoring_ctx[:200]}",
+            json.dumps(result),
+        )
 
-    # Store learnings in persistent memory
-    for learning in result.get("learnings", []):
-        topic = learning.get("topic", "general")
-        insight = learning.get("insight", "")
-        confidence = learning.get("confidence", 0.5)
-        if insight:
-            db.store_ai_memory(
-                topic=topic,
-                insight=insight,
-                source_tournament_id=tournament_id,
-                confidence=confidence,
-                expires_days=180,
-            )
+        # Store learnings in persistent memory
+        for learning in result.get("learnings", []):
+            topic = learning.get("topic", "general")
+            insight = learning.get("insight", "")
+            confidence = learning.get("confidence", 0.5)
+            if insight:
+                db.store_ai_memory(
+                    topic=topic,
+                    insight=insight,
+                    source_tournament_id=tournament_id,
+                    confidence=confidence,
+                    expires_days=180,
+                )
 
     return result
 
@@ -762,14 +764,13 @@ def _check_ai_adjustment_hit_rate() -> float | None:
     """Check historical AI adjustment accuracy. Returns hit rate or None if insufficient data."""
     try:
         from src import db
-        conn = db.get_conn()
-        rows = conn.execute("""
-            SELECT COUNT(*) as total,
-                   SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as hits
-            FROM ai_adjustment_log
-            WHERE correct IS NOT NULL
-        """).fetchone()
-        conn.close()
+        with db.connection() as conn:
+            rows = conn.execute("""
+                SELECT COUNT(*) as total,
+                       SUM(CASE WHEN correct = 1 THEN 1 ELSE 0 END) as hits
+                FROM ai_adjustment_log
+                WHERE correct IS NOT NULL
+            """).fetchone()
         total = rows[0] if rows else 0
         if total < 10:
             return None
@@ -882,19 +883,19 @@ def get_ai_status() -> dict:
     """Return status of AI brain configuration and hit rate (watches/fades)."""
     provider = _get_provider()
     available = is_ai_available()
-    memory_count = len(db.get_ai_memories(limit=9999))
+    memory_count = min(db.count_ai_memories(), 9999)
     topics = db.get_all_ai_memory_topics()
 
     # Hit rate: watches (positive adj) and fades (negative adj), correct = was_helpful=1
-    conn = db.get_conn()
-    rows = conn.execute(
-        "SELECT adjustment_value, was_helpful FROM ai_adjustments WHERE was_helpful IS NOT NULL"
-    ).fetchall()
-    conn.close()
-    watches_ok = sum(1 for r in rows if r["adjustment_value"] and r["adjustment_value"] > 0 and r["was_helpful"] == 1)
-    watches_total = sum(1 for r in rows if r["adjustment_value"] and r["adjustment_value"] > 0)
-    fades_ok = sum(1 for r in rows if r["adjustment_value"] and r["adjustment_value"] < 0 and r["was_helpful"] == 1)
-    fades_total = sum(1 for r in rows if r["adjustment_value"] and r["adjustment_value"] < 0)
+    with db.read_connection() as conn:
+        row = conn.execute(
+            """SELECT COALESCE(SUM(adjustment_value > 0 AND was_helpful = 1), 0),
+                      COALESCE(SUM(adjustment_value > 0), 0),
+                      COALESCE(SUM(adjustment_value < 0 AND was_helpful = 1), 0),
+                      COALESCE(SUM(adjustment_value < 0), 0)
+               FROM ai_adjustments WHERE was_helpful IS NOT NULL"""
+        ).fetchone()
+    watches_ok, watches_total, fades_ok, fades_total = row
 
     return {
         "provider": provider,
@@ -309,6 +309,8 @@ def restore_backup(backup_path: str) -> bool:
         return False
 
     db_path = _current_db_path()
+    # Pooled connections would keep reading the pre-restore file's pages.
+    db.close_all_connections()
     if os.path.exists(db_path):
         pre_restore = db_path + ".pre_restore"
         shutil.copy2(db_path, pre_restore)
@@ -45,12 +45,11 @@ def update_calibration_curve() -> dict[str, Any]:
     Writes a global curve (``bet_type`` empty string) plus one curve per
     distinct non-empty ``bet_type`` present in the log.
     """
-    conn = db.get_conn()
-    rows = conn.execute(
-        "SELECT model_prob, actual_outcome, bet_type FROM prediction_log "
-        "WHERE model_prob IS NOT NULL AND actual_outcome IS NOT NULL"
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            "SELECT model_prob, actual_outcome, bet_type FROM prediction_log "
+            "WHERE model_prob IS NOT NULL AND actual_outcome IS NOT NULL"
+        ).fetchall()
 
     if not rows:
         return {}
@@ -69,47 +68,46 @@ def update_calibration_curve() -> dict[str, Any]:
 
     for bet_type_key, segment in segments:
         type_results: dict[str, Any] = {}
-        conn = db.get_conn()
-        conn.execute("DELETE FROM calibration_curve WHERE bet_type = ?", (bet_type_key,))
-        for low, high, label in PROBABILITY_BUCKETS:
-            in_bucket = [r for r in segment if low <= r["model_prob"] < high]
-            if not in_bucket:
-                continue
-
-            predicted_avg = sum(r["model_prob"] for r in in_bucket) / len(in_bucket)
-            actual_rate = sum(r["actual_outcome"] for r in in_bucket) / len(in_bucket)
-            sample_size = len(in_bucket)
-
-            if predicted_avg > 0:
-                correction_factor = actual_rate / predicted_avg
-            else:
-                correction_factor = 1.0
-
-            type_results[label] = {
-                "predicted_avg": round(predicted_avg, 6),
-                "actual_hit_rate": round(actual_rate, 6),
-                "sample_size": sample_size,
-                "correction_factor": round(correction_factor, 4),
-            }
-
-            conn.execute(
-                """
-                INSERT INTO calibration_curve
-                    (bet_type, probability_bucket, predicted_avg, actual_hit_rate,
-                     sample_size, correction_factor)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    bet_type_key,
-                    label,
-                    predicted_avg,
-                    actual_rate,
-                    sample_size,
-                    correction_factor,
-                ),
-            )
-        conn.commit()
-        conn.close()
+        with db.connection() as conn:
+            conn.execute("DELETE FROM calibration_curve WHERE bet_type = ?", (bet_type_key,))
+            for low, high, label in PROBABILITY_BUCKETS:
+                in_bucket = [r for r in segment if low <= r["model_prob"] < high]
+                if not in_bucket:
+                    continue
+
+                predicted_avg = sum(r["model_prob"] for r in in_bucket) / len(in_bucket)
+                actual_rate = sum(r["actual_outcome"] for r in in_bucket) / len(in_bucket)
+                sample_size = len(in_bucket)
+
+                if predicted_avg > 0:
+                    correction_factor = actual_rate / predicted_avg
+                else:
+                    correction_factor = 1.0
+
+                type_results[label] = {
+                    "predicted_avg": round(predicted_avg, 6),
+                    "actual_hit_rate": round(actual_rate, 6),
+                    "sample_size": sample_size,
+                    "correction_factor": round(correction_factor, 4),
+                }
+
+                conn.execute(
+                    """
+                    INSERT INTO calibration_curve
+                        (bet_type, probability_bucket, predicted_avg, actual_hit_rate,
+                         sample_size, correction_factor)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        bet_type_key,
+                        label,
+                        predicted_avg,
+                        actual_rate,
+                        sample_size,
+                        correction_factor,
+                    ),
+                )
+            conn.commit()
         all_results[bet_type_key or "global"] = type_results
 
     return all_results
@@ -157,16 +155,15 @@ def get_calibration_correction(probability: float, bet_type: str | None = None)
 
 def fetch_calibration_curves_grouped() -> dict[str, Any]:
     """Return all calibration_curve rows grouped by ``bet_type`` for APIs."""
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT bet_type, probability_bucket, predicted_avg, actual_hit_rate,
-               sample_size, correction_factor, updated_at
-        FROM calibration_curve
-        ORDER BY bet_type, probability_bucket
-        """
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT bet_type, probability_bucket, predicted_avg, actual_hit_rate,
+                   sample_size, correction_factor, updated_at
+            FROM calibration_curve
+            ORDER BY bet_type, probability_bucket
+            """
+        ).fetchall()
 
     by_market: dict[str, list[dict[str, Any]]] = {}
     for r in rows:
@@ -169,11 +169,10 @@ def generate_card(tournament_name: str,
     lines.append("")
 
     try:
-        conn = db.get_conn()
-        matchup_preds = conn.execute(
-            "SELECT actual_outcome, profit FROM prediction_log WHERE bet_type = 'matchup' AND actual_outcome IS NOT NULL"
-        ).fetchall()
-        conn.close()
+        with db.connection() as conn:
+            matchup_preds = conn.execute(
+                "SELECT actual_outcome, profit FROM prediction_log WHERE bet_type = 'matchup' AND actual_outcome IS NOT NULL"
+            ).fetchall()
         if matchup_preds:
             wins = sum(1 for p in matchup_preds if (p["actual_outcome"] or 0) == 1)
             losses = sum(1 for p in matchup_preds if (p["actual_outcome"] or 0) == 0)
@@ -479,112 +479,111 @@ def import_cards_from_dirs(
     dry_run: bool = True,
 ) -> ImportManifest:
     db.ensure_initialized()
-    conn = db.get_conn()
-    manifest = ImportManifest(year=year)
-    candidates = discover_card_candidates(search_dirs)
+    with db.connection() as conn:
+        manifest = ImportManifest(year=year)
+        candidates = discover_card_candidates(search_dirs)
 
-    by_event: dict[str, list[CardCandidate]] = {}
-    for candidate in candidates:
-        try:
-            if candidate.kind == "betting_card":
-                text = candidate.path.read_text(encoding="utf-8")
-                event_name = extract_event_name_from_card(text)
-            else:
-                event_name = candidate.path.stem.replace("_provenance", "").replace("_", " ")
-            resolved = resolve_event_id(conn, event_name, year)
-            if not resolved:
-                manifest.errors.append(f"unresolved_event: {candidate.path} ({event_name})")
-                continue
-            event_id = str(resolved["event_id"])
-            candidate.event_name_hint = str(resolved.get("event_name") or event_name)
-            by_event.setdefault(event_id, []).append(candidate)
-        except OSError as exc:
-            manifest.errors.append(f"read_error: {candidate.path}: {exc}")
-
-    for event_id, event_candidates in by_event.items():
-        event_name = event_candidates[0].event_name_hint
-        schedule_row = conn.execute(
-            """
-            SELECT MIN(event_completed) AS round1
-            FROM rounds WHERE event_id = ? AND year = ?
-            """,
-            (event_id, year),
-        ).fetchone()
-        round1_thursday = None
-        if schedule_row and schedule_row["round1"]:
+        by_event: dict[str, list[CardCandidate]] = {}
+        for candidate in candidates:
             try:
-                round1_thursday = datetime.strptime(str(schedule_row["round1"])[:10], "%Y-%m-%d").date()
-            except ValueError:
-                round1_thursday = None
-
-        dashboard_cards = [c for c in event_candidates if c.lane == "dashboard"]
-        lab_cards = [c for c in event_candidates if c.lane == "lab"]
-        lane_results: dict[str, Any] = {}
-
-        for lane_name, lane_candidates in (("dashboard", dashboard_cards), ("lab", lab_cards)):
-            if not lane_candidates:
-                continue
-            chosen, rejected = select_canonical_card(
-                lane_candidates,
-                event_name=event_name,
-                round1_thursday=round1_thursday,
-            )
-            if not chosen:
-                continue
-            if chosen.kind == "provenance":
-                parsed = parse_provenance_json(chosen.path)
-            else:
-                parsed = parse_card_file(chosen.path)
-            if not parsed:
-                prov_cards = [c for c in lane_candidates if c.kind == "provenance" and c.path != chosen.path]
-                if prov_cards:
-                    fallback, extra_rejected = select_canonical_card(
-                        prov_cards,
-                        event_name=event_name,
-                        round1_thursday=round1_thursday,
-                    )
-                    if fallback:
-                        rejected.extend(extra_rejected)
-                        chosen = fallback
-                        parsed = parse_provenance_json(chosen.path)
-            parsed = [pick for pick in parsed if pick.market_odds]
-            positive = [pick for pick in parsed if (pick.ev or 0) > 0]
-            pick_source = "lab_sandbox" if lane_name == "lab" else "cockpit"
-            model_variant = "v5" if lane_name == "lab" else "baseline"
-            tournament_id = _ensure_tournament(conn, name=event_name, event_id=event_id, year=year)
-            locked = _has_locked_outcomes(conn, tournament_id)
-            pick_rows = parsed_to_pick_rows(
-                positive,
-                tournament_id=tournament_id,
-                source=pick_source,
-                model_variant=model_variant,
-                card_path=chosen.path,
-            )
-            pick_rows = dedupe_grading_picks(pick_rows)
-            inserted = 0
-            if not dry_run and positive and not locked:
-                db.store_picks(pick_rows)
-                inserted = len(pick_rows)
-            else:
-                inserted = len(pick_rows)
-
-            lane_results[lane_name] = {
-                "canonical_card": str(chosen.path),
-                "rejected": [str(card.path) for card in rejected],
-                "parsed_matchups": len(parsed),
-                "positive_ev": len(positive),
-                "would_insert": inserted,
-                "skipped_locked": locked,
-            }
-
-        if lane_results:
-            manifest.events.append(
-                {
-                    "event_id": event_id,
-                    "name": event_name,
-                    "lanes": lane_results,
+                if candidate.kind == "betting_card":
+                    text = candidate.path.read_text(encoding="utf-8")
+                    event_name = extract_event_name_from_card(text)
+                else:
+                    event_name = candidate.path.stem.replace("_provenance", "").replace("_", " ")
+                resolved = resolve_event_id(conn, event_name, year)
+                if not resolved:
+                    manifest.errors.append(f"unresolved_event: {candidate.path} ({event_name})")
+                    continue
+                event_id = str(resolved["event_id"])
+                candidate.event_name_hint = str(resolved.get("event_name") or event_name)
+                by_event.setdefault(event_id, []).append(candidate)
+            except OSError as exc:
+                manifest.errors.append(f"read_error: {candidate.path}: {exc}")
+
+        for event_id, event_candidates in by_event.items():
+            event_name = event_candidates[0].event_name_hint
+            schedule_row = conn.execute(
+                """
+                SELECT MIN(event_completed) AS round1
+                FROM rounds WHERE event_id = ? AND year = ?
+                """,
+                (event_id, year),
+            ).fetchone()
+            round1_thursday = None
+            if schedule_row and schedule_row["round1"]:
+                try:
+                    round1_thursday = datetime.strptime(str(schedule_row["round1"])[:10], "%Y-%m-%d").date()
+                except ValueError:
+                    round1_thursday = None
+
+            dashboard_cards = [c for c in event_candidates if c.lane == "dashboard"]
+            lab_cards = [c for c in event_candidates if c.lane == "lab"]
+            lane_results: dict[str, Any] = {}
+
+            for lane_name, lane_candidates in (("dashboard", dashboard_cards), ("lab", lab_cards)):
+                if not lane_candidates:
+                    continue
+                chosen, rejected = select_canonical_card(
+                    lane_candidates,
+                    event_name=event_name,
+                    round1_thursday=round1_thursday,
+                )
+                if not chosen:
+                    continue
+                if chosen.kind == "provenance":
+                    parsed = parse_provenance_json(chosen.path)
+                else:
+                    parsed = parse_card_file(chosen.path)
+                if not parsed:
+                    prov_cards = [c for c in lane_candidates if c.kind == "provenance" and c.path != chosen.path]
+                    if prov_cards:
+                        fallback, extra_rejected = select_canonical_card(
+                            prov_cards,
+                            event_name=event_name,
+                            round1_thursday=round1_thursday,
+                        )
+                        if fallback:
+                            rejected.extend(extra_rejected)
+                            chosen = fallback
+                            parsed = parse_provenance_json(chosen.path)
+                parsed = [pick for pick in parsed if pick.market_odds]
+                positive = [pick for pick in parsed if (pick.ev or 0) > 0]
+                pick_source = "lab_sandbox" if lane_name == "lab" else "cockpit"
+                model_variant = "v5" if lane_name == "lab" else "baseline"
+                tournament_id = _ensure_tournament(conn, name=event_name, event_id=event_id, year=year)
+                locked = _has_locked_outcomes(conn, tournament_id)
+                pick_rows = parsed_to_pick_rows(
+                    positive,
+                    tournament_id=tournament_id,
+                    source=pick_source,
+                    model_variant=model_variant,
+                    card_path=chosen.path,
+                )
+                pick_rows = dedupe_grading_picks(pick_rows)
+                inserted = 0
+                if not dry_run and positive and not locked:
+                    db.store_picks(pick_rows)
+                    inserted = len(pick_rows)
+                else:
+                    inserted = len(pick_rows)
+
+                lane_results[lane_name] = {
+                    "canonical_card": str(chosen.path),
+                    "rejected": [str(card.path) for card in rejected],
+                    "parsed_matchups": len(parsed),
+                    "positive_ev": len(positive),
+                    "would_insert": inserted,
+                    "skipped_locked": locked,
                 }
-            )
 
-    conn.close()
+            if lane_results:
+                manifest.events.append(
+                    {
+                        "event_id": event_id,
+                        "name": event_name,
+                        "lanes": lane_results,
+                    }
+                )
+
     return manifest
@@ -56,27 +56,26 @@ def record_clv(
     implied_closing = _implied_from_decimal(closing_odds_decimal)
     clv_pct = (implied_taken - implied_closing) * 100.0
     book_val = (market_book or "").strip() or None
-    conn = db.get_conn()
-    conn.execute(
-        """INSERT INTO clv_log
-           (tournament_id, player_key, bet_type, market_book, odds_taken_decimal, closing_odds_decimal,
-            implied_taken, implied_closing, clv_pct, outcome)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            tournament_id,
-            player_key,
-            bet_type,
-            book_val,
-            odds_taken_decimal,
-            closing_odds_decimal,
-            implied_taken,
-            implied_closing,
-            clv_pct,
-            outcome,
-        ),
-    )
-    conn.commit()
-    conn.close()
+    with db.connection() as conn:
+        conn.execute(
+            """INSERT INTO clv_log
+               (tournament_id, player_key, bet_type, market_book, odds_taken_decimal, closing_odds_decimal,
+                implied_taken, implied_closing, clv_pct, outcome)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                tournament_id,
+                player_key,
+                bet_type,
+                book_val,
+                odds_taken_decimal,
+                closing_odds_decimal,
+                implied_taken,
+                implied_closing,
+                clv_pct,
+                outcome,
+            ),
+        )
+        conn.commit()
     return clv_pct
 
 
@@ -84,11 +83,10 @@ def compute_clv_summary() -> dict:
     """
     Aggregate CLV from clv_log. Returns avg_clv_pct, n_bets, significant (True if n >= 50).
     """
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT COUNT(*) AS n, AVG(clv_pct) AS avg_clv FROM clv_log"
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*) AS n, AVG(clv_pct) AS avg_clv FROM clv_log"
+        ).fetchone()
     n = row["n"] or 0
     avg = row["avg_clv"]
     return {
@@ -105,22 +103,21 @@ def compute_clv_summary_by_book() -> dict:
     Rows with NULL/blank ``market_book`` are labeled ``(unknown)``.
     Each segment includes ``significant`` when n_bets >= CLV_SIGNIFICANCE_MIN_BETS.
     """
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT
-            CASE
-                WHEN market_book IS NULL OR TRIM(market_book) = '' THEN '(unknown)'
-                ELSE TRIM(market_book)
-            END AS book_key,
-            COUNT(*) AS n_bets,
-            AVG(clv_pct) AS avg_clv_pct
-        FROM clv_log
-        GROUP BY book_key
-        ORDER BY n_bets DESC
-        """
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT
+                CASE
+                    WHEN market_book IS NULL OR TRIM(market_book) = '' THEN '(unknown)'
+                    ELSE TRIM(market_book)
+                END AS book_key,
+                COUNT(*) AS n_bets,
+                AVG(clv_pct) AS avg_clv_pct
+            FROM clv_log
+            GROUP BY book_key
+            ORDER BY n_bets DESC
+            """
+        ).fetchall()
 
     segments = []
     for r in rows:
@@ -144,10 +141,9 @@ def compute_clv_summary_by_book() -> dict:
 
 def get_clv_for_tournament(tournament_id: int) -> list[dict]:
     """Return all clv_log rows for a tournament (for learning loop / display)."""
-    conn = db.get_conn()
-    rows = conn.execute(
-        "SELECT * FROM clv_log WHERE tournament_id = ? ORDER BY id",
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            "SELECT * FROM clv_log WHERE tournament_id = ? ORDER BY id",
+            (tournament_id,),
+        ).fetchall()
     return [dict(r) for r in rows]
@@ -288,7 +288,7 @@ def ingest_folder(folder_path: str, tournament_id: int,
 
     Returns summary: {filename: {type, mode, window, rows}}
     """
-    from src.db import log_csv_import, store_metrics
+    from src.db import log_csv_import, store_metrics, transaction
 
     summary = {}
     csv_files = sorted([
@@ -314,15 +314,18 @@ def ingest_folder(folder_path: str, tournament_id: int,
             dm = data_mode_override or detect_data_mode(fname)
             rw = detect_round_window(fname, df_peek)
 
-            # Log the import
+            # Parse before taking the write lock; rows get the import id below
             df_full = pd.read_csv(fpath, dtype=str)
-            import_id = log_csv_import(
-                tournament_id, fname, file_type, dm, rw, len(df_full)
-            )
-
-            # Parse and store
-            metric_rows = parse_csv(fpath, tournament_id, import_id, dm, rw)
-            store_metrics(metric_rows)
+            metric_rows = parse_csv(fpath, tournament_id, None, dm, rw)
+
+            # Log the import and store its metrics as one commit
+            with transaction():
+                import_id = log_csv_import(
+                    tournament_id, fname, file_type, dm, rw, len(df_full)
+                )
+                for row in metric_rows:
+                    row["csv_import_id"] = import_id
+                store_metrics(metric_rows)
 
             summary[fname] = {
                 "type": file_type,
@@ -17,12 +17,19 @@ import os
 import requests
 import threading
 import time
-from collections import deque
+from collections import defaultdict, deque
 from datetime import date, datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Optional
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup; stdlib json via requests is the fallback
+    _orjson = None
 
 from src import db
 from src.field_selection import extract_field_player_keys, normalize_field_entries
+from src.odds_utils import american_to_implied_prob
 from src.player_normalizer import normalize_name, display_name
 
 logger = logging.getLogger(__name__)
@@ -38,7 +45,9 @@ class DataGolfRequestManager:
         self.window_seconds = window_seconds
         self.cooldown_seconds = cooldown_seconds
         self.request_times: deque[float] = deque()
-        self.cache: dict[str, tuple[float, dict | list]] = {}
+        # key -> (expires_at, stale_until, value)
+        self.cache: dict[str, tuple[float, float, dict | list]] = {}
+        self.refreshing: set[str] = set()
         self.blocked_until = 0.0
         self.lock = threading.Lock()
 
@@ -69,16 +78,52 @@ class DataGolfRequestManager:
             cached = self.cache.get(key)
             if not cached:
                 return None
-            expires_at, value = cached
+            expires_at, stale_until, value = cached
+            if now >= stale_until:
+                self.cache.pop(key, None)
+                return None
             if now >= expires_at:
+                return None
+            return value
+
+    def get_stale(self, key: str, *, now: float | None = None) -> dict | list | None:
+        """Return an expired entry that is still inside its stale-while-revalidate window."""
+        now = time.time() if now is None else now
+        with self.lock:
+            cached = self.cache.get(key)
+            if not cached:
+                return None
+            _expires_at, stale_until, value = cached
+            if now >= stale_until:
                 self.cache.pop(key, None)
                 return None
             return value
 
-    def set_cached(self, key: str, value: dict | list, *, ttl_seconds: int, now: float | None = None) -> None:
+    def set_cached(
+        self,
+        key: str,
+        value: dict | list,
+        *,
+        ttl_seconds: int,
+        stale_ttl_seconds: int = 0,
+        now: float | None = None,
+    ) -> None:
         now = time.time() if now is None else now
         with self.lock:
-            self.cache[key] = (now + ttl_seconds, value)
+            expires_at = now + ttl_seconds
+            self.cache[key] = (expires_at, expires_at + max(0, stale_ttl_seconds), value)
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim the background refresh for ``key``; False if one is already running."""
+        with self.lock:
+            if key in self.refreshing:
+                return False
+            self.refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self.lock:
+            self.refreshing.discard(key)
 
     def status(self) -> dict:
         now = time.time()
@@ -91,11 +136,20 @@ class DataGolfRequestManager:
                 "cooldown_seconds": self.cooldown_seconds,
                 "blocked_until": self.blocked_until,
                 "cached_entries": len(self.cache),
+                "refreshing": len(self.refreshing),
             }
 
 
 REQUEST_MANAGER = DataGolfRequestManager()
 
+# Live odds boards are polled by the UI: keep the usual 5-minute freshness, but
+# serve the last board while a background refresh runs instead of blocking the
+# request.
+ODDS_CACHE_TTL_SECONDS = 300
+ODDS_STALE_TTL_SECONDS = 240
+# The schedule changes a few times a week at most.
+SCHEDULE_STALE_TTL_SECONDS = 3600
+
 
 def _safe_float(val) -> float | None:
     """Safely convert a value to float, returning None for non-numeric."""
@@ -142,12 +196,30 @@ def _cache_key(endpoint: str, params: dict) -> str:
     return f"{endpoint}:{json.dumps(params, sort_keys=True, default=str)}"
 
 
-def _call_api(endpoint: str, params: dict = None, *, cache_ttl_seconds: int = 300) -> dict | list:
+def _decode_json(resp: requests.Response) -> dict | list:
+    """Decode a response body, using orjson when installed (full odds boards are large)."""
+    if _orjson is not None:
+        return _orjson.loads(resp.content)
+    return resp.json()
+
+
+def _call_api(
+    endpoint: str,
+    params: dict = None,
+    *,
+    cache_ttl_seconds: int = 300,
+    stale_ttl_seconds: int = 0,
+) -> dict | list:
     """
     Call a Data Golf API endpoint.
 
     Returns parsed JSON (dict or list).
     Raises on HTTP errors or missing key.
+
+    Responses are cached for ``cache_ttl_seconds``. With ``stale_ttl_seconds``
+    set, an expired response is still returned for that much longer while a
+    single background thread refreshes it (stale-while-revalidate), so polled
+    endpoints never block the caller on a refetch.
     """
     key = _get_api_key()
     params = params or {}
@@ -159,6 +231,28 @@ def _call_api(endpoint: str, params: dict = None, *, cache_ttl_seconds: int = 30
     if cached is not None:
         return cached
 
+    if stale_ttl_seconds > 0:
+        stale = REQUEST_MANAGER.get_stale(cache_key)
+        if stale is not None:
+            if REQUEST_MANAGER.begin_refresh(cache_key):
+                threading.Thread(
+                    target=_refresh_cached_response,
+                    args=(endpoint, params, cache_key, cache_ttl_seconds, stale_ttl_seconds),
+                    name=f"dg-refresh-{endpoint}",
+                    daemon=True,
+                ).start()
+            return stale
+
+    return _fetch_and_cache(endpoint, params, cache_key, cache_ttl_seconds, stale_ttl_seconds)
+
+
+def _fetch_and_cache(
+    endpoint: str,
+    params: dict,
+    cache_key: str,
+    cache_ttl_seconds: int,
+    stale_ttl_seconds: int,
+) -> dict | list:
     url = f"{BASE_URL}/{endpoint}"
     wait_seconds = REQUEST_MANAGER.reserve_slot()
     if wait_seconds > 0:
@@ -180,13 +274,31 @@ def _call_api(endpoint: str, params: dict = None, *, cache_ttl_seconds: int = 30
         raise RuntimeError(f"Data Golf API connection error on {endpoint}: {e}")
 
     try:
-        data = resp.json()
-        REQUEST_MANAGER.set_cached(cache_key, data, ttl_seconds=cache_ttl_seconds)
+        data = _decode_json(resp)
+        REQUEST_MANAGER.set_cached(
+            cache_key, data, ttl_seconds=cache_ttl_seconds, stale_ttl_seconds=stale_ttl_seconds,
+        )
         return data
     except ValueError:
         raise RuntimeError(f"Data Golf API returned non-JSON for {endpoint}: {resp.text[:200]}")
 
 
+def _refresh_cached_response(
+    endpoint: str,
+    params: dict,
+    cache_key: str,
+    cache_ttl_seconds: int,
+    stale_ttl_seconds: int,
+) -> None:
+    """Background stale-while-revalidate refresh; failures keep the stale entry."""
+    try:
+        _fetch_and_cache(endpoint, params, cache_key, cache_ttl_seconds, stale_ttl_seconds)
+    except Exception:
+        logger.warning("Background refresh failed for %s", endpoint, exc_info=True)
+    finally:
+        REQUEST_MANAGER.end_refresh(cache_key)
+
+
 def get_datagolf_throttle_status() -> dict:
     """Return the shared DataGolf throttle/cache status."""
     return REQUEST_MANAGER.status()
@@ -888,18 +1000,11 @@ def store_skill_ratings_as_metrics(tournament_id: int, field_player_keys: list[s
         for metric_name, value in fields.items():
             fval = _safe_float(value)
             if fval is not None:
-                metric_rows.append({
-                    "tournament_id": tournament_id,
-                    "csv_import_id": import_id,
-                    "player_key": pk,
-                    "player_display": pdisp,
-                    "metric_category": "dg_skill",
-                    "data_mode": "recent_form",
-                    "round_window": "all",
-                    "metric_name": metric_name,
-                    "metric_value": fval,
-                    "metric_text": None,
-                })
+                metric_rows.append(db.MetricRow(
+                    tournament_id, import_id, pk, pdisp,
+                    "dg_skill", "recent_form", "all",
+                    metric_name, fval, None,
+                ))
 
     db.store_metrics(metric_rows)
     return len(metric_rows)
@@ -936,18 +1041,11 @@ def store_rankings_as_metrics(tournament_id: int, field_player_keys: list[str])
         ]:
             fval = _safe_float(value)
             if fval is not None:
-                metric_rows.append({
-                    "tournament_id": tournament_id,
-                    "csv_import_id": import_id,
-                    "player_key": pk,
-                    "player_display": pdisp,
-                    "metric_category": "dg_ranking",
-                    "data_mode": "recent_form",
-                    "round_window": "all",
-                    "metric_name": metric_name,
-                    "metric_value": fval,
-                    "metric_text": None,
-                })
+                metric_rows.append(db.MetricRow(
+                    tournament_id, import_id, pk, pdisp,
+                    "dg_ranking", "recent_form", "all",
+                    metric_name, fval, None,
+                ))
 
     db.store_metrics(metric_rows)
     return len(metric_rows)
@@ -987,45 +1085,29 @@ def store_approach_skill_as_metrics(tournament_id: int, field_player_keys: list[
             continue
         pdisp = display_name(p.get("player_name", pk))
 
+        # Collect sg_per_shot values in the same pass for the composite below
+        sg_vals = []
         for bucket in buckets:
             for lie in lies:
                 for stat in stats:
                     field_name = f"{bucket}_{lie}_{stat}"
                     fval = _safe_float(p.get(field_name))
                     if fval is not None:
-                        metric_rows.append({
-                            "tournament_id": tournament_id,
-                            "csv_import_id": import_id,
-                            "player_key": pk,
-                            "player_display": pdisp,
-                            "metric_category": "dg_approach",
-                            "data_mode": "recent_form",
-                            "round_window": "all",
-                            "metric_name": field_name,
-                            "metric_value": fval,
-                            "metric_text": None,
-                        })
+                        if stat == "sg_per_shot":
+                            sg_vals.append(fval)
+                        metric_rows.append(db.MetricRow(
+                            tournament_id, import_id, pk, pdisp,
+                            "dg_approach", "recent_form", "all",
+                            field_name, fval, None,
+                        ))
 
         # Also store overall approach SG composite (average across buckets)
-        sg_vals = []
-        for bucket in buckets:
-            for lie in lies:
-                v = _safe_float(p.get(f"{bucket}_{lie}_sg_per_shot"))
-                if v is not None:
-                    sg_vals.append(v)
         if sg_vals:
-            metric_rows.append({
-                "tournament_id": tournament_id,
-                "csv_import_id": import_id,
-                "player_key": pk,
-                "player_display": pdisp,
-                "metric_category": "dg_approach",
-                "data_mode": "recent_form",
-                "round_window": "all",
-                "metric_name": "approach_sg_composite",
-                "metric_value": round(sum(sg_vals) / len(sg_vals), 4),
-                "metric_text": None,
-            })
+            metric_rows.append(db.MetricRow(
+                tournament_id, import_id, pk, pdisp,
+                "dg_approach", "recent_form", "all",
+                "approach_sg_composite", round(sum(sg_vals) / len(sg_vals), 4), None,
+            ))
 
     db.store_metrics(metric_rows)
     return len(metric_rows)
@@ -1048,40 +1130,51 @@ BOOK_NAMES = {
 NON_BOOK_KEYS = {"player_name", "dg_id", "datagolf", "am"}
 
 
+@lru_cache(maxsize=4096)
+def _rounded_implied_prob(price: int) -> float:
+    """Implied probability rounded to 4dp, memoized per American price.
+
+    A full odds board repeats the same handful of prices across books and
+    players, so rows share one conversion + round per distinct price.
+    """
+    return round(american_to_implied_prob(price), 4)
+
+
 def _parse_american_odds(val) -> int | None:
     """Parse American odds from a string like '+4000' or '-150' or 'n/a'.
 
     Returns None for invalid or unreasonable values (e.g., +500000).
     """
-    if val is None or val == "n/a" or val == "":
-        return None
-    try:
-        price = int(str(val).replace("+", ""))
-        # Reject clearly unreasonable odds (bad API data)
-        # Real golf odds max out around +50000 for outrights
-        if price > 50000 or price < -10000 or price == 0:
+    if type(val) is int:
+        price = val
+    else:
+        # None, "" and "n/a" all mean "no price posted"
+        if not val or val == "n/a":
             return None
-        return price
-    except (ValueError, TypeError):
+        try:
+            price = int(str(val).replace("+", ""))
+        except (ValueError, TypeError):
+            return None
+    # Reject clearly unreasonable odds (bad API data)
+    # Real golf odds max out around +50000 for outrights
+    if price > 50000 or price < -10000 or price == 0:
         return None
+    return price
 
 
-def fetch_outright_odds(market: str = "win", tour: str = "pga",
-                        odds_format: str = "american") -> list[dict]:
+def iter_outright_odds(market: str = "win", tour: str = "pga",
+                       odds_format: str = "american") -> Iterator[dict]:
     """
-    Fetch live outright odds from Data Golf's betting tools.
+    Yield live outright odds rows from Data Golf's betting tools.
 
-    market: 'win', 'top_5', 'top_10', 'top_20', 'make_cut', 'frl'
-    Returns list of {player, bookmaker, price, implied_prob, market}
-    in the same format that odds.py uses.
+    Streaming variant of fetch_outright_odds() for callers that consume rows
+    one at a time (e.g. DB writers) and never need the full list in memory.
     """
-    from src.odds import american_to_implied_prob
-
     raw = _call_api("betting-tools/outrights", {
         "tour": tour,
         "market": market,
         "odds_format": odds_format,
-    })
+    }, cache_ttl_seconds=ODDS_CACHE_TTL_SECONDS, stale_ttl_seconds=ODDS_STALE_TTL_SECONDS)
 
     odds_list = raw.get("odds", []) if isinstance(raw, dict) else []
 
@@ -1092,32 +1185,27 @@ def fetch_outright_odds(market: str = "win", tour: str = "pga",
     }
     display_market = market_name_map.get(market, market)
 
-    results = []
     for player in odds_list:
         if not isinstance(player, dict):
             continue
         player_name = player.get("player_name", "")
         if not player_name:
             continue
+        player_display = display_name(player_name)
 
         # Extract odds from each sportsbook
         for book_key, book_display in BOOK_NAMES.items():
-            odds_val = player.get(book_key)
-            if odds_val is None or odds_val == "n/a" or odds_val == "":
-                continue
-
-            price = _parse_american_odds(odds_val)
+            price = _parse_american_odds(player.get(book_key))
             if price is None:
                 continue
 
-            impl_prob = american_to_implied_prob(price)
-            results.append({
-                "player": display_name(player_name),
+            yield {
+                "player": player_display,
                 "bookmaker": book_display,
                 "price": price,
-                "implied_prob": round(impl_prob, 4),
+                "implied_prob": _rounded_implied_prob(price),
                 "market": display_market,
-            })
+            }
 
         # Also extract DG's own model odds for reference
         dg_odds = player.get("datagolf", {})
@@ -1126,15 +1214,25 @@ def fetch_outright_odds(market: str = "win", tour: str = "pga",
                                       ("baseline", "DG-Base")]:
                 dg_price = _parse_american_odds(dg_odds.get(dg_key))
                 if dg_price is not None:
-                    results.append({
-                        "player": display_name(player_name),
+                    yield {
+                        "player": player_display,
                         "bookmaker": dg_label,
                         "price": dg_price,
-                        "implied_prob": round(american_to_implied_prob(dg_price), 4),
+                        "implied_prob": _rounded_implied_prob(dg_price),
                         "market": display_market,
-                    })
+                    }
+
 
-    return results
+def fetch_outright_odds(market: str = "win", tour: str = "pga",
+                        odds_format: str = "american") -> list[dict]:
+    """
+    Fetch live outright odds from Data Golf's betting tools.
+
+    market: 'win', 'top_5', 'top_10', 'top_20', 'make_cut', 'frl'
+    Returns list of {player, bookmaker, price, implied_prob, market}
+    in the same format that odds.py uses.
+    """
+    return list(iter_outright_odds(market=market, tour=tour, odds_format=odds_format))
 
 
 def fetch_matchup_odds_with_diagnostics(
@@ -1260,7 +1358,7 @@ def get_current_event_info(tour: str = "pga") -> dict | None:
         schedule = _call_api("get-schedule", {
             "tour": tour,
             "upcoming_only": "yes",
-        })
+        }, stale_ttl_seconds=SCHEDULE_STALE_TTL_SECONDS)
         if isinstance(schedule, list) and schedule:
             return schedule[0]
         elif isinstance(schedule, dict):
@@ -1769,6 +1867,10 @@ def fetch_dg_matchup_all_pairings(tour: str = "pga", odds_format: str = "america
     return result
 
 
+# DG outright market -> bet_type key used by picks/CLV tracking
+CLOSING_MARKET_MAP = {"win": "outright", "top_5": "top5", "top_10": "top10", "top_20": "top20"}
+
+
 def fetch_closing_odds(tour: str = "pga") -> dict:
     """
     Fetch closing odds from Data Golf for CLV tracking.
@@ -1778,8 +1880,8 @@ def fetch_closing_odds(tour: str = "pga") -> dict:
 
     Returns: {player_dg_id: {market: closing_decimal_odds}} or empty dict.
     """
-    results = {}
-    for market in ["win", "top_5", "top_10", "top_20"]:
+    results: defaultdict[str, dict] = defaultdict(dict)
+    for market, closing_market in CLOSING_MARKET_MAP.items():
         try:
             raw = _call_api("betting-tools/outrights", {
                 "tour": tour,
@@ -1798,13 +1900,8 @@ def fetch_closing_odds(tour: str = "pga") -> dict:
                         book_odds.append(val)
                 if book_odds:
                     avg_odds = sum(book_odds) / len(book_odds)
-                    from src.player_normalizer import normalize_name as _norm
-                    pk = _norm(player_name)
-                    if pk not in results:
-                        results[pk] = {}
-                    market_map = {"win": "outright", "top_5": "top5", "top_10": "top10", "top_20": "top20"}
-                    results[pk][market_map.get(market, market)] = round(avg_odds, 2)
+                    results[normalize_name(player_name)][closing_market] = round(avg_odds, 2)
         except Exception:
             logger.debug("Closing odds fetch failed for market=%s", market, exc_info=True)
             continue
-    return results
+    return dict(results)
@@ -23,13 +23,27 @@ Tables:
   telegram_alert_sent    – dedupe keys for personal Telegram matchup EV notifications
 """
 
+import asyncio
+import atexit
+import heapq
+import itertools
 import logging
+import operator
 import sqlite3
 import json
 import os
 import shutil
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator, NamedTuple, Sequence
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    _orjson = None
 
 from src import config
 from src.player_normalizer import normalize_name
@@ -101,23 +115,441 @@ DB_PATH = _resolve_db_path()
 
 
 _DB_INITIALIZED = False
+_INITIALIZED_DB_PATH: str | None = None
+_INIT_LOCK = threading.RLock()
 
+# Bump whenever the schema script or _run_migrations changes in a way existing
+# databases must pick up; databases already at this version skip both on startup.
+SCHEMA_VERSION = 19
 
-def get_conn() -> sqlite3.Connection:
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH, timeout=15.0)
+
+class _PooledConnection(sqlite3.Connection):
+    """Long-lived per-thread connection handed out by get_conn().
+
+    Acquire it with ``with connection()`` (or get_conn() paired with close()
+    in a finally). On a pooled connection close() only releases it: once the
+    outermost caller in the thread releases, any uncommitted transaction is
+    rolled back, matching what closing a short-lived connection used to do.
+    Nested get_conn() callers share the same connection and never discard an
+    outer caller's pending writes. Ownership is tracked only by these
+    explicit acquire/release calls.
+    """
+
+    _depth = 0
+    # >0 while a transaction() block is open: helper commits are deferred to it.
+    _batch_depth = 0
+
+    def commit(self) -> None:
+        if self._batch_depth:
+            return
+        super().commit()
+
+    def close(self) -> None:
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0 and self.in_transaction:
+            self.rollback()
+
+    def _close_for_real(self) -> None:
+        super().close()
+
+
+_TLS = threading.local()
+_POOL_LOCK = threading.Lock()
+_POOL_GENERATION = 0
+_POOLED_CONNECTIONS: "weakref.WeakSet[_PooledConnection]" = weakref.WeakSet()
+
+
+# Applied once per pooled connection. WAL mode for concurrent read/write (the
+# deploy lock in run_predictions prevents parallel pipeline runs); NORMAL sync
+# is durable under WAL except on power loss. cache_size and mmap_size apply to
+# every connection, and a thread can hold a writer and a reader (times every
+# uvicorn threadpool thread), so both are kept modest: 8 MB of page cache and
+# a 64 MB mapping per connection.
+# page_size comes first: it only takes effect on a brand-new file, and only
+# before the switch to WAL writes the header (a no-op on existing databases).
+_CONNECTION_PRAGMAS = """
+    PRAGMA page_size=4096;
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=15000;
+    PRAGMA foreign_keys=ON;
+    PRAGMA cache_size=-8192;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=67108864;
+    PRAGMA wal_autocheckpoint=10000;
+"""
+
+
+# sqlite3 keeps an LRU of prepared statements per connection, keyed by SQL
+# text. Now that connections are long-lived the cache survives across helper
+# calls, so repeated queries skip sqlite3_prepare_v2; sized above the default
+# 128 to hold every static statement in this module plus common variants.
+_STATEMENT_CACHE_SIZE = 512
+
+
+# Directories already created for a DB_PATH; reopening a pooled connection
+# (new thread, fork, DB_PATH switch) then skips the makedirs syscalls.
+_READY_DB_DIRS: set[str] = set()
+
+
+def _ensure_db_dir(path: str) -> None:
+    db_dir = os.path.dirname(path)
+    if db_dir not in _READY_DB_DIRS:
+        os.makedirs(db_dir, exist_ok=True)
+        _READY_DB_DIRS.add(db_dir)
+
+
+def _open_conn(path: str) -> _PooledConnection:
+    _ensure_db_dir(path)
+    # check_same_thread=False only so close_all_connections() can tear down
+    # other threads' connections; each connection is still used by one thread.
+    conn = sqlite3.connect(
+        path,
+        timeout=15.0,
+        factory=_PooledConnection,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
     conn.row_factory = sqlite3.Row
-    # WAL mode for concurrent read/write and deploy lock in run_predictions prevents parallel pipeline runs
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA busy_timeout=15000")
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
+def _current_task() -> "asyncio.Task | None":
+    try:
+        return asyncio.current_task()
+    except RuntimeError:  # no running event loop in this thread
+        return None
+
+
+def _slots() -> dict:
+    """Pooled connection slots for the current caller.
+
+    Plain threads share one set per thread. Code running inside an asyncio
+    task (async FastAPI handlers all run on the event loop's thread) gets a
+    set per task instead, so concurrent requests never share a connection or
+    its open transaction; _close_task_slots() closes them when the task ends.
+    """
+    task = _current_task()
+    if task is None:
+        return _TLS.__dict__
+    per_task = _TLS.__dict__.setdefault("task_slots", {})
+    slots = per_task.get(task)
+    if slots is None:
+        slots = per_task[task] = {}
+        task.add_done_callback(_close_task_slots)
+    return slots
+
+
+def _close_task_slots(task: "asyncio.Task") -> None:
+    slots = _TLS.__dict__.get("task_slots", {}).pop(task, None) or {}
+    for state in slots.values():
+        conn = state[0]
+        if state[2] == os.getpid():
+            try:
+                conn._close_for_real()
+            except sqlite3.Error:
+                pass
+        with _POOL_LOCK:
+            _POOLED_CONNECTIONS.discard(conn)
+
+
+def _thread_conn(slot: str, query_only: bool = False) -> _PooledConnection:
+    """Return the caller's pooled connection in *slot*, (re)opening as needed."""
+    slots = _slots()
+    state = slots.get(slot)
+    conn = state[0] if state else None
+    if conn is None or state[1:] != (DB_PATH, os.getpid(), _POOL_GENERATION):
+        if conn is not None and state[2] == os.getpid():
+            try:
+                conn._close_for_real()
+            except sqlite3.Error:
+                pass
+        conn = _open_conn(DB_PATH)
+        if query_only:
+            conn.execute("PRAGMA query_only=1")
+        slots[slot] = (conn, DB_PATH, os.getpid(), _POOL_GENERATION)
+        with _POOL_LOCK:
+            _POOLED_CONNECTIONS.add(conn)
+    conn._depth += 1
     return conn
 
 
+def _schema_ready() -> bool:
+    return _DB_INITIALIZED and _INITIALIZED_DB_PATH == DB_PATH
+
+
+def get_conn() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, opening it on first use.
+
+    The connection (and its PRAGMAs) is reused across calls; it is reopened
+    when DB_PATH changes, after a fork, or after close_all_connections().
+    Inside an asyncio task the connection belongs to the task rather than
+    the event loop's thread. The first connection to a DB_PATH runs init_db().
+    Release it with close(); prefer ``with connection()``.
+    """
+    if not _schema_ready():
+        init_db()
+    return _thread_conn("conn")
+
+
+get_writer = get_conn
+
+
+@contextmanager
+def connection():
+    """``with connection() as conn:`` form of get_conn().
+
+    Releases the pooled connection on exit even when the body raises, so an
+    exception can never leave this thread's nesting depth raised (which would
+    stop the outermost release from rolling back abandoned transactions).
+    """
+    conn = get_conn()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def get_reader() -> sqlite3.Connection:
+    """Return this thread's read-only (PRAGMA query_only) connection.
+
+    Under WAL each thread's reader runs concurrently with other threads'
+    readers and the writer. If this thread's writer has a transaction open,
+    the writer is returned instead so the caller still sees its own
+    uncommitted rows. Release with close() like get_conn().
+    """
+    if not _schema_ready():
+        init_db()
+    state = _slots().get("conn")
+    if state and state[0].in_transaction and state[1] == DB_PATH:
+        return _thread_conn("conn")
+    return _thread_conn("reader", query_only=True)
+
+
+@contextmanager
+def read_connection():
+    """``with read_connection() as conn:`` form of get_reader()."""
+    conn = get_reader()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def close_all_connections() -> None:
+    """Close every pooled connection (all threads); the next get_conn() reopens.
+
+    Call before replacing the database file on disk (e.g. restoring a backup).
+    """
+    global _POOL_GENERATION
+    with _POOL_LOCK:
+        _POOL_GENERATION += 1
+        conns = list(_POOLED_CONNECTIONS)
+        _POOLED_CONNECTIONS.clear()
+    for conn in conns:
+        try:
+            conn._close_for_real()
+        except sqlite3.Error:
+            pass
+    _TLS.__dict__.pop("conn", None)
+    _TLS.__dict__.pop("reader", None)
+    _TLS.__dict__.pop("task_slots", None)
+    # The file may be about to be replaced; drop row caches tied to it.
+    _TOURNAMENT_ID_CACHE.clear()
+    _ACTIVE_WEIGHTS_CACHE.clear()
+    _DG_ID_CACHE.clear()
+    _COURSE_PROFILE_CACHE.clear()
+    _BLENDED_WEIGHTS_CACHE.clear()
+    _READY_DB_DIRS.clear()
+    _LAST_OPTIMIZED.clear()
+
+
+atexit.register(close_all_connections)
+
+
+@contextmanager
+def _immediate_transaction(conn: sqlite3.Connection):
+    """Run a bulk write as one BEGIN IMMEDIATE ... COMMIT, rolling back on error.
+
+    Taking the write lock up front avoids upgrading a deferred transaction
+    mid-batch. Inside a transaction() block the write joins it and the block
+    commits. Any other open transaction belongs to a get_conn() caller that
+    has not committed; joining it would leave this write uncommitted too, so
+    that raises instead (a separate connection would have hit the lock).
+    """
+    if conn.in_transaction:
+        if not conn._batch_depth:
+            raise sqlite3.OperationalError(
+                "write helper called while this thread's connection has an "
+                "uncommitted transaction outside db.transaction()"
+            )
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+# Bulk writes at least this large refresh planner statistics afterwards.
+_OPTIMIZE_MIN_ROWS = 1000
+
+
+def _optimize(conn: sqlite3.Connection) -> None:
+    """Run PRAGMA optimize with a bounded analysis sample.
+
+    optimize only re-ANALYZEs tables whose row counts moved enough since the
+    last run, so this is cheap when nothing much changed. Skipped while a
+    transaction is open so it never commits or extends a caller's batch.
+    """
+    if conn.in_transaction:
+        return
+    conn.execute("PRAGMA analysis_limit=400")
+    conn.execute("PRAGMA optimize")
+    _LAST_OPTIMIZED[DB_PATH] = time.monotonic()
+
+
+# DB_PATH -> monotonic time of the last _optimize() in this process. Small
+# writes only re-run optimize once this interval has passed.
+_LAST_OPTIMIZED: dict[str, float] = {}
+_OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+
+def _maybe_optimize(conn: sqlite3.Connection) -> None:
+    """_optimize() at most once per _OPTIMIZE_INTERVAL_SECONDS per database."""
+    last = _LAST_OPTIMIZED.get(DB_PATH)
+    if last is None or time.monotonic() - last >= _OPTIMIZE_INTERVAL_SECONDS:
+        _optimize(conn)
+
+
+def maybe_optimize() -> None:
+    """Refresh planner statistics after a write if the interval has passed.
+
+    For write paths outside this module; helpers here call _maybe_optimize()
+    on the connection they already hold.
+    """
+    with connection() as conn:
+        _maybe_optimize(conn)
+
+
+# store_rounds / store_metrics loads at least this large re-ANALYZE the
+# table outright.
+_ANALYZE_MIN_ROWS = 10_000
+
+
+def _analyze(conn: sqlite3.Connection, table: str) -> None:
+    """Refresh sqlite_stat1 for *table* with the same bounded sample.
+
+    PRAGMA optimize (SQLite < 3.46) only re-analyzes tables this connection
+    has queried, so it misses a pure backfill; this analyzes unconditionally.
+    Skipped while a transaction is open, like _optimize().
+    """
+    if conn.in_transaction:
+        return
+    conn.execute("PRAGMA analysis_limit=400")
+    conn.execute(f"ANALYZE {table}")
+
+
+@contextmanager
+def transaction():
+    """Group several write helpers into one BEGIN IMMEDIATE ... COMMIT.
+
+    Helpers keep committing on their own outside this block. Inside it,
+    their conn.commit() calls on this thread's connection are deferred, so
+    e.g. log_csv_import + store_metrics + store_picks cost one WAL commit and
+    roll back together if anything raises. Blocks nest; the outermost one
+    commits.
+
+        with db.transaction():
+            import_id = db.log_csv_import(...)
+            db.store_metrics(rows)
+    """
+    conn = get_conn()
+    try:
+        started = not conn.in_transaction
+        if not started and not conn._batch_depth:
+            raise sqlite3.OperationalError(
+                "db.transaction() opened while this thread's connection has an "
+                "uncommitted transaction outside db.transaction()"
+            )
+        if started:
+            conn.execute("BEGIN IMMEDIATE")
+        conn._batch_depth += 1
+        try:
+            yield conn
+        except BaseException:
+            conn._batch_depth -= 1
+            if started:
+                conn.rollback()
+            raise
+        conn._batch_depth -= 1
+        if started:
+            conn.commit()
+    finally:
+        conn.close()
+
+
 def init_db():
-    """Create tables if they don't exist."""
+    """Create tables if they don't exist, then migrate older databases.
+
+    One-shot per process and DB_PATH: repeat calls return immediately unless
+    DB_PATH changed or _DB_INITIALIZED was reset. _run_migrations only runs
+    while schema_version is below SCHEMA_VERSION. get_conn()/get_reader()
+    call this on first use, so importing the module touches no database.
+    Concurrent first calls serialize on _INIT_LOCK; calls made from inside
+    initialization (via get_conn()) return immediately.
+    """
+    if _schema_ready() or getattr(_TLS, "initializing", None) == DB_PATH:
+        return
+    with _INIT_LOCK:
+        if _schema_ready():
+            return
+        _TLS.initializing = DB_PATH
+        try:
+            _create_schema()
+        finally:
+            _TLS.initializing = None
+
+
+def _create_schema() -> None:
+    global _DB_INITIALIZED, _INITIALIZED_DB_PATH
     conn = get_conn()
+    if not _schema_is_current(conn):
+        _apply_schema(conn)
+
+    try:
+        from src.data_views import ensure_analytics_views
+
+        ensure_analytics_views(conn)
+    except Exception as exc:
+        _logger.warning("Analytics views setup failed: %s", exc)
+
+    conn.commit()
+    _optimize(conn)
+    conn.close()
+    _DB_INITIALIZED = True
+    _INITIALIZED_DB_PATH = DB_PATH
+
+
+def _schema_is_current(conn: sqlite3.Connection) -> bool:
+    """True when the file was fully set up at SCHEMA_VERSION by _apply_schema().
+
+    PRAGMA user_version lives in the database header, so on an up-to-date
+    database this costs one header read plus one row lookup instead of
+    compiling the whole CREATE ... IF NOT EXISTS script again. The
+    schema_version row is still checked so resetting it forces a migration
+    re-run, as before.
+    """
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    return user_version == SCHEMA_VERSION and _get_schema_version(conn) == SCHEMA_VERSION
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    """Create missing tables and indexes, migrate, and stamp user_version."""
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS tournaments (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -155,13 +587,23 @@ def init_db():
             metric_text TEXT         -- for non-numeric values like 'CUT', 'T14'
         );
 
-        CREATE INDEX IF NOT EXISTS idx_metrics_player
-            ON metrics(tournament_id, player_key);
-        CREATE INDEX IF NOT EXISTS idx_metrics_category
-            ON metrics(tournament_id, metric_category, data_mode, round_window);
-        -- Q4: composite for per-tournament per-player metric fetches (metric_category filter)
-        CREATE INDEX IF NOT EXISTS idx_metrics_tourn_player_cat
-            ON metrics(tournament_id, player_key, metric_category);
+        -- Covering index for get_player_metrics (SELECT * ... ORDER BY category,
+        -- window, name) and get_player_display_names: index-only, no sort.
+        CREATE INDEX IF NOT EXISTS idx_metrics_player_cover
+            ON metrics(tournament_id, player_key, metric_category, round_window, metric_name,
+                       data_mode, metric_value, metric_text, player_display, csv_import_id);
+        -- Covering index for get_metrics_by_category (SELECT * by tournament,
+        -- category and optional mode/window): index-only, no table lookups.
+        CREATE INDEX IF NOT EXISTS idx_metrics_category_cover
+            ON metrics(tournament_id, metric_category, data_mode, round_window, player_key,
+                       metric_name, metric_value, metric_text, player_display, csv_import_id);
+        -- Confirmed field roster for get_all_players: only the field_status
+        -- rows, already ordered by player_key. The filter columns are repeated
+        -- so the lookup stays index-only (SQLite does not infer them from WHERE).
+        CREATE INDEX IF NOT EXISTS idx_metrics_confirmed_field
+            ON metrics(tournament_id, player_key, metric_category, metric_name, metric_text)
+            WHERE metric_category = 'meta' AND metric_name = 'field_status'
+              AND metric_text = 'confirmed';
 
         CREATE TABLE IF NOT EXISTS picks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -210,6 +652,8 @@ def init_db():
             notes TEXT,
             entered_at TEXT DEFAULT (datetime('now'))
         );
+        -- Outcome lookups by pick (grading, pick ledger joins).
+        CREATE INDEX IF NOT EXISTS idx_pick_outcomes_pick ON pick_outcomes(pick_id);
 
         CREATE TABLE IF NOT EXISTS weight_sets (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -221,6 +665,9 @@ def init_db():
             roi REAL,
             created_at TEXT DEFAULT (datetime('now'))
         );
+        -- Partial index: get_active_weights reads the newest active set.
+        CREATE INDEX IF NOT EXISTS idx_weight_sets_active
+            ON weight_sets(active, id DESC) WHERE active = 1;
 
         -- ═══ Data Golf round-level data ═══
         CREATE TABLE IF NOT EXISTS rounds (
@@ -264,18 +711,32 @@ def init_db():
             UNIQUE(dg_id, event_id, year, round_num)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_rounds_player
-            ON rounds(dg_id, event_completed DESC);
+        -- Recent-rounds lookups ORDER BY event_completed DESC, round_num DESC;
+        -- round_num in the key lets the index satisfy the sort.
+        CREATE INDEX IF NOT EXISTS idx_rounds_player_recent
+            ON rounds(dg_id, event_completed DESC, round_num DESC);
         CREATE INDEX IF NOT EXISTS idx_rounds_course
             ON rounds(course_num, dg_id);
-        CREATE INDEX IF NOT EXISTS idx_rounds_event
-            ON rounds(event_id, year);
-        CREATE INDEX IF NOT EXISTS idx_rounds_player_key
-            ON rounds(player_key, event_completed DESC);
+        -- Covers get_event_results: index-only, with DISTINCT in key order.
+        CREATE INDEX IF NOT EXISTS idx_rounds_event_results
+            ON rounds(event_id, year, dg_id, player_name, player_key, fin_text);
+        -- Covers get_rounds_backfill_status's GROUP BY tour, year counts.
+        CREATE INDEX IF NOT EXISTS idx_rounds_tour_year_dg_event
+            ON rounds(tour, year, dg_id, event_id);
+        CREATE INDEX IF NOT EXISTS idx_rounds_player_key_recent
+            ON rounds(player_key, event_completed DESC, round_num DESC);
         -- Q4: composite for per-player completed-events lookups
         CREATE INDEX IF NOT EXISTS idx_rounds_player_event
             ON rounds(player_key, event_completed);
 
+        -- player_key -> MIN(dg_id) over rounds, so lookups read a small
+        -- table instead of rounds. _run_migrations installs the triggers
+        -- (_PLAYER_DG_ID_TRIGGERS) that keep it current and rebuilds it.
+        CREATE TABLE IF NOT EXISTS player_dg_ids (
+            player_key TEXT PRIMARY KEY,
+            dg_id INTEGER NOT NULL
+        ) WITHOUT ROWID;
+
         -- ═══ Course-specific learned weights ═══
         CREATE TABLE IF NOT EXISTS course_weight_profiles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -384,8 +845,8 @@ def init_db():
             expires_at TEXT              -- insights fade; recency matters
         );
 
-        CREATE INDEX IF NOT EXISTS idx_ai_memory_topic
-            ON ai_memory(topic, confidence DESC);
+        CREATE INDEX IF NOT EXISTS idx_ai_memory_topic_rank
+            ON ai_memory(topic, confidence DESC, created_at DESC);
 
         CREATE TABLE IF NOT EXISTS ai_decisions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -396,6 +857,9 @@ def init_db():
             created_at TEXT DEFAULT (datetime('now'))
         );
 
+        CREATE INDEX IF NOT EXISTS idx_ai_decisions_tid_phase_time
+            ON ai_decisions(tournament_id, phase, created_at DESC);
+
         -- ═══ Dynamic blend (EWA) history ═══
         CREATE TABLE IF NOT EXISTS blend_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -923,16 +1387,23 @@ def init_db():
     conn.commit()
 
     # ── Migrations for existing databases ──
-    _run_migrations(conn)
-
-    try:
-        from src.data_views import ensure_analytics_views
+    if _get_schema_version(conn) < SCHEMA_VERSION:
+        _run_migrations(conn)
+        conn.execute(
+            "UPDATE schema_version SET version = ?, updated_at = datetime('now') WHERE id = 1",
+            (SCHEMA_VERSION,),
+        )
+        conn.commit()
+        # Refresh planner statistics so new indexes are picked up; the
+        # analysis limit keeps this to a bounded sample on large tables.
+        conn.executescript("PRAGMA analysis_limit=400; ANALYZE;")
+    # Stamped last, so an interrupted setup re-runs the script next time.
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-        ensure_analytics_views(conn)
-    except Exception as exc:
-        _logger.warning("Analytics views setup failed: %s", exc)
 
-    conn.close()
+def _get_schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT version FROM schema_version WHERE id = 1").fetchone()
+    return int(row["version"]) if row and row["version"] is not None else 0
 
 
 def _ensure_pick_ledger_tables(conn: sqlite3.Connection) -> None:
@@ -1000,14 +1471,13 @@ def _ensure_pick_ledger_tables(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    existing = _table_columns(conn, "pick_outcomes")
     for col, col_type, default in [
         ("pick_key", "TEXT", None),
         ("grading_authority", "TEXT", None),
         ("outcome_locked", "INTEGER", "0"),
     ]:
-        try:
-            conn.execute(f"SELECT {col} FROM pick_outcomes LIMIT 1")
-        except sqlite3.OperationalError:
+        if col not in existing:
             default_clause = f" DEFAULT {default}" if default is not None else ""
             conn.execute(f"ALTER TABLE pick_outcomes ADD COLUMN {col} {col_type}{default_clause}")
     conn.commit()
@@ -1041,28 +1511,103 @@ def _ensure_pre_teeoff_tables(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+# Columns added to tables after their first release: (table, column, declaration).
+# _run_migrations adds whichever are missing, in this order.
+_ADDED_COLUMNS = (
+    ("csv_imports", "source", "TEXT DEFAULT 'betsperts'"),
+    # Profit tracking on pick_outcomes
+    ("pick_outcomes", "odds_decimal", "REAL"),
+    ("pick_outcomes", "stake", "REAL"),
+    ("pick_outcomes", "profit", "REAL"),
+    ("pick_outcomes", "model_hit", "INTEGER"),
+    ("tournaments", "year", "INTEGER"),
+    ("tournaments", "event_id", "TEXT"),
+    # Model lane/source fields on picks
+    ("picks", "model_variant", "TEXT DEFAULT 'baseline'"),
+    ("picks", "source", "TEXT DEFAULT 'ui_display'"),
+    ("picks", "market_book", "TEXT"),
+    # Engine-scale: per-pick config provenance (which track config epoch produced it).
+    ("picks", "model_config_hash", "TEXT"),
+    ("picks", "market_type", "TEXT DEFAULT ''"),
+    ("historical_predictions", "actual_finish", "TEXT"),
+    ("pit_rolling_stats", "sg_total_rank", "INTEGER"),
+    ("research_proposals", "theory_metadata_json", "TEXT"),
+    # v5 Milestone A: calibration_curve keyed by (bet_type, probability_bucket)
+    ("calibration_curve", "bet_type", "TEXT NOT NULL DEFAULT ''"),
+    # v5 Milestone A: CLV rows optionally tagged with sportsbook
+    ("clv_log", "market_book", "TEXT"),
+    ("prediction_log", "odds_timing", "TEXT DEFAULT 'unknown'"),
+)
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> set[tuple[str, str]]:
+    """ALTER in any _ADDED_COLUMNS entries the database lacks; return those added.
+
+    One PRAGMA table_info per table instead of a SELECT probe (and a caught
+    OperationalError) per column.
+    """
+    existing: dict[str, set[str]] = {}
+    added = set()
+    for table, column, declaration in _ADDED_COLUMNS:
+        if table not in existing:
+            existing[table] = _table_columns(conn, table)
+        if column not in existing[table]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+            existing[table].add(column)
+            added.add((table, column))
+    conn.commit()
+    return added
+
+
+# Keep player_dg_ids[player_key] = MIN(dg_id) over rounds on every write.
+# Inserts only lower the stored value; updates that move a row's player_key
+# or dg_id, and deletes, recompute the affected keys from rounds.
+_PLAYER_DG_ID_TRIGGERS = """
+    DROP TRIGGER IF EXISTS trg_rounds_player_dg_id;
+    CREATE TRIGGER trg_rounds_player_dg_id
+    AFTER INSERT ON rounds
+    WHEN NEW.player_key IS NOT NULL AND NEW.dg_id IS NOT NULL
+    BEGIN
+        INSERT INTO player_dg_ids (player_key, dg_id)
+        VALUES (NEW.player_key, NEW.dg_id)
+        ON CONFLICT(player_key) DO UPDATE SET dg_id = excluded.dg_id
+        WHERE excluded.dg_id < player_dg_ids.dg_id;
+    END;
+
+    DROP TRIGGER IF EXISTS trg_rounds_player_dg_id_update;
+    CREATE TRIGGER trg_rounds_player_dg_id_update
+    AFTER UPDATE OF player_key, dg_id ON rounds
+    WHEN OLD.player_key IS NOT NEW.player_key OR OLD.dg_id IS NOT NEW.dg_id
+    BEGIN
+        DELETE FROM player_dg_ids WHERE player_key = OLD.player_key;
+        INSERT INTO player_dg_ids (player_key, dg_id)
+        SELECT player_key, MIN(dg_id) FROM rounds
+        WHERE player_key IN (OLD.player_key, NEW.player_key) AND dg_id IS NOT NULL
+        GROUP BY player_key
+        ON CONFLICT(player_key) DO UPDATE SET dg_id = excluded.dg_id;
+    END;
+
+    DROP TRIGGER IF EXISTS trg_rounds_player_dg_id_delete;
+    CREATE TRIGGER trg_rounds_player_dg_id_delete
+    AFTER DELETE ON rounds
+    WHEN OLD.player_key IS NOT NULL
+    BEGIN
+        DELETE FROM player_dg_ids WHERE player_key = OLD.player_key;
+        INSERT INTO player_dg_ids (player_key, dg_id)
+        SELECT player_key, MIN(dg_id) FROM rounds
+        WHERE player_key = OLD.player_key AND dg_id IS NOT NULL
+        GROUP BY player_key;
+    END;
+"""
+
+
 def _run_migrations(conn: sqlite3.Connection):
     """Add columns/tables that may be missing in older databases."""
-    # Add source column to csv_imports if missing
-    try:
-        conn.execute("SELECT source FROM csv_imports LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE csv_imports ADD COLUMN source TEXT DEFAULT 'betsperts'")
-        conn.commit()
-
-    # Add profit tracking columns to pick_outcomes if missing
-    for col, col_type, default in [
-        ("odds_decimal", "REAL", None),
-        ("stake", "REAL", None),
-        ("profit", "REAL", None),
-        ("model_hit", "INTEGER", None),
-    ]:
-        try:
-            conn.execute(f"SELECT {col} FROM pick_outcomes LIMIT 1")
-        except sqlite3.OperationalError:
-            default_clause = f" DEFAULT {default}" if default is not None else ""
-            conn.execute(f"ALTER TABLE pick_outcomes ADD COLUMN {col} {col_type}{default_clause}")
-            conn.commit()
+    added_columns = _add_missing_columns(conn)
     try:
         conn.execute(
             """
@@ -1082,35 +1627,6 @@ def _run_migrations(conn: sqlite3.Connection):
         # Runtime reads use COALESCE(model_hit, hit), so null model_hit is safe.
         pass
 
-    # Add year column to tournaments if missing
-    try:
-        conn.execute("SELECT year FROM tournaments LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE tournaments ADD COLUMN year INTEGER")
-        conn.commit()
-
-    # Add model lane/source fields to picks if missing
-    try:
-        conn.execute("SELECT model_variant FROM picks LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE picks ADD COLUMN model_variant TEXT DEFAULT 'baseline'")
-        conn.commit()
-    try:
-        conn.execute("SELECT source FROM picks LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE picks ADD COLUMN source TEXT DEFAULT 'ui_display'")
-        conn.commit()
-    try:
-        conn.execute("SELECT market_book FROM picks LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE picks ADD COLUMN market_book TEXT")
-        conn.commit()
-    # Engine-scale: per-pick config provenance (which track config epoch produced it).
-    try:
-        conn.execute("SELECT model_config_hash FROM picks LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE picks ADD COLUMN model_config_hash TEXT")
-        conn.commit()
     conn.execute("UPDATE picks SET model_variant = 'baseline' WHERE model_variant IS NULL OR TRIM(model_variant) = ''")
     conn.execute("UPDATE picks SET source = 'ui_display' WHERE source IS NULL OR TRIM(source) = ''")
     try:
@@ -1121,10 +1637,7 @@ def _run_migrations(conn: sqlite3.Connection):
         pass
     conn.execute("UPDATE picks SET opponent_key = '' WHERE opponent_key IS NULL")
     conn.execute("UPDATE picks SET opponent_display = '' WHERE opponent_display IS NULL")
-    try:
-        conn.execute("SELECT market_type FROM picks LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE picks ADD COLUMN market_type TEXT DEFAULT ''")
+    if ("picks", "market_type") in added_columns:
         conn.execute(
             "UPDATE picks SET market_type = 'tournament_matchups' "
             "WHERE bet_type = 'matchup' AND (market_type IS NULL OR TRIM(market_type) = '')"
@@ -1135,51 +1648,33 @@ def _run_migrations(conn: sqlite3.Connection):
     conn.commit()
     _migrate_picks_unique_index(conn)
 
-    # Add event_id column to tournaments if missing
-    try:
-        conn.execute("SELECT event_id FROM tournaments LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE tournaments ADD COLUMN event_id TEXT")
-        conn.commit()
-
-    # Add actual_finish column to historical_predictions if missing
-    try:
-        conn.execute("SELECT actual_finish FROM historical_predictions LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE historical_predictions ADD COLUMN actual_finish TEXT")
-        conn.commit()
-
-    # Add sg_total_rank column to pit_rolling_stats if missing
-    try:
-        conn.execute("SELECT sg_total_rank FROM pit_rolling_stats LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE pit_rolling_stats ADD COLUMN sg_total_rank INTEGER")
-        conn.commit()
+    # (Re)install the player_dg_ids triggers and rebuild the table, dropping
+    # mappings written by the older first-row-wins insert-only trigger.
+    conn.executescript(_PLAYER_DG_ID_TRIGGERS)
+    conn.execute("DELETE FROM player_dg_ids")
+    conn.execute(
+        """INSERT INTO player_dg_ids (player_key, dg_id)
+           SELECT player_key, MIN(dg_id) FROM rounds
+           WHERE player_key IS NOT NULL AND dg_id IS NOT NULL
+           GROUP BY player_key"""
+    )
+    conn.commit()
 
-    # Add theory metadata to research proposals if missing
-    try:
-        conn.execute("SELECT theory_metadata_json FROM research_proposals LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE research_proposals ADD COLUMN theory_metadata_json TEXT")
-        conn.commit()
+    # AI memory expiries used to be written with local datetime.now().isoformat()
+    # ("T" separator, local clock); store_ai_memory() now writes SQLite's UTC
+    # datetime('now') format, which is what every expiry filter compares to.
+    conn.execute(
+        """UPDATE ai_memory SET expires_at = datetime(expires_at, 'utc')
+           WHERE expires_at LIKE '%T%' AND datetime(expires_at, 'utc') IS NOT NULL"""
+    )
+    conn.commit()
 
-    # v5 Milestone A: calibration_curve keyed by (bet_type, probability_bucket)
-    try:
-        conn.execute("SELECT bet_type FROM calibration_curve LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute(
-            "ALTER TABLE calibration_curve ADD COLUMN bet_type TEXT NOT NULL DEFAULT ''"
-        )
-        conn.commit()
+    # v5 Milestone A: one calibration_curve row per (bet_type, probability_bucket)
     try:
         conn.execute(
-            """
-            DELETE FROM calibration_curve
-            WHERE id NOT IN (
-                SELECT MAX(id) FROM calibration_curve
-                GROUP BY bet_type, probability_bucket
-            )
-            """
+            "DELETE FROM calibration_curve WHERE id IN ("
+            + _superseded_ids_sql("calibration_curve", "bet_type, probability_bucket")
+            + ")"
         )
         conn.execute(
             "CREATE UNIQUE INDEX IF NOT EXISTS idx_calibration_curve_type_bucket "
@@ -1191,13 +1686,6 @@ def _run_migrations(conn: sqlite3.Connection):
             "calibration_curve unique index migration skipped", exc_info=True
         )
 
-    # v5 Milestone A: CLV rows optionally tagged with sportsbook
-    try:
-        conn.execute("SELECT market_book FROM clv_log LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE clv_log ADD COLUMN market_book TEXT")
-        conn.commit()
-
     conn.execute("""
         CREATE TABLE IF NOT EXISTS research_model_registry (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1317,33 +1805,23 @@ def _run_migrations(conn: sqlite3.Connection):
     """)
     conn.commit()
 
-    # Add UNIQUE index on metrics for dedup (prevents duplicate SG:TOT rows per player/window)
-    try:
+    # Add UNIQUE index on metrics for dedup (prevents duplicate SG:TOT rows
+    # per player/window). store_metrics() upserts ON CONFLICT against it, so
+    # a failure here must propagate rather than stamp SCHEMA_VERSION without it.
+    existing = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_metrics_unique'"
+    ).fetchone()
+    if not existing:
         # First deduplicate: keep the row with the highest id (most recent)
-        conn.execute("""
-            DELETE FROM metrics
-            WHERE id NOT IN (
-                SELECT MAX(id) FROM metrics
-                GROUP BY tournament_id, player_key, metric_category, data_mode, round_window, metric_name
-            )
-        """)
+        conn.execute(
+            "DELETE FROM metrics WHERE id IN ("
+            + _superseded_ids_sql("metrics", ", ".join(_METRIC_KEY_COLUMNS))
+            + ")"
+        )
+        conn.execute(
+            f"CREATE UNIQUE INDEX idx_metrics_unique ON metrics({', '.join(_METRIC_KEY_COLUMNS)})"
+        )
         conn.commit()
-    except Exception:
-        logging.getLogger(__name__).debug("Metrics dedup skipped (table may be empty or not exist yet)", exc_info=True)
-
-    try:
-        conn.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_metrics_unique'")
-        existing = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_metrics_unique'"
-        ).fetchone()
-        if not existing:
-            conn.execute("""
-                CREATE UNIQUE INDEX idx_metrics_unique
-                ON metrics(tournament_id, player_key, metric_category, data_mode, round_window, metric_name)
-            """)
-            conn.commit()
-    except Exception:
-        logging.getLogger(__name__).debug("Metrics unique index creation skipped", exc_info=True)
 
     # Add UNIQUE constraints via indexes (safe to run repeatedly)
     _add_unique_constraints(conn)
@@ -1372,13 +1850,55 @@ def _ensure_hot_path_indexes(conn: sqlite3.Connection) -> None:
     """Create composite indexes for hot-path queries on existing DBs.
 
     Idempotent: uses CREATE INDEX IF NOT EXISTS. No data is read or modified.
-    Covers Q4 defect — full scans on rounds / metrics / historical_odds.
+    Covers Q4 defect — full scans on rounds / metrics / historical_odds —
+    plus the covering metrics index that replaced idx_metrics_player and the
+    recent-rounds indexes that replaced idx_rounds_player(_key).
     """
     statements = (
         "CREATE INDEX IF NOT EXISTS idx_rounds_player_event "
         "ON rounds(player_key, event_completed)",
-        "CREATE INDEX IF NOT EXISTS idx_metrics_tourn_player_cat "
-        "ON metrics(tournament_id, player_key, metric_category)",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_player_recent "
+        "ON rounds(dg_id, event_completed DESC, round_num DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_player_key_recent "
+        "ON rounds(player_key, event_completed DESC, round_num DESC)",
+        # Replaced by the player_dg_ids lookup table.
+        "DROP INDEX IF EXISTS idx_rounds_player_key_dg",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_event_results "
+        "ON rounds(event_id, year, dg_id, player_name, player_key, fin_text)",
+        # (event_id, year) is a prefix of idx_rounds_event_results.
+        "DROP INDEX IF EXISTS idx_rounds_event",
+        "CREATE INDEX IF NOT EXISTS idx_rounds_tour_year_dg_event "
+        "ON rounds(tour, year, dg_id, event_id)",
+        # Superseded by the *_recent indexes above (same leading columns).
+        "DROP INDEX IF EXISTS idx_rounds_player",
+        "DROP INDEX IF EXISTS idx_rounds_player_key",
+        # (tournament_id, player_key, metric_category) is a prefix of both
+        # idx_metrics_player_cover and idx_metrics_unique; a third copy only
+        # made every metrics insert maintain one more B-tree.
+        "DROP INDEX IF EXISTS idx_metrics_tourn_player_cat",
+        "CREATE INDEX IF NOT EXISTS idx_metrics_player_cover "
+        "ON metrics(tournament_id, player_key, metric_category, round_window, metric_name, "
+        "data_mode, metric_value, metric_text, player_display, csv_import_id)",
+        # (tournament_id, player_key) is a prefix of the indexes above.
+        "DROP INDEX IF EXISTS idx_metrics_player",
+        "CREATE INDEX IF NOT EXISTS idx_metrics_category_cover "
+        "ON metrics(tournament_id, metric_category, data_mode, round_window, player_key, "
+        "metric_name, metric_value, metric_text, player_display, csv_import_id)",
+        # Prefix of idx_metrics_category_cover.
+        "DROP INDEX IF EXISTS idx_metrics_category",
+        "CREATE INDEX IF NOT EXISTS idx_metrics_confirmed_field "
+        "ON metrics(tournament_id, player_key, metric_category, metric_name, metric_text) "
+        "WHERE metric_category = 'meta' AND metric_name = 'field_status' "
+        "AND metric_text = 'confirmed'",
+        "CREATE INDEX IF NOT EXISTS idx_pick_outcomes_pick ON pick_outcomes(pick_id)",
+        "CREATE INDEX IF NOT EXISTS idx_weight_sets_active "
+        "ON weight_sets(active, id DESC) WHERE active = 1",
+        "CREATE INDEX IF NOT EXISTS idx_ai_decisions_tid_phase_time "
+        "ON ai_decisions(tournament_id, phase, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_ai_memory_topic_rank "
+        "ON ai_memory(topic, confidence DESC, created_at DESC)",
+        # (topic, confidence) is a prefix of idx_ai_memory_topic_rank.
+        "DROP INDEX IF EXISTS idx_ai_memory_topic",
         "CREATE INDEX IF NOT EXISTS idx_historical_odds_event_book_ts "
         "ON historical_odds(event_id, book, year)",
         "CREATE INDEX IF NOT EXISTS idx_live_snapshot_history_event_section "
@@ -1397,6 +1917,19 @@ def _ensure_hot_path_indexes(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _superseded_ids_sql(table: str, partition_cols: str) -> str:
+    """SELECT of ids that have a newer row (higher id) with the same partition_cols.
+
+    Single pass via ROW_NUMBER() instead of probing NOT IN (SELECT MAX(id) ...)
+    per row; NULLs partition together just as they group together.
+    """
+    return (
+        f"SELECT id FROM (SELECT id, ROW_NUMBER() OVER "
+        f"(PARTITION BY {partition_cols} ORDER BY id DESC) AS rn FROM {table}) "
+        f"WHERE rn > 1"
+    )
+
+
 def _add_unique_constraints(conn: sqlite3.Connection):
     """Add UNIQUE indexes for dedup. Deduplicates existing data first."""
     constraint_defs = [
@@ -1428,79 +1961,79 @@ def _add_unique_constraints(conn: sqlite3.Connection):
 
         # Deduplicate: keep the row with the highest id (most recent)
         try:
+            superseded = _superseded_ids_sql(table, cols.strip("()"))
+            # Dependent pick_outcomes are removed explicitly below; skip
+            # per-row FK checks during the bulk delete.
+            conn.execute("PRAGMA defer_foreign_keys = ON")
             if table == "picks":
-                conn.execute(f"""
-                    DELETE FROM pick_outcomes
-                    WHERE pick_id IN (
-                        SELECT id FROM {table}
-                        WHERE id NOT IN (
-                            SELECT MAX(id) FROM {table}
-                            GROUP BY {cols.strip('()')}
-                        )
-                    )
-                """)
-            conn.execute(f"""
-                DELETE FROM {table}
-                WHERE id NOT IN (
-                    SELECT MAX(id) FROM {table}
-                    GROUP BY {cols.strip('()')}
-                )
-            """)
+                conn.execute(f"DELETE FROM pick_outcomes WHERE pick_id IN ({superseded})")
+            conn.execute(f"DELETE FROM {table} WHERE id IN ({superseded})")
             conn.execute(
                 f"CREATE UNIQUE INDEX IF NOT EXISTS {idx_name} ON {table} {cols}"
             )
             conn.commit()
         except sqlite3.OperationalError:
             # Table might not exist yet or columns might differ
-            pass
+            conn.rollback()
 
 
 # ── Tournament helpers ──────────────────────────────────────────────
 
+# (DB_PATH, name, year) -> (tournament id, has event_id). Entries are only
+# added once the row is committed: an id from an INSERT still pending inside a
+# db.transaction() block is dropped (and sqlite_sequence rewound) if the block
+# rolls back, and could then be reissued to a different tournament. Committed
+# ids are never reused, so entries only go stale on a restore.
+_TOURNAMENT_ID_CACHE: dict[tuple[str, str, int], tuple[int, bool]] = {}
+_TOURNAMENT_ID_CACHE_SIZE = 64
+
+
 def get_or_create_tournament(name: str, course: str = None,
                              date: str = None, year: int = None,
                              event_id: str = None) -> int:
     if year is None:
         year = datetime.now().year
-    conn = get_conn()
-
-    # Ensure event_id column exists (migration-safe)
-    try:
-        conn.execute("SELECT event_id FROM tournaments LIMIT 0")
-    except sqlite3.OperationalError:
-        conn.execute("ALTER TABLE tournaments ADD COLUMN event_id TEXT")
-        conn.commit()
-
-    row = conn.execute(
-        "SELECT id, year, event_id FROM tournaments WHERE name = ? AND (year = ? OR year IS NULL)",
-        (name, year),
-    ).fetchone()
-    if row:
-        tid = row["id"]
-        # Fix NULL year or missing event_id on existing rows
-        updates = []
-        params = []
-        if row["year"] is None and year is not None:
-            updates.append("year = ?")
-            params.append(year)
-        if row["event_id"] is None and event_id is not None:
-            updates.append("event_id = ?")
-            params.append(event_id)
-        if updates:
-            params.append(tid)
-            conn.execute(
-                f"UPDATE tournaments SET {', '.join(updates)} WHERE id = ?",
-                params,
+    cache_key = (DB_PATH, name, year)
+    cached = _TOURNAMENT_ID_CACHE.get(cache_key)
+    if cached is not None and (cached[1] or event_id is None):
+        return cached[0]
+    with connection() as conn:
+        row = conn.execute(
+            "SELECT id, year, event_id FROM tournaments WHERE name = ? AND (year = ? OR year IS NULL)",
+            (name, year),
+        ).fetchone()
+        if row:
+            tid = row["id"]
+            # Fix NULL year or missing event_id on existing rows
+            updates = []
+            params = []
+            if row["year"] is None and year is not None:
+                updates.append("year = ?")
+                params.append(year)
+            if row["event_id"] is None and event_id is not None:
+                updates.append("event_id = ?")
+                params.append(event_id)
+            if updates:
+                params.append(tid)
+                conn.execute(
+                    f"UPDATE tournaments SET {', '.join(updates)} WHERE id = ?",
+                    params,
+                )
+                conn.commit()
+        else:
+            cur = conn.execute(
+                "INSERT INTO tournaments (name, course, date, year, event_id) VALUES (?, ?, ?, ?, ?)",
+                (name, course, date, year, event_id),
             )
+            tid = cur.lastrowid
             conn.commit()
-    else:
-        cur = conn.execute(
-            "INSERT INTO tournaments (name, course, date, year, event_id) VALUES (?, ?, ?, ?, ?)",
-            (name, course, date, year, event_id),
-        )
-        tid = cur.lastrowid
-        conn.commit()
-    conn.close()
+        committed = not conn.in_transaction
+    if not committed:
+        return tid
+    has_event_id = event_id is not None or (row is not None and row["event_id"] is not None)
+    if len(_TOURNAMENT_ID_CACHE) >= _TOURNAMENT_ID_CACHE_SIZE:
+        _TOURNAMENT_ID_CACHE.pop(next(iter(_TOURNAMENT_ID_CACHE)))
+    _TOURNAMENT_ID_CACHE[cache_key] = (tid, has_event_id)
     return tid
 
 
@@ -1508,74 +2041,207 @@ def get_or_create_tournament(name: str, course: str = None,
 
 def log_csv_import(tournament_id, filename, file_type, data_mode, round_window,
                    row_count, source="betsperts") -> int:
-    conn = get_conn()
-    cur = conn.execute(
-        """INSERT INTO csv_imports
-           (tournament_id, filename, file_type, data_mode, round_window, row_count, source)
-           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-        (tournament_id, filename, file_type, data_mode, round_window, row_count, source),
-    )
-    import_id = cur.lastrowid
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        cur = conn.execute(
+            """INSERT INTO csv_imports
+               (tournament_id, filename, file_type, data_mode, round_window, row_count, source)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            (tournament_id, filename, file_type, data_mode, round_window, row_count, source),
+        )
+        import_id = cur.lastrowid
+        conn.commit()
     return import_id
 
 
-def store_metrics(rows: list[dict]):
-    """Bulk insert/update metric rows. Uses INSERT OR REPLACE for dedup."""
+def _insert_multi_row(
+    conn: sqlite3.Connection,
+    multi_sql: str,
+    single_sql: str,
+    per_insert: int,
+    values: Sequence[tuple],
+) -> None:
+    """Insert *values* as full chunks of *per_insert* rows, then the remainder.
+
+    *multi_sql* holds *per_insert* VALUES groups, so each full chunk costs one
+    statement step instead of one per row; the tail uses *single_sql*.
+    """
+    n_full = len(values) - len(values) % per_insert
+    if n_full:
+        conn.executemany(
+            multi_sql,
+            (
+                tuple(itertools.chain.from_iterable(values[i:i + per_insert]))
+                for i in range(0, n_full, per_insert)
+            ),
+        )
+    if n_full < len(values):
+        conn.executemany(single_sql, values[n_full:])
+
+
+class MetricRow(NamedTuple):
+    """Positional metric row; field order matches _METRIC_COLUMNS."""
+
+    tournament_id: int
+    csv_import_id: int | None
+    player_key: str
+    player_display: str
+    metric_category: str
+    data_mode: str
+    round_window: str
+    metric_name: str
+    metric_value: float | None
+    metric_text: str | None
+
+
+_METRIC_COLUMNS = MetricRow._fields
+_metric_values = operator.itemgetter(*_METRIC_COLUMNS)
+# Matches idx_metrics_unique. Upserting in place keeps the row id and only
+# touches indexes whose columns changed, unlike REPLACE's delete + insert.
+_METRIC_KEY_COLUMNS = (
+    "tournament_id", "player_key", "metric_category", "data_mode", "round_window", "metric_name",
+)
+_UPSERT_METRICS_CLAUSE = (
+    f" ON CONFLICT({', '.join(_METRIC_KEY_COLUMNS)}) DO UPDATE SET "
+    + ", ".join(
+        f"{col} = excluded.{col}" for col in _METRIC_COLUMNS if col not in _METRIC_KEY_COLUMNS
+    )
+)
+_METRICS_VALUES_SQL = f"({', '.join('?' * len(_METRIC_COLUMNS))})"
+_INSERT_METRICS_SQL = (
+    f"INSERT INTO metrics ({', '.join(_METRIC_COLUMNS)}) VALUES {_METRICS_VALUES_SQL}"
+    + _UPSERT_METRICS_CLAUSE
+)
+# Same row cap as the rounds inserter (999 bound parameters per statement).
+_METRICS_ROWS_PER_INSERT = 999 // len(_METRIC_COLUMNS)
+_INSERT_METRICS_MULTI_SQL = (
+    f"INSERT INTO metrics ({', '.join(_METRIC_COLUMNS)}) VALUES "
+    + ", ".join([_METRICS_VALUES_SQL] * _METRICS_ROWS_PER_INSERT)
+    + _UPSERT_METRICS_CLAUSE
+)
+
+
+def store_metrics(rows: Iterable[dict] | Iterable[MetricRow]):
+    """Bulk insert/update metric rows, upserting on idx_metrics_unique.
+
+    Accepts any iterable of either dicts keyed by column name or MetricRow
+    tuples. Dicts are converted to positional tuples once so binding skips
+    per-column lookups. A single call must not mix the two shapes. Full
+    chunks of _METRICS_ROWS_PER_INSERT rows go through one multi-row INSERT
+    each.
+    """
+    rows = list(rows)
     if not rows:
         return
+    values = rows if isinstance(rows[0], tuple) else list(map(_metric_values, rows))
     conn = get_conn()
-    conn.executemany(
-        """INSERT OR REPLACE INTO metrics
-           (tournament_id, csv_import_id, player_key, player_display,
-            metric_category, data_mode, round_window,
-            metric_name, metric_value, metric_text)
-           VALUES (:tournament_id, :csv_import_id, :player_key, :player_display,
-                    :metric_category, :data_mode, :round_window,
-                    :metric_name, :metric_value, :metric_text)""",
-        rows,
-    )
-    conn.commit()
-    conn.close()
+    try:
+        with _immediate_transaction(conn):
+            _insert_multi_row(
+                conn, _INSERT_METRICS_MULTI_SQL, _INSERT_METRICS_SQL, _METRICS_ROWS_PER_INSERT, values,
+            )
+        # A whole tournament's metric set is a pure backfill from this
+        # connection's point of view, which PRAGMA optimize would skip.
+        if len(rows) >= _ANALYZE_MIN_ROWS:
+            _analyze(conn, "metrics")
+        elif len(rows) >= _OPTIMIZE_MIN_ROWS:
+            _optimize(conn)
+        else:
+            _maybe_optimize(conn)
+    finally:
+        conn.close()
 
 
 # ── Metrics query helpers ───────────────────────────────────────────
 
-def get_player_metrics(tournament_id: int, player_key: str) -> list[dict]:
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT * FROM metrics
-           WHERE tournament_id = ? AND player_key = ?
-           ORDER BY metric_category, round_window, metric_name""",
-        (tournament_id, player_key),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def _column_values(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> list:
+    """Return the first column of every row, skipping sqlite3.Row construction."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return [r[0] for r in cur.execute(sql, params)]
+
+
+class Record(sqlite3.Row):
+    """sqlite3.Row with dict-style .get().
+
+    Read helpers return these instead of copying every row into a dict:
+    keyed and indexed access stay in C, and callers written against dicts
+    (``m["metric_name"]``, ``m.get(...)``, ``dict(m)``) keep working. Callers
+    that need to mutate or JSON-encode a row should convert it with dict().
+    """
+
+    __slots__ = ()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except IndexError:
+            return default
+
+
+def _fetch_records(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> list[Record]:
+    cur = conn.cursor()
+    cur.row_factory = Record
+    return cur.execute(sql, params).fetchall()
+
+
+def _in_list(values: Sequence) -> tuple[str, list]:
+    """Placeholders and params for ``col IN (...)`` with a bucketed arity.
+
+    The list is padded (repeating its last value, harmless inside IN) to the
+    next power of two, minimum 8, so varying list lengths map to a handful of
+    SQL strings that stay in the connection's prepared-statement cache
+    instead of each length being parsed anew.
+    """
+    params = list(values)
+    size = 8
+    while size < len(params):
+        size *= 2
+    params.extend(params[-1:] * (size - len(params)))
+    return ",".join("?" * size), params
+
+
+def _fetch_scalar(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> Any:
+    """First column of the first row (None if no row), read with tuple rows."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    row = cur.execute(sql, params).fetchone()
+    return row[0] if row else None
+
+
+def get_player_metrics(tournament_id: int, player_key: str) -> list[Record]:
+    with read_connection() as conn:
+        rows = _fetch_records(
+            conn,
+            """SELECT * FROM metrics
+               WHERE tournament_id = ? AND player_key = ?
+               ORDER BY metric_category, round_window, metric_name""",
+            (tournament_id, player_key),
+        )
+    return rows
 
 
 def get_player_metrics_by_categories(
     tournament_id: int,
     player_key: str,
     categories: list[str],
-) -> list[dict]:
+) -> list[Record]:
     """Return player metrics filtered to specific metric categories."""
     if not categories:
         return []
 
-    placeholders = ",".join("?" for _ in categories)
-    params = [tournament_id, player_key, *categories]
-    conn = get_conn()
-    rows = conn.execute(
-        f"""SELECT * FROM metrics
-            WHERE tournament_id = ?
-              AND player_key = ?
-              AND metric_category IN ({placeholders})
-            ORDER BY metric_category, round_window, metric_name""",
-        params,
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    placeholders, category_params = _in_list(categories)
+    params = [tournament_id, player_key, *category_params]
+    with read_connection() as conn:
+        rows = _fetch_records(
+            conn,
+            f"""SELECT * FROM metrics
+                WHERE tournament_id = ?
+                  AND player_key = ?
+                  AND metric_category IN ({placeholders})
+                ORDER BY metric_category, round_window, metric_name""",
+            params,
+        )
+    return rows
 
 
 def get_tournament_metric_values(
@@ -1600,10 +2266,10 @@ def get_tournament_metric_values(
         sql += " AND round_window = ?"
         params.append(round_window)
 
-    conn = get_conn()
-    rows = conn.execute(sql, params).fetchall()
-    conn.close()
-    return [float(r["metric_value"]) for r in rows if r["metric_value"] is not None]
+    with read_connection() as conn:
+        values = _column_values(conn, sql, params)
+    # IS NOT NULL is already in the WHERE clause.
+    return list(map(float, values))
 
 
 def get_tournament_field_size(tournament_id: int) -> int:
@@ -1613,30 +2279,27 @@ def get_tournament_field_size(tournament_id: int) -> int:
     Prefers explicit confirmed field rows from Data Golf field updates,
     then falls back to distinct players seen in metrics.
     """
-    conn = get_conn()
-    try:
-        confirmed_row = conn.execute(
-            """SELECT COUNT(DISTINCT player_key) AS cnt
+    with read_connection() as conn:
+        confirmed_count = _fetch_scalar(
+            conn,
+            """SELECT COUNT(DISTINCT player_key)
                FROM metrics
                WHERE tournament_id = ?
                  AND metric_category = 'meta'
                  AND metric_name = 'field_status'
                  AND metric_text = 'confirmed'""",
             (tournament_id,),
-        ).fetchone()
-        confirmed_count = int(confirmed_row["cnt"] or 0) if confirmed_row else 0
-        if confirmed_count > 0:
-            return confirmed_count
+        )
+        if confirmed_count:
+            return int(confirmed_count)
 
-        fallback_row = conn.execute(
-            """SELECT COUNT(DISTINCT player_key) AS cnt
+        return int(_fetch_scalar(
+            conn,
+            """SELECT COUNT(DISTINCT player_key)
                FROM metrics
                WHERE tournament_id = ?""",
             (tournament_id,),
-        ).fetchone()
-        return int(fallback_row["cnt"] or 0) if fallback_row else 0
-    finally:
-        conn.close()
+        ) or 0)
 
 
 def get_all_players(tournament_id: int, confirmed_field_only: bool = True) -> list[str]:
@@ -1649,46 +2312,39 @@ def get_all_players(tournament_id: int, confirmed_field_only: bool = True) -> li
     predate the stricter marker. In strict mode, if no confirmed field exists,
     returns an empty list (fail closed) to avoid ranking non-participants.
     """
-    conn = get_conn()
-    has_explicit_field = conn.execute(
-        """SELECT 1 FROM metrics
-           WHERE tournament_id = ?
-             AND metric_category = 'meta'
-             AND metric_name = 'field_status'
-             AND metric_text = 'confirmed'
-           LIMIT 1""",
-        (tournament_id,),
-    ).fetchone()
-    if confirmed_field_only and has_explicit_field:
-        rows = conn.execute(
-            """SELECT DISTINCT player_key FROM metrics
+    with read_connection() as conn:
+        if not confirmed_field_only:
+            # GROUP BY walks the (tournament_id, player_key) index in order
+            # instead of building a temp B-tree for DISTINCT.
+            return _column_values(
+                conn,
+                "SELECT player_key FROM metrics WHERE tournament_id = ? GROUP BY player_key",
+                (tournament_id,),
+            )
+        # The WHERE clause matches idx_metrics_confirmed_field exactly, so only
+        # the field_status rows are read, already in player_key order.
+        players = _column_values(
+            conn,
+            """SELECT player_key FROM metrics
                WHERE tournament_id = ?
                  AND metric_category = 'meta'
                  AND metric_name = 'field_status'
-                 AND metric_text = 'confirmed'""",
+                 AND metric_text = 'confirmed'
+               GROUP BY player_key""",
             (tournament_id,),
-        ).fetchall()
-    else:
+        )
+    if not players:
         # Fail closed for strict field integrity when no explicit field exists.
         # Any proxy based on stats can include players not actually in the event.
-        if confirmed_field_only:
-            _logger.warning(
-                "No explicit confirmed field rows found for tournament_id=%s; returning empty field list",
-                tournament_id,
-            )
-            rows = []
-        else:
-            rows = conn.execute(
-                "SELECT DISTINCT player_key FROM metrics WHERE tournament_id = ?",
-                (tournament_id,),
-            ).fetchall()
-    conn.close()
-    return [r["player_key"] for r in rows]
+        _logger.warning(
+            "No explicit confirmed field rows found for tournament_id=%s; returning empty field list",
+            tournament_id,
+        )
+    return players
 
 
 def get_metrics_by_category(tournament_id: int, category: str,
-                            data_mode: str = None, round_window: str = None) -> list[dict]:
-    conn = get_conn()
+                            data_mode: str = None, round_window: str = None) -> list[Record]:
     sql = "SELECT * FROM metrics WHERE tournament_id = ? AND metric_category = ?"
     params = [tournament_id, category]
     if data_mode:
@@ -1697,20 +2353,21 @@ def get_metrics_by_category(tournament_id: int, category: str,
     if round_window:
         sql += " AND round_window = ?"
         params.append(round_window)
-    rows = conn.execute(sql, params).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    with read_connection() as conn:
+        rows = _fetch_records(conn, sql, params)
+    return rows
 
 
 def get_player_display_names(tournament_id: int) -> dict:
     """Return {player_key: player_display} mapping."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT DISTINCT player_key, player_display FROM metrics
-           WHERE tournament_id = ? AND player_display IS NOT NULL""",
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(
+            """SELECT DISTINCT player_key, player_display FROM metrics
+               WHERE tournament_id = ? AND player_display IS NOT NULL""",
+            (tournament_id,),
+        ).fetchall()
 
     def _display_quality(player_key: str, player_display: str) -> tuple[int, int]:
         display = str(player_display or "").strip()
@@ -1718,10 +2375,12 @@ def get_player_display_names(tournament_id: int) -> dict:
         has_space = " " in display
         return (0 if key_like else 1, 1 if has_space else 0)
 
-    best: dict[str, str] = {}
-    for row in rows:
-        player_key = row["player_key"]
-        player_display = row["player_display"]
+    # Most keys have a single display; only rank when a key repeats.
+    best = dict(rows)
+    if len(best) == len(rows):
+        return best
+    best = {}
+    for player_key, player_display in rows:
         current = best.get(player_key)
         if current is None or _display_quality(player_key, player_display) > _display_quality(player_key, current):
             best[player_key] = player_display
@@ -1751,115 +2410,117 @@ def _migrate_picks_unique_index(conn: sqlite3.Connection) -> None:
     _add_unique_constraints(conn)
 
 
+# idx_picks_unique: one pick per lane and play on these columns;
+# _PICK_DATA_COLUMNS are what a better-priced duplicate overwrites.
+_PICK_KEY_COLUMNS = (
+    "tournament_id", "model_variant", "source", "player_key", "bet_type", "market_type",
+    "opponent_key",
+)
+_PICK_DATA_COLUMNS = (
+    "player_display", "opponent_display", "composite_score", "course_fit_score", "form_score",
+    "momentum_score", "model_prob", "market_odds", "market_book", "market_implied_prob", "ev",
+    "confidence", "reasoning", "model_config_hash",
+)
+_PICK_COLUMNS = _PICK_KEY_COLUMNS + _PICK_DATA_COLUMNS
+_PICK_KEY_LEN = len(_PICK_KEY_COLUMNS)
+_PICK_ODDS_INDEX = _PICK_COLUMNS.index("market_odds")
+_PICK_EV_INDEX = _PICK_COLUMNS.index("ev")
+_SELECT_PICK_SQL = (
+    "SELECT id, market_odds, ev FROM picks WHERE "
+    + " AND ".join(f"{col} = ?" for col in _PICK_KEY_COLUMNS)
+    + " LIMIT 1"
+)
+_INSERT_PICK_SQL = (
+    f"INSERT INTO picks ({', '.join(_PICK_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_PICK_COLUMNS))})"
+)
+_UPDATE_PICK_SQL = (
+    "UPDATE picks SET " + ", ".join(f"{col} = ?" for col in _PICK_DATA_COLUMNS) + " WHERE id = ?"
+)
+
+
+def _pick_values(pick: dict) -> tuple:
+    """One pick as a tuple in _PICK_COLUMNS order, with lane defaults applied."""
+    return (
+        pick["tournament_id"],
+        (pick.get("model_variant") or "baseline").strip().lower(),
+        pick.get("source") or "cockpit",
+        pick.get("player_key"),
+        pick.get("bet_type"),
+        pick.get("market_type") or "",
+        pick.get("opponent_key") or "",
+        pick.get("player_display"),
+        pick.get("opponent_display") or "",
+        pick.get("composite_score"),
+        pick.get("course_fit_score"),
+        pick.get("form_score"),
+        pick.get("momentum_score"),
+        pick.get("model_prob"),
+        pick.get("market_odds"),
+        pick.get("market_book") or "",
+        pick.get("market_implied_prob"),
+        pick.get("ev"),
+        pick.get("confidence"),
+        pick.get("reasoning"),
+        pick.get("model_config_hash"),
+    )
+
+
 def store_picks(picks: list[dict]):
+    """Insert picks, keeping one row per lane key with the best odds/EV.
+
+    Rows are bound as positional tuples against the module-level statements,
+    so each call reuses three cached prepared statements.
+    """
     if not picks:
         return
     from src.official_pick_record import american_odds_rank
 
-    normalized_rows = []
-    for pick in picks:
-        normalized_rows.append({
-            "tournament_id": pick["tournament_id"],
-            "model_variant": (pick.get("model_variant") or "baseline").strip().lower(),
-            "source": pick.get("source") or "cockpit",
-            "bet_type": pick.get("bet_type"),
-            "market_type": pick.get("market_type") or "",
-            "player_key": pick.get("player_key"),
-            "player_display": pick.get("player_display"),
-            "opponent_key": pick.get("opponent_key") or "",
-            "opponent_display": pick.get("opponent_display") or "",
-            "composite_score": pick.get("composite_score"),
-            "course_fit_score": pick.get("course_fit_score"),
-            "form_score": pick.get("form_score"),
-            "momentum_score": pick.get("momentum_score"),
-            "model_prob": pick.get("model_prob"),
-            "market_odds": pick.get("market_odds"),
-            "market_book": pick.get("market_book") or "",
-            "market_implied_prob": pick.get("market_implied_prob"),
-            "ev": pick.get("ev"),
-            "confidence": pick.get("confidence"),
-            "reasoning": pick.get("reasoning"),
-            "model_config_hash": pick.get("model_config_hash"),
-        })
-    conn = get_conn()
-    select_sql = """
-        SELECT id, market_odds, ev, market_book FROM picks
-        WHERE tournament_id = :tournament_id
-          AND model_variant = :model_variant
-          AND source = :source
-          AND player_key = :player_key
-          AND bet_type = :bet_type
-          AND market_type = :market_type
-          AND opponent_key = :opponent_key
-        LIMIT 1
-    """
-    insert_sql = """
-        INSERT INTO picks
-           (tournament_id, model_variant, source, bet_type, market_type, player_key, player_display,
-            opponent_key, opponent_display,
-            composite_score, course_fit_score, form_score, momentum_score,
-            model_prob, market_odds, market_book, market_implied_prob, ev,
-            confidence, reasoning, model_config_hash)
-           VALUES (:tournament_id, :model_variant, :source, :bet_type, :market_type, :player_key, :player_display,
-                    :opponent_key, :opponent_display,
-                    :composite_score, :course_fit_score, :form_score, :momentum_score,
-                    :model_prob, :market_odds, :market_book, :market_implied_prob, :ev,
-                    :confidence, :reasoning, :model_config_hash)
-    """
-    update_sql = """
-        UPDATE picks SET
-            player_display = :player_display,
-            opponent_display = :opponent_display,
-            composite_score = :composite_score,
-            course_fit_score = :course_fit_score,
-            form_score = :form_score,
-            momentum_score = :momentum_score,
-            model_prob = :model_prob,
-            market_odds = :market_odds,
-            market_book = :market_book,
-            market_implied_prob = :market_implied_prob,
-            ev = :ev,
-            confidence = :confidence,
-            reasoning = :reasoning,
-            model_config_hash = :model_config_hash
-        WHERE id = :existing_id
-    """
-    for row in normalized_rows:
-        existing = conn.execute(select_sql, row).fetchone()
-        if existing is None:
-            conn.execute(insert_sql, row)
-            continue
-        better_odds = american_odds_rank(row.get("market_odds")) > american_odds_rank(existing["market_odds"])
-        better_ev = float(row.get("ev") or 0) > float(existing["ev"] or 0)
-        if better_odds or better_ev:
-            conn.execute(update_sql, {**row, "existing_id": existing["id"]})
-    conn.commit()
-    conn.close()
+    values = list(map(_pick_values, picks))
+    with connection() as conn:
+        with _immediate_transaction(conn):
+            for row in values:
+                existing = conn.execute(_SELECT_PICK_SQL, row[:_PICK_KEY_LEN]).fetchone()
+                if existing is None:
+                    conn.execute(_INSERT_PICK_SQL, row)
+                    continue
+                better_odds = american_odds_rank(row[_PICK_ODDS_INDEX]) > american_odds_rank(existing["market_odds"])
+                better_ev = float(row[_PICK_EV_INDEX] or 0) > float(existing["ev"] or 0)
+                if better_odds or better_ev:
+                    conn.execute(_UPDATE_PICK_SQL, (*row[_PICK_KEY_LEN:], existing["id"]))
+        _maybe_optimize(conn)
 
 
-def store_results(tournament_id: int, results_list: list[dict]):
+def store_results(tournament_id: int, results_list: Iterable[dict]):
+    """Upsert finishes for a tournament; *results_list* may be any iterable.
+
+    Rows are bound straight from the iterable, so a generator-fed backfill
+    never holds a second full copy of the field as parameter tuples.
+    """
     if not results_list:
         return
     conn = get_conn()
-    conn.executemany(
-        """INSERT INTO results
-           (tournament_id, player_key, player_display, finish_position,
-            finish_text, made_cut)
-           VALUES (?, ?, ?, ?, ?, ?)
-           ON CONFLICT(tournament_id, player_key) DO UPDATE SET
-               player_display = excluded.player_display,
-               finish_position = excluded.finish_position,
-               finish_text = excluded.finish_text,
-               made_cut = excluded.made_cut,
-               entered_at = datetime('now')""",
-        [
-            (tournament_id, r["player_key"], r["player_display"],
-             r.get("finish_position"), r.get("finish_text"), r.get("made_cut"))
-            for r in results_list
-        ],
-    )
-    conn.commit()
-    conn.close()
+    try:
+        with _immediate_transaction(conn):
+            conn.executemany(
+                """INSERT INTO results
+                   (tournament_id, player_key, player_display, finish_position,
+                    finish_text, made_cut)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(tournament_id, player_key) DO UPDATE SET
+                       player_display = excluded.player_display,
+                       finish_position = excluded.finish_position,
+                       finish_text = excluded.finish_text,
+                       made_cut = excluded.made_cut,
+                       entered_at = datetime('now')""",
+                (
+                    (tournament_id, r["player_key"], r["player_display"],
+                     r.get("finish_position"), r.get("finish_text"), r.get("made_cut"))
+                    for r in results_list
+                ),
+            )
+    finally:
+        conn.close()
 
 
 def try_claim_telegram_alert(alert_hash: str) -> bool:
@@ -1887,240 +2548,561 @@ def try_claim_telegram_alert(alert_hash: str) -> bool:
 DEFAULT_WEIGHTS = config.DEFAULT_WEIGHTS
 
 
+def _loads_weights(text: str) -> dict:
+    """Parse a weights_json blob, with orjson when installed.
+
+    Writes keep json.dumps so the stored text format does not change; that
+    can emit NaN/Infinity, which orjson rejects, so those fall back to json.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# Parsed active weight set per database path, keyed by weight_sets.id.
+# Weight sets are insert-only, so an unchanged id means unchanged JSON.
+_ACTIVE_WEIGHTS_CACHE: dict[str, tuple[int, dict]] = {}
+
+
+def _active_weight_set() -> tuple[int | None, dict]:
+    """(weight_sets.id, shared parsed weights) of the active set; do not mutate.
+
+    id is None when no set is active and DEFAULT_WEIGHTS apply.
+    """
+    with read_connection() as conn:
+        row = conn.execute(
+            "SELECT id, weights_json FROM weight_sets WHERE active = 1 ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+    if not row:
+        return None, DEFAULT_WEIGHTS
+    cached = _ACTIVE_WEIGHTS_CACHE.get(DB_PATH)
+    if cached is None or cached[0] != row[0]:
+        cached = (row[0], _loads_weights(row[1]))
+        _ACTIVE_WEIGHTS_CACHE[DB_PATH] = cached
+    return cached
+
+
 def get_active_weights() -> dict:
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT weights_json FROM weight_sets WHERE active = 1 ORDER BY id DESC LIMIT 1"
-    ).fetchone()
-    conn.close()
-    if row:
-        return json.loads(row["weights_json"])
-    return DEFAULT_WEIGHTS.copy()
+    # Callers are free to tweak the returned weights, so hand out a copy.
+    return _active_weight_set()[1].copy()
 
 
 def save_weights(name: str, weights: dict, active: bool = True):
     conn = get_conn()
-    if active:
-        conn.execute("UPDATE weight_sets SET active = 0")
-    conn.execute(
-        "INSERT INTO weight_sets (name, weights_json, active) VALUES (?, ?, ?)",
-        (name, json.dumps(weights), 1 if active else 0),
-    )
-    conn.commit()
-    conn.close()
+    try:
+        with _immediate_transaction(conn):
+            if active:
+                conn.execute("UPDATE weight_sets SET active = 0")
+            conn.execute(
+                "INSERT INTO weight_sets (name, weights_json, active) VALUES (?, ?, ?)",
+                (name, json.dumps(weights), 1 if active else 0),
+            )
+    finally:
+        _ACTIVE_WEIGHTS_CACHE.pop(DB_PATH, None)
+        conn.close()
 
 
 # ── Rounds helpers (Data Golf historical data) ─────────────────────
 
+_ROUNDS_COLUMNS = (
+    "dg_id", "player_name", "player_key", "tour", "season", "year",
+    "event_id", "event_name", "event_completed",
+    "course_name", "course_num", "course_par", "round_num",
+    "score", "sg_total", "sg_ott", "sg_app", "sg_arg", "sg_putt", "sg_t2g",
+    "driving_dist", "driving_acc", "gir", "scrambling", "prox_fw", "prox_rgh",
+    "great_shots", "poor_shots",
+    "birdies", "pars", "bogies", "doubles_or_worse", "eagles_or_better",
+    "fin_text", "teetime", "start_hole",
+)
+_round_values = operator.itemgetter(*_ROUNDS_COLUMNS)
+_ROUNDS_VALUES_SQL = f"({', '.join('?' * len(_ROUNDS_COLUMNS))})"
+_ROUND_KEY_COLUMNS = ("dg_id", "event_id", "year", "round_num")
+_ROUND_DATA_COLUMNS = tuple(c for c in _ROUNDS_COLUMNS if c not in _ROUND_KEY_COLUMNS)
+# Re-published rounds (Data Golf corrections) overwrite the stored row, but
+# only when they carry SG data and actually differ, so re-running a backfill
+# over unchanged history writes no pages.
+_UPSERT_ROUNDS_CLAUSE = (
+    f" ON CONFLICT({', '.join(_ROUND_KEY_COLUMNS)}) DO UPDATE SET "
+    + ", ".join(f"{col} = excluded.{col}" for col in _ROUND_DATA_COLUMNS)
+    + " WHERE excluded.sg_total IS NOT NULL"
+    + f" AND ({', '.join(f'rounds.{c}' for c in _ROUND_DATA_COLUMNS)})"
+    + f" IS NOT ({', '.join(f'excluded.{c}' for c in _ROUND_DATA_COLUMNS)})"
+)
+_INSERT_ROUNDS_SQL = (
+    f"INSERT INTO rounds ({', '.join(_ROUNDS_COLUMNS)}) VALUES {_ROUNDS_VALUES_SQL}"
+    + _UPSERT_ROUNDS_CLAUSE
+)
+# Multi-row VALUES statement for bulk backfills; stays under SQLite's
+# historical 999 bound-parameter limit so it works on any build.
+_ROUNDS_ROWS_PER_INSERT = 999 // len(_ROUNDS_COLUMNS)
+_INSERT_ROUNDS_MULTI_SQL = (
+    f"INSERT INTO rounds ({', '.join(_ROUNDS_COLUMNS)}) VALUES "
+    + ", ".join([_ROUNDS_VALUES_SQL] * _ROUNDS_ROWS_PER_INSERT)
+    + _UPSERT_ROUNDS_CLAUSE
+)
+
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def _bulk_load_synchronous() -> str | None:
+    """PRAGMA synchronous override for bulk round backfills (GOLF_SQLITE_SYNC).
+
+    Unset or unrecognized values keep the connection default (NORMAL).
+    """
+    mode = (os.environ.get("GOLF_SQLITE_SYNC") or "").strip().upper()
+    return mode if mode in _SYNCHRONOUS_MODES else None
+
+
+# Rows committed per transaction by store_rounds(): bounds WAL growth on
+# multi-season backfills. A whole number of multi-row INSERTs.
+_ROUNDS_ROWS_PER_TRANSACTION = _ROUNDS_ROWS_PER_INSERT * (10_000 // _ROUNDS_ROWS_PER_INSERT)
+
+
+def _insert_round_values(conn: sqlite3.Connection, values: list[tuple]) -> None:
+    _insert_multi_row(conn, _INSERT_ROUNDS_MULTI_SQL, _INSERT_ROUNDS_SQL, _ROUNDS_ROWS_PER_INSERT, values)
+
+
 def store_rounds(rounds_list: list[dict]):
-    """Bulk insert round data. Uses INSERT OR IGNORE for dedup on UNIQUE constraint."""
+    """Bulk upsert round data on UNIQUE(dg_id, event_id, year, round_num).
+
+    A conflicting row is updated only when the incoming one has sg_total and
+    differs from what is stored; otherwise it is left untouched.
+
+    Full chunks of _ROUNDS_ROWS_PER_INSERT rows go through one multi-row
+    INSERT each; the remainder uses the single-row statement. Large loads
+    commit every _ROUNDS_ROWS_PER_TRANSACTION rows (safe to re-run: unchanged
+    rows are skipped); inside an open transaction() everything
+    joins it. With GOLF_SQLITE_SYNC=OFF the commits skip their WAL sync
+    (backfills only: a power loss can drop the last loads, which are
+    re-fetchable).
+    """
     if not rounds_list:
         return
+    values = list(map(_round_values, rounds_list))
     conn = get_conn()
-    conn.executemany(
-        """INSERT OR IGNORE INTO rounds
-           (dg_id, player_name, player_key, tour, season, year,
-            event_id, event_name, event_completed,
-            course_name, course_num, course_par, round_num,
-            score, sg_total, sg_ott, sg_app, sg_arg, sg_putt, sg_t2g,
-            driving_dist, driving_acc, gir, scrambling, prox_fw, prox_rgh,
-            great_shots, poor_shots,
-            birdies, pars, bogies, doubles_or_worse, eagles_or_better,
-            fin_text, teetime, start_hole)
-           VALUES (:dg_id, :player_name, :player_key, :tour, :season, :year,
-                    :event_id, :event_name, :event_completed,
-                    :course_name, :course_num, :course_par, :round_num,
-                    :score, :sg_total, :sg_ott, :sg_app, :sg_arg, :sg_putt, :sg_t2g,
-                    :driving_dist, :driving_acc, :gir, :scrambling, :prox_fw, :prox_rgh,
-                    :great_shots, :poor_shots,
-                    :birdies, :pars, :bogies, :doubles_or_worse, :eagles_or_better,
-                    :fin_text, :teetime, :start_hole)""",
-        rounds_list,
-    )
-    conn.commit()
-    conn.close()
+    # synchronous can only change outside a transaction.
+    sync_mode = None if conn.in_transaction else _bulk_load_synchronous()
+    step = len(values) if conn.in_transaction else _ROUNDS_ROWS_PER_TRANSACTION
+    try:
+        if sync_mode:
+            conn.execute(f"PRAGMA synchronous={sync_mode}")
+        for start in range(0, len(values), step):
+            with _immediate_transaction(conn):
+                _insert_round_values(conn, values[start:start + step])
+        _DG_ID_CACHE.clear()
+        if len(values) >= _ANALYZE_MIN_ROWS:
+            _analyze(conn, "rounds")
+        elif len(values) >= _OPTIMIZE_MIN_ROWS:
+            _optimize(conn)
+    finally:
+        if sync_mode:
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.close()
 
 
-def get_player_recent_rounds(dg_id: int, limit: int = 24) -> list[dict]:
-    """Get last N rounds for a player, ordered most recent first."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT * FROM rounds
-           WHERE dg_id = ? AND sg_total IS NOT NULL
-           ORDER BY event_completed DESC, round_num DESC
-           LIMIT ?""",
-        (dg_id, limit),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+_ROUND_SELECTABLE_COLUMNS = frozenset(("id", *_ROUNDS_COLUMNS))
 
 
-def get_player_recent_rounds_by_key(player_key: str, limit: int = 24) -> list[dict]:
-    """Get last N rounds for a player by normalized name key."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT * FROM rounds
-           WHERE player_key = ? AND sg_total IS NOT NULL
-           ORDER BY event_completed DESC, round_num DESC
-           LIMIT ?""",
-        (player_key, limit),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def _round_columns_sql(columns: Sequence[str] | None, *required: str) -> str:
+    """SELECT list for the rounds getters' *columns* argument (None = every column).
 
+    Names are checked against the rounds schema before being formatted into
+    SQL; *required* columns (e.g. a batched helper's grouping key) are added
+    when missing.
+    """
+    if columns is None:
+        return "*"
+    unknown = set(columns).difference(_ROUND_SELECTABLE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown rounds columns: {sorted(unknown)}")
+    return ", ".join(dict.fromkeys((*required, *columns)))
+
+
+def get_player_recent_rounds(
+    dg_id: int, limit: int = 24, columns: Sequence[str] | None = None
+) -> list[Record]:
+    """Get last N rounds for a player, ordered most recent first.
+
+    Pass *columns* to read only those fields instead of the whole row.
+    """
+    with read_connection() as conn:
+        return _fetch_records(
+            conn,
+            f"""SELECT {_round_columns_sql(columns)} FROM rounds
+               WHERE dg_id = ? AND sg_total IS NOT NULL
+               ORDER BY event_completed DESC, round_num DESC
+               LIMIT ?""",
+            (dg_id, limit),
+        )
 
-def get_player_course_rounds(dg_id: int, course_num: int) -> list[dict]:
-    """Get all rounds at a specific course for a player."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT * FROM rounds
-           WHERE dg_id = ? AND course_num = ? AND sg_total IS NOT NULL
-           ORDER BY event_completed DESC, round_num DESC""",
-        (dg_id, course_num),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+
+def get_player_recent_rounds_by_key(
+    player_key: str, limit: int = 24, columns: Sequence[str] | None = None
+) -> list[Record]:
+    """Get last N rounds for a player by normalized name key; *columns* as above."""
+    with read_connection() as conn:
+        return _fetch_records(
+            conn,
+            f"""SELECT {_round_columns_sql(columns)} FROM rounds
+               WHERE player_key = ? AND sg_total IS NOT NULL
+               ORDER BY event_completed DESC, round_num DESC
+               LIMIT ?""",
+            (player_key, limit),
+        )
+
+
+_SG_AGGREGATE_COLUMNS = ("sg_total", "sg_ott", "sg_app", "sg_arg", "sg_putt", "sg_t2g")
+_PLAYER_SG_AGGREGATES_SQL = (
+    "SELECT COUNT(*), "
+    + ", ".join(f"AVG({col})" for col in _SG_AGGREGATE_COLUMNS)
+    + f""" FROM (
+        SELECT {', '.join(_SG_AGGREGATE_COLUMNS)} FROM rounds
+        WHERE player_key = ? AND sg_total IS NOT NULL
+        ORDER BY event_completed DESC, round_num DESC
+        LIMIT ?
+    )"""
+)
+
+
+def get_player_sg_aggregates(player_key: str, limit: int = 24) -> dict:
+    """Round count and mean SG per category over a player's last *limit* rounds.
+
+    Same rows as get_player_recent_rounds_by_key(), averaged by SQLite (AVG
+    skips NULLs, matching rolling_stats._compute_average) so callers that
+    only need the summary never fetch the rounds.
+    """
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        count, *means = cur.execute(_PLAYER_SG_AGGREGATES_SQL, (player_key, limit)).fetchone()
+    return {"rounds": count, **dict(zip(_SG_AGGREGATE_COLUMNS, means))}
+
+
+def get_recent_rounds_for_players(
+    player_keys: Sequence[str], limit: int = 24, columns: Sequence[str] | None = None
+) -> dict[str, list[Record]]:
+    """Batched get_player_recent_rounds_by_key(): last *limit* rounds per key.
+
+    One windowed query per _IN_CLAUSE_CHUNK keys instead of one query per
+    player. Keys without rounds are omitted; each list has the same rows and
+    order as the single-player getter. *columns* narrows each row; player_key
+    is always included.
+    """
+    keys = list(dict.fromkeys(player_keys))
+    found: dict[str, list[Record]] = {}
+    select_list = _round_columns_sql(
+        ("id", *_ROUNDS_COLUMNS) if columns is None else columns, "player_key"
+    )
+    with read_connection() as conn:
+        for start in range(0, len(keys), _IN_CLAUSE_CHUNK):
+            placeholders, chunk = _in_list(keys[start:start + _IN_CLAUSE_CHUNK])
+            rows = _fetch_records(
+                conn,
+                f"""SELECT {select_list} FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY player_key
+                            ORDER BY event_completed DESC, round_num DESC
+                        ) AS recent_rank
+                        FROM rounds
+                        WHERE player_key IN ({placeholders}) AND sg_total IS NOT NULL
+                    )
+                    WHERE recent_rank <= ?
+                    ORDER BY player_key, recent_rank""",
+                (*chunk, limit),
+            )
+            for key, group in itertools.groupby(rows, key=operator.itemgetter("player_key")):
+                found[key] = list(group)
+    return found
+
+
+def get_player_course_rounds(
+    dg_id: int, course_num: int, columns: Sequence[str] | None = None
+) -> list[Record]:
+    """Get all rounds at a specific course for a player; *columns* as above."""
+    with read_connection() as conn:
+        return _fetch_records(
+            conn,
+            f"""SELECT {_round_columns_sql(columns)} FROM rounds
+               WHERE dg_id = ? AND course_num = ? AND sg_total IS NOT NULL
+               ORDER BY event_completed DESC, round_num DESC""",
+            (dg_id, course_num),
+        )
+
+
+def get_course_rounds_for_players(
+    dg_ids: Sequence[int], course_num: int, columns: Sequence[str] | None = None
+) -> dict[int, list[Record]]:
+    """Batched get_player_course_rounds(): every round at *course_num* per dg_id.
+
+    Served by idx_rounds_course(course_num, dg_id), one query per
+    _IN_CLAUSE_CHUNK ids. Players without rounds at the course are omitted.
+    *columns* narrows each row; dg_id is always included.
+    """
+    ids = list(dict.fromkeys(dg_ids))
+    found: dict[int, list[Record]] = {}
+    select_list = _round_columns_sql(columns, "dg_id")
+    with read_connection() as conn:
+        for start in range(0, len(ids), _IN_CLAUSE_CHUNK):
+            placeholders, chunk = _in_list(ids[start:start + _IN_CLAUSE_CHUNK])
+            rows = _fetch_records(
+                conn,
+                f"""SELECT {select_list} FROM rounds
+                    WHERE course_num = ? AND dg_id IN ({placeholders})
+                      AND sg_total IS NOT NULL
+                    ORDER BY dg_id, event_completed DESC, round_num DESC""",
+                (course_num, *chunk),
+            )
+            for dg_id, group in itertools.groupby(rows, key=operator.itemgetter("dg_id")):
+                found[dg_id] = list(group)
+    return found
 
 
 def get_rounds_backfill_status() -> list[dict]:
     """Show which tours/years are stored and how many rounds each has."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT tour, year, COUNT(*) as round_count,
-                  COUNT(DISTINCT dg_id) as player_count,
-                  COUNT(DISTINCT event_id) as event_count
-           FROM rounds
-           GROUP BY tour, year
-           ORDER BY tour, year"""
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        rows = conn.execute(
+            """SELECT tour, year, COUNT(*) as round_count,
+                      COUNT(DISTINCT dg_id) as player_count,
+                      COUNT(DISTINCT event_id) as event_count
+               FROM rounds
+               GROUP BY tour, year
+               ORDER BY tour, year"""
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
 def get_rounds_count() -> int:
     """Total rounds stored."""
-    conn = get_conn()
-    row = conn.execute("SELECT COUNT(*) as cnt FROM rounds").fetchone()
-    conn.close()
-    return row["cnt"] if row else 0
+    with read_connection() as conn:
+        return _fetch_scalar(conn, "SELECT COUNT(*) FROM rounds") or 0
+
+
+# (DB_PATH, player_key) -> dg_id. Hits are kept until store_rounds() writes
+# (which may correct a row's player_key); misses are not cached.
+_DG_ID_CACHE: dict[tuple[str, str], int] = {}
+
+_DG_ID_FOR_PLAYER_SQL = "SELECT dg_id FROM player_dg_ids WHERE player_key = ?"
 
 
 def get_dg_id_for_player(player_key: str) -> int | None:
-    """Look up dg_id from rounds table by player_key."""
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT dg_id FROM rounds WHERE player_key = ? LIMIT 1",
-        (player_key,),
-    ).fetchone()
-    conn.close()
-    return row["dg_id"] if row else None
+    """Look up a player's dg_id (from the rounds-fed player_dg_ids table)."""
+    cache_key = (DB_PATH, player_key)
+    dg_id = _DG_ID_CACHE.get(cache_key)
+    if dg_id is not None:
+        return dg_id
+    with read_connection() as conn:
+        row = conn.execute(_DG_ID_FOR_PLAYER_SQL, (player_key,)).fetchone()
+    if row is None or row[0] is None:
+        return None
+    _DG_ID_CACHE[cache_key] = row[0]
+    return row[0]
+
+
+# Bound parameters per IN (...) lookup, well under SQLite's variable limit;
+# a power of two so full chunks need no _in_list() padding.
+_IN_CLAUSE_CHUNK = 512
 
 
-def get_event_results(event_id: str, year: int) -> list[dict]:
+def get_dg_ids_for_players(player_keys: Sequence[str]) -> dict[str, int]:
+    """Resolve many player_keys to dg_ids; keys without rounds are omitted.
+
+    Batched form of get_dg_id_for_player: cached keys are answered from
+    memory and the rest are resolved with one player_dg_ids query per chunk.
+    """
+    found: dict[str, int] = {}
+    missing = []
+    for key in dict.fromkeys(player_keys):
+        dg_id = _DG_ID_CACHE.get((DB_PATH, key))
+        if dg_id is not None:
+            found[key] = dg_id
+        else:
+            missing.append(key)
+    if not missing:
+        return found
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        for start in range(0, len(missing), _IN_CLAUSE_CHUNK):
+            placeholders, chunk = _in_list(missing[start:start + _IN_CLAUSE_CHUNK])
+            for key, dg_id in cur.execute(
+                f"SELECT player_key, dg_id FROM player_dg_ids WHERE player_key IN ({placeholders})",
+                chunk,
+            ):
+                found[key] = dg_id
+                _DG_ID_CACHE[(DB_PATH, key)] = dg_id
+    return found
+
+
+def get_round_player_names(player_keys: Sequence[str]) -> dict[str, str]:
+    """Raw rounds player_name per player_key, one IN query per chunk of keys.
+
+    Keys with no rounds are omitted.
+    """
+    keys = list(dict.fromkeys(player_keys))
+    found: dict[str, str] = {}
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        for start in range(0, len(keys), _IN_CLAUSE_CHUNK):
+            placeholders, chunk = _in_list(keys[start:start + _IN_CLAUSE_CHUNK])
+            found.update(cur.execute(
+                f"""SELECT player_key, MIN(player_name) FROM rounds
+                    WHERE player_key IN ({placeholders}) AND player_name IS NOT NULL
+                    GROUP BY player_key""",
+                chunk,
+            ))
+    return found
+
+
+def get_event_results(event_id: str, year: int) -> list[Record]:
     """Get finish positions for all players in an event (for auto-results)."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT DISTINCT dg_id, player_name, player_key, fin_text
-           FROM rounds
-           WHERE event_id = ? AND year = ?""",
-        (event_id, year),
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    with read_connection() as conn:
+        return _fetch_records(
+            conn,
+            """SELECT DISTINCT dg_id, player_name, player_key, fin_text
+               FROM rounds
+               WHERE event_id = ? AND year = ?""",
+            (event_id, year),
+        )
 
 
 # ── Course weight profile helpers ──────────────────────────────────
 
+# (DB_PATH, course_num) -> (expires_at, parsed profile or None). Profiles
+# change after a tournament is learned from; save_course_weight_profile clears
+# this process's entries and the TTL bounds staleness from other processes.
+# On expiry the row is re-read, but weights_json is only re-parsed if the
+# stored text actually changed.
+_COURSE_PROFILE_CACHE: dict[tuple[str, int], tuple[float, dict | None]] = {}
+_COURSE_PROFILE_TTL_SECONDS = 300.0
+
+
+def _course_weight_profile(course_num: int) -> dict | None:
+    """Shared cached profile for get_course_weight_profile(); do not mutate."""
+    cache_key = (DB_PATH, course_num)
+    cached = _COURSE_PROFILE_CACHE.get(cache_key)
+    if cached is None or cached[0] <= time.monotonic():
+        with read_connection() as conn:
+            row = conn.execute(
+                """SELECT id, course_num, course_name, weights_json, tournaments_used,
+                          last_updated, confidence
+                   FROM course_weight_profiles WHERE course_num = ?""",
+                (course_num,),
+            ).fetchone()
+        profile = None
+        if row:
+            previous = cached[1] if cached else None
+            profile = dict(row)
+            if previous is not None and previous["weights_json"] == profile["weights_json"]:
+                profile["weights"] = previous["weights"]
+            else:
+                profile["weights"] = _loads_weights(profile["weights_json"])
+        cached = (time.monotonic() + _COURSE_PROFILE_TTL_SECONDS, profile)
+        _COURSE_PROFILE_CACHE[cache_key] = cached
+    return cached[1]
+
+
 def get_course_weight_profile(course_num: int) -> dict | None:
     """Get learned weight profile for a course."""
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT * FROM course_weight_profiles WHERE course_num = ?",
-        (course_num,),
-    ).fetchone()
-    conn.close()
-    if row:
-        result = dict(row)
-        result["weights"] = json.loads(result["weights_json"])
-        return result
-    return None
+    profile = _course_weight_profile(course_num)
+    if profile is None:
+        return None
+    return {**profile, "weights": dict(profile["weights"])}
 
 
 def save_course_weight_profile(course_num: int, course_name: str,
                                weights: dict, tournaments_used: int,
                                confidence: float):
     """Save or update course-specific weight profile."""
-    conn = get_conn()
-    conn.execute(
-        """INSERT INTO course_weight_profiles
-           (course_num, course_name, weights_json, tournaments_used, confidence, last_updated)
-           VALUES (?, ?, ?, ?, ?, datetime('now'))
-           ON CONFLICT(course_num) DO UPDATE SET
-               weights_json = excluded.weights_json,
-               tournaments_used = excluded.tournaments_used,
-               confidence = excluded.confidence,
-               last_updated = datetime('now')""",
-        (course_num, course_name, json.dumps(weights), tournaments_used, confidence),
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn, _immediate_transaction(conn):
+        conn.execute(
+            """INSERT INTO course_weight_profiles
+               (course_num, course_name, weights_json, tournaments_used, confidence, last_updated)
+               VALUES (?, ?, ?, ?, ?, datetime('now'))
+               ON CONFLICT(course_num) DO UPDATE SET
+                   weights_json = excluded.weights_json,
+                   tournaments_used = excluded.tournaments_used,
+                   confidence = excluded.confidence,
+                   last_updated = datetime('now')""",
+            (course_num, course_name, json.dumps(weights), tournaments_used, confidence),
+        )
+    _COURSE_PROFILE_CACHE.pop((DB_PATH, course_num), None)
 
 
 # ── Prediction log helpers ─────────────────────────────────────────
 
+_PREDICTION_LOG_COLUMNS = (
+    "tournament_id", "player_key", "bet_type", "model_prob", "dg_prob",
+    "market_implied_prob", "actual_outcome", "odds_decimal", "profit", "odds_timing",
+)
+_prediction_values = operator.itemgetter(*_PREDICTION_LOG_COLUMNS)
+_INSERT_PREDICTION_LOG_SQL = (
+    f"INSERT OR IGNORE INTO prediction_log ({', '.join(_PREDICTION_LOG_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_PREDICTION_LOG_COLUMNS))})"
+)
+# Rows bound per executemany call; the whole batch is still one transaction.
+_PREDICTION_LOG_CHUNK = 1000
+
+
 def log_predictions(predictions: list[dict]):
     """Store predictions for calibration tracking.
 
     Uses INSERT OR IGNORE so the first (pre-tournament) snapshot is
     preserved.  A mid-tournament re-run won't silently overwrite
-    pre-tournament odds with in-play prices.
+    pre-tournament odds with in-play prices.  Conflicting rows on
+    idx_prediction_log_unique are skipped, never deleted and re-inserted,
+    so re-logging a batch writes no pages for rows already present.
     """
     if not predictions:
         return
-    conn = get_conn()
-    _migrate_prediction_log_timing(conn)
-    conn.executemany(
-        """INSERT OR IGNORE INTO prediction_log
-           (tournament_id, player_key, bet_type, model_prob, dg_prob,
-            market_implied_prob, actual_outcome, odds_decimal, profit, odds_timing)
-           VALUES (:tournament_id, :player_key, :bet_type, :model_prob, :dg_prob,
-                    :market_implied_prob, :actual_outcome, :odds_decimal, :profit,
-                    :odds_timing)""",
-        predictions,
-    )
-    conn.commit()
-    conn.close()
+    values = list(map(_prediction_values, predictions))
+    with connection() as conn, _immediate_transaction(conn):
+        for start in range(0, len(values), _PREDICTION_LOG_CHUNK):
+            conn.executemany(_INSERT_PREDICTION_LOG_SQL, values[start:start + _PREDICTION_LOG_CHUNK])
 
 
 def has_predictions(tournament_id: int) -> bool:
     """Check if prediction_log already has entries for this tournament."""
-    conn = get_conn()
-    row = conn.execute(
-        "SELECT 1 FROM prediction_log WHERE tournament_id = ? LIMIT 1",
-        (tournament_id,),
-    ).fetchone()
-    conn.close()
+    with read_connection() as conn:
+        row = conn.execute(
+            "SELECT 1 FROM prediction_log WHERE tournament_id = ? LIMIT 1",
+            (tournament_id,),
+        ).fetchone()
     return row is not None
 
 
-def _migrate_prediction_log_timing(conn: sqlite3.Connection):
-    """Add odds_timing column to prediction_log if missing."""
-    cols = [r[1] for r in conn.execute("PRAGMA table_info(prediction_log)").fetchall()]
-    if "odds_timing" not in cols:
-        conn.execute(
-            "ALTER TABLE prediction_log ADD COLUMN odds_timing TEXT DEFAULT 'unknown'"
-        )
-        conn.commit()
+# Rows fetched per chunk by the iter_* streaming readers.
+_FETCH_BATCH_SIZE = 256
+
+
+def iter_calibration_data() -> Iterator[dict]:
+    """Stream prediction log entries (oldest first) without loading them all.
+
+    One query under one read snapshot, fetched _FETCH_BATCH_SIZE rows at a
+    time. Holds this thread's reader connection until the generator is
+    exhausted or closed; call close() on it when stopping early.
+    """
+    with read_connection() as conn:
+        cur = conn.execute("SELECT * FROM prediction_log ORDER BY created_at, id")
+        while True:
+            rows = cur.fetchmany(_FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
 
 
 def get_calibration_data(min_tournaments: int = 3) -> list[dict]:
-    """Get all prediction log entries for calibration analysis."""
-    conn = get_conn()
-    rows = conn.execute(
-        "SELECT * FROM prediction_log ORDER BY created_at"
-    ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    """Get all prediction log entries for calibration analysis.
+
+    Materializes the whole log; prefer iter_calibration_data() when the
+    rows can be consumed as they stream.
+    """
+    return list(iter_calibration_data())
 
 
 # ── Live snapshot + market row history helpers ─────────────────────
@@ -2161,20 +3143,19 @@ def store_live_snapshot_sections(
     if not section_rows:
         return 0
 
-    conn = get_conn()
-    conn.executemany(
-        """
-        INSERT INTO live_snapshot_history
-            (snapshot_id, generated_at, tour, cadence_mode, section, event_id, event_name,
-             source_event_id, source_event_name, active, payload_json)
-        VALUES
-            (:snapshot_id, :generated_at, :tour, :cadence_mode, :section, :event_id, :event_name,
-             :source_event_id, :source_event_name, :active, :payload_json)
-        """,
-        section_rows,
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO live_snapshot_history
+                (snapshot_id, generated_at, tour, cadence_mode, section, event_id, event_name,
+                 source_event_id, source_event_name, active, payload_json)
+            VALUES
+                (:snapshot_id, :generated_at, :tour, :cadence_mode, :section, :event_id, :event_name,
+                 :source_event_id, :source_event_name, :active, :payload_json)
+            """,
+            section_rows,
+        )
+        conn.commit()
     return len(section_rows)
 
 
@@ -2194,35 +3175,34 @@ def list_past_snapshot_events(
     output. Callers (e.g. the past-events API) use this to keep the currently
     upcoming or live event from leaking into the past-events selector.
     """
-    conn = get_conn()
-    # Pull a wider candidate window than `limit` so we can post-filter without
-    # losing real past events. The correlated subquery for `event_name` picks
-    # the name from the row with the most recent generated_at per event_id.
-    rows = conn.execute(
-        """
-        SELECT
-            h.source_event_id AS event_id,
-            (
-                SELECT COALESCE(h2.source_event_name, h2.event_name)
-                FROM live_snapshot_history h2
-                WHERE h2.source_event_id = h.source_event_id
-                  AND h2.section IN ('live', 'upcoming')
-                ORDER BY h2.generated_at DESC, h2.id DESC
-                LIMIT 1
-            ) AS event_name,
-            MAX(h.generated_at) AS latest_generated_at,
-            COUNT(*) AS snapshot_count
-        FROM live_snapshot_history h
-        WHERE h.section IN ('live', 'upcoming')
-          AND h.source_event_id IS NOT NULL
-          AND TRIM(h.source_event_id) != ''
-        GROUP BY h.source_event_id
-        ORDER BY latest_generated_at DESC, h.source_event_id DESC
-        LIMIT ?
-        """,
-        (max(int(limit) * 3, int(limit) + 5),),
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        # Pull a wider candidate window than `limit` so we can post-filter without
+        # losing real past events. The correlated subquery for `event_name` picks
+        # the name from the row with the most recent generated_at per event_id.
+        rows = conn.execute(
+            """
+            SELECT
+                h.source_event_id AS event_id,
+                (
+                    SELECT COALESCE(h2.source_event_name, h2.event_name)
+                    FROM live_snapshot_history h2
+                    WHERE h2.source_event_id = h.source_event_id
+                      AND h2.section IN ('live', 'upcoming')
+                    ORDER BY h2.generated_at DESC, h2.id DESC
+                    LIMIT 1
+                ) AS event_name,
+                MAX(h.generated_at) AS latest_generated_at,
+                COUNT(*) AS snapshot_count
+            FROM live_snapshot_history h
+            WHERE h.section IN ('live', 'upcoming')
+              AND h.source_event_id IS NOT NULL
+              AND TRIM(h.source_event_id) != ''
+            GROUP BY h.source_event_id
+            ORDER BY latest_generated_at DESC, h.source_event_id DESC
+            LIMIT ?
+            """,
+            (max(int(limit) * 3, int(limit) + 5),),
+        ).fetchall()
 
     excluded = {str(eid).strip() for eid in (exclude_event_ids or set()) if eid}
     out: list[dict] = []
@@ -2242,19 +3222,18 @@ def get_latest_snapshot_section(event_id: str, *, section: str = "live") -> dict
     normalized_event_id = str(event_id or "").strip()
     if not normalized_event_id:
         return None
-    conn = get_conn()
-    row = conn.execute(
-        """
-        SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id,
-               source_event_name, active, payload_json
-        FROM live_snapshot_history
-        WHERE source_event_id = ? AND section = ?
-        ORDER BY generated_at DESC, id DESC
-        LIMIT 1
-        """,
-        (normalized_event_id, section),
-    ).fetchone()
-    conn.close()
+    with read_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id,
+                   source_event_name, active, payload_json
+            FROM live_snapshot_history
+            WHERE source_event_id = ? AND section = ?
+            ORDER BY generated_at DESC, id DESC
+            LIMIT 1
+            """,
+            (normalized_event_id, section),
+        ).fetchone()
     if not row:
         return None
     payload = dict(row)
@@ -2271,19 +3250,18 @@ def get_first_snapshot_section(event_id: str, *, section: str = "live") -> dict
     normalized_event_id = str(event_id or "").strip()
     if not normalized_event_id:
         return None
-    conn = get_conn()
-    row = conn.execute(
-        """
-        SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id,
-               source_event_name, active, payload_json
-        FROM live_snapshot_history
-        WHERE source_event_id = ? AND section = ?
-        ORDER BY generated_at ASC, id ASC
-        LIMIT 1
-        """,
-        (normalized_event_id, section),
-    ).fetchone()
-    conn.close()
+    with read_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id,
+                   source_event_name, active, payload_json
+            FROM live_snapshot_history
+            WHERE source_event_id = ? AND section = ?
+            ORDER BY generated_at ASC, id ASC
+            LIMIT 1
+            """,
+            (normalized_event_id, section),
+        ).fetchone()
     if not row:
         return None
     payload = dict(row)
@@ -2302,18 +3280,17 @@ def list_snapshot_timeline_points(event_id: str, *, section: str = "live", limit
     if not normalized_event_id:
         return []
 
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id, source_event_name, event_name, active, payload_json
-        FROM live_snapshot_history
-        WHERE source_event_id = ? AND section = ?
-        ORDER BY generated_at DESC, id DESC
-        LIMIT ?
-        """,
-        (normalized_event_id, normalized_section, int(limit)),
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT snapshot_id, generated_at, tour, cadence_mode, section, source_event_id, source_event_name, event_name, active, payload_json
+            FROM live_snapshot_history
+            WHERE source_event_id = ? AND section = ?
+            ORDER BY generated_at DESC, id DESC
+            LIMIT ?
+            """,
+            (normalized_event_id, normalized_section, int(limit)),
+        ).fetchall()
 
     points: list[dict] = []
     for row in rows:
@@ -2405,35 +3382,33 @@ def upsert_pre_teeoff_candidate(
     normalized = str(event_id or "").strip()
     if not normalized or not isinstance(section_payload, dict):
         return
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    conn.execute(
-        """
-        INSERT INTO pre_teeoff_candidates (event_id, tour, event_name, payload_json, updated_at)
-        VALUES (?, ?, ?, ?, datetime('now'))
-        ON CONFLICT(event_id) DO UPDATE SET
-            tour = excluded.tour,
-            event_name = excluded.event_name,
-            payload_json = excluded.payload_json,
-            updated_at = datetime('now')
-        """,
-        (normalized, (tour or "").strip().lower() or None, (event_name or "").strip() or None, json.dumps(section_payload)),
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        conn.execute(
+            """
+            INSERT INTO pre_teeoff_candidates (event_id, tour, event_name, payload_json, updated_at)
+            VALUES (?, ?, ?, ?, datetime('now'))
+            ON CONFLICT(event_id) DO UPDATE SET
+                tour = excluded.tour,
+                event_name = excluded.event_name,
+                payload_json = excluded.payload_json,
+                updated_at = datetime('now')
+            """,
+            (normalized, (tour or "").strip().lower() or None, (event_name or "").strip() or None, json.dumps(section_payload)),
+        )
+        conn.commit()
 
 
 def has_pre_teeoff_frozen(event_id: str) -> bool:
     normalized = str(event_id or "").strip()
     if not normalized:
         return False
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    row = conn.execute(
-        "SELECT 1 FROM pre_teeoff_frozen WHERE event_id = ? LIMIT 1",
-        (normalized,),
-    ).fetchone()
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        row = conn.execute(
+            "SELECT 1 FROM pre_teeoff_frozen WHERE event_id = ? LIMIT 1",
+            (normalized,),
+        ).fetchone()
     return row is not None
 
 
@@ -2441,13 +3416,12 @@ def get_pre_teeoff_candidate_payload(event_id: str) -> dict | None:
     normalized = str(event_id or "").strip()
     if not normalized:
         return None
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    row = conn.execute(
-        "SELECT payload_json FROM pre_teeoff_candidates WHERE event_id = ?",
-        (normalized,),
-    ).fetchone()
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        row = conn.execute(
+            "SELECT payload_json FROM pre_teeoff_candidates WHERE event_id = ?",
+            (normalized,),
+        ).fetchone()
     if not row or not row[0]:
         return None
     try:
@@ -2460,13 +3434,12 @@ def get_pre_teeoff_frozen_payload(event_id: str) -> dict | None:
     normalized = str(event_id or "").strip()
     if not normalized:
         return None
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    row = conn.execute(
-        "SELECT payload_json FROM pre_teeoff_frozen WHERE event_id = ?",
-        (normalized,),
-    ).fetchone()
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        row = conn.execute(
+            "SELECT payload_json FROM pre_teeoff_frozen WHERE event_id = ?",
+            (normalized,),
+        ).fetchone()
     if not row or not row[0]:
         return None
     try:
@@ -2480,21 +3453,20 @@ def build_final_leaderboard_from_results(event_id: str) -> list[dict]:
     normalized = str(event_id or "").strip()
     if not normalized:
         return []
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT r.player_key, r.player_display, r.finish_position, r.finish_text, r.made_cut
-        FROM results r
-        JOIN tournaments t ON t.id = r.tournament_id
-        WHERE t.event_id = ?
-        ORDER BY
-            CASE WHEN r.finish_position IS NULL THEN 1 ELSE 0 END,
-            r.finish_position ASC,
-            r.player_display ASC
-        """,
-        (normalized,),
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT r.player_key, r.player_display, r.finish_position, r.finish_text, r.made_cut
+            FROM results r
+            JOIN tournaments t ON t.id = r.tournament_id
+            WHERE t.event_id = ?
+            ORDER BY
+                CASE WHEN r.finish_position IS NULL THEN 1 ELSE 0 END,
+                r.finish_position ASC,
+                r.player_display ASC
+            """,
+            (normalized,),
+        ).fetchall()
     if not rows:
         return []
 
@@ -2580,25 +3552,24 @@ def insert_pre_teeoff_frozen(
     normalized = str(event_id or "").strip()
     if not normalized or not isinstance(section_payload, dict):
         return False
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    cur = conn.execute(
-        """
-        INSERT OR IGNORE INTO pre_teeoff_frozen
-            (event_id, tour, event_name, payload_json, frozen_at, source_snapshot_id)
-        VALUES (?, ?, ?, ?, datetime('now'), ?)
-        """,
-        (
-            normalized,
-            (tour or "").strip().lower() or None,
-            (event_name or "").strip() or None,
-            json.dumps(section_payload),
-            (source_snapshot_id or "").strip() or None,
-        ),
-    )
-    conn.commit()
-    inserted = cur.rowcount > 0
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        cur = conn.execute(
+            """
+            INSERT OR IGNORE INTO pre_teeoff_frozen
+                (event_id, tour, event_name, payload_json, frozen_at, source_snapshot_id)
+            VALUES (?, ?, ?, ?, datetime('now'), ?)
+            """,
+            (
+                normalized,
+                (tour or "").strip().lower() or None,
+                (event_name or "").strip() or None,
+                json.dumps(section_payload),
+                (source_snapshot_id or "").strip() or None,
+            ),
+        )
+        conn.commit()
+        inserted = cur.rowcount > 0
     return inserted
 
 
@@ -2614,22 +3585,21 @@ def list_completed_snapshot_events(
     upcoming event never leaks into the past-event selector.
     """
     excluded = {str(eid).strip() for eid in (exclude_event_ids or set()) if eid}
-    conn = get_conn()
-    _ensure_pre_teeoff_tables(conn)
-    live_rows = list_past_snapshot_events(
-        limit=max(int(limit) * 3, 120),
-        exclude_event_ids=excluded or None,
-    )
-    frozen_rows = conn.execute(
-        """
-        SELECT event_id, event_name, frozen_at
-        FROM pre_teeoff_frozen
-        ORDER BY frozen_at DESC
-        LIMIT ?
-        """,
-        (max(int(limit) * 3, 120),),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        _ensure_pre_teeoff_tables(conn)
+        live_rows = list_past_snapshot_events(
+            limit=max(int(limit) * 3, 120),
+            exclude_event_ids=excluded or None,
+        )
+        frozen_rows = conn.execute(
+            """
+            SELECT event_id, event_name, frozen_at
+            FROM pre_teeoff_frozen
+            ORDER BY frozen_at DESC
+            LIMIT ?
+            """,
+            (max(int(limit) * 3, 120),),
+        ).fetchall()
     merged: dict[str, dict[str, Any]] = {}
     frozen_event_ids = {str(fr["event_id"]).strip() for fr in frozen_rows if fr["event_id"]}
     for row in live_rows:
@@ -2771,22 +3741,21 @@ def store_market_prediction_rows(rows: list[dict]) -> int:
             normalized.append(item)
         rows = normalized
 
-    conn = get_conn()
-    conn.executemany(
-        """
-        INSERT INTO market_prediction_rows
-            (snapshot_id, generated_at, tour, section, event_id, event_name, market_family,
-             market_type, player_key, player_display, opponent_key, opponent_display, book,
-             odds, model_prob, implied_prob, ev, is_value, payload_json)
-        VALUES
-            (:snapshot_id, :generated_at, :tour, :section, :event_id, :event_name, :market_family,
-             :market_type, :player_key, :player_display, :opponent_key, :opponent_display, :book,
-             :odds, :model_prob, :implied_prob, :ev, :is_value, :payload_json)
-        """,
-        rows,
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO market_prediction_rows
+                (snapshot_id, generated_at, tour, section, event_id, event_name, market_family,
+                 market_type, player_key, player_display, opponent_key, opponent_display, book,
+                 odds, model_prob, implied_prob, ev, is_value, payload_json)
+            VALUES
+                (:snapshot_id, :generated_at, :tour, :section, :event_id, :event_name, :market_family,
+                 :market_type, :player_key, :player_display, :opponent_key, :opponent_display, :book,
+                 :odds, :model_prob, :implied_prob, :ev, :is_value, :payload_json)
+            """,
+            rows,
+        )
+        conn.commit()
     return len(rows)
 
 
@@ -2801,25 +3770,24 @@ def append_shadow_event_simulation(
     payload_json: dict[str, Any],
 ) -> int:
     """Append one shadow MC result row (append-only; no updates)."""
-    conn = get_conn()
-    conn.execute(
-        """
-        INSERT INTO shadow_event_simulations
-            (snapshot_id, event_id, section, tour, n_sims, engine_version, payload_json)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            snapshot_id,
-            event_id,
-            section,
-            tour,
-            n_sims,
-            engine_version,
-            json.dumps(payload_json),
-        ),
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO shadow_event_simulations
+                (snapshot_id, event_id, section, tour, n_sims, engine_version, payload_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                snapshot_id,
+                event_id,
+                section,
+                tour,
+                n_sims,
+                engine_version,
+                json.dumps(payload_json),
+            ),
+        )
+        conn.commit()
     return 1
 
 
@@ -2843,18 +3811,17 @@ def get_market_prediction_rows_for_event(
         clauses.append("section = ?")
         params.append(str(section))
     params.append(int(limit))
-    conn = get_conn()
-    rows = conn.execute(
-        f"""
-        SELECT *
-        FROM market_prediction_rows
-        WHERE {' AND '.join(clauses)}
-        ORDER BY generated_at DESC, id DESC
-        LIMIT ?
-        """,
-        params,
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT *
+            FROM market_prediction_rows
+            WHERE {' AND '.join(clauses)}
+            ORDER BY generated_at DESC, id DESC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
     result = [dict(row) for row in rows]
     for row in result:
         raw_payload = row.get("payload_json")
@@ -2874,25 +3841,24 @@ def _count_market_prediction_rows_for_event(
     normalized_event_id = str(event_id or "").strip()
     if not normalized_event_id:
         return 0
-    conn = get_conn()
-    try:
+    with read_connection() as conn:
         if sections:
             placeholders = ",".join("?" for _ in sections)
-            row = conn.execute(
+            count = _fetch_scalar(
+                conn,
                 f"""
-                SELECT COUNT(*) AS c FROM market_prediction_rows
+                SELECT COUNT(*) FROM market_prediction_rows
                 WHERE event_id = ? AND section IN ({placeholders})
                 """,
                 (normalized_event_id, *sections),
-            ).fetchone()
+            )
         else:
-            row = conn.execute(
-                "SELECT COUNT(*) AS c FROM market_prediction_rows WHERE event_id = ?",
+            count = _fetch_scalar(
+                conn,
+                "SELECT COUNT(*) FROM market_prediction_rows WHERE event_id = ?",
                 (normalized_event_id,),
-            ).fetchone()
-    finally:
-        conn.close()
-    return int(row["c"] or 0) if row else 0
+            )
+    return int(count or 0)
 
 
 def get_completed_market_prediction_rows_for_event(
@@ -3011,25 +3977,23 @@ def _ledger_rows_for_completed_event(
     lane: str,
     limit: int,
 ) -> list[dict]:
-    conn = get_conn()
-    try:
-        conn.execute("SELECT 1 FROM pick_ledger LIMIT 1")
-    except sqlite3.OperationalError:
-        conn.close()
-        return []
-    rows = conn.execute(
-        """
-        SELECT * FROM pick_ledger
-        WHERE event_id = ? AND lane = ?
-          AND lifecycle IN ('frozen_pre_teeoff', 'displayed', 'graded', 'recovered')
-        ORDER BY
-            CASE lifecycle WHEN 'frozen_pre_teeoff' THEN 0 WHEN 'displayed' THEN 1 ELSE 2 END,
-            generated_at ASC
-        LIMIT ?
-        """,
-        (event_id, lane, int(limit)),
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        try:
+            conn.execute("SELECT 1 FROM pick_ledger LIMIT 1")
+        except sqlite3.OperationalError:
+            return []
+        rows = conn.execute(
+            """
+            SELECT * FROM pick_ledger
+            WHERE event_id = ? AND lane = ?
+              AND lifecycle IN ('frozen_pre_teeoff', 'displayed', 'graded', 'recovered')
+            ORDER BY
+                CASE lifecycle WHEN 'frozen_pre_teeoff' THEN 0 WHEN 'displayed' THEN 1 ELSE 2 END,
+                generated_at ASC
+            LIMIT ?
+            """,
+            (event_id, lane, int(limit)),
+        ).fetchall()
     result: list[dict] = []
     for row in rows:
         d = dict(row)
@@ -3057,17 +4021,16 @@ def _fetch_all_market_rows_for_section(
         params.append(str(market_family))
     params.append(int(limit))
 
-    conn = get_conn()
-    rows = conn.execute(
-        f"""
-        SELECT * FROM market_prediction_rows
-        WHERE {' AND '.join(clauses)}
-        ORDER BY generated_at ASC, id ASC
-        LIMIT ?
-        """,
-        params,
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT * FROM market_prediction_rows
+            WHERE {' AND '.join(clauses)}
+            ORDER BY generated_at ASC, id ASC
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
 
     result = [dict(row) for row in rows]
     for row in result:
@@ -3094,41 +4057,39 @@ def _fetch_market_rows_for_section(
         params.append(str(market_family))
 
     sort = "ASC" if str(order).upper() == "ASC" else "DESC"
-    conn = get_conn()
-    anchor = conn.execute(
-        f"""
-        SELECT snapshot_id, generated_at
-        FROM market_prediction_rows
-        WHERE {' AND '.join(clauses)}
-        ORDER BY generated_at {sort}, id {sort}
-        LIMIT 1
-        """,
-        params,
-    ).fetchone()
-    if not anchor:
-        conn.close()
-        return []
+    with read_connection() as conn:
+        anchor = conn.execute(
+            f"""
+            SELECT snapshot_id, generated_at
+            FROM market_prediction_rows
+            WHERE {' AND '.join(clauses)}
+            ORDER BY generated_at {sort}, id {sort}
+            LIMIT 1
+            """,
+            params,
+        ).fetchone()
+        if not anchor:
+            return []
+
+        anchor_clauses = list(clauses)
+        anchor_params = list(params)
+        if anchor["snapshot_id"]:
+            anchor_clauses.append("snapshot_id = ?")
+            anchor_params.append(anchor["snapshot_id"])
+        else:
+            anchor_clauses.append("generated_at = ?")
+            anchor_params.append(anchor["generated_at"])
+        anchor_params.append(int(limit))
 
-    anchor_clauses = list(clauses)
-    anchor_params = list(params)
-    if anchor["snapshot_id"]:
-        anchor_clauses.append("snapshot_id = ?")
-        anchor_params.append(anchor["snapshot_id"])
-    else:
-        anchor_clauses.append("generated_at = ?")
-        anchor_params.append(anchor["generated_at"])
-    anchor_params.append(int(limit))
-
-    rows = conn.execute(
-        f"""
-        SELECT * FROM market_prediction_rows
-        WHERE {' AND '.join(anchor_clauses)}
-        ORDER BY id ASC
-        LIMIT ?
-        """,
-        anchor_params,
-    ).fetchall()
-    conn.close()
+        rows = conn.execute(
+            f"""
+            SELECT * FROM market_prediction_rows
+            WHERE {' AND '.join(anchor_clauses)}
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            anchor_params,
+        ).fetchall()
 
     result = [dict(row) for row in rows]
     for row in result:
@@ -3151,39 +4112,37 @@ def _fetch_earliest_market_rows_any_section(
     if market_family:
         clauses.append("market_family = ?")
         params.append(str(market_family))
-    conn = get_conn()
-    anchor = conn.execute(
-        f"""
-        SELECT snapshot_id, generated_at, section
-        FROM market_prediction_rows
-        WHERE {' AND '.join(clauses)}
-        ORDER BY generated_at ASC, id ASC
-        LIMIT 1
-        """,
-        params,
-    ).fetchone()
-    if not anchor:
-        conn.close()
-        return []
-    anchor_clauses = list(clauses)
-    anchor_params = list(params)
-    if anchor["snapshot_id"]:
-        anchor_clauses.append("snapshot_id = ?")
-        anchor_params.append(anchor["snapshot_id"])
-    else:
-        anchor_clauses.append("generated_at = ?")
-        anchor_params.append(anchor["generated_at"])
-    anchor_params.append(int(limit))
-    rows = conn.execute(
-        f"""
-        SELECT * FROM market_prediction_rows
-        WHERE {' AND '.join(anchor_clauses)}
-        ORDER BY id ASC
-        LIMIT ?
-        """,
-        anchor_params,
-    ).fetchall()
-    conn.close()
+    with read_connection() as conn:
+        anchor = conn.execute(
+            f"""
+            SELECT snapshot_id, generated_at, section
+            FROM market_prediction_rows
+            WHERE {' AND '.join(clauses)}
+            ORDER BY generated_at ASC, id ASC
+            LIMIT 1
+            """,
+            params,
+        ).fetchone()
+        if not anchor:
+            return []
+        anchor_clauses = list(clauses)
+        anchor_params = list(params)
+        if anchor["snapshot_id"]:
+            anchor_clauses.append("snapshot_id = ?")
+            anchor_params.append(anchor["snapshot_id"])
+        else:
+            anchor_clauses.append("generated_at = ?")
+            anchor_params.append(anchor["generated_at"])
+        anchor_params.append(int(limit))
+        rows = conn.execute(
+            f"""
+            SELECT * FROM market_prediction_rows
+            WHERE {' AND '.join(anchor_clauses)}
+            ORDER BY id ASC
+            LIMIT ?
+            """,
+            anchor_params,
+        ).fetchall()
     result = [dict(row) for row in rows]
     for row in result:
         raw_payload = row.get("payload_json")
@@ -3270,48 +4229,106 @@ def _american_odds_score(raw_odds: Any) -> float:
 
 def store_ai_memory(topic: str, insight: str, source_tournament_id: int = None,
                     confidence: float = 0.5, expires_days: int = 180):
-    """Store an AI brain learning/insight."""
-    conn = get_conn()
-    expires_at = None
-    if expires_days:
-        from datetime import timedelta
-        expires_at = (datetime.now() + timedelta(days=expires_days)).isoformat()
-    conn.execute(
-        """INSERT INTO ai_memory (topic, insight, source_tournament_id, confidence, expires_at)
-           VALUES (?, ?, ?, ?, ?)""",
-        (topic, insight, source_tournament_id, confidence, expires_at),
-    )
-    conn.commit()
-    conn.close()
+    """Store an AI brain learning/insight.
+
+    SQLite computes expires_at from *expires_days* (None or 0 = never
+    expires), in the same UTC datetime('now') format the expiry filters
+    compare with. A negative count stores an already-expired memory.
+    """
+    if expires_days is not None:
+        days = int(expires_days)
+        if days != expires_days:
+            raise ValueError(f"expires_days must be a whole number of days, got {expires_days!r}")
+        expires_days = days
+    with connection() as conn, _immediate_transaction(conn):
+        conn.execute(
+            """INSERT INTO ai_memory (topic, insight, source_tournament_id, confidence, expires_at)
+               VALUES (?1, ?2, ?3, ?4,
+                       CASE WHEN ?5 THEN datetime('now', printf('%+d days', ?5)) END)""",
+            (topic, insight, source_tournament_id, confidence, expires_days),
+        )
+        _purge_expired_ai_memories(conn)
 
 
-def get_ai_memories(topics: list[str] = None, limit: int = 50) -> list[dict]:
-    """Retrieve relevant AI memories, filtered by topic. Excludes expired."""
-    conn = get_conn()
-    sql = """SELECT * FROM ai_memory
-             WHERE (expires_at IS NULL OR expires_at > datetime('now'))"""
-    params = []
-    if topics:
-        placeholders = ",".join("?" for _ in topics)
-        sql += f" AND topic IN ({placeholders})"
-        params.extend(topics)
-    sql += " ORDER BY confidence DESC, created_at DESC LIMIT ?"
-    params.append(limit)
-    rows = conn.execute(sql, params).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+def _purge_expired_ai_memories(conn) -> int:
+    """Delete ai_memory rows whose expiry has passed; returns the row count.
+
+    Runs on every memory write and in the storage cleanup ops job to keep
+    the table small; readers still filter on expires_at because rows lapse
+    between writes.
+    """
+    return conn.execute(
+        "DELETE FROM ai_memory WHERE expires_at <= datetime('now')"
+    ).rowcount
+
+
+def purge_expired_ai_memories() -> int:
+    """Delete expired AI memories and return how many were removed."""
+    with connection() as conn, _immediate_transaction(conn):
+        return _purge_expired_ai_memories(conn)
+
+
+_AI_MEMORIES_SQL = """SELECT id, topic, insight, source_tournament_id, confidence, created_at, expires_at
+    FROM ai_memory
+    WHERE (expires_at IS NULL OR expires_at > datetime('now'))
+    ORDER BY confidence DESC, created_at DESC LIMIT ?"""
+
+# Walks idx_ai_memory_topic_rank in order for one topic and stops at LIMIT.
+_AI_MEMORIES_BY_TOPIC_SQL = """SELECT id, topic, insight, source_tournament_id, confidence, created_at, expires_at
+    FROM ai_memory
+    WHERE topic = ? AND (expires_at IS NULL OR expires_at > datetime('now'))
+    ORDER BY confidence DESC, created_at DESC LIMIT ?"""
+
+
+def _ai_memory_rank(row: sqlite3.Row) -> tuple:
+    # Mirrors ORDER BY confidence DESC, created_at DESC (NULLs sort last).
+    confidence, created_at = row["confidence"], row["created_at"]
+    return (confidence is not None, confidence or 0.0, created_at is not None, created_at or "")
+
+
+def get_ai_memories(topics: list[str] = None, limit: int = 50) -> list[Record]:
+    """Retrieve relevant AI memories, filtered by topic. Excludes expired.
+
+    With *topics*, each topic runs the same prepared statement off
+    idx_ai_memory_topic_rank and the already-ordered results are merged.
+    """
+    with read_connection() as conn:
+        if not topics:
+            return _fetch_records(conn, _AI_MEMORIES_SQL, (limit,))
+        per_topic = [
+            _fetch_records(conn, _AI_MEMORIES_BY_TOPIC_SQL, (topic, limit))
+            for topic in dict.fromkeys(topics)
+        ]
+    if len(per_topic) == 1:
+        return per_topic[0]
+    return list(itertools.islice(heapq.merge(*per_topic, key=_ai_memory_rank, reverse=True), limit))
+
+
+def count_ai_memories() -> int:
+    """Number of live (unexpired) AI memories, without fetching them."""
+    with read_connection() as conn:
+        return _fetch_scalar(
+            conn,
+            """SELECT COUNT(*) FROM ai_memory
+               WHERE expires_at IS NULL OR expires_at > datetime('now')""",
+        ) or 0
 
 
 def get_all_ai_memory_topics() -> list[str]:
-    """Get all distinct memory topics."""
-    conn = get_conn()
-    rows = conn.execute(
-        """SELECT DISTINCT topic FROM ai_memory
-           WHERE expires_at IS NULL OR expires_at > datetime('now')
-           ORDER BY topic"""
-    ).fetchall()
-    conn.close()
-    return [r["topic"] for r in rows]
+    """Get all distinct topics that still have an unexpired memory.
+
+    Memories lapse with the clock, not with writes, so the expiry filter
+    stays even though _purge_expired_ai_memories() trims the table.
+    """
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(
+            """SELECT DISTINCT topic FROM ai_memory
+               WHERE expires_at IS NULL OR expires_at > datetime('now')
+               ORDER BY topic"""
+        ).fetchall()
+    return [r[0] for r in rows]
 
 
 # ── AI decisions helpers ───────────────────────────────────────────
@@ -3319,62 +4336,85 @@ def get_all_ai_memory_topics() -> list[str]:
 def store_ai_decision(tournament_id: int, phase: str,
                       input_summary: str, output_json: str):
     """Log an AI brain decision/analysis."""
-    conn = get_conn()
-    conn.execute(
-        """INSERT INTO ai_decisions (tournament_id, phase, input_summary, output_json)
-           VALUES (?, ?, ?, ?)""",
-        (tournament_id, phase, input_summary, output_json),
-    )
-    conn.commit()
-    conn.close()
+    with connection() as conn, _immediate_transaction(conn):
+        conn.execute(
+            """INSERT INTO ai_decisions (tournament_id, phase, input_summary, output_json)
+               VALUES (?, ?, ?, ?)""",
+            (tournament_id, phase, input_summary, output_json),
+        )
+
 
+_AI_DECISIONS_SELECT = (
+    "SELECT id, tournament_id, phase, input_summary, output_json, created_at "
+    "FROM ai_decisions"
+)
 
-def get_ai_decisions(tournament_id: int = None, phase: str = None) -> list[dict]:
+# (has tournament_id, has phase) -> SQL. Fixed strings keep each shape a
+# single statement-cache entry; the tid+phase shape is served in order by
+# idx_ai_decisions_tid_phase_time.
+_AI_DECISIONS_SQL = {
+    (True, True): f"{_AI_DECISIONS_SELECT} WHERE tournament_id = ? AND phase = ? "
+                  "ORDER BY created_at DESC",
+    (True, False): f"{_AI_DECISIONS_SELECT} WHERE tournament_id = ? ORDER BY created_at DESC",
+    (False, True): f"{_AI_DECISIONS_SELECT} WHERE phase = ? ORDER BY created_at DESC",
+    (False, False): f"{_AI_DECISIONS_SELECT} ORDER BY created_at DESC",
+}
+
+
+def get_ai_decisions(tournament_id: int = None, phase: str = None) -> list[Record]:
     """Retrieve AI decisions, optionally filtered."""
-    conn = get_conn()
-    sql = "SELECT * FROM ai_decisions WHERE 1=1"
-    params = []
-    if tournament_id:
-        sql += " AND tournament_id = ?"
-        params.append(tournament_id)
-    if phase:
-        sql += " AND phase = ?"
-        params.append(phase)
-    sql += " ORDER BY created_at DESC"
-    rows = conn.execute(sql, params).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    sql = _AI_DECISIONS_SQL[(bool(tournament_id), bool(phase))]
+    params = [p for p in (tournament_id, phase) if p]
+    with read_connection() as conn:
+        return _fetch_records(conn, sql, params)
 
 
 # ── Weights helpers with course-aware lookup ───────────────────────
 
+# (DB_PATH, course_num) -> ((weights id, profile weights_json, confidence), blend).
+_BLENDED_WEIGHTS_CACHE: dict[tuple[str, int], tuple[tuple, dict]] = {}
+
+# Everything the course blend depends on, in one round trip: the active
+# weight set's id and the course profile's raw JSON and confidence (NULLs
+# when there is no profile).
+_WEIGHT_BLEND_STAMP_SQL = """
+    SELECT (SELECT id FROM weight_sets WHERE active = 1 ORDER BY id DESC LIMIT 1),
+           p.weights_json, p.confidence
+    FROM (SELECT 1) LEFT JOIN course_weight_profiles p ON p.course_num = ?
+"""
+
+
 def get_weights_for_course(course_num: int = None) -> dict:
     """
     Get weights, blending global with course-specific if available.
 
     If a course_weight_profile exists and has enough confidence,
-    blend it with global weights.
+    blend it with global weights. One stamp query per call; the blend is
+    rebuilt only when the active set or the stored profile changes.
     """
-    global_weights = get_active_weights()
     if course_num is None:
-        return global_weights
-
-    profile = get_course_weight_profile(course_num)
-    if profile is None or profile.get("confidence", 0) < 0.3:
-        return global_weights
-
-    # Blend: higher confidence = more course-specific influence
-    conf = profile["confidence"]
-    course_w = profile["weights"]
-    blended = {}
-    for key in global_weights:
-        if key in course_w:
-            blended[key] = round(
-                global_weights[key] * (1 - conf) + course_w[key] * conf, 4
-            )
+        return get_active_weights()
+
+    with read_connection() as conn:
+        stamp = tuple(conn.execute(_WEIGHT_BLEND_STAMP_SQL, (course_num,)).fetchone())
+    cache_key = (DB_PATH, course_num)
+    cached = _BLENDED_WEIGHTS_CACHE.get(cache_key)
+    if cached is None or cached[0] != stamp:
+        weights_id, global_weights = _active_weight_set()
+        _, profile_json, conf = stamp
+        if profile_json is None or (conf or 0) < 0.3:
+            blended = dict(global_weights)
         else:
-            blended[key] = global_weights[key]
-    return blended
+            # Blend: higher confidence = more course-specific influence
+            keep = 1 - conf
+            course_w = _loads_weights(profile_json)
+            blended = {
+                key: round(value * keep + course_w[key] * conf, 4) if key in course_w else value
+                for key, value in global_weights.items()
+            }
+        cached = ((weights_id, profile_json, conf), blended)
+        _BLENDED_WEIGHTS_CACHE[cache_key] = cached
+    return cached[1].copy()
 
 
 def reclaim_database_disk(
@@ -3435,6 +4475,8 @@ def reclaim_database_disk(
             return {"ok": False, "skipped": True, "reason": "VACUUM INTO did not produce output"}
         backup_path = DB_PATH + ".pre_reclaim"
         shutil.copy2(DB_PATH, backup_path)
+        # Pooled connections would keep reading the replaced inode.
+        close_all_connections()
         os.replace(temp_path, DB_PATH)
         after = os.path.getsize(DB_PATH) if os.path.exists(DB_PATH) else 0
         return {
@@ -3560,26 +4602,17 @@ def prune_snapshot_history_tables(
 
 
 def ensure_initialized():
-    """Initialize the database if not already done. Call before first use."""
-    global _DB_INITIALIZED
-    if not _DB_INITIALIZED:
-        init_db()
-        _DB_INITIALIZED = True
+    """Initialize the database if not already done (get_conn() also does this)."""
+    init_db()
 
 
 def get_app_metadata(key: str) -> Any | None:
     """Return a JSON-deserialized app_metadata value or None."""
-    import json
-
-    ensure_initialized()
-    conn = get_conn()
-    try:
+    with read_connection() as conn:
         row = conn.execute(
             "SELECT value_json FROM app_metadata WHERE key = ?",
             (key,),
         ).fetchone()
-    finally:
-        conn.close()
     if not row:
         return None
     try:
@@ -3590,11 +4623,7 @@ def get_app_metadata(key: str) -> Any | None:
 
 def set_app_metadata(key: str, value: Any) -> None:
     """Persist a JSON-serializable app_metadata value."""
-    import json
-
-    ensure_initialized()
-    conn = get_conn()
-    try:
+    with connection() as conn:
         conn.execute(
             """
             INSERT INTO app_metadata (key, value_json, updated_at)
@@ -3606,10 +4635,4 @@ def set_app_metadata(key: str, value: Any) -> None:
             (key, json.dumps(value, default=str)),
         )
         conn.commit()
-    finally:
-        conn.close()
-
 
-# Lazy initialization: ensure tables exist on first connection use.
-# This replaces the old module-level init_db() call so .env can load first.
-ensure_initialized()
@@ -10,6 +10,8 @@ after 5+ tournaments applies EWA update with floor 10% / ceiling 50% model weigh
 import logging
 import math
 
+import numpy as np
+
 from src import config
 from src import db
 from src.feature_flags import is_enabled
@@ -21,12 +23,14 @@ MODEL_WEIGHT_FLOOR = 0.10
 MODEL_WEIGHT_CEILING = 0.50
 MIN_TOURNAMENTS_FOR_EWA = 5
 DRIFT_WORSE_PCT = 0.15  # flag if blend Brier >15% worse than DG-only
+BRIER_NUMPY_MIN_N = 64  # below this, fromiter setup costs more than the Python loop
 
 
-def _oos_promotion_allows_model_weight_increase(bet_type: str) -> bool:
+def _oos_promotion_allows_model_weight_increase(bet_type: str, n_tournaments: int | None = None) -> bool:
     """
     When feature flag ``dynamic_blend_oos_promotion`` is on, require recent
     tournaments where model Brier beats DG Brier (with margin) and enough samples.
+    n_tournaments, when the caller already counted blend_history, skips the recount.
     """
     if not is_enabled("dynamic_blend_oos_promotion"):
         return True
@@ -35,12 +39,13 @@ def _oos_promotion_allows_model_weight_increase(bet_type: str) -> bool:
     min_tourn = int(getattr(config, "DYNAMIC_BLEND_PROMO_MIN_TOURNAMENTS", 8))
     edge = float(getattr(config, "DYNAMIC_BLEND_PROMO_MODEL_EDGE", 0.02))
 
-    conn = db.get_conn()
-    try:
-        n_tourn = conn.execute(
-            "SELECT COUNT(DISTINCT tournament_id) AS c FROM blend_history WHERE bet_type = ?",
-            (bet_type,),
-        ).fetchone()["c"]
+    with db.read_connection() as conn:
+        n_tourn = n_tournaments
+        if n_tourn is None:
+            n_tourn = conn.execute(
+                "SELECT COUNT(DISTINCT tournament_id) AS c FROM blend_history WHERE bet_type = ?",
+                (bet_type,),
+            ).fetchone()["c"]
         if n_tourn < min_tourn:
             return False
         rows = conn.execute(
@@ -49,8 +54,6 @@ def _oos_promotion_allows_model_weight_increase(bet_type: str) -> bool:
                ORDER BY id DESC LIMIT ?""",
             (bet_type, window),
         ).fetchall()
-    finally:
-        conn.close()
 
     if len(rows) < window:
         return False
@@ -69,6 +72,18 @@ def _oos_promotion_allows_model_weight_increase(bet_type: str) -> bool:
     return True
 
 
+# Latest row plus the distinct-tournament count in one statement; ?1 is bound
+# once for both.
+_LATEST_BLEND_SQL = """
+    SELECT dg_weight, model_weight, brier_blended,
+           (SELECT COUNT(DISTINCT tournament_id) FROM blend_history WHERE bet_type = ?1)
+               AS n_tournaments
+    FROM blend_history
+    WHERE bet_type = ?1
+    ORDER BY id DESC LIMIT 1
+"""
+
+
 def get_blend_ratio(bet_type: str) -> tuple[float, float]:
     """
     Return (dg_weight, model_weight) for the given bet type.
@@ -78,26 +93,18 @@ def get_blend_ratio(bet_type: str) -> tuple[float, float]:
     if not is_enabled("dynamic_blend"):
         return config.get_blend_weights(bet_type)
 
-    conn = db.get_conn()
-    row = conn.execute(
-        """SELECT dg_weight, model_weight, brier_blended FROM blend_history
-           WHERE bet_type = ? ORDER BY id DESC LIMIT 1""",
-        (bet_type,),
-    ).fetchone()
-    count = conn.execute(
-        "SELECT COUNT(DISTINCT tournament_id) AS c FROM blend_history WHERE bet_type = ?",
-        (bet_type,),
-    ).fetchone()["c"]
-    conn.close()
+    with db.read_connection() as conn:
+        row = conn.execute(_LATEST_BLEND_SQL, (bet_type,)).fetchone()
     if not row:
         return config.get_blend_weights(bet_type)
     dg_w = float(row["dg_weight"])
     model_w = float(row["model_weight"])
     brier_blended = row["brier_blended"]
+    count = row["n_tournaments"]
     if count >= MIN_TOURNAMENTS_FOR_EWA and brier_blended is not None:
         new_model = model_w * math.exp(-EWA_LR * brier_blended)
         new_model = max(MODEL_WEIGHT_FLOOR, min(MODEL_WEIGHT_CEILING, new_model))
-        if new_model > model_w and not _oos_promotion_allows_model_weight_increase(bet_type):
+        if new_model > model_w and not _oos_promotion_allows_model_weight_increase(bet_type, count):
             new_model = model_w
         return (1.0 - new_model, new_model)
     return (dg_w, model_w)
@@ -108,7 +115,16 @@ def _brier_score(probs: list[float], outcomes: list[int]) -> float:
     if not probs or len(probs) != len(outcomes):
         return 0.0
     n = len(probs)
-    return sum((p - y) ** 2 for p, y in zip(probs, outcomes)) / n
+    if n < BRIER_NUMPY_MIN_N:
+        return sum((p - y) ** 2 for p, y in zip(probs, outcomes)) / n
+    p = np.fromiter(probs, dtype=np.float64, count=n)
+    y = np.fromiter(outcomes, dtype=np.int8, count=n)
+    return _brier_score_arrays(p, y)
+
+
+def _brier_score_arrays(probs: np.ndarray, outcomes: np.ndarray) -> float:
+    """Brier score over equal-length, non-empty probability and 0/1 outcome arrays."""
+    return float(((probs - outcomes) ** 2).mean())
 
 
 def record_tournament_brier(
@@ -124,34 +140,35 @@ def record_tournament_brier(
     if not brier_data:
         return
 
-    conn = db.get_conn()
-    for bet_type, data in brier_data.items():
-        brier_dg = data.get("brier_dg")
-        brier_model = data.get("brier_model")
-        brier_blended = data.get("brier_blended")
-        n = data.get("n_predictions", 0)
-        dg_weight = data.get("dg_weight")
-        model_weight = data.get("model_weight")
-        if dg_weight is None or model_weight is None:
-            dg_weight, model_weight = config.get_blend_weights(bet_type)
-
-        conn.execute(
-            """INSERT INTO blend_history
-               (tournament_id, bet_type, brier_dg, brier_model, brier_blended,
-                n_predictions, dg_weight, model_weight)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (tournament_id, bet_type, brier_dg, brier_model, brier_blended,
-             n, dg_weight, model_weight),
-        )
-        # Drift check: blend Brier >15% worse than DG-only
-        if brier_dg is not None and brier_blended is not None and brier_dg > 0:
-            if brier_blended >= brier_dg * (1 + DRIFT_WORSE_PCT):
-                logger.warning(
-                    "Blend drift: %s blended Brier %.4f is >15%% worse than DG-only %.4f",
-                    bet_type, brier_blended, brier_dg,
-                )
-    conn.commit()
-    conn.close()
+    # BEGIN IMMEDIATE up front: readers on other threads stay on their own
+    # connections while the rows for every bet_type are appended.
+    with db.transaction() as conn:
+        for bet_type, data in brier_data.items():
+            brier_dg = data.get("brier_dg")
+            brier_model = data.get("brier_model")
+            brier_blended = data.get("brier_blended")
+            n = data.get("n_predictions", 0)
+            dg_weight = data.get("dg_weight")
+            model_weight = data.get("model_weight")
+            if dg_weight is None or model_weight is None:
+                dg_weight, model_weight = config.get_blend_weights(bet_type)
+
+            conn.execute(
+                """INSERT INTO blend_history
+                   (tournament_id, bet_type, brier_dg, brier_model, brier_blended,
+                    n_predictions, dg_weight, model_weight)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (tournament_id, bet_type, brier_dg, brier_model, brier_blended,
+                 n, dg_weight, model_weight),
+            )
+            # Drift check: blend Brier >15% worse than DG-only
+            if brier_dg is not None and brier_blended is not None and brier_dg > 0:
+                if brier_blended >= brier_dg * (1 + DRIFT_WORSE_PCT):
+                    logger.warning(
+                        "Blend drift: %s blended Brier %.4f is >15%% worse than DG-only %.4f",
+                        bet_type, brier_blended, brier_dg,
+                    )
+    db.maybe_optimize()
 
 
 def compute_brier_from_bets(value_bets_by_type: dict, result_map: dict, outcomes_fn) -> dict:
@@ -165,34 +182,38 @@ def compute_brier_from_bets(value_bets_by_type: dict, result_map: dict, outcomes
 
     brier_data = {}
     for bet_type, bets in value_bets_by_type.items():
-        dg_probs = []
-        model_probs = []
-        blended_probs = []
-        outcomes = []
+        size = len(bets)
+        dg_arr = np.empty(size, dtype=np.float64)
+        model_arr = np.empty(size, dtype=np.float64)
+        blended_arr = np.empty(size, dtype=np.float64)
+        outcomes_arr = np.empty(size, dtype=np.int8)
+        n = 0
         for bet in bets:
-            pk = bet.get("player_key")
-            actual = outcomes_fn(pk, result_map) if outcomes_fn else 0
             dg_only = bet.get("dg_only_prob")
             model_only = bet.get("model_only_prob")
             blended = bet.get("blended_prob") or bet.get("model_prob")
-            if dg_only is not None or model_only is not None or blended is not None:
-                if actual is None:
-                    continue
-                dg_probs.append(dg_only if dg_only is not None else 0.0)
-                model_probs.append(model_only if model_only is not None else 0.0)
-                blended_probs.append(blended if blended is not None else 0.0)
-                outcomes.append(1 if actual else 0)
-        if not outcomes:
+            if dg_only is None and model_only is None and blended is None:
+                continue
+            actual = outcomes_fn(bet.get("player_key"), result_map) if outcomes_fn else 0
+            if actual is None:
+                continue
+            dg_arr[n] = dg_only if dg_only is not None else 0.0
+            model_arr[n] = model_only if model_only is not None else 0.0
+            blended_arr[n] = blended if blended is not None else 0.0
+            outcomes_arr[n] = 1 if actual else 0
+            n += 1
+        if not n:
             continue
-        brier_dg = _brier_score(dg_probs, outcomes) if dg_probs else None
-        brier_model = _brier_score(model_probs, outcomes) if model_probs else None
-        brier_blended = _brier_score(blended_probs, outcomes) if blended_probs else None
+        outcomes_arr = outcomes_arr[:n]
+        brier_dg = _brier_score_arrays(dg_arr[:n], outcomes_arr)
+        brier_model = _brier_score_arrays(model_arr[:n], outcomes_arr)
+        brier_blended = _brier_score_arrays(blended_arr[:n], outcomes_arr)
         dg_w, model_w = get_blend_weights(bet_type)
         brier_data[bet_type] = {
             "brier_dg": brier_dg,
             "brier_model": brier_model,
             "brier_blended": brier_blended,
-            "n_predictions": len(outcomes),
+            "n_predictions": n,
             "dg_weight": dg_w,
             "model_weight": model_w,
         }
@@ -31,19 +31,18 @@ from src import db
 
 
 def _fetch_rows(model_name: str, since: datetime) -> list[dict[str, Any]]:
-    conn = db.get_conn()
-    rows = conn.execute(
-        """
-        SELECT model_name, model_version, matchup_id, p1_key, p2_key,
-               predicted_p, champion_p, book_price_p1, book_price_p2,
-               outcome, ts
-        FROM challenger_predictions
-        WHERE model_name = ?
-          AND ts >= ?
-        """,
-        (model_name, since.isoformat(sep=" ", timespec="seconds")),
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT model_name, model_version, matchup_id, p1_key, p2_key,
+                   predicted_p, champion_p, book_price_p1, book_price_p2,
+                   outcome, ts
+            FROM challenger_predictions
+            WHERE model_name = ?
+              AND ts >= ?
+            """,
+            (model_name, since.isoformat(sep=" ", timespec="seconds")),
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
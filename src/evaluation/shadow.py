@@ -136,19 +136,18 @@ def record_matchup_shadow(
         return
 
     try:
-        conn = db.get_conn()
-        conn.executemany(
-            """
-            INSERT INTO challenger_predictions (
-                model_name, model_version, market_type, matchup_id,
-                tournament_id, p1_key, p2_key, predicted_p, champion_p,
-                book_price_p1, book_price_p2
+        with db.connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO challenger_predictions (
+                    model_name, model_version, market_type, matchup_id,
+                    tournament_id, p1_key, p2_key, predicted_p, champion_p,
+                    book_price_p1, book_price_p2
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
-        conn.commit()
-        conn.close()
+            conn.commit()
     except Exception:
         logger.warning("Failed to persist challenger_predictions rows", exc_info=True)
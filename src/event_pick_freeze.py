@@ -218,10 +218,9 @@ def freeze_completed_event_picks(
 ) -> dict[str, Any]:
     """Backfill dashboard + lab lanes and grade when inventory exists."""
     db.ensure_initialized()
-    conn = db.get_conn()
-    tournament_id = _ensure_tournament(conn, event_id=event_id, year=year, event_name=event_name)
-    has_results = _event_has_results(conn, tournament_id)
-    conn.close()
+    with db.connection() as conn:
+        tournament_id = _ensure_tournament(conn, event_id=event_id, year=year, event_name=event_name)
+        has_results = _event_has_results(conn, tournament_id)
 
     ledger_count, mpr_count = _inventory_exists(event_id)
     if ledger_count == 0 and mpr_count == 0:
@@ -235,21 +234,20 @@ def freeze_completed_event_picks(
     dash_inserted = backfill_completed_market_rows_into_picks(event_id, tournament_id, source="dashboard")
     lab_inserted = backfill_completed_market_rows_into_picks(event_id, tournament_id, source="lab")
 
-    conn = db.get_conn()
-    ledger_linked = _backfill_ledger_tournament_id(
-        conn,
-        event_id=event_id,
-        tournament_id=tournament_id,
-        year=year,
-    )
-    canonical_ledger = _write_canonical_ledger_rows(
-        event_id,
-        tournament_id=tournament_id,
-        year=year,
-        event_name=event_name,
-    )
-    ungraded = _ungraded_positive_ev_count(conn, tournament_id)
-    conn.close()
+    with db.connection() as conn:
+        ledger_linked = _backfill_ledger_tournament_id(
+            conn,
+            event_id=event_id,
+            tournament_id=tournament_id,
+            year=year,
+        )
+        canonical_ledger = _write_canonical_ledger_rows(
+            event_id,
+            tournament_id=tournament_id,
+            year=year,
+            event_name=event_name,
+        )
+        ungraded = _ungraded_positive_ev_count(conn, tournament_id)
 
     if not has_results:
         from src.event_results import acquire_event_results
@@ -260,9 +258,8 @@ def freeze_completed_event_picks(
             tournament_id=tournament_id,
         )
         if acquisition.get("status") == "ok":
-            conn = db.get_conn()
-            has_results = _event_has_results(conn, tournament_id)
-            conn.close()
+            with db.connection() as conn:
+                has_results = _event_has_results(conn, tournament_id)
         else:
             logger.info(
                 "Results acquisition pending for event %s/%s: %s",
@@ -499,10 +496,9 @@ def _completed_events_for_sweep(conn, *, year: int) -> list[dict[str, Any]]:
 def ensure_all_completed_pga_events_graded(*, year: int | None = None) -> dict[str, Any]:
     """Backfill + grade every completed PGA event that still has ungraded +EV picks."""
     db.ensure_initialized()
-    conn = db.get_conn()
-    current_year = year or __import__("datetime").datetime.now().year
-    rows = _completed_events_for_sweep(conn, year=current_year)
-    conn.close()
+    with db.connection() as conn:
+        current_year = year or __import__("datetime").datetime.now().year
+        rows = _completed_events_for_sweep(conn, year=current_year)
 
     results: list[dict[str, Any]] = []
     for row in rows:
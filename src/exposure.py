@@ -5,8 +5,9 @@ Caps per-player (5%) and per-tournament (12%) effective exposure.
 When feature flag exposure_caps is on, filters value bets that exceed caps.
 """
 
+import heapq
 import logging
-from copy import deepcopy
+from collections import defaultdict
 from typing import Optional
 
 from src.feature_flags import is_enabled
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 PER_PLAYER_CAP_PCT = 0.05   # 5% of bankroll per player
 PER_TOURNAMENT_CAP_PCT = 0.12  # 12% per tournament
 MIN_BETS_AFTER_CAP = 3
+# Units of slack when filter_by_exposure compares its running totals to a cap.
+_CAP_TOLERANCE = 1e-9
 
 
 def compute_exposure(
@@ -33,9 +36,10 @@ def compute_exposure(
         "tournament_over": bool,
     }
     """
-    per_player = {}
+    # Raw units first, divided once at the end.
+    units_by_player = defaultdict(float)
     tournament_total = 0.0
-    for bet_type, bets in value_bets_by_type.items():
+    for bets in value_bets_by_type.values():
         for bet in bets:
             if not bet.get("is_value"):
                 continue
@@ -43,18 +47,24 @@ def compute_exposure(
             if not pk:
                 continue
             units = stake_per_bet * bet.get("stake_multiplier", 1.0)
-            per_player[pk] = per_player.get(pk, 0.0) + units
+            units_by_player[pk] += units
             tournament_total += units
 
     if bankroll and bankroll > 0:
-        per_player = {k: v / bankroll for k, v in per_player.items()}
+        per_player = {}
+        over_players = []
+        for pk, units in units_by_player.items():
+            fraction = units / bankroll
+            per_player[pk] = fraction
+            if fraction > PER_PLAYER_CAP_PCT:
+                over_players.append(pk)
         tournament_total = tournament_total / bankroll
+        tournament_over = tournament_total > PER_TOURNAMENT_CAP_PCT
     else:
         # No bankroll: use raw units; caps not comparable
-        pass
-
-    over_players = [pk for pk, v in per_player.items() if v > PER_PLAYER_CAP_PCT]
-    tournament_over = (bankroll and bankroll > 0) and tournament_total > PER_TOURNAMENT_CAP_PCT
+        per_player = dict(units_by_player)
+        over_players = [pk for pk, v in per_player.items() if v > PER_PLAYER_CAP_PCT]
+        tournament_over = False
 
     return {
         "per_player": per_player,
@@ -72,6 +82,11 @@ def filter_by_exposure(
     """
     Return a copy of value_bets_by_type with bets removed so caps are not exceeded.
     Removes lowest-EV bets first. When exposure_caps flag is off, returns unchanged.
+
+    Copy-on-write: only bet lists that lose a bet are copied, and only the
+    disabled bets are replaced (by copies with is_value=False); everything
+    else is shared with the input. Per-player and tournament units are kept
+    as running totals, so the whole pass is O(B log B).
     """
     if not is_enabled("exposure_caps"):
         return value_bets_by_type, []
@@ -80,40 +95,74 @@ def filter_by_exposure(
         return value_bets_by_type, []
 
     warnings = []
-    result = deepcopy(value_bets_by_type)
-
-    def _exposure(result_copy: dict) -> dict:
-        return compute_exposure(result_copy, stake_per_bet, bankroll)
-
-    while True:
-        exp = _exposure(result)
-        over = set(exp["over_exposed_players"])
-        tour_over = exp["tournament_over"]
-        if not over and not tour_over:
-            break
-
-        # Collect all value bets as (bet_type, index, bet, ev)
-        candidates = []
-        for bet_type, bets in result.items():
-            for i, bet in enumerate(bets):
-                if not bet.get("is_value"):
-                    continue
-                pk = bet.get("player_key")
-                if pk in over or tour_over:
-                    candidates.append((bet_type, i, bet, bet.get("ev", 0.0)))
-        if not candidates:
+    result = dict(value_bets_by_type)
+    copied_types = set()
+
+    # Running totals drift by float rounding as bets are subtracted; a total
+    # within _CAP_TOLERANCE of a cap counts as at the cap, not over it.
+    player_cap = PER_PLAYER_CAP_PCT * bankroll + _CAP_TOLERANCE
+    tournament_cap = PER_TOURNAMENT_CAP_PCT * bankroll + _CAP_TOLERANCE
+
+    # Heap entries are (ev, order, bet_type, index); order keeps ties in scan order.
+    all_heap = []
+    player_heaps: dict = defaultdict(list)
+    player_units: dict = defaultdict(float)
+    entry_units = {}
+    tournament_units = 0.0
+    order = 0
+    for bet_type, bets in result.items():
+        for i, bet in enumerate(bets):
+            if not bet.get("is_value"):
+                continue
+            entry = (bet.get("ev", 0.0), order, bet_type, i)
+            order += 1
+            all_heap.append(entry)
+            pk = bet.get("player_key")
+            if pk:
+                units = stake_per_bet * bet.get("stake_multiplier", 1.0)
+                player_heaps[pk].append(entry)
+                player_units[pk] += units
+                entry_units[entry[1]] = (pk, units)
+                tournament_units += units
+    heapq.heapify(all_heap)
+    for heap in player_heaps.values():
+        heapq.heapify(heap)
+
+    over = {pk for pk, units in player_units.items() if units > player_cap}
+    disabled = set()
+
+    def _pop_live(heap: list):
+        while heap and heap[0][1] in disabled:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    while over or tournament_units > tournament_cap:
+        if tournament_units > tournament_cap:
+            victim = _pop_live(all_heap)
+        else:
+            tops = [top for top in (_pop_live(player_heaps[pk]) for pk in over) if top]
+            victim = min(tops) if tops else None
+        if victim is None:
             break
-        # Remove the one with lowest EV
-        candidates.sort(key=lambda x: x[3])
-        bt, idx, _b, _ev = candidates[0]
-        result[bt][idx] = {**_b, "is_value": False}
-        logger.debug("Exposure cap: disabled bet %s %s (ev=%.2f)", bt, _b.get("player_key"), _ev)
-
-    exp = _exposure(result)
-    if exp["over_exposed_players"] or exp["tournament_over"]:
+        ev, seq, bt, idx = victim
+        disabled.add(seq)
+        if bt not in copied_types:
+            result[bt] = list(result[bt])
+            copied_types.add(bt)
+        bet = result[bt][idx]
+        result[bt][idx] = {**bet, "is_value": False}
+        if seq in entry_units:
+            pk, units = entry_units[seq]
+            tournament_units -= units
+            player_units[pk] -= units
+            if player_units[pk] <= player_cap:
+                over.discard(pk)
+        logger.debug("Exposure cap: disabled bet %s %s (ev=%.2f)", bt, bet.get("player_key"), ev)
+
+    if over or tournament_units > tournament_cap:
         warnings.append("Exposure caps: some exposure remains over limit (cannot reduce further).")
-    n_value = sum(1 for bets in result.values() for b in bets if b.get("is_value"))
-    if n_value < MIN_BETS_AFTER_CAP and n_value < sum(1 for bets in value_bets_by_type.values() for b in bets if b.get("is_value")):
+    n_value = order - len(disabled)
+    if n_value < MIN_BETS_AFTER_CAP and n_value < order:
         warnings.append(f"After exposure filter, fewer than {MIN_BETS_AFTER_CAP} value bets remain.")
 
     return result, warnings
@@ -7,34 +7,97 @@ flags here so features can be toggled or killed without code deploy.
 
 import os
 import logging
+import re
+import time
 
 logger = logging.getLogger(__name__)
 
+_FLAGS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "feature_flags.yaml")
+# How often is_enabled() stats the file for edits; a reload only re-parses
+# when st_mtime_ns moved.
+_RECHECK_SECONDS = 5.0
+
 _FLAGS: dict[str, bool] = {}
 _LOADED = False
+_MTIME_NS: int | None = None
+_RECHECK_AT = 0.0
+
+# The file is a flat "name: bool" map. Lines of that shape are parsed here;
+# anything else (nesting, quoted values, flow style) falls back to PyYAML.
+_FLAG_LINE = re.compile(
+    r"([A-Za-z0-9_]+)[ \t]*:[ \t]*"
+    r"(true|True|TRUE|false|False|FALSE|yes|Yes|YES|no|No|NO|on|On|ON|off|Off|OFF|[-+]?[0-9]+)"
+    r"[ \t]*(?:#.*)?"
+)
+_TRUE_WORDS = frozenset(("true", "yes", "on"))
+
+
+def _parse_flags(text: str) -> dict[str, bool] | None:
+    """Parse flat ``name: bool`` lines; None if the file needs a real YAML parser."""
+    flags = {}
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        match = _FLAG_LINE.fullmatch(line.rstrip())
+        if match is None:
+            return None
+        name, value = match.groups()
+        lowered = value.lower()
+        if lowered in _TRUE_WORDS:
+            flags[name] = True
+        elif lowered.lstrip("+-").isdigit():
+            flags[name] = int(value) != 0
+        else:
+            flags[name] = False
+    return flags
 
 
 def _load_flags() -> dict[str, bool]:
-    global _LOADED, _FLAGS
-    if _LOADED:
-        return _FLAGS
-    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "feature_flags.yaml")
-    if os.path.exists(path):
-        try:
-            import yaml
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
-            _FLAGS = {k: bool(v) for k, v in data.items() if isinstance(v, (bool, int))}
-        except Exception as e:
-            logger.warning("Could not load feature_flags.yaml: %s", e)
-    _LOADED = True
+    global _LOADED, _FLAGS, _MTIME_NS, _RECHECK_AT
+    try:
+        mtime_ns = os.stat(_FLAGS_PATH).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if not _LOADED or mtime_ns != _MTIME_NS:
+        if mtime_ns is None:
+            _FLAGS = {}
+        else:
+            try:
+                with open(_FLAGS_PATH) as f:
+                    text = f.read()
+                flags = _parse_flags(text)
+                if flags is None:
+                    import yaml
+                    data = yaml.safe_load(text) or {}
+                    flags = {k: bool(v) for k, v in data.items() if isinstance(v, (bool, int))}
+                _FLAGS = flags
+            except Exception as e:
+                logger.warning("Could not load feature_flags.yaml: %s", e)
+        _MTIME_NS = mtime_ns
+        _LOADED = True
+    _RECHECK_AT = time.monotonic() + _RECHECK_SECONDS
     return _FLAGS
 
 
 def is_enabled(flag_name: str) -> bool:
-    """Return True if the feature flag is enabled, False otherwise."""
-    flags = _load_flags()
-    return flags.get(flag_name, False)
+    """Return True if the feature flag is enabled, False otherwise.
+
+    Between file checks this is a clock read and a dict lookup; scoring
+    loops call it per bet.
+    """
+    if time.monotonic() >= _RECHECK_AT:
+        _load_flags()
+    return _FLAGS.get(flag_name, False)
+
+
+def clear_cache() -> None:
+    """Forget loaded flags so the next lookup re-reads feature_flags.yaml."""
+    global _LOADED, _FLAGS, _MTIME_NS, _RECHECK_AT
+    _FLAGS = {}
+    _LOADED = False
+    _MTIME_NS = None
+    _RECHECK_AT = 0.0
 
 
 def get_all() -> dict[str, bool]:
@@ -7,7 +7,10 @@ auto-reduce to eighth-Kelly.
 """
 
 import logging
-from typing import Optional
+import time
+from typing import Optional, Sequence
+
+import numpy as np
 
 from src import db
 from src.feature_flags import is_enabled
@@ -17,6 +20,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_KELLY_FRACTION = 0.25   # quarter-Kelly
 DRAWDOWN_KELLY_FRACTION = 0.125  # eighth-Kelly when in drawdown
 DRAWDOWN_THRESHOLD = 0.85   # balance < 85% of peak -> use DRAWDOWN_KELLY_FRACTION
+MAX_STAKE_FRACTION = 0.25   # cap single bet at 25% of bankroll
+MIN_DISPLAY_UNITS = 0.01    # minimum 1% shown when sizing is on
+
+
+# DB_PATH -> (expires_at, latest bankroll row as a dict or None). The bankroll
+# only moves when a tournament is settled, so a short TTL is enough to keep
+# repeated kelly_stake/units_for_bet calls off the database;
+# update_bankroll_after_tournament drops the entry for this process.
+_BANKROLL_CACHE: dict[str, tuple[float, Optional[dict]]] = {}
+_BANKROLL_TTL_SECONDS = 1.0
 
 
 def get_bankroll_state() -> Optional[dict]:
@@ -24,20 +37,37 @@ def get_bankroll_state() -> Optional[dict]:
     Return latest bankroll row or None if not initialized.
     {balance, peak_balance, kelly_fraction, date, notes}
     """
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT balance, peak_balance, kelly_fraction, date, notes FROM bankroll ORDER BY id DESC LIMIT 1"
-    ).fetchone()
-    conn.close()
-    if not row:
-        return None
-    return {
-        "balance": row["balance"],
-        "peak_balance": row["peak_balance"],
-        "kelly_fraction": row["kelly_fraction"],
-        "date": row["date"],
-        "notes": row["notes"],
-    }
+    cached = _BANKROLL_CACHE.get(db.DB_PATH)
+    if cached is None or cached[0] <= time.monotonic():
+        with db.read_connection() as conn:
+            row = conn.execute(
+                "SELECT balance, peak_balance, kelly_fraction, date, notes FROM bankroll ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        state = None
+        if row:
+            state = {
+                "balance": row["balance"],
+                "peak_balance": row["peak_balance"],
+                "kelly_fraction": row["kelly_fraction"],
+                "date": row["date"],
+                "notes": row["notes"],
+            }
+        cached = (time.monotonic() + _BANKROLL_TTL_SECONDS, state)
+        _BANKROLL_CACHE[db.DB_PATH] = cached
+    return dict(cached[1]) if cached[1] is not None else None
+
+
+def _kelly_fraction_for_state(state: Optional[dict]) -> float:
+    """Kelly multiplier for the bankroll state, dropping to eighth-Kelly in drawdown."""
+    if not state:
+        return DEFAULT_KELLY_FRACTION
+    kf = state["kelly_fraction"]
+    balance = state["balance"]
+    peak = state["peak_balance"]
+    if peak and peak > 0 and balance < peak * DRAWDOWN_THRESHOLD:
+        kf = DRAWDOWN_KELLY_FRACTION
+        logger.info("Drawdown: using eighth-Kelly (balance %.0f%% of peak)", 100 * balance / peak)
+    return kf
 
 
 def kelly_stake(
@@ -60,21 +90,10 @@ def kelly_stake(
         return 0.0
     # Kelly fraction of bankroll: f = (p*odds - 1) / (odds - 1) = edge / (odds - 1)
     frac = edge / (decimal_odds - 1.0)
-    if kelly_fraction is not None:
-        frac = frac * kelly_fraction
-    else:
-        state = get_bankroll_state()
-        if state:
-            kf = state["kelly_fraction"]
-            balance = state["balance"]
-            peak = state["peak_balance"]
-            if peak and peak > 0 and balance < peak * DRAWDOWN_THRESHOLD:
-                kf = DRAWDOWN_KELLY_FRACTION
-                logger.info("Drawdown: using eighth-Kelly (balance %.0f%% of peak)", 100 * balance / peak)
-            frac = frac * kf
-        else:
-            frac = frac * DEFAULT_KELLY_FRACTION
-    return max(0.0, min(frac, 0.25))  # cap single bet at 25% of bankroll
+    if kelly_fraction is None:
+        kelly_fraction = _kelly_fraction_for_state(get_bankroll_state())
+    frac = frac * kelly_fraction
+    return max(0.0, min(frac, MAX_STAKE_FRACTION))
 
 
 def units_for_bet(
@@ -92,8 +111,36 @@ def units_for_bet(
     bal = bankroll if bankroll is not None else (state["balance"] if state else None)
     if bal is None or bal <= 0:
         return 1.0
-    frac = kelly_stake(model_prob, decimal_odds, bankroll=bal)
-    return max(0.01, frac)  # minimum 1% for display
+    frac = kelly_stake(model_prob, decimal_odds, bankroll=bal, kelly_fraction=_kelly_fraction_for_state(state))
+    return max(MIN_DISPLAY_UNITS, frac)
+
+
+def units_for_bets(
+    model_probs: Sequence[float],
+    decimal_odds: Sequence[float],
+    bankroll: Optional[float] = None,
+) -> list[float]:
+    """
+    Batch units_for_bet: one bankroll read and array math for the whole slate.
+    model_probs and decimal_odds are parallel sequences.
+    """
+    n = len(model_probs)
+    if not (is_enabled("kelly_sizing") or is_enabled("kelly_stakes")):
+        return [1.0] * n
+    state = get_bankroll_state()
+    bal = bankroll if bankroll is not None else (state["balance"] if state else None)
+    if bal is None or bal <= 0:
+        return [1.0] * n
+    kf = _kelly_fraction_for_state(state)
+    probs = np.asarray(model_probs, dtype=np.float64)
+    odds = np.asarray(decimal_odds, dtype=np.float64)
+    edges = probs * odds - 1.0
+    valid = (probs > 0) & (odds > 1) & (edges > 0)
+    frac = np.where(valid, edges / np.where(valid, odds - 1.0, 1.0) * kf, 0.0)
+    # max(MIN_DISPLAY_UNITS, max(0, min(f, cap))) folds into one clip because
+    # the display floor sits above zero.
+    np.clip(frac, MIN_DISPLAY_UNITS, MAX_STAKE_FRACTION, out=frac)
+    return frac.tolist()
 
 
 def update_bankroll_after_tournament(
@@ -105,21 +152,21 @@ def update_bankroll_after_tournament(
     Append a new bankroll row after settling a tournament.
     balance = previous balance + profit_units; peak_balance = max(peak, balance).
     """
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT balance, peak_balance, kelly_fraction FROM bankroll ORDER BY id DESC LIMIT 1"
-    ).fetchone()
-    if row:
-        balance = row["balance"] + profit_units
-        peak = max(row["peak_balance"], balance)
-        kf = row["kelly_fraction"]
-    else:
-        balance = profit_units
-        peak = max(balance, 0)
-        kf = DEFAULT_KELLY_FRACTION
-    conn.execute(
-        "INSERT INTO bankroll (date, balance, peak_balance, kelly_fraction, notes) VALUES (?, ?, ?, ?, ?)",
-        (date, balance, peak, kf, notes),
-    )
-    conn.commit()
-    conn.close()
+    # Read-then-append under one write lock so concurrent settlements chain.
+    with db.transaction() as conn:
+        row = conn.execute(
+            "SELECT balance, peak_balance, kelly_fraction FROM bankroll ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if row:
+            balance = row["balance"] + profit_units
+            peak = max(row["peak_balance"], balance)
+            kf = row["kelly_fraction"]
+        else:
+            balance = profit_units
+            peak = max(balance, 0)
+            kf = DEFAULT_KELLY_FRACTION
+        conn.execute(
+            "INSERT INTO bankroll (date, balance, peak_balance, kelly_fraction, notes) VALUES (?, ?, ?, ?, ?)",
+            (date, balance, peak, kf, notes),
+        )
+    _BANKROLL_CACHE.pop(db.DB_PATH, None)
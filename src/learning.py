@@ -20,6 +20,8 @@ import sqlite3
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 from src import db
 from src.player_key_resolver import resolve_player_key
 from src.player_normalizer import display_name, normalize_name
@@ -33,6 +35,9 @@ from src.matchup_outcome_store import (
 
 logger = logging.getLogger("learning")
 
+# Finish-position markets graded for CLV rows: bet_type -> worst winning finish.
+_CLV_FINISH_THRESHOLDS = {"outright": 1, "top5": 5, "top10": 10, "top20": 20}
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  Auto-Results & Pick Scoring
@@ -392,161 +397,118 @@ def score_picks_for_tournament(
     """
     from src.pick_ledger import log_grading_audit
 
-    conn = db.get_conn()
-
-    picks = conn.execute(
-        "SELECT * FROM picks WHERE tournament_id = ?", (tournament_id,)
-    ).fetchall()
-
-    results, result_source = _load_results_for_tournament(conn, tournament_id)
-
-    if not picks:
-        conn.close()
-        return {"status": "no_picks", "message": "No picks logged for this tournament."}
-    if not results:
-        conn.close()
-        return {"status": "no_results", "message": "No results entered yet."}
-
-    result_map = {r["player_key"]: dict(r) for r in results}
-    resolution_context = _build_result_resolution_context(conn, tournament_id, result_map)
-    all_results_list = [dict(r) for r in results]
+    with db.connection() as conn:
+        picks = conn.execute(
+            "SELECT * FROM picks WHERE tournament_id = ?", (tournament_id,)
+        ).fetchall()
 
-    def _grade_model_hit(*, bet_hit: int, is_push: bool) -> int:
-        if is_push:
-            return 0
-        return 1 if bet_hit else 0
-
-    def _resolve_pick_outcome_key(pick: dict, existing_pick_key: str | None) -> str:
-        if existing_pick_key:
-            return existing_pick_key
-        from src.pick_ledger import compute_pick_key, normalize_american_odds
-
-        t_row = conn.execute(
-            "SELECT event_id FROM tournaments WHERE id = ?", (tournament_id,)
-        ).fetchone()
-        event_id = str(t_row["event_id"] or "") if t_row else ""
-        return compute_pick_key(
-            event_id=event_id,
-            lane="cockpit" if pick.get("source") in ("cockpit", "ui_display") else "lab",
-            section="upcoming",
-            phase="pre_tournament",
-            bet_type=str(pick.get("bet_type") or "matchup"),
-            player_key=str(pick.get("player_key") or ""),
-            opponent_key=str(pick.get("opponent_key") or ""),
-            book=str(pick.get("market_book") or ""),
-            odds=normalize_american_odds(pick.get("market_odds")),
-            snapshot_id=f"pick_{pick['id']}",
-        )
+        results, result_source = _load_results_for_tournament(conn, tournament_id)
+
+        if not picks:
+            return {"status": "no_picks", "message": "No picks logged for this tournament."}
+        if not results:
+            return {"status": "no_results", "message": "No results entered yet."}
+
+        result_map = {r["player_key"]: dict(r) for r in results}
+        resolution_context = _build_result_resolution_context(conn, tournament_id, result_map)
+        all_results_list = [dict(r) for r in results]
+
+        def _grade_model_hit(*, bet_hit: int, is_push: bool) -> int:
+            if is_push:
+                return 0
+            return 1 if bet_hit else 0
+
+        event_ids: list[str] = []
+
+        def _resolve_pick_outcome_key(pick: dict, existing_pick_key: str | None) -> str:
+            if existing_pick_key:
+                return existing_pick_key
+            from src.pick_ledger import compute_pick_key, normalize_american_odds
+
+            if not event_ids:
+                t_row = conn.execute(
+                    "SELECT event_id FROM tournaments WHERE id = ?", (tournament_id,)
+                ).fetchone()
+                event_ids.append(str(t_row["event_id"] or "") if t_row else "")
+            return compute_pick_key(
+                event_id=event_ids[0],
+                lane="cockpit" if pick.get("source") in ("cockpit", "ui_display") else "lab",
+                section="upcoming",
+                phase="pre_tournament",
+                bet_type=str(pick.get("bet_type") or "matchup"),
+                player_key=str(pick.get("player_key") or ""),
+                opponent_key=str(pick.get("opponent_key") or ""),
+                book=str(pick.get("market_book") or ""),
+                odds=normalize_american_odds(pick.get("market_odds")),
+                snapshot_id=f"pick_{pick['id']}",
+            )
 
-    scored = 0
-    voided = 0
-    model_hits = 0
-    bet_hits = 0
-    resolved = 0
-    skipped_non_positive_ev = 0
-    skipped_locked = 0
-    total_profit = 0.0
-    voided_picks: list[dict] = []
-    resolution_methods = {
-        "direct": 0,
-        "normalize_name": 0,
-        "dg_id": 0,
-        "fuzzy": 0,
-        "unresolved": 0,
-    }
-    opponent_resolution_methods = {
-        "direct": 0,
-        "normalize_name": 0,
-        "dg_id": 0,
-        "fuzzy": 0,
-        "unresolved": 0,
-    }
+        scored = 0
+        voided = 0
+        model_hits = 0
+        bet_hits = 0
+        resolved = 0
+        skipped_non_positive_ev = 0
+        skipped_locked = 0
+        total_profit = 0.0
+        voided_picks: list[dict] = []
+        resolution_methods = {
+            "direct": 0,
+            "normalize_name": 0,
+            "dg_id": 0,
+            "fuzzy": 0,
+            "unresolved": 0,
+        }
+        opponent_resolution_methods = {
+            "direct": 0,
+            "normalize_name": 0,
+            "dg_id": 0,
+            "fuzzy": 0,
+            "unresolved": 0,
+        }
 
-    for raw_pick in picks:
-        pick = dict(raw_pick)
-        ev = pick.get("ev")
-        if ev is None or ev <= 0:
-            skipped_non_positive_ev += 1
-            continue
-        pk = pick["player_key"]
-        bt = pick["bet_type"]
-        matchup_mode = _matchup_grading_mode(pick, bt)
-        is_3ball = _is_3ball_pick(pick, bt)
-        grading_authority = "computed"
-        outcome = None
-        actual_finish = None
-        notes = None
-        r = None
-
-        if matchup_mode == "round_matchups":
-            stored = lookup_matchup_outcome(
-                conn,
-                tournament_id,
-                str(pk or ""),
-                str(pick.get("opponent_key") or ""),
-                "round_matchups",
-                pick.get("market_book"),
-            )
-            if not stored:
-                reason = "no_stored_round_matchup_outcome"
-                if _persist_void_outcome(
-                    conn,
-                    pick=pick,
-                    tournament_id=tournament_id,
-                    reason=reason,
-                    force_audit=force_audit,
-                    audit_reason=audit_reason,
-                ):
-                    voided += 1
-                    voided_picks.append({
-                        "pick_id": pick["id"],
-                        "player_key": pk,
-                        "bet_type": bt,
-                        "market_type": "round_matchups",
-                        "reason": reason,
-                    })
+        # Every pick is visited once, so outcome rows read up front stay current
+        # for their pick; first row per pick_id, as fetchone() returned before.
+        existing_outcomes: dict[int, sqlite3.Row] = {}
+        for row in conn.execute(
+            """SELECT po.id, po.pick_id, po.model_hit, po.outcome_locked, po.hit, po.profit,
+                      po.grading_authority, po.pick_key
+               FROM picks p
+               JOIN pick_outcomes po ON po.pick_id = p.id
+               WHERE p.tournament_id = ?
+               ORDER BY po.id""",
+            (tournament_id,),
+        ):
+            existing_outcomes.setdefault(row["pick_id"], row)
+        new_outcomes: list[tuple] = []
+
+        for raw_pick in picks:
+            pick = dict(raw_pick)
+            ev = pick.get("ev")
+            if ev is None or ev <= 0:
+                skipped_non_positive_ev += 1
                 continue
-            outcome = outcome_from_stored_matchup(stored, str(pk or ""))
-            grading_authority = "matchup_outcome"
-            actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
-        else:
-            resolution = _resolve_pick_result_key(
-                pick=pick,
-                result_map=result_map,
-                resolution_context=resolution_context,
-            )
-            resolution_methods[resolution["method"]] += 1
-            resolved_player_key = resolution["key"]
-            r = result_map.get(resolved_player_key) if resolved_player_key else None
-            if not r and not is_3ball:
-                reason = f"player_not_in_results (method={resolution['method']})"
-                logger.warning(
-                    "Scoring void: no results for player_key=%s bet_type=%s method=%s player_display=%s",
-                    pk,
-                    bt,
-                    resolution["method"],
-                    pick.get("player_display"),
-                )
-                if _persist_void_outcome(
+            pk = pick["player_key"]
+            bt = pick["bet_type"]
+            matchup_mode = _matchup_grading_mode(pick, bt)
+            is_3ball = _is_3ball_pick(pick, bt)
+            grading_authority = "computed"
+            outcome = None
+            actual_finish = None
+            notes = None
+            r = None
+
+            if matchup_mode == "round_matchups":
+                stored = lookup_matchup_outcome(
                     conn,
-                    pick=pick,
-                    tournament_id=tournament_id,
-                    reason=reason,
-                    force_audit=force_audit,
-                    audit_reason=audit_reason,
-                ):
-                    voided += 1
-                    voided_picks.append({
-                        "pick_id": pick["id"],
-                        "player_key": pk,
-                        "bet_type": bt,
-                        "reason": reason,
-                    })
-                continue
-
-            if is_3ball:
-                if not r:
-                    reason = f"player_not_in_results (method={resolution['method']})"
+                    tournament_id,
+                    str(pk or ""),
+                    str(pick.get("opponent_key") or ""),
+                    "round_matchups",
+                    pick.get("market_book"),
+                )
+                if not stored:
+                    reason = "no_stored_round_matchup_outcome"
                     if _persist_void_outcome(
                         conn,
                         pick=pick,
@@ -560,87 +522,51 @@ def score_picks_for_tournament(
                             "pick_id": pick["id"],
                             "player_key": pk,
                             "bet_type": bt,
+                            "market_type": "round_matchups",
                             "reason": reason,
                         })
                     continue
-                finish = r.get("finish_position")
-                finish_text = r.get("finish_text")
-                made_cut = r.get("made_cut", 0)
-                stored = lookup_any_matchup_for_player(
-                    conn,
-                    tournament_id,
-                    str(pk or ""),
-                    "3_balls",
-                    pick.get("market_book"),
-                )
-                if stored:
-                    outcome = outcome_from_stored_matchup(stored, str(pk or ""))
-                    grading_authority = "matchup_outcome"
-                    actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
-                else:
-                    group_finishes = _threeball_opponent_finishes(
-                        conn,
-                        tournament_id,
-                        pick,
-                        str(pk or ""),
-                        result_map,
-                        resolution_context,
-                    )
-                    outcome = determine_outcome(
-                        "3ball",
-                        finish,
-                        finish_text,
-                        made_cut,
-                        all_results_list,
-                        group_opponent_finishes=group_finishes,
-                    )
-                    actual_finish = finish_text
-            elif matchup_mode == "tournament_matchups":
-                finish = r.get("finish_position")
-                finish_text = r.get("finish_text")
-                made_cut = r.get("made_cut", 0)
-                opponent_resolution = _resolve_pick_result_key(
-                    pick={
-                        "player_key": pick.get("opponent_key"),
-                        "player_display": pick.get("opponent_display"),
-                    },
+                outcome = outcome_from_stored_matchup(stored, str(pk or ""))
+                grading_authority = "matchup_outcome"
+                actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
+            else:
+                resolution = _resolve_pick_result_key(
+                    pick=pick,
                     result_map=result_map,
                     resolution_context=resolution_context,
                 )
-                opponent_resolution_methods[opponent_resolution["method"]] += 1
-                opp_result = result_map.get(opponent_resolution["key"]) if opponent_resolution["key"] else None
-                if opp_result:
-                    opp_finish = opp_result.get("finish_position")
-                    opp_finish_text = opp_result.get("finish_text")
-                    outcome = determine_outcome(
-                        "matchup",
-                        finish,
-                        finish_text,
-                        made_cut,
-                        all_results_list,
-                        opponent_finish=opp_finish,
-                    )
-                    actual_finish = f"{r.get('finish_text')} vs {opp_finish_text}"
-                    notes = (
-                        f"Matchup result: {pick.get('player_display')} {r.get('finish_text')} "
-                        f"vs {pick.get('opponent_display')} {opp_finish_text}"
+                resolution_methods[resolution["method"]] += 1
+                resolved_player_key = resolution["key"]
+                r = result_map.get(resolved_player_key) if resolved_player_key else None
+                if not r and not is_3ball:
+                    reason = f"player_not_in_results (method={resolution['method']})"
+                    logger.warning(
+                        "Scoring void: no results for player_key=%s bet_type=%s method=%s player_display=%s",
+                        pk,
+                        bt,
+                        resolution["method"],
+                        pick.get("player_display"),
                     )
-                else:
-                    stored = lookup_matchup_outcome(
+                    if _persist_void_outcome(
                         conn,
-                        tournament_id,
-                        str(pk or ""),
-                        str(pick.get("opponent_key") or ""),
-                        "tournament_matchups",
-                        pick.get("market_book"),
-                    )
-                    if not stored:
-                        reason = f"opponent_not_in_results (method={opponent_resolution['method']})"
-                        logger.warning(
-                            "Scoring void: no results for opponent_key=%s player_key=%s",
-                            pick.get("opponent_key"),
-                            pk,
-                        )
+                        pick=pick,
+                        tournament_id=tournament_id,
+                        reason=reason,
+                        force_audit=force_audit,
+                        audit_reason=audit_reason,
+                    ):
+                        voided += 1
+                        voided_picks.append({
+                            "pick_id": pick["id"],
+                            "player_key": pk,
+                            "bet_type": bt,
+                            "reason": reason,
+                        })
+                    continue
+
+                if is_3ball:
+                    if not r:
+                        reason = f"player_not_in_results (method={resolution['method']})"
                         if _persist_void_outcome(
                             conn,
                             pick=pick,
@@ -653,198 +579,289 @@ def score_picks_for_tournament(
                             voided_picks.append({
                                 "pick_id": pick["id"],
                                 "player_key": pk,
-                                "opponent_key": pick.get("opponent_key"),
                                 "bet_type": bt,
                                 "reason": reason,
                             })
                         continue
-                    outcome = outcome_from_stored_matchup(stored, str(pk or ""))
-                    grading_authority = "matchup_outcome"
-                    actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
-            else:
-                finish = r.get("finish_position")
-                finish_text = r.get("finish_text")
-                made_cut = r.get("made_cut", 0)
-                outcome = determine_outcome(
-                    bt, finish, finish_text, made_cut, all_results_list,
-                )
-                actual_finish = r.get("finish_text")
+                    finish = r.get("finish_position")
+                    finish_text = r.get("finish_text")
+                    made_cut = r.get("made_cut", 0)
+                    stored = lookup_any_matchup_for_player(
+                        conn,
+                        tournament_id,
+                        str(pk or ""),
+                        "3_balls",
+                        pick.get("market_book"),
+                    )
+                    if stored:
+                        outcome = outcome_from_stored_matchup(stored, str(pk or ""))
+                        grading_authority = "matchup_outcome"
+                        actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
+                    else:
+                        group_finishes = _threeball_opponent_finishes(
+                            conn,
+                            tournament_id,
+                            pick,
+                            str(pk or ""),
+                            result_map,
+                            resolution_context,
+                        )
+                        outcome = determine_outcome(
+                            "3ball",
+                            finish,
+                            finish_text,
+                            made_cut,
+                            all_results_list,
+                            group_opponent_finishes=group_finishes,
+                        )
+                        actual_finish = finish_text
+                elif matchup_mode == "tournament_matchups":
+                    finish = r.get("finish_position")
+                    finish_text = r.get("finish_text")
+                    made_cut = r.get("made_cut", 0)
+                    opponent_resolution = _resolve_pick_result_key(
+                        pick={
+                            "player_key": pick.get("opponent_key"),
+                            "player_display": pick.get("opponent_display"),
+                        },
+                        result_map=result_map,
+                        resolution_context=resolution_context,
+                    )
+                    opponent_resolution_methods[opponent_resolution["method"]] += 1
+                    opp_result = result_map.get(opponent_resolution["key"]) if opponent_resolution["key"] else None
+                    if opp_result:
+                        opp_finish = opp_result.get("finish_position")
+                        opp_finish_text = opp_result.get("finish_text")
+                        outcome = determine_outcome(
+                            "matchup",
+                            finish,
+                            finish_text,
+                            made_cut,
+                            all_results_list,
+                            opponent_finish=opp_finish,
+                        )
+                        actual_finish = f"{r.get('finish_text')} vs {opp_finish_text}"
+                        notes = (
+                            f"Matchup result: {pick.get('player_display')} {r.get('finish_text')} "
+                            f"vs {pick.get('opponent_display')} {opp_finish_text}"
+                        )
+                    else:
+                        stored = lookup_matchup_outcome(
+                            conn,
+                            tournament_id,
+                            str(pk or ""),
+                            str(pick.get("opponent_key") or ""),
+                            "tournament_matchups",
+                            pick.get("market_book"),
+                        )
+                        if not stored:
+                            reason = f"opponent_not_in_results (method={opponent_resolution['method']})"
+                            logger.warning(
+                                "Scoring void: no results for opponent_key=%s player_key=%s",
+                                pick.get("opponent_key"),
+                                pk,
+                            )
+                            if _persist_void_outcome(
+                                conn,
+                                pick=pick,
+                                tournament_id=tournament_id,
+                                reason=reason,
+                                force_audit=force_audit,
+                                audit_reason=audit_reason,
+                            ):
+                                voided += 1
+                                voided_picks.append({
+                                    "pick_id": pick["id"],
+                                    "player_key": pk,
+                                    "opponent_key": pick.get("opponent_key"),
+                                    "bet_type": bt,
+                                    "reason": reason,
+                                })
+                            continue
+                        outcome = outcome_from_stored_matchup(stored, str(pk or ""))
+                        grading_authority = "matchup_outcome"
+                        actual_finish, notes = _notes_from_stored_matchup(stored, pick, str(pk or ""))
+                else:
+                    finish = r.get("finish_position")
+                    finish_text = r.get("finish_text")
+                    made_cut = r.get("made_cut", 0)
+                    outcome = determine_outcome(
+                        bt, finish, finish_text, made_cut, all_results_list,
+                    )
+                    actual_finish = r.get("finish_text")
 
-        if outcome is None:
-            continue
+            if outcome is None:
+                continue
 
-        resolved += 1
-        hit = outcome["hit"]
-        fraction = outcome["fraction"]
-        is_push = outcome["is_push"]
-        model_hit = _grade_model_hit(bet_hit=hit, is_push=is_push)
-
-        odds_decimal = parse_odds_to_decimal(pick["market_odds"])
-        stake = 1.0
-        profit = compute_profit(hit, fraction, is_push, odds_decimal, stake)
-
-        total_profit += profit
-
-        existing = conn.execute(
-            """SELECT id, model_hit, outcome_locked, hit, profit, grading_authority, pick_key
-               FROM pick_outcomes WHERE pick_id = ?""",
-            (pick["id"],),
-        ).fetchone()
-
-        if existing and int(existing["outcome_locked"] or 0) == 1 and not force_audit:
-            skipped_locked += 1
-            if existing["model_hit"]:
-                model_hits += 1
-            if existing["hit"]:
-                bet_hits += 1
-            continue
+            resolved += 1
+            hit = outcome["hit"]
+            fraction = outcome["fraction"]
+            is_push = outcome["is_push"]
+            model_hit = _grade_model_hit(bet_hit=hit, is_push=is_push)
 
-        if actual_finish is None and r is not None:
-            actual_finish = r.get("finish_text")
+            odds_decimal = parse_odds_to_decimal(pick["market_odds"])
+            stake = 1.0
+            profit = compute_profit(hit, fraction, is_push, odds_decimal, stake)
 
-        pick_key = _resolve_pick_outcome_key(
-            pick,
-            existing["pick_key"] if existing else None,
-        )
+            total_profit += profit
 
-        if existing and force_audit:
-            # Skip the write/audit entirely when the newly computed outcome is
-            # identical to what's already stored and the row isn't locked --
-            # otherwise a full-tournament force_audit regrade (used to recover
-            # incorrectly voided picks) would spam grading_audit_log with
-            # thousands of no-op "regrade" entries for picks that were already
-            # graded correctly. Locked rows always go through the write path
-            # below (preserves the existing manual-correction/unlock behavior).
-            unchanged = (
-                int(existing["outcome_locked"] or 0) == 0
-                and int(existing["hit"] or 0) == int(hit)
-                and int(existing["model_hit"] or 0) == int(model_hit)
-                and str(existing["grading_authority"] or "") == grading_authority
-                and abs(float(existing["profit"] or 0.0) - float(profit)) < 1e-9
-            )
-            if not unchanged:
-                log_grading_audit(
-                    pick_id=pick["id"],
-                    pick_key=pick_key,
-                    tournament_id=tournament_id,
-                    action="regrade",
-                    reason=audit_reason or "force_audit",
-                    previous=dict(existing),
-                    new={
-                        "hit": hit,
-                        "model_hit": model_hit,
-                        "profit": profit,
-                        "grading_authority": grading_authority,
-                    },
-                    conn=conn,
-                )
-                conn.execute(
-                    f"""UPDATE pick_outcomes SET
-                           hit = ?, model_hit = ?, actual_finish = ?, odds_decimal = ?,
-                           stake = ?, profit = ?, notes = ?, grading_authority = ?,
-                           pick_key = ?, outcome_locked = 0
-                       WHERE id = ?""",
-                    (hit, model_hit, actual_finish, odds_decimal, stake, profit, notes, grading_authority, pick_key, existing["id"]),
-                )
-            scored += 1
-            if model_hit:
-                model_hits += 1
-            if hit:
-                bet_hits += 1
-            continue
+            existing = existing_outcomes.get(pick["id"])
 
-        if not existing:
-            conn.execute(
-                """INSERT INTO pick_outcomes
-                   (pick_id, pick_key, hit, model_hit, actual_finish, odds_decimal, stake, profit,
-                    notes, grading_authority, outcome_locked)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)""",
-                (pick["id"], pick_key, hit, model_hit, actual_finish,
-                 odds_decimal, stake, profit, notes, grading_authority),
-            )
-            scored += 1
-            if model_hit:
-                model_hits += 1
-            if hit:
-                bet_hits += 1
-        else:
-            # A previously-void, unlocked pick that now resolves (e.g. matchup
-            # settlement data arrived from a book we didn't query the first
-            # time) must be written back even without force_audit -- void was
-            # never meant to be final, it just means "couldn't determine a
-            # winner yet". Picks that were already computed stay untouched
-            # here (unchanged conservative behavior) unless force_audit is set.
-            was_void_unlocked = (
-                int(existing["outcome_locked"] or 0) == 0
-                and str(existing["grading_authority"] or "").lower() == "void"
+            if existing and int(existing["outcome_locked"] or 0) == 1 and not force_audit:
+                skipped_locked += 1
+                if existing["model_hit"]:
+                    model_hits += 1
+                if existing["hit"]:
+                    bet_hits += 1
+                continue
+
+            if actual_finish is None and r is not None:
+                actual_finish = r.get("finish_text")
+
+            pick_key = _resolve_pick_outcome_key(
+                pick,
+                existing["pick_key"] if existing else None,
             )
-            if was_void_unlocked:
-                log_grading_audit(
-                    pick_id=pick["id"],
-                    pick_key=pick_key,
-                    tournament_id=tournament_id,
-                    action="regrade",
-                    reason=audit_reason or "void_recovered",
-                    previous=dict(existing),
-                    new={
-                        "hit": hit,
-                        "model_hit": model_hit,
-                        "profit": profit,
-                        "grading_authority": grading_authority,
-                    },
-                    conn=conn,
+
+            if existing and force_audit:
+                # Skip the write/audit entirely when the newly computed outcome is
+                # identical to what's already stored and the row isn't locked --
+                # otherwise a full-tournament force_audit regrade (used to recover
+                # incorrectly voided picks) would spam grading_audit_log with
+                # thousands of no-op "regrade" entries for picks that were already
+                # graded correctly. Locked rows always go through the write path
+                # below (preserves the existing manual-correction/unlock behavior).
+                unchanged = (
+                    int(existing["outcome_locked"] or 0) == 0
+                    and int(existing["hit"] or 0) == int(hit)
+                    and int(existing["model_hit"] or 0) == int(model_hit)
+                    and str(existing["grading_authority"] or "") == grading_authority
+                    and abs(float(existing["profit"] or 0.0) - float(profit)) < 1e-9
                 )
-                conn.execute(
-                    """UPDATE pick_outcomes SET
-                           hit = ?, model_hit = ?, actual_finish = ?, odds_decimal = ?,
-                           stake = ?, profit = ?, notes = ?, grading_authority = ?,
-                           pick_key = ?
-                       WHERE id = ? AND COALESCE(outcome_locked, 0) = 0""",
-                    (hit, model_hit, actual_finish, odds_decimal, stake, profit, notes, grading_authority, pick_key, existing["id"]),
+                if not unchanged:
+                    log_grading_audit(
+                        pick_id=pick["id"],
+                        pick_key=pick_key,
+                        tournament_id=tournament_id,
+                        action="regrade",
+                        reason=audit_reason or "force_audit",
+                        previous=dict(existing),
+                        new={
+                            "hit": hit,
+                            "model_hit": model_hit,
+                            "profit": profit,
+                            "grading_authority": grading_authority,
+                        },
+                        conn=conn,
+                    )
+                    conn.execute(
+                        f"""UPDATE pick_outcomes SET
+                               hit = ?, model_hit = ?, actual_finish = ?, odds_decimal = ?,
+                               stake = ?, profit = ?, notes = ?, grading_authority = ?,
+                               pick_key = ?, outcome_locked = 0
+                           WHERE id = ?""",
+                        (hit, model_hit, actual_finish, odds_decimal, stake, profit, notes, grading_authority, pick_key, existing["id"]),
+                    )
+                scored += 1
+                if model_hit:
+                    model_hits += 1
+                if hit:
+                    bet_hits += 1
+                continue
+
+            if not existing:
+                new_outcomes.append(
+                    (pick["id"], pick_key, hit, model_hit, actual_finish,
+                     odds_decimal, stake, profit, notes, grading_authority)
                 )
                 scored += 1
-            elif existing["model_hit"] is None:
-                conn.execute(
-                    "UPDATE pick_outcomes SET model_hit = ? WHERE id = ? AND COALESCE(outcome_locked, 0) = 0",
-                    (model_hit, existing["id"]),
+                if model_hit:
+                    model_hits += 1
+                if hit:
+                    bet_hits += 1
+            else:
+                # A previously-void, unlocked pick that now resolves (e.g. matchup
+                # settlement data arrived from a book we didn't query the first
+                # time) must be written back even without force_audit -- void was
+                # never meant to be final, it just means "couldn't determine a
+                # winner yet". Picks that were already computed stay untouched
+                # here (unchanged conservative behavior) unless force_audit is set.
+                was_void_unlocked = (
+                    int(existing["outcome_locked"] or 0) == 0
+                    and str(existing["grading_authority"] or "").lower() == "void"
                 )
-            if model_hit:
-                model_hits += 1
-            if hit:
-                bet_hits += 1
-
-    if skipped_non_positive_ev:
-        logger.info(
-            "Scoring skipped %d pick(s) with ev missing or <= 0 for tournament %s",
-            skipped_non_positive_ev,
-            tournament_id,
-        )
-    if skipped_locked:
-        logger.info(
-            "Scoring skipped %d locked authoritative outcome(s) for tournament %s",
-            skipped_locked,
-            tournament_id,
-        )
+                if was_void_unlocked:
+                    log_grading_audit(
+                        pick_id=pick["id"],
+                        pick_key=pick_key,
+                        tournament_id=tournament_id,
+                        action="regrade",
+                        reason=audit_reason or "void_recovered",
+                        previous=dict(existing),
+                        new={
+                            "hit": hit,
+                            "model_hit": model_hit,
+                            "profit": profit,
+                            "grading_authority": grading_authority,
+                        },
+                        conn=conn,
+                    )
+                    conn.execute(
+                        """UPDATE pick_outcomes SET
+                               hit = ?, model_hit = ?, actual_finish = ?, odds_decimal = ?,
+                               stake = ?, profit = ?, notes = ?, grading_authority = ?,
+                               pick_key = ?
+                           WHERE id = ? AND COALESCE(outcome_locked, 0) = 0""",
+                        (hit, model_hit, actual_finish, odds_decimal, stake, profit, notes, grading_authority, pick_key, existing["id"]),
+                    )
+                    scored += 1
+                elif existing["model_hit"] is None:
+                    conn.execute(
+                        "UPDATE pick_outcomes SET model_hit = ? WHERE id = ? AND COALESCE(outcome_locked, 0) = 0",
+                        (model_hit, existing["id"]),
+                    )
+                if model_hit:
+                    model_hits += 1
+                if hit:
+                    bet_hits += 1
+
+        if skipped_non_positive_ev:
+            logger.info(
+                "Scoring skipped %d pick(s) with ev missing or <= 0 for tournament %s",
+                skipped_non_positive_ev,
+                tournament_id,
+            )
+        if skipped_locked:
+            logger.info(
+                "Scoring skipped %d locked authoritative outcome(s) for tournament %s",
+                skipped_locked,
+                tournament_id,
+            )
 
-    conn.commit()
-    conn.close()
+        conn.executemany(
+            """INSERT INTO pick_outcomes
+               (pick_id, pick_key, hit, model_hit, actual_finish, odds_decimal, stake, profit,
+                notes, grading_authority, outcome_locked)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)""",
+            new_outcomes,
+        )
+        conn.commit()
 
     from src.grading_record import build_record_summary, format_graded_pick_rows
 
-    conn = db.get_conn()
-    graded_rows = conn.execute(
-        """
-        SELECT p.id, p.model_variant, p.source, p.bet_type, p.market_type,
-               p.player_key, p.player_display, p.opponent_key, p.opponent_display,
-               p.market_odds, p.market_book, p.model_prob, p.ev,
-               po.hit AS hit, po.hit AS bet_hit, po.profit, po.stake, po.odds_decimal
-        FROM picks p
-        JOIN pick_outcomes po ON po.pick_id = p.id
-        WHERE p.tournament_id = ? AND COALESCE(p.ev, 0) > 0
-        """,
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+    with db.read_connection() as conn:
+        graded_rows = conn.execute(
+            """
+            SELECT p.id, p.model_variant, p.source, p.bet_type, p.market_type,
+                   p.player_key, p.player_display, p.opponent_key, p.opponent_display,
+                   p.market_odds, p.market_book, p.model_prob, p.ev,
+                   po.hit AS hit, po.hit AS bet_hit, po.profit, po.stake, po.odds_decimal
+            FROM picks p
+            JOIN pick_outcomes po ON po.pick_id = p.id
+            WHERE p.tournament_id = ? AND COALESCE(p.ev, 0) > 0
+            """,
+            (tournament_id,),
+        ).fetchall()
     deduped_summary = build_record_summary(format_graded_pick_rows([dict(row) for row in graded_rows]))
 
     return {
@@ -885,9 +902,8 @@ def log_predictions_for_tournament(tournament_id: int,
     odds_timing: 'pre_tournament', 'in_play', or 'unknown'
     """
     # Get results for outcome
-    conn = db.get_conn()
-    results, _ = _load_results_for_tournament(conn, tournament_id)
-    conn.close()
+    with db.read_connection() as conn:
+        results, _ = _load_results_for_tournament(conn, tournament_id)
 
     result_map = {r["player_key"]: dict(r) for r in results}
     all_results_list = [dict(r) for r in results]
@@ -1027,6 +1043,13 @@ def log_matchup_predictions_for_tournament(tournament_id: int,
 #  Calibration Analysis
 # ═══════════════════════════════════════════════════════════════════
 
+# Calibration curve buckets: [low, high) between consecutive edges.
+_CALIBRATION_EDGES = np.array([0.00, 0.02, 0.05, 0.10, 0.20, 0.35, 0.50, 1.00])
+_CALIBRATION_LABELS = ("0-2%", "2-5%", "5-10%", "10-20%", "20-35%", "35-50%", "50-100%")
+# prediction_log columns compute_calibration() reads.
+_CALIBRATION_COLUMNS = ("model_prob", "actual_outcome", "dg_prob", "market_implied_prob", "profit")
+
+
 def compute_calibration() -> dict:
     """
     Analyze how well-calibrated our predictions are.
@@ -1036,88 +1059,77 @@ def compute_calibration() -> dict:
 
     Also computes Brier score (lower = better).
     """
-    data = db.get_calibration_data()
-    if not data:
+    # Stream the log into the few columns used here rather than holding
+    # every row as a dict.
+    columns = {name: [] for name in _CALIBRATION_COLUMNS}
+    for row in db.iter_calibration_data():
+        for name, values in columns.items():
+            values.append(row[name])
+    total_predictions = len(columns["model_prob"])
+    if not total_predictions:
         return {"status": "no_data", "message": "No prediction data yet."}
 
-    # Buckets for calibration curve
-    buckets = [
-        (0.00, 0.02, "0-2%"),
-        (0.02, 0.05, "2-5%"),
-        (0.05, 0.10, "5-10%"),
-        (0.10, 0.20, "10-20%"),
-        (0.20, 0.35, "20-35%"),
-        (0.35, 0.50, "35-50%"),
-        (0.50, 1.00, "50-100%"),
-    ]
+    def _column(name: str) -> np.ndarray:
+        # None -> NaN, so presence masks replace per-row `is not None` checks.
+        return np.array(columns[name], dtype=np.float64)
+
+    mp = _column("model_prob")
+    ao = _column("actual_outcome")
+    has_mp = ~np.isnan(mp)
+    has_ao = ~np.isnan(ao)
+
+    # Calibration curve: digitize gives 1..7 for the [low, high) buckets,
+    # 0 below 0% and 8 at or above 100%; rows without a model_prob go to 0.
+    n_slots = len(_CALIBRATION_EDGES) + 1
+    slot = np.digitize(np.where(has_mp, mp, -1.0), _CALIBRATION_EDGES)
+    counts = np.bincount(slot, minlength=n_slots)
+    pred_sums = np.bincount(slot, weights=np.where(has_mp, mp, 0.0), minlength=n_slots)
+    resolved_counts = np.bincount(slot, weights=has_ao, minlength=n_slots)
+    # int() per outcome, as before.
+    actual_sums = np.bincount(slot, weights=np.where(has_ao, np.trunc(ao), 0.0), minlength=n_slots)
 
     calibration = []
-    brier_sum = 0.0
-    brier_count = 0
-
-    for low, high, label in buckets:
-        in_bucket = [
-            d for d in data
-            if d["model_prob"] is not None
-            and low <= d["model_prob"] < high
-        ]
-        if not in_bucket:
+    for i, label in enumerate(_CALIBRATION_LABELS, start=1):
+        if not counts[i] or not resolved_counts[i]:
             continue
-
-        predicted_avg = sum(d["model_prob"] for d in in_bucket) / len(in_bucket)
-        resolved = [d for d in in_bucket if d["actual_outcome"] is not None]
-        if not resolved:
-            continue
-        actual_rate = sum(int(d["actual_outcome"]) for d in resolved) / len(resolved)
-
+        predicted_avg = float(pred_sums[i] / counts[i])
+        actual_rate = float(actual_sums[i] / resolved_counts[i])
         calibration.append({
             "bucket": label,
-            "count": len(in_bucket),
+            "count": int(counts[i]),
             "predicted_avg": round(predicted_avg, 4),
             "actual_rate": round(actual_rate, 4),
             "gap": round(actual_rate - predicted_avg, 4),
         })
 
     # Brier score
-    for d in data:
-        if d["model_prob"] is not None and d["actual_outcome"] is not None:
-            brier_sum += (d["model_prob"] - d["actual_outcome"]) ** 2
-            brier_count += 1
-
-    brier = round(brier_sum / brier_count, 6) if brier_count else None
+    scored = has_mp & has_ao
+    brier = round(float(((mp[scored] - ao[scored]) ** 2).mean()), 6) if scored.any() else None
 
     # Compare model vs DG vs market
-    model_brier = 0.0
-    dg_brier = 0.0
-    market_brier = 0.0
-    comparison_count = 0
-
-    for d in data:
-        if (d["model_prob"] is not None and d["dg_prob"] is not None
-                and d["market_implied_prob"] is not None
-                and d["actual_outcome"] is not None):
-            model_brier += (d["model_prob"] - d["actual_outcome"]) ** 2
-            dg_brier += (d["dg_prob"] - d["actual_outcome"]) ** 2
-            market_brier += (d["market_implied_prob"] - d["actual_outcome"]) ** 2
-            comparison_count += 1
+    dg = _column("dg_prob")
+    mk = _column("market_implied_prob")
+    compared = scored & ~np.isnan(dg) & ~np.isnan(mk)
+    comparison_count = int(compared.sum())
 
     model_comparison = None
     if comparison_count >= 20:
+        outcomes = ao[compared]
         model_comparison = {
             "count": comparison_count,
-            "model_brier": round(model_brier / comparison_count, 6),
-            "dg_brier": round(dg_brier / comparison_count, 6),
-            "market_brier": round(market_brier / comparison_count, 6),
+            "model_brier": round(float(((mp[compared] - outcomes) ** 2).mean()), 6),
+            "dg_brier": round(float(((dg[compared] - outcomes) ** 2).mean()), 6),
+            "market_brier": round(float(((mk[compared] - outcomes) ** 2).mean()), 6),
         }
 
     # ROI tracking
-    value_bets = [d for d in data if d["profit"] is not None]
-    total_profit = sum(d["profit"] for d in value_bets)
-    total_staked = len(value_bets)  # 1 unit each
+    profits = [p for p in columns["profit"] if p is not None]
+    total_profit = sum(profits)
+    total_staked = len(profits)  # 1 unit each
     roi = round(total_profit / total_staked * 100, 2) if total_staked else 0
 
     return {
-        "total_predictions": len(data),
+        "total_predictions": total_predictions,
         "calibration": calibration,
         "brier_score": brier,
         "model_comparison": model_comparison,
@@ -1141,15 +1153,14 @@ def update_course_weights(tournament_id: int, course_num: int,
 
     Requires at least some scored picks for this tournament.
     """
-    conn = db.get_conn()
-    picks = conn.execute(
-        """SELECT p.*, po.hit
-           FROM picks p
-           JOIN pick_outcomes po ON po.pick_id = p.id
-           WHERE p.tournament_id = ?""",
-        (tournament_id,),
-    ).fetchall()
-    conn.close()
+    with db.read_connection() as conn:
+        picks = conn.execute(
+            """SELECT p.*, po.hit
+               FROM picks p
+               JOIN pick_outcomes po ON po.pick_id = p.id
+               WHERE p.tournament_id = ?""",
+            (tournament_id,),
+        ).fetchall()
 
     if len(picks) < 5:
         return None
@@ -1218,85 +1229,82 @@ def update_prediction_outcomes(tournament_id: int) -> int:
 
     Returns count of updated entries.
     """
-    conn = db.get_conn()
+    with db.connection() as conn:
+        results, _ = _load_results_for_tournament(conn, tournament_id)
+        if not results:
+            return 0
 
-    results, _ = _load_results_for_tournament(conn, tournament_id)
-    if not results:
-        conn.close()
-        return 0
+        result_map = {r["player_key"]: dict(r) for r in results}
+        all_results_list = [dict(r) for r in results]
 
-    result_map = {r["player_key"]: dict(r) for r in results}
-    all_results_list = [dict(r) for r in results]
+        predictions = conn.execute(
+            "SELECT id, player_key, bet_type, odds_decimal FROM prediction_log WHERE tournament_id = ?",
+            (tournament_id,),
+        ).fetchall()
 
-    predictions = conn.execute(
-        "SELECT id, player_key, bet_type, odds_decimal FROM prediction_log WHERE tournament_id = ?",
-        (tournament_id,),
-    ).fetchall()
+        updated = 0
+        for pred in predictions:
+            pk = pred["player_key"]
+            bt = pred["bet_type"]
 
-    updated = 0
-    for pred in predictions:
-        pk = pred["player_key"]
-        bt = pred["bet_type"]
-
-        resolved = False
-        actual = 0
-        fraction = 0.0
-        is_push = False
-
-        if bt == "matchup" and "|" in pk:
-            pick_key, opponent_key = pk.split("|", 1)
-            r_pick = result_map.get(pick_key)
-            r_opp = result_map.get(opponent_key)
-            if not r_pick or not r_opp:
-                continue
-            pick_pos = r_pick.get("finish_position") if r_pick else None
-            pick_text = r_pick.get("finish_text") if r_pick else None
-            pick_made_cut = r_pick.get("made_cut", 0) if r_pick else 0
-            opp_pos = r_opp.get("finish_position") if r_opp else None
-            outcome = determine_outcome(
-                "matchup",
-                pick_pos,
-                pick_text,
-                pick_made_cut,
-                all_results_list,
-                opponent_finish=opp_pos,
-            )
-            actual = outcome["hit"]
-            fraction = outcome["fraction"]
-            is_push = outcome["is_push"]
-            resolved = True
-        else:
-            r = result_map.get(pk)
-            if not r:
-                continue
-            outcome = determine_outcome(
-                bt,
-                r.get("finish_position"),
-                r.get("finish_text"),
-                r.get("made_cut", 0),
-                all_results_list,
-            )
-            actual = outcome["hit"]
-            fraction = outcome["fraction"]
-            is_push = outcome["is_push"]
-            resolved = True
+            resolved = False
+            actual = 0
+            fraction = 0.0
+            is_push = False
 
-        if not resolved:
-            continue
+            if bt == "matchup" and "|" in pk:
+                pick_key, opponent_key = pk.split("|", 1)
+                r_pick = result_map.get(pick_key)
+                r_opp = result_map.get(opponent_key)
+                if not r_pick or not r_opp:
+                    continue
+                pick_pos = r_pick.get("finish_position") if r_pick else None
+                pick_text = r_pick.get("finish_text") if r_pick else None
+                pick_made_cut = r_pick.get("made_cut", 0) if r_pick else 0
+                opp_pos = r_opp.get("finish_position") if r_opp else None
+                outcome = determine_outcome(
+                    "matchup",
+                    pick_pos,
+                    pick_text,
+                    pick_made_cut,
+                    all_results_list,
+                    opponent_finish=opp_pos,
+                )
+                actual = outcome["hit"]
+                fraction = outcome["fraction"]
+                is_push = outcome["is_push"]
+                resolved = True
+            else:
+                r = result_map.get(pk)
+                if not r:
+                    continue
+                outcome = determine_outcome(
+                    bt,
+                    r.get("finish_position"),
+                    r.get("finish_text"),
+                    r.get("made_cut", 0),
+                    all_results_list,
+                )
+                actual = outcome["hit"]
+                fraction = outcome["fraction"]
+                is_push = outcome["is_push"]
+                resolved = True
 
-        odds_dec = pred["odds_decimal"]
-        profit = None
-        if odds_dec:
-            profit = compute_profit(actual, fraction, is_push, odds_dec, 1.0)
+            if not resolved:
+                continue
 
-        conn.execute(
-            "UPDATE prediction_log SET actual_outcome = ?, profit = ? WHERE id = ?",
-            (actual, profit, pred["id"]),
-        )
-        updated += 1
+            odds_dec = pred["odds_decimal"]
+            profit = None
+            if odds_dec:
+                profit = compute_profit(actual, fraction, is_push, odds_dec, 1.0)
 
-    conn.commit()
-    conn.close()
+            conn.execute(
+                "UPDATE prediction_log SET actual_outcome = ?, profit = ? WHERE id = ?",
+                (actual, profit, pred["id"]),
+            )
+            updated += 1
+
+        conn.commit()
     return updated
 
 
@@ -1420,12 +1428,15 @@ def post_tournament_learn(tournament_id: int,
             from src.clv import record_clv
             from src.datagolf import fetch_closing_odds
             closing = fetch_closing_odds()
-            conn = db.get_conn()
-            picks = conn.execute(
-                "SELECT player_key, bet_type, market_odds, market_book FROM picks WHERE tournament_id = ?",
-                (tournament_id,),
-            ).fetchall()
-            conn.close()
+            with db.read_connection() as conn:
+                picks = conn.execute(
+                    "SELECT player_key, bet_type, market_odds, market_book FROM picks WHERE tournament_id = ?",
+                    (tournament_id,),
+                ).fetchall()
+                finishes = dict(conn.execute(
+                    "SELECT player_key, finish_position FROM results WHERE tournament_id = ?",
+                    (tournament_id,),
+                ).fetchall())
             clv_count = 0
             for pick in picks:
                 pk = pick["player_key"]
@@ -1446,22 +1457,11 @@ def post_tournament_learn(tournament_id: int,
                 closing_player = closing.get(pk, {})
                 closing_dec = closing_player.get(bt)
                 if closing_dec:
-                    result_conn = db.get_conn()
-                    res = result_conn.execute(
-                        "SELECT finish_position FROM results WHERE tournament_id = ? AND player_key = ?",
-                        (tournament_id, pk),
-                    ).fetchone()
-                    result_conn.close()
                     outcome = None
-                    if res and res["finish_position"]:
-                        if bt == "outright":
-                            outcome = 1 if res["finish_position"] == 1 else 0
-                        elif bt == "top5":
-                            outcome = 1 if res["finish_position"] <= 5 else 0
-                        elif bt == "top10":
-                            outcome = 1 if res["finish_position"] <= 10 else 0
-                        elif bt == "top20":
-                            outcome = 1 if res["finish_position"] <= 20 else 0
+                    finish = finishes.get(pk)
+                    threshold = _CLV_FINISH_THRESHOLDS.get(bt)
+                    if finish and threshold is not None:
+                        outcome = 1 if finish <= threshold else 0
                     record_clv(
                         tournament_id,
                         pk,
@@ -1481,15 +1481,14 @@ def post_tournament_learn(tournament_id: int,
     try:
         from src.feature_flags import is_enabled
         if is_enabled("platt_scaling"):
-            conn = db.get_conn()
-            matchup_outcomes = conn.execute(
-                """SELECT p.model_prob, p.actual_outcome
-                   FROM prediction_log p
-                   WHERE p.bet_type = 'matchup'
-                     AND p.actual_outcome IS NOT NULL
-                     AND p.model_prob IS NOT NULL"""
-            ).fetchall()
-            conn.close()
+            with db.read_connection() as conn:
+                matchup_outcomes = conn.execute(
+                    """SELECT p.model_prob, p.actual_outcome
+                       FROM prediction_log p
+                       WHERE p.bet_type = 'matchup'
+                         AND p.actual_outcome IS NOT NULL
+                         AND p.model_prob IS NOT NULL"""
+                ).fetchall()
             n = len(matchup_outcomes)
             if n >= 100:
                 try:
@@ -1502,14 +1501,13 @@ def post_tournament_learn(tournament_id: int,
                     new_a = float(lr.coef_[0][0])
                     new_b = float(lr.intercept_[0])
                     brier = float(np.mean((X.flatten() - y) ** 2))
-                    conn = db.get_conn()
-                    conn.execute(
-                        """INSERT INTO matchup_calibration (a_param, b_param, n_samples, brier_score)
-                           VALUES (?, ?, ?, ?)""",
-                        (new_a, new_b, n, brier),
-                    )
-                    conn.commit()
-                    conn.close()
+                    with db.connection() as conn:
+                        conn.execute(
+                            """INSERT INTO matchup_calibration (a_param, b_param, n_samples, brier_score)
+                               VALUES (?, ?, ?, ?)""",
+                            (new_a, new_b, n, brier),
+                        )
+                        conn.commit()
                     summary["steps"]["matchup_calibration"] = {
                         "a": round(new_a, 4), "b": round(new_b, 4),
                         "n": n, "brier": round(brier, 4),
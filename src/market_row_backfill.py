@@ -65,12 +65,11 @@ def backfill_completed_market_rows_into_picks(
 
 
 def _pick_count(tournament_id: int, source: str) -> int:
-    conn = db.get_conn()
-    row = conn.execute(
-        "SELECT COUNT(*) AS c FROM picks WHERE tournament_id = ? AND source = ?",
-        (tournament_id, source),
-    ).fetchone()
-    conn.close()
+    with db.connection() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*) AS c FROM picks WHERE tournament_id = ? AND source = ?",
+            (tournament_id, source),
+        ).fetchone()
     return int(row["c"] or 0) if row else 0
 
 
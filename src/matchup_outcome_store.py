@@ -95,12 +95,13 @@ def store_matchup_outcomes(
     conn: sqlite3.Connection | None = None,
 ) -> int:
     """Idempotently persist parsed DG matchup outcome rows."""
-    close = False
     if conn is None:
         from src import db
 
-        conn = db.get_conn()
-        close = True
+        with db.connection() as own_conn:
+            return store_matchup_outcomes(
+                tournament_id, event_id, year, rows, book=book, conn=own_conn,
+            )
     ensure_matchup_outcome_table(conn)
     stored = 0
     for raw in rows:
@@ -142,8 +143,6 @@ def store_matchup_outcomes(
         if cursor.rowcount:
             stored += 1
     conn.commit()
-    if close:
-        conn.close()
     return stored
 
 
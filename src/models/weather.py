@@ -214,20 +214,18 @@ def build_player_weather_profiles(min_rounds: int = 20) -> dict:
     Returns {player_key: {"wind_sg_diff": float, "rain_sg_diff": float,
                           "cold_sg_diff": float, "total_rounds": int}}
     """
-    conn = db.get_conn()
-
-    # Get all rounds joined with weather summary data
-    rows = conn.execute("""
-        SELECT r.player_key, r.sg_total, r.round_num,
-               r.event_id, r.year,
-               ws.avg_wind_kmh, ws.total_precip_mm, ws.avg_temp_c,
-               ws.conditions_rating
-        FROM rounds r
-        JOIN tournament_weather_summary ws
-            ON r.event_id = ws.event_id AND r.year = ws.year AND r.round_num = ws.round_num
-        WHERE r.sg_total IS NOT NULL
-    """).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        # Get all rounds joined with weather summary data
+        rows = conn.execute("""
+            SELECT r.player_key, r.sg_total, r.round_num,
+                   r.event_id, r.year,
+                   ws.avg_wind_kmh, ws.total_precip_mm, ws.avg_temp_c,
+                   ws.conditions_rating
+            FROM rounds r
+            JOIN tournament_weather_summary ws
+                ON r.event_id = ws.event_id AND r.year = ws.year AND r.round_num = ws.round_num
+            WHERE r.sg_total IS NOT NULL
+        """).fetchall()
 
     if not rows:
         return {}
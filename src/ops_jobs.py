@@ -62,6 +62,23 @@ def create_job(conn: sqlite3.Connection, job_type: str, payload: dict[str, Any]
     return job_id
 
 
+_TERMINAL_STATUSES = frozenset({"complete", "partial", "error", "failed"})
+
+# One fixed statement for every progress update (NULL leaves a column as is),
+# so sqlite3's statement cache reuses a single prepared program.
+_UPDATE_JOB_SQL = """
+    UPDATE ops_jobs SET
+        updated_at = ?,
+        status = COALESCE(?, status),
+        progress_pct = COALESCE(?, progress_pct),
+        message = COALESCE(?, message),
+        result_json = COALESCE(?, result_json),
+        error = COALESCE(?, error),
+        completed_at = COALESCE(?, completed_at)
+    WHERE id = ?
+"""
+
+
 def update_job(
     conn: sqlite3.Connection,
     job_id: str,
@@ -73,28 +90,20 @@ def update_job(
     error: str | None = None,
 ) -> None:
     ensure_ops_jobs_table(conn)
-    fields: list[str] = ["updated_at = ?"]
-    params: list[Any] = [_now_iso()]
-    if status is not None:
-        fields.append("status = ?")
-        params.append(status)
-    if progress_pct is not None:
-        fields.append("progress_pct = ?")
-        params.append(int(progress_pct))
-    if message is not None:
-        fields.append("message = ?")
-        params.append(message)
-    if result is not None:
-        fields.append("result_json = ?")
-        params.append(json.dumps(result))
-    if error is not None:
-        fields.append("error = ?")
-        params.append(error)
-    if status in {"complete", "partial", "error", "failed"}:
-        fields.append("completed_at = ?")
-        params.append(_now_iso())
-    params.append(job_id)
-    conn.execute(f"UPDATE ops_jobs SET {', '.join(fields)} WHERE id = ?", params)
+    now = _now_iso()
+    conn.execute(
+        _UPDATE_JOB_SQL,
+        (
+            now,
+            status,
+            int(progress_pct) if progress_pct is not None else None,
+            message,
+            json.dumps(result) if result is not None else None,
+            error,
+            now if status in _TERMINAL_STATUSES else None,
+            job_id,
+        ),
+    )
     conn.commit()
 
 
@@ -163,6 +172,8 @@ def run_storage_cleanup(
     stale_removed = remove_stale_db_recovery_copies(db.DB_PATH)
     report["steps"]["stale_db_copies"] = {"removed": stale_removed, "count": len(stale_removed)}
 
+    report["steps"]["ai_memory_purge"] = {"removed": db.purge_expired_ai_memories()}
+
     conn = db.get_conn()
     try:
         try:
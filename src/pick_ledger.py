@@ -423,8 +423,7 @@ def insert_authoritative_pick_outcome(
 ) -> int | None:
     """Insert pick + locked outcome from Tier A source. Returns pick_id."""
     db.store_picks([pick_row])
-    conn = db.get_conn()
-    try:
+    with db.connection() as conn:
         pick = conn.execute(
             """
             SELECT id FROM picks
@@ -445,7 +444,6 @@ def insert_authoritative_pick_outcome(
             ),
         ).fetchone()
         if not pick:
-            conn.close()
             return None
         pick_id = int(pick["id"])
         pick_key = ledger_row.get("pick_key")
@@ -456,7 +454,6 @@ def insert_authoritative_pick_outcome(
             (pick_id,),
         ).fetchone()
         if existing and int(existing["outcome_locked"] or 0) == 1:
-            conn.close()
             return pick_id
         if existing:
             conn.execute(
@@ -480,15 +477,11 @@ def insert_authoritative_pick_outcome(
                 (pick_id, pick_key, hit, model_hit, result, odds_decimal, profit, notes, grading_authority),
             )
         conn.commit()
-        conn.close()
-        graded_ledger = {**ledger_row, "lifecycle": "graded"}
-        if graded_ledger.get("event_name") is None:
-            graded_ledger["event_name"] = None
-        persist_pick_ledger_rows([graded_ledger])
-        return pick_id
-    except Exception:
-        conn.close()
-        raise
+    graded_ledger = {**ledger_row, "lifecycle": "graded"}
+    if graded_ledger.get("event_name") is None:
+        graded_ledger["event_name"] = None
+    persist_pick_ledger_rows([graded_ledger])
+    return pick_id
 
 
 def log_grading_audit(
@@ -41,6 +41,10 @@ TRADITIONAL_STATS = {
 }
 
 
+# Round fields read by compute_rolling_metrics (everything else is skipped).
+_ROUND_FIELDS = ("event_completed", *SG_CATEGORIES.values(), *TRADITIONAL_STATS.values())
+
+
 def _compute_average(rounds: list[dict], field: str) -> float | None:
     """Compute average of a field across rounds, skipping None values."""
     vals = [r[field] for r in rounds if r.get(field) is not None]
@@ -147,16 +151,15 @@ def compute_rolling_metrics(tournament_id: int,
     display_names = db.get_player_display_names(tournament_id)
 
     # Also build from rounds if needed
-    conn = db.get_conn()
-    for pk in field_player_keys:
-        if pk not in display_names:
-            row = conn.execute(
-                "SELECT player_name FROM rounds WHERE player_key = ? LIMIT 1",
-                (pk,),
-            ).fetchone()
-            if row:
-                display_names[pk] = display_name(row["player_name"])
-    conn.close()
+    missing_names = [pk for pk in field_player_keys if pk not in display_names]
+    for pk, raw_name in db.get_round_player_names(missing_names).items():
+        display_names[pk] = display_name(raw_name)
+
+    # Full history per player in one batched query; each window below is a
+    # prefix of it (rows are most recent first).
+    history_by_key = db.get_recent_rounds_for_players(
+        field_player_keys, limit=9999, columns=_ROUND_FIELDS
+    )
 
     all_metric_rows = []
     sg_computed = 0
@@ -170,7 +173,7 @@ def compute_rolling_metrics(tournament_id: int,
         player_sg_avgs = {}  # {player_key: {sg_name: avg_value}}
 
         for pk in field_player_keys:
-            rounds = db.get_player_recent_rounds_by_key(pk, limit=window)
+            rounds = history_by_key.get(pk, [])[:window]
             if not rounds:
                 continue
 
@@ -242,7 +245,7 @@ def compute_rolling_metrics(tournament_id: int,
     # ═══ 2. "All" window (no limit — full history in DB) ═══
     player_all_avgs = {}
     for pk in field_player_keys:
-        rounds = db.get_player_recent_rounds_by_key(pk, limit=9999)
+        rounds = history_by_key.get(pk)
         if not rounds:
             continue
         avgs = {}
@@ -276,7 +279,7 @@ def compute_rolling_metrics(tournament_id: int,
     for stat_name, db_field in TRADITIONAL_STATS.items():
         values = {}
         for pk in field_player_keys:
-            rounds = db.get_player_recent_rounds_by_key(pk, limit=24)
+            rounds = history_by_key.get(pk, [])[:24]
             avg = _compute_average(rounds, db_field) if rounds else None
             values[pk] = avg
 
@@ -313,12 +316,15 @@ def compute_rolling_metrics(tournament_id: int,
     # ═══ 4. Course-specific averages (recency-weighted) ═══
     if course_num:
         player_course_avgs = {}
+        dg_ids = db.get_dg_ids_for_players(field_player_keys)
+        course_rounds = db.get_course_rounds_for_players(
+            [dg_id for dg_id in dg_ids.values() if dg_id], course_num, columns=_ROUND_FIELDS
+        )
         for pk in field_player_keys:
-            # Look up dg_id for this player
-            dg_id = db.get_dg_id_for_player(pk)
+            dg_id = dg_ids.get(pk)
             if not dg_id:
                 continue
-            rounds = db.get_player_course_rounds(dg_id, course_num)
+            rounds = course_rounds.get(dg_id)
             if not rounds:
                 continue
 
@@ -375,16 +381,17 @@ def compute_rolling_metrics(tournament_id: int,
 
     # ═══ 5. Log import and store all metrics ═══
     if all_metric_rows:
-        import_id = db.log_csv_import(
-            tournament_id, "computed_rolling_stats", "computed",
-            "recent_form", "all", len(all_metric_rows), source="computed"
-        )
-        # Update csv_import_id for all rows
-        for row in all_metric_rows:
-            if row["csv_import_id"] is None:
-                row["csv_import_id"] = import_id
-
-        db.store_metrics(all_metric_rows)
+        with db.transaction():
+            import_id = db.log_csv_import(
+                tournament_id, "computed_rolling_stats", "computed",
+                "recent_form", "all", len(all_metric_rows), source="computed"
+            )
+            # Update csv_import_id for all rows
+            for row in all_metric_rows:
+                if row["csv_import_id"] is None:
+                    row["csv_import_id"] = import_id
+
+            db.store_metrics(all_metric_rows)
 
     summary = {
         "total_metrics": len(all_metric_rows),
@@ -411,11 +418,10 @@ def get_field_from_rounds(dg_ids: list[int] = None) -> list[str]:
     """
     if not dg_ids:
         return []
-    conn = db.get_conn()
-    placeholders = ",".join("?" for _ in dg_ids)
-    rows = conn.execute(
-        f"SELECT DISTINCT player_key FROM rounds WHERE dg_id IN ({placeholders})",
-        dg_ids,
-    ).fetchall()
-    conn.close()
+    with db.connection() as conn:
+        placeholders = ",".join("?" for _ in dg_ids)
+        rows = conn.execute(
+            f"SELECT DISTINCT player_key FROM rounds WHERE dg_id IN ({placeholders})",
+            dg_ids,
+        ).fetchall()
     return [r["player_key"] for r in rows if r["player_key"]]
@@ -10,7 +10,7 @@ from fastapi import APIRouter, Query
 from fastapi.responses import PlainTextResponse
 
 from src.data_views import ensure_analytics_views
-from src.db import ensure_initialized, get_conn
+from src.db import connection, ensure_initialized
 from src.grading_record import pick_lane_sql
 
 router = APIRouter(tags=["analytics"])
@@ -196,33 +196,32 @@ async def analytics_summary(
         date_to=date_to,
         include_reconstructed=include_reconstructed,
     )
-    conn = get_conn()
-    row = conn.execute(
-        f"""
-        SELECT
-            COUNT(*) AS pick_count,
-            SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END) AS wins,
-            SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) != 0 THEN 1 ELSE 0 END) AS losses,
-            SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) = 0 THEN 1 ELSE 0 END) AS pushes,
-            SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) AS graded_count,
-            ROUND(SUM(COALESCE(po.profit, 0)), 2) AS profit_units,
-            ROUND(
-                CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
-                THEN 100.0 * SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END)
-                     / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
-                ELSE 0 END, 1
-            ) AS win_rate_pct,
-            ROUND(
-                CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
-                THEN 100.0 * SUM(COALESCE(po.profit, 0)) / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
-                ELSE 0 END, 2
-            ) AS roi_pct
-        {PICKS_FROM}
-        WHERE {where}
-        """,
-        params,
-    ).fetchone()
-    conn.close()
+    with connection() as conn:
+        row = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS pick_count,
+                SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END) AS wins,
+                SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) != 0 THEN 1 ELSE 0 END) AS losses,
+                SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) = 0 THEN 1 ELSE 0 END) AS pushes,
+                SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) AS graded_count,
+                ROUND(SUM(COALESCE(po.profit, 0)), 2) AS profit_units,
+                ROUND(
+                    CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
+                    THEN 100.0 * SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END)
+                         / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
+                    ELSE 0 END, 1
+                ) AS win_rate_pct,
+                ROUND(
+                    CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
+                    THEN 100.0 * SUM(COALESCE(po.profit, 0)) / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
+                    ELSE 0 END, 2
+                ) AS roi_pct
+            {PICKS_FROM}
+            WHERE {where}
+            """,
+            params,
+        ).fetchone()
     data = dict(row) if row else {}
     return {
         "pick_count": int(data.get("pick_count") or 0),
@@ -280,37 +279,35 @@ async def list_analytics_picks(
         date_to=to_date,
         include_reconstructed=include_reconstructed,
     )
-    conn = get_conn()
-    rows = conn.execute(
-        f"""
-        {PICKS_SELECT}
-        {PICKS_FROM}
-        WHERE {where}
-        ORDER BY COALESCE(po.entered_at, p.created_at) DESC, p.id DESC
-        LIMIT ? OFFSET ?
-        """,
-        (*params, int(limit), int(offset)),
-    ).fetchall()
-    picks = [dict(r) for r in rows]
+    with connection() as conn:
+        rows = conn.execute(
+            f"""
+            {PICKS_SELECT}
+            {PICKS_FROM}
+            WHERE {where}
+            ORDER BY COALESCE(po.entered_at, p.created_at) DESC, p.id DESC
+            LIMIT ? OFFSET ?
+            """,
+            (*params, int(limit), int(offset)),
+        ).fetchall()
+        picks = [dict(r) for r in rows]
 
-    if format == "csv":
-        conn.close()
-        buf = io.StringIO()
-        if picks:
-            writer = csv.DictWriter(buf, fieldnames=list(picks[0].keys()))
-            writer.writeheader()
-            writer.writerows(picks)
-        return PlainTextResponse(buf.getvalue(), media_type="text/csv")
+        if format == "csv":
+            buf = io.StringIO()
+            if picks:
+                writer = csv.DictWriter(buf, fieldnames=list(picks[0].keys()))
+                writer.writeheader()
+                writer.writerows(picks)
+            return PlainTextResponse(buf.getvalue(), media_type="text/csv")
 
-    total = conn.execute(
-        f"""
-        SELECT COUNT(*) AS c
-        {PICKS_FROM}
-        WHERE {where}
-        """,
-        params,
-    ).fetchone()
-    conn.close()
+        total = conn.execute(
+            f"""
+            SELECT COUNT(*) AS c
+            {PICKS_FROM}
+            WHERE {where}
+            """,
+            params,
+        ).fetchone()
 
     return {
         "total": int(total["c"] if total else 0),
@@ -352,29 +349,28 @@ async def rollup_analytics_picks(
         ev_min=ev_min,
         include_reconstructed=include_reconstructed,
     )
-    conn = get_conn()
-    rows = conn.execute(
-        f"""
-        SELECT
-            {group_col} AS group_key,
-            MAX(t.name) AS group_label,
-            COUNT(*) AS count,
-            SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END) AS wins,
-            SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) != 0 THEN 1 ELSE 0 END) AS losses,
-            SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) = 0 THEN 1 ELSE 0 END) AS pushes,
-            SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) AS graded_count,
-            ROUND(SUM(COALESCE(po.profit, 0)), 2) AS profit,
-            ROUND(
-                CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
-                THEN 100.0 * SUM(COALESCE(po.profit, 0)) / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
-                ELSE 0 END, 2
-            ) AS roi_pct
-        {PICKS_FROM}
-        WHERE {where}
-        GROUP BY group_key
-        ORDER BY profit DESC
-        """,
-        params,
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT
+                {group_col} AS group_key,
+                MAX(t.name) AS group_label,
+                COUNT(*) AS count,
+                SUM(CASE WHEN po.hit = 1 THEN 1 ELSE 0 END) AS wins,
+                SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) != 0 THEN 1 ELSE 0 END) AS losses,
+                SUM(CASE WHEN po.id IS NOT NULL AND po.hit = 0 AND COALESCE(po.profit, 0) = 0 THEN 1 ELSE 0 END) AS pushes,
+                SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) AS graded_count,
+                ROUND(SUM(COALESCE(po.profit, 0)), 2) AS profit,
+                ROUND(
+                    CASE WHEN SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END) > 0
+                    THEN 100.0 * SUM(COALESCE(po.profit, 0)) / SUM(CASE WHEN po.id IS NOT NULL THEN 1 ELSE 0 END)
+                    ELSE 0 END, 2
+                ) AS roi_pct
+            {PICKS_FROM}
+            WHERE {where}
+            GROUP BY group_key
+            ORDER BY profit DESC
+            """,
+            params,
+        ).fetchall()
     return {"group_by": group_by, "rows": [dict(r) for r in rows]}
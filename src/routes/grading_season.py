@@ -9,7 +9,7 @@ from typing import Any
 from fastapi import APIRouter, Query
 
 from src import db
-from src.db import ensure_initialized, get_conn
+from src.db import connection, ensure_initialized
 from src.grading_record import (
     build_lane_comparison,
     build_record_summary,
@@ -477,132 +477,131 @@ async def get_grading_season(
     tour: str = Query("pga", pattern="^(pga|liv|all)$"),
 ):
     ensure_initialized()
-    conn = get_conn()
-    discovered = _discover_season_events(conn, year, tour=None if tour == "all" else tour)
-
-    events_out: list[dict[str, Any]] = []
-    all_dashboard_picks: list[dict] = []
-    all_lab_picks: list[dict] = []
-
-    def _chronological_key(item: dict[str, Any]) -> tuple:
-        raw_date = item.get("event_date") or ""
-        return (str(raw_date), str(item.get("name") or ""))
-
-    sorted_events = sorted(discovered.values(), key=_chronological_key)
-
-    for meta in sorted_events[:limit]:
-        tournament_id = meta.get("tournament_id")
-        if tournament_id is None and meta.get("event_id"):
-            row = conn.execute(
-                "SELECT id FROM tournaments WHERE event_id = ? AND year = ? LIMIT 1",
-                (meta["event_id"], year),
-            ).fetchone()
-            tournament_id = row["id"] if row else None
-
-        last_graded_at = None
-        if tournament_id:
-            lg = conn.execute(
-                """
-                SELECT MAX(po.entered_at) AS last_graded_at
-                FROM pick_outcomes po
-                JOIN picks p ON p.id = po.pick_id
-                WHERE p.tournament_id = ?
-                """,
-                (tournament_id,),
-            ).fetchone()
-            last_graded_at = lg["last_graded_at"] if lg else None
-
-        has_results = False
-        if tournament_id:
-            rc = conn.execute(
-                "SELECT COUNT(*) AS c FROM results WHERE tournament_id = ?",
-                (tournament_id,),
-            ).fetchone()
-            has_results = bool(rc and int(rc["c"] or 0) > 0)
-
-        rollup = meta.get("rollup_record")
-        dashboard_lane = _build_lane_payload(
-            conn,
-            event_id=str(meta["event_id"]),
-            tournament_id=tournament_id,
-            lane="cockpit",
-            rollup_record=rollup,
-            has_results=has_results,
-        )
-        lab_lane = _build_lane_payload(
-            conn,
-            event_id=str(meta["event_id"]),
-            tournament_id=tournament_id,
-            lane="lab",
-            rollup_record=None,
-            has_results=has_results,
-        )
-        reconciliation = _event_reconciliation(
-            conn,
-            event_id=str(meta["event_id"]),
-            tournament_id=tournament_id,
-            dashboard_lane=dashboard_lane,
-            include_past_replay=include_reconciliation,
-        )
-        comparison = build_lane_comparison(dashboard_lane["picks"], lab_lane["picks"])
-        all_dashboard_picks.extend(dashboard_lane["picks"])
-        all_lab_picks.extend(lab_lane["picks"])
-
-        if not include_picks:
-            dashboard_lane = {**dashboard_lane, "picks": []}
-            lab_lane = {**lab_lane, "picks": []}
-
-        event_payload = {
-            "event_id": meta["event_id"],
-            "name": meta["name"],
-            "course": meta.get("course"),
-            "year": meta.get("year", year),
-            "event_date": meta.get("event_date"),
-            "tournament_id": tournament_id,
-            "authority_tier": meta.get("authority_tier"),
-            "picks_detail_missing": bool(meta.get("picks_detail_missing")),
-            "inventory_count": int(meta.get("inventory_count") or 0),
-            "has_results": has_results,
-            "last_graded_at": last_graded_at,
-            "grading_report": _event_grading_report(dashboard_lane, lab_lane),
-            "lanes": {
-                "dashboard": dashboard_lane,
-                "lab": lab_lane,
-            },
-            "comparison": comparison,
-            "reconciliation": reconciliation,
-        }
-
-        if not has_results and dashboard_lane["graded_pick_count"] == 0 and lab_lane["graded_pick_count"] == 0:
-            if dashboard_lane["status"] == "no_data":
-                event_payload["status"] = "no_data"
-            else:
-                event_payload["status"] = "in_progress"
-        elif lane in {"cockpit", "dashboard"}:
-            event_payload["graded_pick_count"] = dashboard_lane["graded_pick_count"]
-            event_payload["hits"] = dashboard_lane["hits"]
-            event_payload["total_profit"] = dashboard_lane["total_profit"]
-            event_payload["picks"] = dashboard_lane["picks"]
-            event_payload["status"] = dashboard_lane["status"]
-        elif lane == "lab":
-            event_payload["graded_pick_count"] = lab_lane["graded_pick_count"]
-            event_payload["hits"] = lab_lane["hits"]
-            event_payload["total_profit"] = lab_lane["total_profit"]
-            event_payload["picks"] = lab_lane["picks"]
-            event_payload["status"] = lab_lane["status"]
-        else:
-            event_payload["graded_pick_count"] = dashboard_lane["graded_pick_count"] + lab_lane["graded_pick_count"]
-            event_payload["hits"] = dashboard_lane["hits"] + lab_lane["hits"]
-            event_payload["total_profit"] = round(
-                float(dashboard_lane["total_profit"] or 0) + float(lab_lane["total_profit"] or 0),
-                2,
+    with connection() as conn:
+        discovered = _discover_season_events(conn, year, tour=None if tour == "all" else tour)
+
+        events_out: list[dict[str, Any]] = []
+        all_dashboard_picks: list[dict] = []
+        all_lab_picks: list[dict] = []
+
+        def _chronological_key(item: dict[str, Any]) -> tuple:
+            raw_date = item.get("event_date") or ""
+            return (str(raw_date), str(item.get("name") or ""))
+
+        sorted_events = sorted(discovered.values(), key=_chronological_key)
+
+        for meta in sorted_events[:limit]:
+            tournament_id = meta.get("tournament_id")
+            if tournament_id is None and meta.get("event_id"):
+                row = conn.execute(
+                    "SELECT id FROM tournaments WHERE event_id = ? AND year = ? LIMIT 1",
+                    (meta["event_id"], year),
+                ).fetchone()
+                tournament_id = row["id"] if row else None
+
+            last_graded_at = None
+            if tournament_id:
+                lg = conn.execute(
+                    """
+                    SELECT MAX(po.entered_at) AS last_graded_at
+                    FROM pick_outcomes po
+                    JOIN picks p ON p.id = po.pick_id
+                    WHERE p.tournament_id = ?
+                    """,
+                    (tournament_id,),
+                ).fetchone()
+                last_graded_at = lg["last_graded_at"] if lg else None
+
+            has_results = False
+            if tournament_id:
+                rc = conn.execute(
+                    "SELECT COUNT(*) AS c FROM results WHERE tournament_id = ?",
+                    (tournament_id,),
+                ).fetchone()
+                has_results = bool(rc and int(rc["c"] or 0) > 0)
+
+            rollup = meta.get("rollup_record")
+            dashboard_lane = _build_lane_payload(
+                conn,
+                event_id=str(meta["event_id"]),
+                tournament_id=tournament_id,
+                lane="cockpit",
+                rollup_record=rollup,
+                has_results=has_results,
+            )
+            lab_lane = _build_lane_payload(
+                conn,
+                event_id=str(meta["event_id"]),
+                tournament_id=tournament_id,
+                lane="lab",
+                rollup_record=None,
+                has_results=has_results,
             )
-            event_payload["picks"] = dashboard_lane["picks"] + lab_lane["picks"]
-            event_payload["status"] = dashboard_lane["status"] if dashboard_lane["status"] != "graded" else lab_lane["status"]
+            reconciliation = _event_reconciliation(
+                conn,
+                event_id=str(meta["event_id"]),
+                tournament_id=tournament_id,
+                dashboard_lane=dashboard_lane,
+                include_past_replay=include_reconciliation,
+            )
+            comparison = build_lane_comparison(dashboard_lane["picks"], lab_lane["picks"])
+            all_dashboard_picks.extend(dashboard_lane["picks"])
+            all_lab_picks.extend(lab_lane["picks"])
+
+            if not include_picks:
+                dashboard_lane = {**dashboard_lane, "picks": []}
+                lab_lane = {**lab_lane, "picks": []}
+
+            event_payload = {
+                "event_id": meta["event_id"],
+                "name": meta["name"],
+                "course": meta.get("course"),
+                "year": meta.get("year", year),
+                "event_date": meta.get("event_date"),
+                "tournament_id": tournament_id,
+                "authority_tier": meta.get("authority_tier"),
+                "picks_detail_missing": bool(meta.get("picks_detail_missing")),
+                "inventory_count": int(meta.get("inventory_count") or 0),
+                "has_results": has_results,
+                "last_graded_at": last_graded_at,
+                "grading_report": _event_grading_report(dashboard_lane, lab_lane),
+                "lanes": {
+                    "dashboard": dashboard_lane,
+                    "lab": lab_lane,
+                },
+                "comparison": comparison,
+                "reconciliation": reconciliation,
+            }
+
+            if not has_results and dashboard_lane["graded_pick_count"] == 0 and lab_lane["graded_pick_count"] == 0:
+                if dashboard_lane["status"] == "no_data":
+                    event_payload["status"] = "no_data"
+                else:
+                    event_payload["status"] = "in_progress"
+            elif lane in {"cockpit", "dashboard"}:
+                event_payload["graded_pick_count"] = dashboard_lane["graded_pick_count"]
+                event_payload["hits"] = dashboard_lane["hits"]
+                event_payload["total_profit"] = dashboard_lane["total_profit"]
+                event_payload["picks"] = dashboard_lane["picks"]
+                event_payload["status"] = dashboard_lane["status"]
+            elif lane == "lab":
+                event_payload["graded_pick_count"] = lab_lane["graded_pick_count"]
+                event_payload["hits"] = lab_lane["hits"]
+                event_payload["total_profit"] = lab_lane["total_profit"]
+                event_payload["picks"] = lab_lane["picks"]
+                event_payload["status"] = lab_lane["status"]
+            else:
+                event_payload["graded_pick_count"] = dashboard_lane["graded_pick_count"] + lab_lane["graded_pick_count"]
+                event_payload["hits"] = dashboard_lane["hits"] + lab_lane["hits"]
+                event_payload["total_profit"] = round(
+                    float(dashboard_lane["total_profit"] or 0) + float(lab_lane["total_profit"] or 0),
+                    2,
+                )
+                event_payload["picks"] = dashboard_lane["picks"] + lab_lane["picks"]
+                event_payload["status"] = dashboard_lane["status"] if dashboard_lane["status"] != "graded" else lab_lane["status"]
 
-        events_out.append(event_payload)
+            events_out.append(event_payload)
 
-    conn.close()
 
     normalized_lane = "dashboard" if lane in {"cockpit", "dashboard"} else lane
     summary = {
@@ -631,36 +630,35 @@ async def get_grading_event_picks(
 ):
     """Graded picks and record for a single completed event (Past replay)."""
     ensure_initialized()
-    conn = get_conn()
-    discovered = _discover_season_events(conn, year)
-    meta = discovered.get(str(event_id))
-    tournament_id = meta.get("tournament_id") if meta else None
-    if tournament_id is None:
-        row = conn.execute(
-            "SELECT id FROM tournaments WHERE event_id = ? AND year = ? LIMIT 1",
-            (event_id, year),
-        ).fetchone()
-        tournament_id = row["id"] if row else None
+    with connection() as conn:
+        discovered = _discover_season_events(conn, year)
+        meta = discovered.get(str(event_id))
+        tournament_id = meta.get("tournament_id") if meta else None
+        if tournament_id is None:
+            row = conn.execute(
+                "SELECT id FROM tournaments WHERE event_id = ? AND year = ? LIMIT 1",
+                (event_id, year),
+            ).fetchone()
+            tournament_id = row["id"] if row else None
 
-    has_results = False
-    if tournament_id:
-        rc = conn.execute(
-            "SELECT COUNT(*) AS c FROM results WHERE tournament_id = ?",
-            (tournament_id,),
-        ).fetchone()
-        has_results = bool(rc and int(rc["c"] or 0) > 0)
+        has_results = False
+        if tournament_id:
+            rc = conn.execute(
+                "SELECT COUNT(*) AS c FROM results WHERE tournament_id = ?",
+                (tournament_id,),
+            ).fetchone()
+            has_results = bool(rc and int(rc["c"] or 0) > 0)
 
-    rollup = meta.get("rollup_record") if meta else None
-    lane_key = "cockpit" if lane == "dashboard" else lane
-    payload = _build_lane_payload(
-        conn,
-        event_id=str(event_id),
-        tournament_id=tournament_id,
-        lane=lane_key,
-        rollup_record=rollup,
-        has_results=has_results,
-    )
-    conn.close()
+        rollup = meta.get("rollup_record") if meta else None
+        lane_key = "cockpit" if lane == "dashboard" else lane
+        payload = _build_lane_payload(
+            conn,
+            event_id=str(event_id),
+            tournament_id=tournament_id,
+            lane=lane_key,
+            rollup_record=rollup,
+            has_results=has_results,
+        )
     return {
         "ok": True,
         "event_id": str(event_id),
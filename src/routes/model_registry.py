@@ -6,7 +6,7 @@ from datetime import datetime
 from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
-from src.db import get_conn
+from src.db import connection
 
 router = APIRouter(tags=["model-registry"])
 
@@ -40,20 +40,19 @@ async def select_best_baseline(request: Request):
     limit = int(payload.get("limit", 200))
     set_champion = bool(payload.get("set_research_champion", False))
 
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT id, name, source, strategy_config_json, summary_metrics_json, guardrail_results_json
-        FROM research_proposals
-        WHERE scope = ?
-          AND status IN ('evaluated', 'approved', 'converted')
-          AND summary_metrics_json IS NOT NULL
-        ORDER BY id DESC
-        LIMIT ?
-        """,
-        (scope, limit),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, name, source, strategy_config_json, summary_metrics_json, guardrail_results_json
+            FROM research_proposals
+            WHERE scope = ?
+              AND status IN ('evaluated', 'approved', 'converted')
+              AND summary_metrics_json IS NOT NULL
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (scope, limit),
+        ).fetchall()
 
     candidates = []
     for row in rows:
@@ -19,6 +19,7 @@ Matchup rules:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger("scoring")
@@ -343,8 +344,14 @@ def parse_odds_to_decimal(odds_text) -> Optional[float]:
     """
     if odds_text is None:
         return None
+    return _decimal_from_odds_text(str(odds_text))
+
+
+@lru_cache(maxsize=4096)
+def _decimal_from_odds_text(text: str) -> Optional[float]:
+    # The same handful of prices repeat across every pick on a card.
     try:
-        odds_int = int(str(odds_text).replace("+", ""))
+        odds_int = int(text.replace("+", ""))
         return american_to_decimal(odds_int)
     except (ValueError, TypeError):
         return None
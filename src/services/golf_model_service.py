@@ -712,14 +712,11 @@ class GolfModelService:
 
         for player_key in field_keys:
             pretty_name = " ".join(part.capitalize() for part in player_key.split("_") if part)
-            recent_rounds = db.get_player_recent_rounds_by_key(player_key, limit=24)
-            if len(recent_rounds) < 8:
+            recent_rounds = db.get_player_sg_aggregates(player_key, limit=24)["rounds"]
+            if recent_rounds < 8:
                 thin_rounds.append(pretty_name)
 
-            player_metrics = db.get_player_metrics(tournament_id, player_key)
-            has_dg_skill = any(m.get("metric_category") == "dg_skill" for m in player_metrics)
-            has_dg_ranking = any(m.get("metric_category") == "dg_ranking" for m in player_metrics)
-            if not has_dg_skill and not has_dg_ranking:
+            if not db.get_player_metrics_by_categories(tournament_id, player_key, ["dg_skill", "dg_ranking"]):
                 missing_skill.append(pretty_name)
 
         strict_field_verified = "strict_field_missing" not in failed_invariants
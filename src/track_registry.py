@@ -212,15 +212,14 @@ def evaluate_promotion_readiness(scope: str = "global") -> dict[str, Any]:
     # the global charter gates which are dominated by the live/cockpit lane.
     lab_graded = 0
     try:
-        conn = db.get_conn()
-        lab_graded = conn.execute(
-            """
-            SELECT COUNT(*) FROM picks p
-            JOIN pick_outcomes po ON po.pick_id = p.id
-            WHERE p.source IN ('lab_sandbox', 'lab_sandbox_candidate') AND p.ev > 0
-            """
-        ).fetchone()[0]
-        conn.close()
+        with db.connection() as conn:
+            lab_graded = conn.execute(
+                """
+                SELECT COUNT(*) FROM picks p
+                JOIN pick_outcomes po ON po.pick_id = p.id
+                WHERE p.source IN ('lab_sandbox', 'lab_sandbox_candidate') AND p.ev > 0
+                """
+            ).fetchone()[0]
     except Exception:
         lab_graded = 0
 
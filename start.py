@@ -325,61 +325,60 @@ def cmd_research_convert(args):
 
 def cmd_status(args):
     """Show system status."""
-    from src.db import ensure_initialized, get_conn
+    from src.db import connection, ensure_initialized
     ensure_initialized()
 
-    conn = get_conn()
+    with connection() as conn:
+        print("\n  GOLF MODEL — SYSTEM STATUS")
+        print("  " + "=" * 40)
 
-    print("\n  GOLF MODEL — SYSTEM STATUS")
-    print("  " + "=" * 40)
+        # Database stats
+        tables = [
+            "tournaments", "rounds", "metrics", "results", "picks",
+            "prediction_log", "runs", "historical_odds", "historical_predictions",
+            "tournament_weather", "experiments", "intel_events",
+            "pit_rolling_stats", "outlier_investigations",
+        ]
+        print("\n  Database Tables:")
+        for table in tables:
+            try:
+                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                print(f"    {table}: {count:,} rows")
+            except Exception:
+                print(f"    {table}: (not created)")
+
+        # API keys
+        print("\n  API Keys:")
+        for key in ["DATAGOLF_API_KEY", "OPENAI_API_KEY", "ODDS_API_KEY"]:
+            val = os.environ.get(key, "")
+            status = f"set ({val[:8]}...)" if val else "NOT SET"
+            print(f"    {key}: {status}")
+
+        # Active strategy
+        try:
+            row = conn.execute("SELECT roi_pct, adopted_at FROM active_strategy WHERE scope='global'").fetchone()
+            if row:
+                print(f"\n  Active Strategy: ROI {row[0]:.1f}% (adopted {row[1]})")
+            else:
+                print("\n  Active Strategy: default (no experiments promoted yet)")
+        except Exception:
+            print("\n  Active Strategy: default")
 
-    # Database stats
-    tables = [
-        "tournaments", "rounds", "metrics", "results", "picks",
-        "prediction_log", "runs", "historical_odds", "historical_predictions",
-        "tournament_weather", "experiments", "intel_events",
-        "pit_rolling_stats", "outlier_investigations",
-    ]
-    print("\n  Database Tables:")
-    for table in tables:
+        # Recent runs
         try:
-            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-            print(f"    {table}: {count:,} rows")
+            runs = conn.execute("""
+                SELECT t.name, r.status, r.created_at
+                FROM runs r JOIN tournaments t ON r.tournament_id = t.id
+                ORDER BY r.created_at DESC LIMIT 3
+            """).fetchall()
+            if runs:
+                print("\n  Recent Runs:")
+                for r in runs:
+                    print(f"    {r[2]} | {r[0]} | {r[1]}")
         except Exception:
-            print(f"    {table}: (not created)")
-
-    # API keys
-    print("\n  API Keys:")
-    for key in ["DATAGOLF_API_KEY", "OPENAI_API_KEY", "ODDS_API_KEY"]:
-        val = os.environ.get(key, "")
-        status = f"set ({val[:8]}...)" if val else "NOT SET"
-        print(f"    {key}: {status}")
-
-    # Active strategy
-    try:
-        row = conn.execute("SELECT roi_pct, adopted_at FROM active_strategy WHERE scope='global'").fetchone()
-        if row:
-            print(f"\n  Active Strategy: ROI {row[0]:.1f}% (adopted {row[1]})")
-        else:
-            print("\n  Active Strategy: default (no experiments promoted yet)")
-    except Exception:
-        print("\n  Active Strategy: default")
-
-    # Recent runs
-    try:
-        runs = conn.execute("""
-            SELECT t.name, r.status, r.created_at
-            FROM runs r JOIN tournaments t ON r.tournament_id = t.id
-            ORDER BY r.created_at DESC LIMIT 3
-        """).fetchall()
-        if runs:
-            print("\n  Recent Runs:")
-            for r in runs:
-                print(f"    {r[2]} | {r[0]} | {r[1]}")
-    except Exception:
-        pass
+            pass
 
-    print()
+        print()
 
 
 def _write_markdown(path: str, content: str) -> None:
@@ -390,7 +389,7 @@ def _write_markdown(path: str, content: str) -> None:
 
 def cmd_select_baseline(args):
     """Select the best baseline strategy from evaluated research proposals."""
-    from src.db import ensure_initialized, get_conn
+    from src.db import connection, ensure_initialized
     ensure_initialized()
 
     from backtester.strategy import StrategyConfig
@@ -403,21 +402,20 @@ def cmd_select_baseline(args):
 
     scope = args.scope
     limit = args.limit
-    conn = get_conn()
-    rows = conn.execute(
-        """
-        SELECT id, name, source, status, strategy_config_json, summary_metrics_json,
-               guardrail_results_json, created_at
-        FROM research_proposals
-        WHERE scope = ?
-          AND status IN ('evaluated', 'approved', 'converted')
-          AND summary_metrics_json IS NOT NULL
-        ORDER BY id DESC
-        LIMIT ?
-        """,
-        (scope, limit),
-    ).fetchall()
-    conn.close()
+    with connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, name, source, status, strategy_config_json, summary_metrics_json,
+                   guardrail_results_json, created_at
+            FROM research_proposals
+            WHERE scope = ?
+              AND status IN ('evaluated', 'approved', 'converted')
+              AND summary_metrics_json IS NOT NULL
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (scope, limit),
+        ).fetchall()
 
     live_strategy = get_live_weekly_model(scope)
     live_record = get_live_weekly_model_record(scope) or {}
@@ -28,8 +28,10 @@ def tmp_db():
 
     yield db
 
-    if os.path.exists(tmp):
-        os.unlink(tmp)
+    db.close_all_connections()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(tmp + suffix):
+            os.unlink(tmp + suffix)
     db.DB_PATH = original_path
     db._DB_INITIALIZED = original_init
 
@@ -15,3 +15,56 @@ def test_is_ai_available_accepts_real_openai_key(monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "sk-test-123")
     monkeypatch.setattr(ai_brain, "_ENV_BOOTSTRAPPED", True)
     assert ai_brain.is_ai_available() is True
+
+
+def test_post_tournament_review_stores_learnings_in_one_transaction(sample_tournament, monkeypatch):
+    db_mod, tid = sample_tournament
+    monkeypatch.setattr(ai_brain, "_call_ai", lambda *a, **k: {
+        "summary": "ok",
+        "learnings": [
+            {"topic": "putting", "insight": "Putting regresses", "confidence": 0.7},
+            {"topic": "weather", "insight": "Wind matters", "confidence": 0.6},
+            {"topic": "empty", "insight": ""},
+        ],
+    })
+    in_transaction = []
+    real_store = db_mod.store_ai_memory
+
+    def spy(**kwargs):
+        conn = db_mod.get_conn()
+        try:
+            in_transaction.append(conn.in_transaction)
+        finally:
+            conn.close()
+        real_store(**kwargs)
+
+    monkeypatch.setattr(db_mod, "store_ai_memory", spy)
+
+    ai_brain.post_tournament_review(tid, tournament_name="Test")
+
+    assert in_transaction == [True, True]
+    assert {m["topic"] for m in db_mod.get_ai_memories(["putting", "weather", "empty"])} == {"putting", "weather"}
+    assert [d["phase"] for d in db_mod.get_ai_decisions(tid)] == ["post_review"]
+
+
+def test_get_ai_status_counts_in_sql(sample_tournament):
+    db_mod, tid = sample_tournament
+    db_mod.store_ai_memory("putting", "one")
+    db_mod.store_ai_memory("putting", "two")
+    conn = db_mod.get_conn()
+    try:
+        conn.executemany(
+            "INSERT INTO ai_adjustments (tournament_id, player_key, adjustment_value, was_helpful) "
+            "VALUES (?, ?, ?, ?)",
+            [(tid, "a", 2.0, 1), (tid, "b", 1.0, 0), (tid, "c", -1.5, 1), (tid, "d", -1.0, None)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    status = ai_brain.get_ai_status()
+
+    assert status["memory_count"] == db_mod.count_ai_memories() == 2
+    assert status["memory_topics"] == ["putting"]
+    assert status["watches_hit_rate"] == (1, 2)
+    assert status["fades_hit_rate"] == (1, 1)
@@ -1,3 +1,6 @@
+from contextlib import nullcontext
+
+
 def test_rollback_policy_uses_previous_live_record(monkeypatch):
     from backtester import model_registry
     from backtester.strategy import StrategyConfig
@@ -8,8 +11,8 @@ def test_rollback_policy_uses_previous_live_record(monkeypatch):
         lambda strategy, **kwargs: {"strategy": strategy, "scope": kwargs.get("scope", "global")},
     )
     monkeypatch.setattr(
-        "backtester.model_registry.db.get_conn",
-        lambda: type(
+        "backtester.model_registry.db.connection",
+        lambda: nullcontext(type(
             "Conn",
             (),
             {
@@ -23,9 +26,8 @@ def test_rollback_policy_uses_previous_live_record(monkeypatch):
                         ]
                     },
                 )(),
-                "close": lambda self: None,
             },
-        )(),
+        )()),
     )
     out = model_registry.rollback_live_weekly_model(scope="global")
     assert out["strategy"].name == "old"
@@ -1,6 +1,7 @@
 import os
 import sys
 import tempfile
+from contextlib import nullcontext
 
 from fastapi.testclient import TestClient
 
@@ -74,7 +75,7 @@ def test_autoresearch_runs_roi_delta_backfilled_from_dossier(monkeypatch):
             return None
 
     monkeypatch.setattr("src.db.ensure_initialized", lambda: None)
-    monkeypatch.setattr(app_module, "get_conn", lambda: _FakeConn())
+    monkeypatch.setattr(app_module, "connection", lambda: nullcontext(_FakeConn()))
 
     client = TestClient(app_module.app)
     response = client.get("/api/autoresearch/runs?scope=global&limit=5")
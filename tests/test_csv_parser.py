@@ -0,0 +1,38 @@
+"""Tests for Betsperts CSV folder ingest."""
+
+from src import csv_parser
+
+
+def _write_csv(folder, name="sg total 12r.csv"):
+    (folder / name).write_text("Player,SG: Total\nScottie Scheffler,2.1\nRory McIlroy,1.4\n")
+
+
+def test_ingest_folder_links_metrics_to_their_import(tmp_path, sample_tournament):
+    db_mod, tid = sample_tournament
+    _write_csv(tmp_path)
+
+    summary = csv_parser.ingest_folder(str(tmp_path), tid)
+    assert summary["sg total 12r.csv"]["rows"] > 0
+
+    with db_mod.read_connection() as conn:
+        import_ids = [r[0] for r in conn.execute("SELECT id FROM csv_imports WHERE tournament_id = ?", (tid,))]
+        linked = {
+            r[0] for r in conn.execute("SELECT DISTINCT csv_import_id FROM metrics WHERE tournament_id = ?", (tid,))
+        }
+    assert len(import_ids) == 1
+    assert linked == set(import_ids)
+
+
+def test_ingest_folder_rolls_back_import_log_when_store_fails(tmp_path, sample_tournament, monkeypatch):
+    db_mod, tid = sample_tournament
+    _write_csv(tmp_path)
+
+    def _fail(rows):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(db_mod, "store_metrics", _fail)
+    summary = csv_parser.ingest_folder(str(tmp_path), tid)
+    assert summary["sg total 12r.csv"]["type"] == "error"
+
+    with db_mod.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM csv_imports WHERE tournament_id = ?", (tid,)).fetchone()[0] == 0
@@ -0,0 +1,101 @@
+"""Tests for Data Golf odds parsing and skill-metric ingestion."""
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from src import datagolf
+
+
+def _outrights_payload():
+    return {
+        "odds": [
+            {
+                "player_name": "Scheffler, Scottie",
+                "dg_id": 18417,
+                "draftkings": "+400",
+                "fanduel": "n/a",
+                "pinnacle": "+450",
+                "datagolf": {"baseline_history_fit": "+380", "baseline": "n/a"},
+            },
+            {"player_name": "", "draftkings": "+1000"},
+            "not-a-dict",
+        ]
+    }
+
+
+def test_iter_outright_odds_streams_rows(monkeypatch):
+    monkeypatch.setattr(datagolf, "_call_api", lambda endpoint, params=None, **_: _outrights_payload())
+
+    rows = datagolf.iter_outright_odds(market="top_10")
+    assert isinstance(rows, types.GeneratorType)
+
+    rows = list(rows)
+    assert [r["bookmaker"] for r in rows] == ["DraftKings", "Pinnacle", "DG-CH"]
+    assert {r["market"] for r in rows} == {"top_10"}
+    assert all(r["player"] == "Scottie Scheffler" for r in rows)
+    assert rows[0]["price"] == 400
+    assert rows[0]["implied_prob"] == 0.2
+
+
+def test_fetch_outright_odds_matches_iterator(monkeypatch):
+    monkeypatch.setattr(datagolf, "_call_api", lambda endpoint, params=None, **_: _outrights_payload())
+
+    assert datagolf.fetch_outright_odds(market="win") == list(datagolf.iter_outright_odds(market="win"))
+
+
+def test_fetch_closing_odds_groups_markets_per_player(monkeypatch):
+    def fake_call_api(endpoint, params=None, **_):
+        if params["market"] == "top_20":
+            raise RuntimeError("boom")
+        return {
+            "odds": [
+                {"player_name": "Scheffler, Scottie", "dg_id": 18417, "draftkings": 5.0, "fanduel": 6.0},
+                {"player_name": "McIlroy, Rory", "dg_id": 10091, "draftkings": "n/a"},
+            ]
+        }
+
+    monkeypatch.setattr(datagolf, "_call_api", fake_call_api)
+
+    closing = datagolf.fetch_closing_odds()
+    assert type(closing) is dict
+    assert closing == {"scottie_scheffler": {"outright": 5.5, "top5": 5.5, "top10": 5.5}}
+
+
+def test_store_approach_skill_composite_uses_single_pass(sample_tournament, monkeypatch):
+    db_mod, tid = sample_tournament
+    player = {
+        "player_name": "Scheffler, Scottie",
+        "50_100_fw_sg_per_shot": 0.1,
+        "50_100_fw_proximity_per_shot": 15.0,
+        "100_150_rgh_sg_per_shot": 0.3,
+        "200_plus_fw_sg_per_shot": "n/a",
+    }
+    monkeypatch.setattr(datagolf, "fetch_approach_skill", lambda period="l24": [player])
+
+    stored = datagolf.store_approach_skill_as_metrics(tid, ["scottie_scheffler"])
+    assert stored == 4
+
+    metrics = {m["metric_name"]: m["metric_value"] for m in db_mod.get_player_metrics(tid, "scottie_scheffler")}
+    assert metrics["approach_sg_composite"] == 0.2
+    assert metrics["50_100_fw_proximity_per_shot"] == 15.0
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("n/a", None),
+        ("+4000", 4000),
+        ("-150", -150),
+        (250, 250),
+        ("+500000", None),
+        (0, None),
+        ("abc", None),
+    ],
+)
+def test_parse_american_odds(raw, expected):
+    assert datagolf._parse_american_odds(raw) == expected
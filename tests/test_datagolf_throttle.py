@@ -2,6 +2,7 @@
 
 import os
 import sys
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -27,3 +28,70 @@ def test_datagolf_request_manager_reports_required_wait():
 
     manager.mark_rate_limited(now=120.0)
     assert manager.reserve_slot(now=121.0) > 0.0
+
+
+def test_datagolf_request_manager_serves_stale_within_window():
+    from src.datagolf import DataGolfRequestManager
+
+    manager = DataGolfRequestManager(max_requests=2, window_seconds=60, cooldown_seconds=300)
+    manager.set_cached("endpoint:{}", {"ok": True}, ttl_seconds=30, stale_ttl_seconds=60, now=100.0)
+
+    assert manager.get_cached("endpoint:{}", now=131.0) is None
+    assert manager.get_stale("endpoint:{}", now=131.0) == {"ok": True}
+    assert manager.get_stale("endpoint:{}", now=191.0) is None
+    assert manager.status()["cached_entries"] == 0
+
+
+def test_datagolf_request_manager_claims_single_refresh():
+    from src.datagolf import DataGolfRequestManager
+
+    manager = DataGolfRequestManager()
+
+    assert manager.begin_refresh("endpoint:{}") is True
+    assert manager.begin_refresh("endpoint:{}") is False
+    manager.end_refresh("endpoint:{}")
+    assert manager.begin_refresh("endpoint:{}") is True
+
+
+def test_call_api_returns_stale_and_refreshes_in_background(monkeypatch):
+    import src.datagolf as dg
+
+    manager = dg.DataGolfRequestManager()
+    monkeypatch.setattr(dg, "REQUEST_MANAGER", manager)
+    monkeypatch.setenv("DATAGOLF_API_KEY", "test-key")
+
+    cache_key = dg._cache_key("get-schedule", {"tour": "pga", "file_format": "json"})
+    manager.set_cached(cache_key, ["old"], ttl_seconds=-1, stale_ttl_seconds=600)
+
+    refreshed = []
+
+    def fake_fetch(endpoint, params, key, ttl, stale_ttl):
+        refreshed.append(endpoint)
+        manager.set_cached(key, ["new"], ttl_seconds=ttl, stale_ttl_seconds=stale_ttl)
+        return ["new"]
+
+    monkeypatch.setattr(dg, "_fetch_and_cache", fake_fetch)
+
+    assert dg._call_api("get-schedule", {"tour": "pga"}, stale_ttl_seconds=600) == ["old"]
+    for _ in range(100):
+        if not manager.refreshing and refreshed:
+            break
+        time.sleep(0.01)
+    assert refreshed == ["get-schedule"]
+    assert dg._call_api("get-schedule", {"tour": "pga"}, stale_ttl_seconds=600) == ["new"]
+
+
+def test_decode_json_handles_payload_and_rejects_non_json():
+    import pytest
+    import requests
+
+    from src.datagolf import _decode_json
+
+    resp = requests.Response()
+    resp._content = b'{"odds": [{"player_name": "Scheffler, Scottie", "draftkings": "+400"}]}'
+    resp.encoding = "utf-8"
+    assert _decode_json(resp) == {"odds": [{"player_name": "Scheffler, Scottie", "draftkings": "+400"}]}
+
+    resp._content = b"<html>rate limited</html>"
+    with pytest.raises(ValueError):
+        _decode_json(resp)
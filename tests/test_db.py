@@ -1,8 +1,13 @@
 """Tests for src/db.py -- dedup, constraints, year-aware lookups."""
 
+import json
 import os
+import sqlite3
 import sys
 import tempfile
+import time
+
+import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -22,6 +27,7 @@ def setup_module():
 
 def teardown_module():
     """Restore original DB path."""
+    db.close_all_connections()
     if os.path.exists(db.DB_PATH):
         os.unlink(db.DB_PATH)
     db.DB_PATH = _original_path
@@ -42,6 +48,17 @@ def test_tournament_same_year_reuse():
     assert tid1 == tid2, "Same name+year should return the same tournament id"
 
 
+def test_tournament_id_from_rolled_back_insert_is_not_cached():
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            doomed = db.get_or_create_tournament("Rolled Back Open", year=2025)
+            raise RuntimeError("abort batch")
+    other = db.get_or_create_tournament("Reissued Id Classic", year=2025)
+    tid = db.get_or_create_tournament("Rolled Back Open", year=2025)
+    assert tid != other
+    assert other == doomed  # sqlite_sequence rewound with the rollback
+
+
 def test_metric_upsert():
     """store_metrics should not raise on duplicate data (INSERT OR REPLACE)."""
     tid = db.get_or_create_tournament("Test Upsert", year=2025)
@@ -410,3 +427,1282 @@ def test_reclaim_database_disk_runs_vacuum_on_small_db(monkeypatch):
     result = db.reclaim_database_disk(min_free_mb=1)
     assert result["ok"] is True
     assert result.get("bytes_before", 0) >= 0
+
+
+def test_store_metrics_accepts_positional_metric_rows():
+    """MetricRow tuples bind positionally to the same columns as dict rows."""
+    tid = db.get_or_create_tournament("Test MetricRow", year=2025)
+    db.store_metrics([
+        db.MetricRow(tid, None, "tiger_woods", "Tiger Woods", "dg_skill",
+                     "recent_form", "all", "dg_sg_total", 2.5, None),
+        db.MetricRow(tid, None, "tiger_woods", "Tiger Woods", "dg_skill",
+                     "recent_form", "all", "dg_sg_putt", 0.4, None),
+    ])
+    metrics = {m["metric_name"]: m for m in db.get_player_metrics(tid, "tiger_woods")}
+    assert metrics["dg_sg_total"]["metric_value"] == 2.5
+    assert metrics["dg_sg_putt"]["metric_category"] == "dg_skill"
+    assert metrics["dg_sg_putt"]["player_display"] == "Tiger Woods"
+
+
+def test_store_metrics_accepts_generator_input():
+    """store_metrics takes any iterable, like store_results."""
+    tid = db.get_or_create_tournament("Test Metric Generator", year=2025)
+    db.store_metrics(
+        {"tournament_id": tid, "csv_import_id": None, "player_key": "rory_mcilroy",
+         "player_display": "Rory McIlroy", "metric_text": None,
+         "metric_category": "dg_skill", "data_mode": "recent_form", "round_window": "all",
+         "metric_name": name, "metric_value": value}
+        for name, value in (("dg_sg_total", 2.1), ("dg_sg_app", 0.9))
+    )
+    db.store_metrics(iter([
+        db.MetricRow(tid, None, "rory_mcilroy", "Rory McIlroy", "dg_skill",
+                     "recent_form", "all", "dg_sg_putt", 0.2, None),
+    ]))
+    metrics = {m["metric_name"]: m["metric_value"] for m in db.get_player_metrics(tid, "rory_mcilroy")}
+    assert metrics == {"dg_sg_total": 2.1, "dg_sg_app": 0.9, "dg_sg_putt": 0.2}
+
+
+def test_get_conn_reuses_thread_connection():
+    """get_conn() hands back the same connection per thread; close() only releases it."""
+    conn1 = db.get_conn()
+    conn1.close()
+    conn2 = db.get_conn()
+    try:
+        assert conn2 is conn1
+        assert conn2.execute("SELECT 1").fetchone()[0] == 1
+    finally:
+        conn2.close()
+
+
+def test_pooled_close_rolls_back_uncommitted_work_at_outermost_release():
+    tid = db.get_or_create_tournament("Test Pool Rollback", year=2025)
+    outer = db.get_conn()
+    outer.execute("UPDATE tournaments SET course = 'Pending' WHERE id = ?", (tid,))
+    inner = db.get_conn()
+    inner.execute("SELECT 1").fetchone()
+    inner.close()
+    # The nested release must not discard the outer caller's pending write.
+    assert outer.in_transaction
+    outer.close()
+    check = db.get_conn()
+    try:
+        row = check.execute("SELECT course FROM tournaments WHERE id = ?", (tid,)).fetchone()
+        assert row["course"] is None
+    finally:
+        check.close()
+
+
+def test_connection_block_releases_and_rolls_back_on_error():
+    tid = db.get_or_create_tournament("Test Pool Raise", year=2025)
+    with pytest.raises(RuntimeError):
+        with db.connection() as conn:
+            conn.execute("UPDATE tournaments SET course = 'Leaked' WHERE id = ?", (tid,))
+            raise RuntimeError("boom")
+
+    assert conn._depth == 0
+    assert not conn.in_transaction
+    db.store_ai_memory("raise_topic", "committed after a failed block")
+    other = sqlite3.connect(db.DB_PATH)
+    try:
+        assert other.execute("SELECT course FROM tournaments WHERE id = ?", (tid,)).fetchone()[0] is None
+        assert other.execute(
+            "SELECT COUNT(*) FROM ai_memory WHERE topic = 'raise_topic'"
+        ).fetchone()[0] == 1
+    finally:
+        other.close()
+
+
+def test_asyncio_tasks_get_their_own_connection():
+    import asyncio
+
+    async def hold_write(tid, started, release):
+        with db.connection() as conn:
+            conn.execute("UPDATE tournaments SET course = 'Task A' WHERE id = ?", (tid,))
+            started.set()
+            await release.wait()
+            conn.rollback()
+        return conn
+
+    async def other_task(started):
+        await started.wait()
+        with db.connection() as conn:
+            assert not conn.in_transaction
+            return conn
+
+    async def main():
+        tid = db.get_or_create_tournament("Test Pool Tasks", year=2025)
+        started, release = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold_write(tid, started, release))
+        other = await asyncio.create_task(other_task(started))
+        release.set()
+        held = await holder
+        await asyncio.sleep(0)  # let the done callbacks run
+        return held, other
+
+    held, other = asyncio.run(main())
+    assert held is not other
+    with pytest.raises(sqlite3.ProgrammingError):
+        held.execute("SELECT 1")
+    with db.connection() as conn:
+        assert conn is not held
+
+
+def test_nested_release_keeps_outer_hold():
+    tid = db.get_or_create_tournament("Test Pool Held", year=2025)
+    outer = db.get_conn()
+    try:
+        outer.execute("UPDATE tournaments SET course = 'Held' WHERE id = ?", (tid,))
+        inner = db.get_conn()
+        inner.close()
+        assert outer.in_transaction
+        assert outer._depth == 1
+    finally:
+        outer.rollback()
+        outer.close()
+
+
+def test_write_helper_refuses_to_join_undeclared_transaction():
+    tid = db.get_or_create_tournament("Test Pool No Join", year=2025)
+    conn = db.get_conn()
+    try:
+        conn.execute("UPDATE tournaments SET course = 'Pending' WHERE id = ?", (tid,))
+        with pytest.raises(sqlite3.OperationalError, match="uncommitted transaction"):
+            db.store_ai_memory("no_join_topic", "must not join")
+        assert conn._depth == 1
+    finally:
+        conn.close()
+    assert "no_join_topic" not in db.get_all_ai_memory_topics()
+
+
+def test_transaction_refuses_to_join_undeclared_transaction():
+    tid = db.get_or_create_tournament("Test Pool No Batch Join", year=2025)
+    conn = db.get_conn()
+    try:
+        conn.execute("UPDATE tournaments SET course = 'Pending' WHERE id = ?", (tid,))
+        with pytest.raises(sqlite3.OperationalError, match="uncommitted transaction"):
+            with db.transaction():
+                pass
+        assert conn._depth == 1
+        assert conn._batch_depth == 0
+    finally:
+        conn.close()
+
+
+def test_close_all_connections_forces_reopen():
+    conn1 = db.get_conn()
+    conn1.close()
+    db.close_all_connections()
+    conn2 = db.get_conn()
+    try:
+        assert conn2 is not conn1
+        assert conn2.execute("SELECT COUNT(*) FROM tournaments").fetchone()[0] >= 0
+    finally:
+        conn2.close()
+
+
+def test_get_conn_applies_pragma_bundle():
+    conn = db.get_conn()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8192
+        assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 67108864
+        assert conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 10000
+    finally:
+        conn.close()
+
+
+def test_store_metrics_rolls_back_whole_batch_on_error():
+    """Bulk writes run in one IMMEDIATE transaction: a bad row stores nothing."""
+    import pytest
+
+    tid = db.get_or_create_tournament("Test Batch Rollback", year=2025)
+    good = db.MetricRow(tid, None, "jon_rahm", "Jon Rahm", "dg_skill",
+                        "recent_form", "all", "dg_sg_total", 1.0, None)
+    bad = (tid, None, None, "Bad Row", "dg_skill", "recent_form", "all", "dg_sg_total", 1.0, None)
+    with pytest.raises(sqlite3.IntegrityError):
+        db.store_metrics([good, bad])
+    assert db.get_player_metrics(tid, "jon_rahm") == []
+    conn = db.get_conn()
+    try:
+        assert not conn.in_transaction
+    finally:
+        conn.close()
+
+
+def _round_row(dg_id: int, round_num: int, event_id: str = "9001") -> dict:
+    row = {col: None for col in db._ROUNDS_COLUMNS}
+    row.update({
+        "dg_id": dg_id,
+        "player_name": f"Player {dg_id}",
+        "player_key": f"player_{dg_id}",
+        "tour": "pga",
+        "year": 2025,
+        "event_id": event_id,
+        "event_completed": "2025-05-01",
+        "round_num": round_num,
+        "sg_total": 0.5,
+    })
+    return row
+
+
+def test_store_rounds_multi_row_chunks_and_remainder():
+    """Rows spanning full multi-row chunks plus a remainder all land once."""
+    per_insert = db._ROUNDS_ROWS_PER_INSERT
+    rows = [_round_row(50_000 + i, 1) for i in range(per_insert * 2 + 5)]
+    db.store_rounds(rows)
+    # Re-storing (plus an in-batch duplicate) collapses onto the UNIQUE key.
+    db.store_rounds(rows[:per_insert] + rows[:1])
+
+    conn = db.get_conn()
+    try:
+        count = conn.execute(
+            "SELECT COUNT(*) FROM rounds WHERE event_id = '9001'"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert count == len(rows)
+    assert db.get_player_recent_rounds(50_000)[0]["player_key"] == "player_50000"
+
+
+def test_store_metrics_multi_row_chunks_and_remainder():
+    """Full multi-row chunks plus a remainder land once; in-chunk duplicates upsert."""
+    tid = db.get_or_create_tournament("Test Metric Chunks", year=2025)
+    per_insert = db._METRICS_ROWS_PER_INSERT
+
+    def row(i, value):
+        return db.MetricRow(tid, None, f"chunk_{i}", f"Chunk {i}", "sim", "recent_form", "all", "win", value, None)
+
+    rows = [row(i, 0.1) for i in range(per_insert * 2 + 3)]
+    db.store_metrics(rows)
+    db.store_metrics([row(0, 0.2)] + rows[1:per_insert - 1] + [row(0, 0.3)])
+
+    conn = db.get_conn()
+    try:
+        count = conn.execute("SELECT COUNT(*) FROM metrics WHERE tournament_id = ?", (tid,)).fetchone()[0]
+        value = conn.execute(
+            "SELECT metric_value FROM metrics WHERE tournament_id = ? AND player_key = 'chunk_0'", (tid,)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    assert count == len(rows)
+    assert value == 0.3
+
+
+def test_init_db_is_one_shot_and_records_schema_version(monkeypatch):
+    """init_db stamps SCHEMA_VERSION and skips migrations once current."""
+    calls = []
+    monkeypatch.setattr(db, "_run_migrations", lambda conn: calls.append(conn))
+
+    db.init_db()  # already initialized for this DB_PATH: no-op
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    db.init_db()  # re-run: schema_version is current, so migrations are skipped
+    assert calls == []
+
+    conn = db.get_conn()
+    try:
+        assert db._get_schema_version(conn) == db.SCHEMA_VERSION
+        conn.execute("UPDATE schema_version SET version = 1 WHERE id = 1")
+        conn.commit()
+    finally:
+        conn.close()
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    db.init_db()
+    assert len(calls) == 1
+    conn = db.get_conn()
+    try:
+        assert db._get_schema_version(conn) == db.SCHEMA_VERSION
+    finally:
+        conn.close()
+
+
+def test_migration_normalizes_legacy_local_ai_memory_expiry(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    local_expiry = datetime.now() + timedelta(days=3)
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT INTO ai_memory (topic, insight, expires_at) VALUES ('legacy_expiry', 'old format', ?)",
+            (local_expiry.isoformat(),),
+        )
+        conn.execute("UPDATE schema_version SET version = 1 WHERE id = 1")
+        conn.commit()
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    db.init_db()
+
+    with db.read_connection() as conn:
+        stored = conn.execute(
+            "SELECT expires_at FROM ai_memory WHERE topic = 'legacy_expiry'"
+        ).fetchone()[0]
+    expected = local_expiry.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    assert stored == expected
+
+
+def test_init_db_skips_schema_script_when_user_version_current(monkeypatch):
+    with db.read_connection() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+
+    monkeypatch.setattr(db, "_apply_schema", lambda conn: pytest.fail("schema script re-run"))
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    db.init_db()
+    assert db._DB_INITIALIZED
+
+
+def test_open_conn_fixes_page_size_before_wal(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "_CONNECTION_PRAGMAS", db._CONNECTION_PRAGMAS.replace("page_size=4096", "page_size=8192"))
+    conn = db._open_conn(str(tmp_path / "fresh.db"))
+    try:
+        conn.execute("CREATE TABLE t (x)")
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA page_size").fetchone()[0] == 8192
+    finally:
+        conn._close_for_real()
+
+
+def test_open_conn_creates_db_dir_once(tmp_path, monkeypatch):
+    calls = []
+    real_makedirs = db.os.makedirs
+    monkeypatch.setattr(db.os, "makedirs", lambda *a, **k: (calls.append(a[0]), real_makedirs(*a, **k)))
+    path = str(tmp_path / "nested" / "dir.db")
+    for _ in range(2):
+        db._open_conn(path)._close_for_real()
+    assert calls == [str(tmp_path / "nested")]
+
+
+def test_add_unique_constraints_keeps_newest_duplicate():
+    """Legacy duplicates are collapsed to the highest id before indexing."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE results (id INTEGER PRIMARY KEY, tournament_id INTEGER, player_key TEXT, note TEXT)")
+    conn.executemany(
+        "INSERT INTO results (tournament_id, player_key, note) VALUES (?, ?, ?)",
+        [(1, "a", "old"), (1, "b", "only"), (1, "a", "new"), (2, "a", "other"), (1, None, "n1"), (1, None, "n2")],
+    )
+    conn.commit()
+
+    db._add_unique_constraints(conn)
+
+    rows = conn.execute("SELECT tournament_id, player_key, note FROM results ORDER BY id").fetchall()
+    assert rows == [(1, "b", "only"), (1, "a", "new"), (2, "a", "other"), (1, None, "n2")]
+    assert conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_results_unique'"
+    ).fetchone()
+    conn.close()
+
+
+def test_player_metrics_and_display_names_are_index_only():
+    """Hot metrics reads are served from idx_metrics_player_cover without a sort."""
+    conn = db.get_conn()
+    try:
+        plan = " ".join(
+            str(r[3]) for r in conn.execute(
+                """EXPLAIN QUERY PLAN SELECT * FROM metrics
+                   WHERE tournament_id = ? AND player_key = ?
+                   ORDER BY metric_category, round_window, metric_name""",
+                (1, "x"),
+            )
+        )
+        assert "COVERING INDEX idx_metrics_player_cover" in plan
+        assert "TEMP B-TREE" not in plan
+
+        plan = " ".join(
+            str(r[3]) for r in conn.execute(
+                """EXPLAIN QUERY PLAN SELECT DISTINCT player_key, player_display FROM metrics
+                   WHERE tournament_id = ? AND player_display IS NOT NULL""",
+                (1,),
+            )
+        )
+        assert "COVERING INDEX" in plan
+    finally:
+        conn.close()
+
+
+def test_get_all_players_returns_distinct_sorted_keys():
+    tid = db.get_or_create_tournament("Test All Players", year=2025)
+    rows = []
+    for pk in ("zach_johnson", "adam_scott", "zach_johnson"):
+        for name in ("sg_total", "sg_ott"):
+            rows.append(db.MetricRow(tid, None, pk, pk, "dg_skill", "recent_form", "all", name, 1.0, None))
+    rows.append(db.MetricRow(tid, None, "adam_scott", "Adam Scott", "meta", "recent_form", "all",
+                             "field_status", None, "confirmed"))
+    db.store_metrics(rows)
+
+    assert db.get_all_players(tid, confirmed_field_only=False) == ["adam_scott", "zach_johnson"]
+    assert db.get_all_players(tid) == ["adam_scott"]
+
+
+def test_active_weights_cached_per_set_and_copied():
+    db.save_weights("cache-a", {"course_fit": 0.4, "form": 0.6})
+    first = db.get_active_weights()
+    first["form"] = 0.0
+    assert db.get_active_weights() == {"course_fit": 0.4, "form": 0.6}
+
+    db.save_weights("cache-b", {"course_fit": 0.5, "form": 0.5})
+    assert db.get_active_weights() == {"course_fit": 0.5, "form": 0.5}
+
+
+def test_store_metrics_upserts_in_place():
+    tid = db.get_or_create_tournament("Test Metric Upsert", year=2025)
+    key = (tid, None, "upsert_player", "Upsert Player", "sim", "recent_form", "all", "sg_total")
+    db.store_metrics([db.MetricRow(*key, 1.0, None)])
+    conn = db.get_conn()
+    try:
+        (first_id,) = conn.execute(
+            "SELECT id FROM metrics WHERE tournament_id = ? AND player_key = 'upsert_player'", (tid,)
+        ).fetchone()
+        db.store_metrics([db.MetricRow(*key, 2.5, "T3")])
+        rows = conn.execute(
+            "SELECT id, metric_value, metric_text FROM metrics "
+            "WHERE tournament_id = ? AND player_key = 'upsert_player'",
+            (tid,),
+        ).fetchall()
+    finally:
+        conn.close()
+    assert [tuple(r) for r in rows] == [(first_id, 2.5, "T3")]
+
+
+def test_reader_is_query_only_and_sees_open_writer_transaction():
+    tid = db.get_or_create_tournament("Test Reader Pool", year=2025)
+    reader = db.get_reader()
+    writer = db.get_writer()
+    try:
+        assert reader is not writer
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM metrics WHERE 1 = 0")
+
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute(
+            "INSERT INTO metrics (tournament_id, player_key, metric_name) VALUES (?, 'pending_player', 'x')",
+            (tid,),
+        )
+        assert db.get_all_players(tid, confirmed_field_only=False) == ["pending_player"]
+        writer.rollback()
+        assert db.get_all_players(tid, confirmed_field_only=False) == []
+    finally:
+        writer.close()
+        reader.close()
+
+
+def test_metric_getters_return_records_with_dict_access():
+    tid = db.get_or_create_tournament("Test Metric Records", year=2025)
+    db.store_metrics([
+        db.MetricRow(tid, None, "record_player", "Record Player", "sim", "recent_form", "all", "win", 0.1, None),
+    ])
+
+    (row,) = db.get_player_metrics(tid, "record_player")
+    assert isinstance(row, db.Record)
+    assert row["metric_value"] == 0.1
+    assert row.get("metric_name") == "win"
+    assert row.get("missing", "fallback") == "fallback"
+    assert dict(row)["player_display"] == "Record Player"
+    assert db.get_metrics_by_category(tid, "sim") == [row]
+
+
+def test_get_or_create_tournament_caches_complete_rows(monkeypatch):
+    tid = db.get_or_create_tournament("Test Tournament Cache", year=2025)
+
+    def _no_db():
+        raise AssertionError("cached lookup should not touch the database")
+
+    monkeypatch.setattr(db, "get_conn", _no_db)
+    assert db.get_or_create_tournament("Test Tournament Cache", year=2025) == tid
+    monkeypatch.undo()
+
+    # A new event_id still has to be written back to the row.
+    assert db.get_or_create_tournament("Test Tournament Cache", year=2025, event_id="777") == tid
+    conn = db.get_conn()
+    try:
+        assert conn.execute("SELECT event_id FROM tournaments WHERE id = ?", (tid,)).fetchone()[0] == "777"
+    finally:
+        conn.close()
+
+
+def test_transaction_defers_helper_commits_until_exit():
+    tid = db.get_or_create_tournament("Test Grouped Writes", year=2025)
+    row = db.MetricRow(tid, None, "grouped_player", "Grouped", "sim", "recent_form", "all", "win", 0.2, None)
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.log_csv_import(tid, "grouped.csv", "sim", "recent_form", "all", 1)
+            db.store_metrics([row])
+            raise RuntimeError("abort batch")
+    assert db.get_player_metrics(tid, "grouped_player") == []
+
+    with db.transaction() as conn:
+        with db.transaction():
+            db.store_metrics([row])
+        assert conn.in_transaction
+    assert [r["metric_value"] for r in db.get_player_metrics(tid, "grouped_player")] == [0.2]
+
+
+def test_event_id_column_added_by_migration_not_per_call(tmp_path, monkeypatch):
+    legacy = tmp_path / "legacy.db"
+    raw = sqlite3.connect(legacy)
+    raw.execute(
+        "CREATE TABLE tournaments (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, "
+        "course TEXT, date TEXT, year INTEGER, created_at TEXT)"
+    )
+    raw.commit()
+    raw.close()
+
+    monkeypatch.setattr(db, "DB_PATH", str(legacy))
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    try:
+        db.init_db()
+        tid = db.get_or_create_tournament("Legacy Open", year=2024, event_id="42")
+        conn = db.get_conn()
+        try:
+            assert conn.execute("SELECT event_id FROM tournaments WHERE id = ?", (tid,)).fetchone()[0] == "42"
+        finally:
+            conn.close()
+    finally:
+        db.close_all_connections()
+
+
+def test_add_missing_columns_only_alters_absent_columns():
+    conn = db.get_conn()
+    try:
+        assert db._add_missing_columns(conn) == set()
+        for table, column, _ in db._ADDED_COLUMNS:
+            assert column in db._table_columns(conn, table)
+    finally:
+        conn.close()
+
+
+def test_pick_ledger_migration_adds_outcome_columns_from_table_info():
+    raw = sqlite3.connect(":memory:")
+    raw.execute("CREATE TABLE pick_outcomes (id INTEGER PRIMARY KEY, pick_id INTEGER, pick_key TEXT)")
+    db._ensure_pick_ledger_tables(raw)
+    db._ensure_pick_ledger_tables(raw)  # idempotent once the columns exist
+
+    columns = db._table_columns(raw, "pick_outcomes")
+    assert {"pick_key", "grading_authority", "outcome_locked"} <= columns
+    raw.close()
+
+
+def test_large_store_refreshes_planner_stats(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db, "_optimize", lambda conn: calls.append(conn))
+    monkeypatch.setattr(db, "_OPTIMIZE_MIN_ROWS", 3)
+    # Optimized just now, so small writes stay inside the throttle window.
+    monkeypatch.setattr(db, "_LAST_OPTIMIZED", {db.DB_PATH: time.monotonic()})
+    tid = db.get_or_create_tournament("Test Optimize", year=2025)
+
+    def rows(n):
+        return [
+            db.MetricRow(tid, None, f"opt_{i}", f"Opt {i}", "sim", "recent_form", "all", "win", 0.1, None)
+            for i in range(n)
+        ]
+
+    db.store_metrics(rows(2))
+    assert calls == []
+    db.store_metrics(rows(3))
+    assert len(calls) == 1
+
+
+def test_bulk_store_rounds_analyzes_rounds(monkeypatch):
+    monkeypatch.setattr(db, "_ANALYZE_MIN_ROWS", 3)
+    with db.connection() as conn:
+        conn.execute("DELETE FROM sqlite_stat1 WHERE tbl = 'rounds'")
+        conn.commit()
+    db.store_rounds([_round_row(891_000 + i, 1) for i in range(3)])
+
+    with db.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'rounds'").fetchone()[0] > 0
+
+
+def test_small_writes_optimize_once_per_interval(monkeypatch):
+    calls = []
+
+    def _fake_optimize(conn):
+        calls.append(conn)
+        db._LAST_OPTIMIZED[db.DB_PATH] = time.monotonic()
+
+    monkeypatch.setattr(db, "_optimize", _fake_optimize)
+    monkeypatch.setattr(db, "_LAST_OPTIMIZED", {})
+    tid = db.get_or_create_tournament("Test Optimize Interval", year=2025)
+    row = db.MetricRow(tid, None, "opt_small", "Opt Small", "sim", "recent_form", "all", "win", 0.1, None)
+
+    db.store_metrics([row])
+    db.store_metrics([row])
+    db.maybe_optimize()
+    assert len(calls) == 1
+
+    db._LAST_OPTIMIZED[db.DB_PATH] -= db._OPTIMIZE_INTERVAL_SECONDS
+    db.maybe_optimize()
+    assert len(calls) == 2
+
+
+def test_bulk_store_metrics_analyzes_metrics(monkeypatch):
+    monkeypatch.setattr(db, "_ANALYZE_MIN_ROWS", 3)
+    with db.connection() as conn:
+        conn.execute("DELETE FROM sqlite_stat1 WHERE tbl = 'metrics'")
+        conn.commit()
+    tid = db.get_or_create_tournament("Test Analyze Metrics", year=2025)
+    db.store_metrics([
+        db.MetricRow(tid, None, f"an_{i}", f"An {i}", "sim", "recent_form", "all", "win", 0.1, None)
+        for i in range(3)
+    ])
+
+    with db.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl = 'metrics'").fetchone()[0] > 0
+
+
+def test_optimize_skips_open_transaction():
+    with db.transaction() as conn:
+        db._optimize(conn)
+        assert conn.in_transaction
+
+
+def test_get_player_display_names_single_display_fast_path():
+    tid = db.get_or_create_tournament("Test Display Fast Path", year=2025)
+    db.store_metrics([
+        db.MetricRow(tid, None, "ludvig_aberg", "Ludvig Aberg", "sim", "recent_form", "all", "win", 0.1, None),
+        db.MetricRow(tid, None, "sahith_theegala", "sahith_theegala", "sim", "recent_form", "all", "win", 0.1, None),
+    ])
+    assert db.get_player_display_names(tid) == {
+        "ludvig_aberg": "Ludvig Aberg",
+        "sahith_theegala": "sahith_theegala",
+    }
+
+
+def test_connection_context_releases_on_error():
+    with pytest.raises(RuntimeError):
+        with db.connection() as conn:
+            conn.execute("INSERT INTO ai_decisions (phase) VALUES ('abandoned')")
+            raise RuntimeError("boom")
+    assert not conn.in_transaction
+    assert conn._depth == 0
+    assert db.get_ai_decisions(phase="abandoned") == []
+
+
+def test_read_connections_are_per_thread_and_reused():
+    import threading
+
+    seen = {}
+
+    def _grab(name):
+        with db.read_connection() as first, db.read_connection() as second:
+            seen[name] = (id(first), first is second)
+
+    workers = [threading.Thread(target=_grab, args=(n,)) for n in ("a", "b")]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert seen["a"][1] and seen["b"][1]
+    assert seen["a"][0] != seen["b"][0]
+
+
+def test_read_helpers_proceed_while_another_thread_writes():
+    import threading
+
+    tid = db.get_or_create_tournament("Test Concurrent Read", year=2025)
+    db.store_metrics([db.MetricRow(tid, None, "reader_a", "Reader A", "sim", "recent_form", "all", "win", 0.1, None)])
+    holding, release = threading.Event(), threading.Event()
+
+    def _hold_write_lock():
+        with db.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM metrics WHERE tournament_id = ?", (tid,))
+            holding.set()
+            release.wait(5)
+            conn.rollback()
+
+    writer = threading.Thread(target=_hold_write_lock)
+    writer.start()
+    try:
+        assert holding.wait(5)
+        assert db.get_tournament_field_size(tid) == 1
+        assert db.get_app_metadata("no_such_key") is None
+    finally:
+        release.set()
+        writer.join()
+
+
+def test_app_metadata_roundtrip_on_pooled_connections():
+    db.set_app_metadata("pool_check", {"runs": 3})
+    db.set_app_metadata("pool_check", {"runs": 4})
+    assert db.get_app_metadata("pool_check") == {"runs": 4}
+
+
+def test_course_profile_cache_invalidated_on_save():
+    assert db.get_course_weight_profile(9901) is None
+    db.save_course_weight_profile(9901, "Cache National", {"course_fit": 0.3}, 4, 0.5)
+    profile = db.get_course_weight_profile(9901)
+    assert profile["weights"] == {"course_fit": 0.3}
+
+    profile["weights"]["course_fit"] = 9.9
+    assert db.get_course_weight_profile(9901)["weights"] == {"course_fit": 0.3}
+
+    db.save_course_weight_profile(9901, "Cache National", {"course_fit": 0.6}, 5, 0.7)
+    assert db.get_course_weight_profile(9901)["weights"] == {"course_fit": 0.6}
+
+
+def test_dg_id_lookup_caches_hits_only():
+    assert db.get_dg_id_for_player("cache_dg_player") is None
+    row = _round_row(424242, 1)
+    row["player_key"] = "cache_dg_player"
+    db.store_rounds([row])
+    assert db.get_dg_id_for_player("cache_dg_player") == 424242
+    assert db._DG_ID_CACHE[(db.DB_PATH, "cache_dg_player")] == 424242
+
+
+def test_log_predictions_chunks_and_keeps_first_snapshot(monkeypatch):
+    monkeypatch.setattr(db, "_PREDICTION_LOG_CHUNK", 2)
+    tid = db.get_or_create_tournament("Test Prediction Chunks", year=2025)
+
+    def pred(i, prob):
+        return {
+            "tournament_id": tid, "player_key": f"pred_{i}", "bet_type": "top10",
+            "model_prob": prob, "dg_prob": None, "market_implied_prob": 0.1,
+            "actual_outcome": None, "odds_decimal": 5.0, "profit": None,
+            "odds_timing": "pre_tournament",
+        }
+
+    def logged():
+        conn = db.get_conn()
+        try:
+            return [tuple(r) for r in conn.execute(
+                "SELECT id, player_key, model_prob FROM prediction_log "
+                "WHERE tournament_id = ? ORDER BY player_key",
+                (tid,),
+            )]
+        finally:
+            conn.close()
+
+    db.log_predictions([pred(i, 0.2) for i in range(5)])
+    first = logged()
+    db.log_predictions([pred(0, 0.9)])
+
+    # Re-logging keeps the original rows (and their ids) untouched.
+    assert logged() == first
+    assert [r[1:] for r in first] == [(f"pred_{i}", 0.2) for i in range(5)]
+
+
+def test_iter_calibration_data_streams_in_batches(monkeypatch):
+    monkeypatch.setattr(db, "_FETCH_BATCH_SIZE", 2)
+    tid = db.get_or_create_tournament("Test Calibration Stream", year=2025)
+    db.log_predictions([
+        {"tournament_id": tid, "player_key": f"cal_{i}", "bet_type": "top10",
+         "model_prob": 0.2, "dg_prob": None, "market_implied_prob": 0.1,
+         "actual_outcome": None, "odds_decimal": 5.0, "profit": None,
+         "odds_timing": "pre_tournament"}
+        for i in range(5)
+    ])
+    rows = db.iter_calibration_data()
+    assert not isinstance(rows, list)
+    streamed = list(rows)
+    assert streamed == db.get_calibration_data()
+    assert len(streamed) >= 5
+    assert len({r["id"] for r in streamed}) == len(streamed)
+    reader = db.get_reader()
+    try:
+        assert reader._depth == 1  # the exhausted generator released its hold
+    finally:
+        reader.close()
+
+    early = db.iter_calibration_data()
+    next(early)
+    early.close()
+    reader = db.get_reader()
+    try:
+        assert reader._depth == 1  # closing early releases it too
+        assert not reader.in_transaction
+    finally:
+        reader.close()
+
+
+def test_course_profile_revalidation_skips_unchanged_json(monkeypatch):
+    db.save_course_weight_profile(9902, "Reparse Links", {"course_fit": 0.2}, 3, 0.4)
+    first = db.get_course_weight_profile(9902)
+
+    monkeypatch.setattr(db, "_COURSE_PROFILE_TTL_SECONDS", 0.0)
+    db._COURSE_PROFILE_CACHE[(db.DB_PATH, 9902)] = (0.0, db._COURSE_PROFILE_CACHE[(db.DB_PATH, 9902)][1])
+    monkeypatch.setattr(db.json, "loads", lambda raw: pytest.fail("unchanged weights were re-parsed"))
+    assert db.get_course_weight_profile(9902) == first
+
+
+def test_get_weights_for_course_blends_by_confidence(monkeypatch):
+    monkeypatch.setattr(db, "_active_weight_set", lambda: (1, {"course_fit": 0.4, "form": 0.6}))
+    db.save_course_weight_profile(9903, "Blend Course", {"course_fit": 0.8}, 6, 0.5)
+    db.save_course_weight_profile(9904, "Low Confidence", {"course_fit": 0.8}, 1, 0.1)
+
+    assert db.get_weights_for_course(9903) == {"course_fit": 0.6, "form": 0.6}
+    assert db.get_weights_for_course(9904) == {"course_fit": 0.4, "form": 0.6}
+    assert db.get_weights_for_course(None) == {"course_fit": 0.4, "form": 0.6}
+
+
+def test_get_weights_for_course_caches_blend_until_inputs_change():
+    db.save_weights("blend-a", {"course_fit": 0.4, "form": 0.6})
+    db.save_course_weight_profile(9905, "Cached Blend", {"course_fit": 0.8}, 6, 0.5)
+
+    first = db.get_weights_for_course(9905)
+    first["form"] = 0.0
+    assert db.get_weights_for_course(9905) == {"course_fit": 0.6, "form": 0.6}
+
+    db.save_weights("blend-b", {"course_fit": 0.2, "form": 0.8})
+    assert db.get_weights_for_course(9905) == {"course_fit": 0.5, "form": 0.8}
+
+    db.save_course_weight_profile(9905, "Cached Blend", {"course_fit": 0.4}, 8, 0.5)
+    assert db.get_weights_for_course(9905) == {"course_fit": 0.3, "form": 0.8}
+
+
+def test_get_weights_for_course_reuses_blend_without_parsing(monkeypatch):
+    db.save_weights("blend-c", {"course_fit": 0.4, "form": 0.6})
+    db.save_course_weight_profile(9906, "Parsed Once", {"course_fit": 0.8}, 6, 0.5)
+    expected = db.get_weights_for_course(9906)
+
+    monkeypatch.setattr(db.json, "loads", lambda raw: pytest.fail("unchanged weights were re-parsed"))
+    assert db.get_weights_for_course(9906) == expected
+
+
+def test_get_dg_ids_for_players_batches_and_skips_unknown(monkeypatch):
+    monkeypatch.setattr(db, "_IN_CLAUSE_CHUNK", 1)
+    rows = []
+    for dg_id, key in ((515151, "batch_one"), (525252, "batch_two")):
+        row = _round_row(dg_id, 1)
+        row["player_key"] = key
+        rows.append(row)
+    db.store_rounds(rows)
+
+    assert db.get_dg_ids_for_players(["batch_one", "batch_two", "batch_one", "batch_none"]) == {
+        "batch_one": 515151,
+        "batch_two": 525252,
+    }
+    assert db.get_dg_id_for_player("batch_two") == 525252
+
+
+def _duplicate_metric_rows_without_unique_index(conn):
+    tournament_id = db.get_or_create_tournament("Metrics Dedup Open", year=2026)
+    conn.execute("DROP INDEX idx_metrics_unique")
+    for value in (1.0, 2.0):
+        conn.execute(
+            """INSERT INTO metrics (tournament_id, player_key, metric_category,
+                                    data_mode, round_window, metric_name, metric_value)
+               VALUES (?, 'dup_metric_player', 'strokes_gained', 'recent_form', 'all', 'sg_total', ?)""",
+            (tournament_id, value),
+        )
+    conn.commit()
+
+
+def test_migration_dedupes_metrics_and_restores_unique_index():
+    with db.connection() as conn:
+        _duplicate_metric_rows_without_unique_index(conn)
+        db._run_migrations(conn)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_metrics_unique'"
+        ).fetchone()
+        assert [r[0] for r in conn.execute(
+            "SELECT metric_value FROM metrics WHERE player_key = 'dup_metric_player'"
+        )] == [2.0]
+
+
+def test_migration_propagates_metrics_unique_index_failure(monkeypatch):
+    monkeypatch.setattr(db, "_superseded_ids_sql", lambda table, cols: "SELECT NULL")
+    with db.connection() as conn:
+        _duplicate_metric_rows_without_unique_index(conn)
+        with pytest.raises(sqlite3.IntegrityError):
+            db._run_migrations(conn)
+        conn.rollback()
+        conn.execute("DELETE FROM metrics WHERE player_key = 'dup_metric_player'")
+        conn.execute(
+            "CREATE UNIQUE INDEX idx_metrics_unique ON metrics("
+            "tournament_id, player_key, metric_category, data_mode, round_window, metric_name)"
+        )
+        conn.commit()
+
+
+def test_player_dg_ids_maintained_by_trigger_and_backfill():
+    row = _round_row(535353, 1)
+    row["player_key"] = "trigger_player"
+    db.store_rounds([row])
+    conn = db.get_conn()
+    try:
+        assert conn.execute(
+            "SELECT dg_id FROM player_dg_ids WHERE player_key = 'trigger_player'"
+        ).fetchone()[0] == 535353
+
+        conn.execute("DELETE FROM player_dg_ids WHERE player_key = 'trigger_player'")
+        conn.commit()
+        db._run_migrations(conn)
+        assert conn.execute(
+            "SELECT dg_id FROM player_dg_ids WHERE player_key = 'trigger_player'"
+        ).fetchone()[0] == 535353
+    finally:
+        conn.close()
+
+
+def test_player_dg_ids_follow_min_dg_id_through_updates_and_deletes():
+    first, second = _round_row(727202, 1), _round_row(727201, 1)
+    first["player_key"] = second["player_key"] = "min_player"
+    db.store_rounds([first, second])
+    assert db.get_dg_id_for_player("min_player") == 727201
+
+    # A corrected player_key on re-ingest moves the mapping with it.
+    fixed = dict(second, player_key="min_player_fixed", sg_total=0.75)
+    db.store_rounds([fixed])
+    assert db.get_dg_id_for_player("min_player") == 727202
+    assert db.get_dg_id_for_player("min_player_fixed") == 727201
+
+    with db.transaction() as conn:
+        conn.execute("DELETE FROM rounds WHERE player_key = 'min_player'")
+    with db.read_connection() as conn:
+        assert conn.execute(
+            "SELECT COUNT(*) FROM player_dg_ids WHERE player_key = 'min_player'"
+        ).fetchone()[0] == 0
+
+
+def test_store_ai_memory_expiry_computed_in_sql():
+    db.store_ai_memory("expiry_topic", "dated", expires_days=30)
+    db.store_ai_memory("expiry_topic", "forever", expires_days=None)
+
+    with db.read_connection() as conn:
+        rows = dict(conn.execute(
+            """SELECT insight, CAST(julianday(expires_at) - julianday('now') + 0.5 AS INTEGER)
+               FROM ai_memory WHERE topic = 'expiry_topic'"""
+        ).fetchall())
+    assert rows == {"dated": 30, "forever": None}
+
+
+def test_store_ai_memory_negative_and_fractional_expiry():
+    db.store_ai_memory("expiry_sign_topic", "lapsed", expires_days=-5)
+    db.store_ai_memory("expiry_sign_topic", "whole_float", expires_days=7.0)
+    with pytest.raises(ValueError):
+        db.store_ai_memory("expiry_sign_topic", "half_day", expires_days=0.5)
+
+    with db.read_connection() as conn:
+        rows = dict(conn.execute(
+            """SELECT insight, CAST(julianday(expires_at) - julianday('now') + 0.5 AS INTEGER)
+               FROM ai_memory WHERE topic = 'expiry_sign_topic'"""
+        ).fetchall())
+    # The lapsed memory is purged by the next write instead of living forever.
+    assert rows == {"whole_float": 7}
+    assert [m["insight"] for m in db.get_ai_memories(["expiry_sign_topic"])] == ["whole_float"]
+
+
+def test_get_ai_memories_merges_topics_by_confidence():
+    db.store_ai_memory("merge_a", "a-low", confidence=0.2)
+    db.store_ai_memory("merge_b", "b-high", confidence=0.9)
+    db.store_ai_memory("merge_a", "a-mid", confidence=0.5)
+    db.store_ai_memory("merge_b", "b-none", confidence=None)
+
+    insights = [m["insight"] for m in db.get_ai_memories(["merge_a", "merge_b", "merge_a"])]
+    assert insights == ["b-high", "a-mid", "a-low", "b-none"]
+    assert [m["insight"] for m in db.get_ai_memories(["merge_a", "merge_b"], limit=2)] == ["b-high", "a-mid"]
+
+
+def test_expired_ai_memories_are_purged_on_write():
+    conn = db.get_conn()
+    try:
+        conn.execute(
+            "INSERT INTO ai_memory (topic, insight, confidence, expires_at) "
+            "VALUES ('stale_topic', 'old', 0.9, '2000-01-01T00:00:00')"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    db.store_ai_memory("fresh_topic", "new insight")
+
+    topics = db.get_all_ai_memory_topics()
+    assert "stale_topic" not in topics
+    assert "fresh_topic" in topics
+    assert db.purge_expired_ai_memories() == 0
+
+
+def test_init_db_does_not_write_ai_memory(monkeypatch):
+    with db.connection() as conn:
+        conn.execute(
+            "INSERT INTO ai_memory (topic, insight, confidence, expires_at) "
+            "VALUES ('init_stale_topic', 'old', 0.9, '2000-01-01 00:00:00')"
+        )
+        conn.commit()
+    monkeypatch.setattr(db, "_DB_INITIALIZED", False)
+    db.init_db()
+
+    assert "init_stale_topic" not in db.get_all_ai_memory_topics()
+    assert db.purge_expired_ai_memories() == 1
+
+
+def test_ai_memory_topic_drops_once_memory_lapses_without_a_write():
+    db.store_ai_memory("lapsing_topic", "short-lived", expires_days=1)
+    assert "lapsing_topic" in db.get_all_ai_memory_topics()
+
+    # Let the clock pass the expiry without going through store_ai_memory.
+    conn = db.get_conn()
+    try:
+        conn.execute(
+            "UPDATE ai_memory SET expires_at = datetime('now', '-1 minute') "
+            "WHERE topic = 'lapsing_topic'"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert "lapsing_topic" not in db.get_all_ai_memory_topics()
+    assert db.get_ai_memories(["lapsing_topic"]) == []
+
+
+def test_get_ai_decisions_filter_combinations(sample_tournament):
+    _, tid = sample_tournament
+    db.store_ai_decision(tid, "pre_analysis", "in", "{}")
+    db.store_ai_decision(tid, "post_review", "in", "{}")
+
+    assert {d["phase"] for d in db.get_ai_decisions(tournament_id=tid)} == {"pre_analysis", "post_review"}
+    assert [d["phase"] for d in db.get_ai_decisions(tid, "post_review")] == ["post_review"]
+    assert all(d["phase"] == "pre_analysis" for d in db.get_ai_decisions(phase="pre_analysis"))
+    assert len(db.get_ai_decisions()) >= 2
+
+
+def test_calibration_data_reflects_commits_and_open_transaction(sample_tournament):
+    _, tid = sample_tournament
+
+    def pred(key):
+        return {
+            "tournament_id": tid, "player_key": key, "bet_type": "top10",
+            "model_prob": 0.3, "dg_prob": 0.25, "market_implied_prob": 0.2,
+            "actual_outcome": None, "odds_decimal": 5.0, "profit": None,
+            "odds_timing": "pre",
+        }
+
+    db.log_predictions([pred("snap_a")])
+    first = db.get_calibration_data()
+    assert db.get_calibration_data() == first
+    first[0]["player_key"] = "mutated"  # callers get their own dicts
+    assert db.get_calibration_data()[-1]["player_key"] == "snap_a"
+
+    db.log_predictions([pred("snap_b")])
+    assert [r["player_key"] for r in db.get_calibration_data()][-2:] == ["snap_a", "snap_b"]
+
+    with db.transaction() as conn:
+        conn.execute("UPDATE prediction_log SET actual_outcome = 1 WHERE player_key = 'snap_a'")
+        # The writer's own uncommitted change is visible inside the transaction.
+        assert {r["player_key"]: r["actual_outcome"] for r in db.get_calibration_data()}["snap_a"] == 1
+    assert {r["player_key"]: r["actual_outcome"] for r in db.get_calibration_data()}["snap_a"] == 1
+
+
+def test_round_getters_return_records():
+    db.store_rounds([_round_row(616161, 1), _round_row(616161, 2)])
+
+    rounds = db.get_player_recent_rounds(616161)
+    assert all(isinstance(r, db.Record) for r in rounds)
+    assert [r["round_num"] for r in rounds] == [2, 1]
+    assert rounds[0].get("dg_id") == 616161
+    assert rounds[0].get("missing_column", "default") == "default"
+    assert dict(rounds[0])["player_key"] == rounds[0]["player_key"]
+
+
+def test_recent_rounds_for_players_matches_single_player_getter(monkeypatch):
+    monkeypatch.setattr(db, "_IN_CLAUSE_CHUNK", 1)
+    rows = []
+    for dg_id, key in ((818181, "batch_a"), (818182, "batch_b")):
+        for n in (1, 2, 3):
+            row = _round_row(dg_id, n, event_id=f"batch{n}")
+            row["player_key"] = key
+            row["event_completed"] = f"2026-0{n}-01"
+            rows.append(row)
+    db.store_rounds(rows)
+
+    batched = db.get_recent_rounds_for_players(["batch_a", "batch_b", "batch_a", "nobody"], limit=2)
+
+    assert set(batched) == {"batch_a", "batch_b"}
+    for key in ("batch_a", "batch_b"):
+        expected = db.get_player_recent_rounds_by_key(key, limit=2)
+        assert [dict(r) for r in batched[key]] == [dict(r) for r in expected]
+
+
+def test_course_rounds_for_players_matches_single_player_getter(monkeypatch):
+    monkeypatch.setattr(db, "_IN_CLAUSE_CHUNK", 1)
+    rows = []
+    for dg_id in (828281, 828282):
+        for n in (1, 2):
+            row = _round_row(dg_id, n, event_id="course_batch")
+            row["course_num"] = 77
+            rows.append(row)
+    off_course = _round_row(828281, 1, event_id="elsewhere")
+    off_course["course_num"] = 78
+    db.store_rounds(rows + [off_course])
+
+    batched = db.get_course_rounds_for_players([828281, 828282, 828283], 77)
+
+    assert set(batched) == {828281, 828282}
+    for dg_id in (828281, 828282):
+        assert [dict(r) for r in batched[dg_id]] == [
+            dict(r) for r in db.get_player_course_rounds(dg_id, 77)
+        ]
+
+
+def test_get_rounds_count(sample_tournament):
+    db_mod, _ = sample_tournament
+    assert db_mod.get_rounds_count() == 0
+    db_mod.store_rounds([_round_row(838381, 1), _round_row(838381, 2)])
+    assert db_mod.get_rounds_count() == 2
+
+
+def test_failed_write_helper_releases_pooled_connection():
+    with pytest.raises(sqlite3.IntegrityError):
+        db.log_csv_import(987654321, "missing.csv", "sg", "recent_form", "12", 1)
+
+    conn = db.get_conn()
+    try:
+        assert conn._depth == 1
+        assert not conn.in_transaction
+    finally:
+        conn.close()
+
+
+def test_store_rounds_honours_bulk_sync_override(monkeypatch):
+    modes = []
+    real_execute = db._PooledConnection.execute
+
+    def spy(self, sql, *args):
+        if sql.startswith("PRAGMA synchronous="):
+            modes.append(sql)
+        return real_execute(self, sql, *args)
+
+    monkeypatch.setattr(db._PooledConnection, "execute", spy)
+    monkeypatch.setenv("GOLF_SQLITE_SYNC", "off")
+    db.store_rounds([_round_row(848481, 1)])
+    monkeypatch.setenv("GOLF_SQLITE_SYNC", "bogus")
+    db.store_rounds([_round_row(848481, 2)])
+
+    assert modes == ["PRAGMA synchronous=OFF", "PRAGMA synchronous=NORMAL"]
+    conn = db.get_conn()
+    try:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    finally:
+        conn.close()
+
+
+def test_store_rounds_commits_large_loads_in_bounded_transactions(monkeypatch):
+    monkeypatch.setattr(db, "_ROUNDS_ROWS_PER_TRANSACTION", db._ROUNDS_ROWS_PER_INSERT)
+    begins = []
+    real_execute = db._PooledConnection.execute
+
+    def spy(self, sql, *args):
+        if sql == "BEGIN IMMEDIATE":
+            begins.append(sql)
+        return real_execute(self, sql, *args)
+
+    monkeypatch.setattr(db._PooledConnection, "execute", spy)
+    rows = [_round_row(858_000 + i, 1) for i in range(db._ROUNDS_ROWS_PER_INSERT * 2 + 1)]
+    db.store_rounds(rows)
+    assert len(begins) == 3
+
+    begins.clear()
+    with db.transaction():
+        db.store_rounds([_round_row(859_000 + i, 1) for i in range(len(rows))])
+    assert len(begins) == 1  # joins the outer transaction
+    assert db.get_rounds_count() >= 2 * len(rows)
+
+
+def test_in_list_buckets_arity_for_statement_reuse():
+    assert db._in_list(["a"]) == (",".join("?" * 8), ["a"] * 8)
+    placeholders, params = db._in_list(range(9))
+    assert placeholders.count("?") == 16
+    assert params[:9] == list(range(9)) and set(params[9:]) == {8}
+    assert db._in_list(range(16))[1] == list(range(16))
+
+
+def test_round_getters_accept_narrow_column_lists():
+    row = _round_row(868681, 1)
+    row["course_num"] = 91
+    db.store_rounds([row])
+
+    (recent,) = db.get_player_recent_rounds(868681, columns=("sg_total", "round_num"))
+    assert recent.keys() == ["sg_total", "round_num"]
+
+    batched = db.get_course_rounds_for_players([868681], 91, columns=("sg_ott",))
+    assert [r.keys() for r in batched[868681]] == [["dg_id", "sg_ott"]]
+
+    with pytest.raises(ValueError):
+        db.get_player_recent_rounds(868681, columns=("sg_total; DROP TABLE rounds",))
+
+
+def test_get_round_player_names_batches_lookup(monkeypatch):
+    monkeypatch.setattr(db, "_IN_CLAUSE_CHUNK", 1)
+    db.store_rounds([_round_row(878781, 1), _round_row(878782, 1)])
+
+    names = db.get_round_player_names(["player_878781", "player_878782", "player_missing"])
+
+    assert names == {"player_878781": "Player 878781", "player_878782": "Player 878782"}
+    assert db.get_round_player_names([]) == {}
+
+
+def test_import_does_not_touch_database_until_first_connection(tmp_path):
+    import subprocess
+    import sys
+
+    db_path = tmp_path / "lazy.db"
+    script = (
+        "import os, src.db as db\n"
+        "assert not os.path.exists(db.DB_PATH), 'import created the database'\n"
+        "conn = db.get_reader()\n"
+        "print(conn.execute(\"SELECT COUNT(*) FROM sqlite_master WHERE name = 'rounds'\").fetchone()[0])\n"
+        "conn.close()\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "GOLF_DB_PATH": str(db_path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "1"
+
+
+def test_store_rounds_applies_corrections_but_skips_unchanged_rows():
+    original = _round_row(888881, 1)
+    db.store_rounds([original])
+
+    def stored():
+        conn = db.get_conn()
+        try:
+            return conn.execute(
+                "SELECT id, sg_total, sg_putt FROM rounds WHERE dg_id = 888881"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    (first,) = stored()
+    conn = db.get_conn()
+    try:
+        before = conn.total_changes
+        db.store_rounds([original])  # unchanged re-publish: no write
+        assert conn.total_changes == before
+    finally:
+        conn.close()
+
+    db.store_rounds([{**original, "sg_total": None, "sg_putt": 9.0}])  # no SG: ignored
+    assert [tuple(r) for r in stored()] == [(first["id"], 0.5, None)]
+
+    db.store_rounds([{**original, "sg_total": 1.25, "sg_putt": 0.4}])  # correction
+    assert [tuple(r) for r in stored()] == [(first["id"], 1.25, 0.4)]
+
+
+def test_player_sg_aggregates_match_python_average():
+    rows = []
+    for n, (sg_total, sg_putt) in enumerate(((1.0, 0.2), (2.0, None), (3.0, 0.6)), start=1):
+        row = _round_row(898981, n)
+        row.update(player_key="agg_player", event_completed=f"2026-0{n}-01",
+                   sg_total=sg_total, sg_putt=sg_putt)
+        rows.append(row)
+    db.store_rounds(rows)
+
+    agg = db.get_player_sg_aggregates("agg_player", limit=2)
+
+    assert agg["rounds"] == 2
+    assert agg["sg_total"] == pytest.approx(2.5)  # the two most recent rounds
+    assert agg["sg_putt"] == pytest.approx(0.6)   # NULLs skipped
+    assert agg["sg_ott"] is None
+    assert db.get_player_sg_aggregates("nobody")["rounds"] == 0
+
+
+def test_weights_json_round_trips_including_non_finite_values():
+    weights = {"course_fit": 0.25, "form": 0.45, "momentum": 0.3}
+    assert db._loads_weights(json.dumps(weights)) == weights
+    parsed = db._loads_weights(json.dumps({"form": float("nan"), "course_fit": float("inf")}))
+    assert parsed["course_fit"] == float("inf") and parsed["form"] != parsed["form"]
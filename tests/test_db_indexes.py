@@ -17,10 +17,38 @@ import src.db as db
 
 EXPECTED_INDEXES = {
     "idx_rounds_player_event": ("rounds", ["player_key", "event_completed"]),
-    "idx_metrics_tourn_player_cat": (
+    "idx_rounds_player_recent": ("rounds", ["dg_id", "event_completed", "round_num"]),
+    "idx_rounds_player_key_recent": ("rounds", ["player_key", "event_completed", "round_num"]),
+    "idx_metrics_player_cover": (
         "metrics",
-        ["tournament_id", "player_key", "metric_category"],
+        [
+            "tournament_id", "player_key", "metric_category", "round_window", "metric_name",
+            "data_mode", "metric_value", "metric_text", "player_display", "csv_import_id",
+        ],
     ),
+    "idx_metrics_category_cover": (
+        "metrics",
+        [
+            "tournament_id", "metric_category", "data_mode", "round_window", "player_key",
+            "metric_name", "metric_value", "metric_text", "player_display", "csv_import_id",
+        ],
+    ),
+    "idx_metrics_confirmed_field": (
+        "metrics",
+        ["tournament_id", "player_key", "metric_category", "metric_name", "metric_text"],
+    ),
+    "idx_pick_outcomes_pick": ("pick_outcomes", ["pick_id"]),
+    "idx_weight_sets_active": ("weight_sets", ["active", "id"]),
+    "idx_rounds_tour_year_dg_event": ("rounds", ["tour", "year", "dg_id", "event_id"]),
+    "idx_rounds_event_results": (
+        "rounds",
+        ["event_id", "year", "dg_id", "player_name", "player_key", "fin_text"],
+    ),
+    "idx_ai_decisions_tid_phase_time": (
+        "ai_decisions",
+        ["tournament_id", "phase", "created_at"],
+    ),
+    "idx_ai_memory_topic_rank": ("ai_memory", ["topic", "confidence", "created_at"]),
     "idx_historical_odds_event_book_ts": (
         "historical_odds",
         ["event_id", "book", "year"],
@@ -109,3 +137,230 @@ def test_ensure_hot_path_indexes_is_idempotent_on_existing_db():
     finally:
         if os.path.exists(path):
             os.unlink(path)
+
+
+def test_recent_rounds_order_is_index_satisfied():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            for column in ("dg_id", "player_key"):
+                plan = " ".join(
+                    str(row[3]) for row in conn.execute(
+                        f"""EXPLAIN QUERY PLAN SELECT * FROM rounds
+                            WHERE {column} = ? AND sg_total IS NOT NULL
+                            ORDER BY event_completed DESC, round_num DESC LIMIT 24""",
+                        (1,),
+                    )
+                )
+                assert "_recent" in plan
+                assert "TEMP B-TREE" not in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_active_weights_lookup_uses_partial_index():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id, weights_json FROM weight_sets "
+                    "WHERE active = 1 ORDER BY id DESC LIMIT 1"
+                )
+            )
+            assert "idx_weight_sets_active" in plan
+            assert "TEMP B-TREE" not in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_backfill_status_is_index_only():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    """EXPLAIN QUERY PLAN SELECT tour, year, COUNT(*), COUNT(DISTINCT dg_id),
+                              COUNT(DISTINCT event_id)
+                       FROM rounds GROUP BY tour, year ORDER BY tour, year"""
+                )
+            )
+            assert "COVERING INDEX idx_rounds_tour_year_dg_event" in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_ai_decisions_by_tournament_and_phase_is_index_ordered():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + db._AI_DECISIONS_SQL[(True, True)],
+                    (1, "pre_analysis"),
+                )
+            )
+            assert "idx_ai_decisions_tid_phase_time" in plan
+            assert "TEMP B-TREE" not in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_event_results_lookup_is_index_only():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    """EXPLAIN QUERY PLAN SELECT DISTINCT dg_id, player_name, player_key, fin_text
+                       FROM rounds WHERE event_id = ? AND year = ?""",
+                    ("14", 2026),
+                )
+            )
+            assert "COVERING INDEX idx_rounds_event_results" in plan
+            assert "TEMP B-TREE" not in plan
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert "idx_rounds_event" not in names
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_ai_memories_by_topic_is_index_ordered():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + db._AI_MEMORIES_BY_TOPIC_SQL,
+                    ("course_fit", 50),
+                )
+            )
+            assert "idx_ai_memory_topic_rank" in plan
+            assert "TEMP B-TREE" not in plan
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert "idx_ai_memory_topic" not in names
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_player_category_metrics_use_cover_index_without_prefix_copy():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    """EXPLAIN QUERY PLAN SELECT metric_name, metric_value FROM metrics
+                       WHERE tournament_id = ? AND player_key = ? AND metric_category = ?""",
+                    (1, "scottie_scheffler", "sim"),
+                )
+            )
+            assert "COVERING INDEX idx_metrics_player_cover" in plan
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert "idx_metrics_tourn_player_cat" not in names
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_metrics_by_category_is_index_only():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            for sql, params in (
+                ("SELECT * FROM metrics WHERE tournament_id = ? AND metric_category = ?", (1, "sim")),
+                (
+                    "SELECT * FROM metrics WHERE tournament_id = ? AND metric_category = ? "
+                    "AND data_mode = ? AND round_window = ?",
+                    (1, "sg", "recent_form", "all"),
+                ),
+            ):
+                plan = " ".join(str(row[3]) for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+                assert "COVERING INDEX idx_metrics_category_cover" in plan
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert "idx_metrics_category" not in names
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_confirmed_field_roster_reads_only_the_partial_index():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    """EXPLAIN QUERY PLAN SELECT player_key FROM metrics
+                       WHERE tournament_id = ?
+                         AND metric_category = 'meta'
+                         AND metric_name = 'field_status'
+                         AND metric_text = 'confirmed'
+                       GROUP BY player_key""",
+                    (1,),
+                )
+            )
+            assert "COVERING INDEX idx_metrics_confirmed_field" in plan
+            assert "TEMP B-TREE" not in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def test_pick_outcome_lookup_by_pick_uses_index():
+    path = _fresh_db_path()
+    try:
+        _with_init_db(path)
+        conn = sqlite3.connect(path)
+        try:
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id, hit FROM pick_outcomes WHERE pick_id = ?", (1,)
+                )
+            )
+            assert "idx_pick_outcomes_pick" in plan
+        finally:
+            conn.close()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
@@ -105,3 +105,83 @@ def test_get_blend_ratio_allows_increase_when_promotion_passes(tmp_db, monkeypat
 
     dg, mw = get_blend_ratio("top10")
     assert mw > 0.10
+
+
+def test_brier_score_numpy_path_matches_python_loop():
+    import random
+
+    from src.dynamic_blend import BRIER_NUMPY_MIN_N, _brier_score
+
+    rng = random.Random(7)
+    n = BRIER_NUMPY_MIN_N * 4
+    probs = [rng.random() for _ in range(n)]
+    outcomes = [rng.randint(0, 1) for _ in range(n)]
+
+    expected = sum((p - y) ** 2 for p, y in zip(probs, outcomes)) / n
+    assert _brier_score(probs, outcomes) == pytest.approx(expected, rel=1e-12)
+    assert isinstance(_brier_score(probs, outcomes), float)
+    assert _brier_score(probs[:3], outcomes[:3]) == pytest.approx(
+        sum((p - y) ** 2 for p, y in zip(probs[:3], outcomes[:3])) / 3
+    )
+
+
+def test_compute_brier_from_bets_skips_unresolved_and_probless_bets(monkeypatch):
+    from src import dynamic_blend
+
+    monkeypatch.setattr("src.config.get_blend_weights", lambda bet_type: (0.9, 0.1))
+    bets = {
+        "top10": [
+            {"player_key": "a", "dg_only_prob": 0.5, "model_only_prob": 0.25, "blended_prob": 0.4},
+            {"player_key": "b", "dg_only_prob": 0.2, "model_prob": 0.1},
+            {"player_key": "c", "dg_only_prob": 0.9},  # unresolved outcome
+            {"player_key": "d"},  # no probabilities
+        ],
+        "win": [{"player_key": "c", "dg_only_prob": 0.1}],
+    }
+    outcomes = {"a": 1, "b": 0, "d": 1}
+
+    data = dynamic_blend.compute_brier_from_bets(bets, outcomes, lambda pk, rm: rm.get(pk))
+
+    assert set(data) == {"top10"}
+    top10 = data["top10"]
+    assert top10["n_predictions"] == 2
+    assert top10["brier_dg"] == pytest.approx(((0.5 - 1) ** 2 + 0.2 ** 2) / 2)
+    assert top10["brier_model"] == pytest.approx(((0.25 - 1) ** 2 + 0.0) / 2)
+    assert top10["brier_blended"] == pytest.approx(((0.4 - 1) ** 2 + 0.1 ** 2) / 2)
+    assert (top10["dg_weight"], top10["model_weight"]) == (0.9, 0.1)
+
+
+def test_record_tournament_brier_rows_feed_get_blend_ratio(tmp_db, monkeypatch):
+    from src import dynamic_blend
+
+    monkeypatch.setattr(dynamic_blend, "is_enabled", lambda name: name == "dynamic_blend")
+    dynamic_blend.record_tournament_brier(
+        7,
+        {
+            "top10": {"brier_dg": 0.2, "brier_model": 0.22, "brier_blended": 0.21,
+                      "n_predictions": 12, "dg_weight": 0.7, "model_weight": 0.3},
+            "top20": {"brier_dg": 0.18, "brier_model": 0.2, "brier_blended": 0.19,
+                      "n_predictions": 9, "dg_weight": 0.6, "model_weight": 0.4},
+        },
+    )
+
+    with tmp_db.read_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM blend_history WHERE tournament_id = 7").fetchone()[0] == 2
+    assert dynamic_blend.get_blend_ratio("top10") == (0.7, 0.3)
+
+
+def test_get_blend_ratio_applies_ewa_once_enough_tournaments(tmp_db, monkeypatch):
+    import math
+
+    from src import dynamic_blend
+
+    monkeypatch.setattr(dynamic_blend, "is_enabled", lambda name: name == "dynamic_blend")
+    conn = tmp_db.get_conn()
+    rows = [(200 + i, 0.25, 0.24, 0.2, 10, 0.7, 0.3) for i in range(dynamic_blend.MIN_TOURNAMENTS_FOR_EWA - 1)]
+    _insert_history(conn, rows)
+    assert dynamic_blend.get_blend_ratio("outright") == (0.7, 0.3)
+
+    _insert_history(conn, [(299, 0.25, 0.24, 0.2, 10, 0.7, 0.3)])
+    conn.close()
+    model_w = 0.3 * math.exp(-dynamic_blend.EWA_LR * 0.2)
+    assert dynamic_blend.get_blend_ratio("outright") == pytest.approx((1.0 - model_w, model_w))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 from src import db
 from src.event_pick_freeze import ensure_event_grading_readiness
 
@@ -101,7 +103,7 @@ def test_ensure_all_completed_pga_events_graded_accepts_complete_status(monkeypa
             "year": year,
         },
     )
-    monkeypatch.setattr("src.event_pick_freeze.db.get_conn", lambda: _FakeConn())
+    monkeypatch.setattr("src.event_pick_freeze.db.connection", lambda: nullcontext(_FakeConn()))
 
     report = ensure_all_completed_pga_events_graded(year=2026)
     assert report["ok"] is True
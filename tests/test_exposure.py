@@ -0,0 +1,90 @@
+"""Tests for portfolio exposure caps."""
+
+from src import exposure
+
+
+def _bet(pk, ev, mult=1.0, value=True):
+    return {"player_key": pk, "ev": ev, "stake_multiplier": mult, "is_value": value}
+
+
+def _enable(monkeypatch):
+    monkeypatch.setattr(exposure, "is_enabled", lambda name: True)
+
+
+def test_filter_by_exposure_is_noop_when_flag_off(monkeypatch):
+    monkeypatch.setattr(exposure, "is_enabled", lambda name: False)
+    bets = {"win": [_bet("a", 0.1)] * 10}
+    assert exposure.filter_by_exposure(bets, bankroll=10) == (bets, [])
+
+
+def test_filter_by_exposure_drops_lowest_ev_bets_of_over_exposed_player(monkeypatch):
+    _enable(monkeypatch)
+    bets = {
+        "win": [_bet("a", 0.30), _bet("a", 0.10), _bet("b", 0.01)],
+        "top10": [_bet("a", 0.20), _bet("a", 0.10)],
+    }
+    result, warnings = exposure.filter_by_exposure(bets, bankroll=50)
+
+    assert [b["is_value"] for b in result["win"]] == [True, False, True]
+    assert [b["is_value"] for b in result["top10"]] == [True, False]
+    assert warnings == []
+    # Input is left untouched.
+    assert all(b["is_value"] for bets_ in bets.values() for b in bets_)
+
+
+def test_filter_by_exposure_trims_tournament_total(monkeypatch):
+    _enable(monkeypatch)
+    bets = {"matchup": [_bet(pk, ev) for pk, ev in zip("abcdef", (0.6, 0.5, 0.4, 0.3, 0.2, 0.1))]}
+    result, warnings = exposure.filter_by_exposure(bets, bankroll=40)
+
+    # 6 units on a 40 bankroll is 15%; the cap (12%) allows 4 units.
+    assert [b["player_key"] for b in result["matchup"] if b["is_value"]] == ["a", "b", "c", "d"]
+    assert warnings == []
+    post = exposure.compute_exposure(result, bankroll=40)
+    assert not post["over_exposed_players"] and not post["tournament_over"]
+
+
+def test_filter_by_exposure_breaks_ev_ties_in_scan_order(monkeypatch):
+    _enable(monkeypatch)
+    bets = {"win": [_bet("a", 0.1), _bet("a", 0.1)], "top5": [_bet("a", 0.1)]}
+    result, _ = exposure.filter_by_exposure(bets, bankroll=20)
+
+    assert [b["is_value"] for b in result["win"]] == [False, False]
+    assert [b["is_value"] for b in result["top5"]] == [True]
+
+
+def test_compute_exposure_reports_fractions_and_over_players():
+    bets = {
+        "win": [_bet("a", 0.1, mult=2.0), _bet("b", 0.1), _bet(None, 0.1), _bet("a", 0.1, value=False)],
+        "top10": [_bet("a", 0.2), _bet("c", 0.1, mult=0.5)],
+    }
+    exp = exposure.compute_exposure(bets, bankroll=50)
+
+    assert exp["per_player"] == {"a": 3 / 50, "b": 1 / 50, "c": 0.5 / 50}
+    assert exp["tournament_total"] == 4.5 / 50
+    assert exp["over_exposed_players"] == ["a"]
+    assert exp["tournament_over"] is False
+    assert exposure.compute_exposure(bets)["tournament_over"] is False
+
+
+def test_filter_by_exposure_copies_only_lists_that_change(monkeypatch):
+    _enable(monkeypatch)
+    bets = {"win": [_bet("a", 0.1), _bet("a", 0.2)], "top20": [_bet("b", 0.3)]}
+    result, _ = exposure.filter_by_exposure(bets, bankroll=30)
+
+    assert result is not bets
+    assert result["top20"] is bets["top20"]
+    assert result["win"] is not bets["win"]
+    assert result["win"][1] is bets["win"][1]
+    assert [b["is_value"] for b in bets["win"]] == [True, True]
+
+
+def test_filter_by_exposure_stops_at_cap_despite_float_drift(monkeypatch):
+    _enable(monkeypatch)
+    # 100 bets of 0.3 units: the 12% cap on 100 allows exactly 40 of them,
+    # though the running total lands a hair above 12.0 after 60 removals.
+    bets = {"matchup": [_bet(f"p{i}", 0.1, mult=0.3) for i in range(100)]}
+    result, warnings = exposure.filter_by_exposure(bets, bankroll=100)
+
+    assert sum(b["is_value"] for b in result["matchup"]) == 40
+    assert warnings == []
@@ -0,0 +1,64 @@
+"""Tests for feature flag loading."""
+
+import os
+import time
+
+from src import feature_flags
+
+
+def test_is_enabled_loads_once_until_cache_cleared(monkeypatch):
+    loads = []
+
+    def fake_load():
+        loads.append(1)
+        monkeypatch.setattr(feature_flags, "_FLAGS", {"dynamic_blend": True})
+        monkeypatch.setattr(feature_flags, "_LOADED", True)
+        monkeypatch.setattr(feature_flags, "_RECHECK_AT", time.monotonic() + 60)
+        return feature_flags._FLAGS
+
+    monkeypatch.setattr(feature_flags, "_load_flags", fake_load)
+    feature_flags.clear_cache()
+
+    assert feature_flags.is_enabled("dynamic_blend") is True
+    assert feature_flags.is_enabled("exposure_caps") is False
+    assert len(loads) == 1
+
+    feature_flags.clear_cache()
+    assert feature_flags.is_enabled("dynamic_blend") is True
+    assert len(loads) == 2
+    feature_flags.clear_cache()
+
+
+def test_parse_flags_handles_flat_bool_map_and_defers_the_rest():
+    text = "# comment\n\nalpha: true\nbeta: False  # off\ngamma: 1\ndelta: 0\nepsilon: yes\n"
+    assert feature_flags._parse_flags(text) == {
+        "alpha": True, "beta": False, "gamma": True, "delta": False, "epsilon": True,
+    }
+    assert feature_flags._parse_flags('alpha: "true"\n') is None
+    assert feature_flags._parse_flags("group:\n  alpha: true\n") is None
+
+
+def test_flags_reload_when_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "feature_flags.yaml"
+    path.write_text("alpha: true\n")
+    monkeypatch.setattr(feature_flags, "_FLAGS_PATH", str(path))
+    feature_flags.clear_cache()
+    try:
+        assert feature_flags.is_enabled("alpha") is True
+
+        path.write_text("alpha: false\nbeta: true\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        # Still inside the recheck window: no stat, old value.
+        assert feature_flags.is_enabled("alpha") is True
+
+        monkeypatch.setattr(feature_flags, "_RECHECK_AT", 0.0)
+        assert feature_flags.is_enabled("alpha") is False
+        assert feature_flags.is_enabled("beta") is True
+
+        # Non-flat YAML still loads through PyYAML.
+        path.write_text('alpha: "yes"\nbeta: [1]\ngamma: true\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert feature_flags.get_all() == {"gamma": True}
+    finally:
+        feature_flags.clear_cache()
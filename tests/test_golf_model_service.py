@@ -44,16 +44,14 @@ def test_validate_field_data_flags_players_with_thin_rounds_and_missing_skill(mo
     service = GolfModelService(tour="pga")
 
     monkeypatch.setattr(
-        "src.services.golf_model_service.db.get_player_recent_rounds_by_key",
-        lambda player_key, limit=24: []
-        if player_key == "jon_rahm"
-        else [{"round_num": idx + 1} for idx in range(12)],
+        "src.services.golf_model_service.db.get_player_sg_aggregates",
+        lambda player_key, limit=24: {"rounds": 0 if player_key == "jon_rahm" else 12},
     )
     monkeypatch.setattr(
-        "src.services.golf_model_service.db.get_player_metrics",
-        lambda tournament_id, player_key: []
+        "src.services.golf_model_service.db.get_player_metrics_by_categories",
+        lambda tournament_id, player_key, categories: []
         if player_key == "jon_rahm"
-        else [{"metric_category": "dg_skill"}, {"metric_category": "dg_ranking"}],
+        else [{"metric_category": c} for c in categories],
     )
 
     validation = service._validate_field_data(
@@ -0,0 +1,58 @@
+"""Tests for Kelly sizing bankroll reads."""
+
+from src import kelly
+
+
+def test_bankroll_state_is_cached_until_settlement(tmp_db):
+    assert kelly.get_bankroll_state() is None
+
+    kelly.update_bankroll_after_tournament(100.0, "2026-04-12", notes="seed")
+    state = kelly.get_bankroll_state()
+    assert state["balance"] == 100.0 and state["peak_balance"] == 100.0
+
+    # Rows written behind the module's back are not seen until the TTL lapses.
+    with tmp_db.transaction() as conn:
+        conn.execute(
+            "INSERT INTO bankroll (date, balance, peak_balance, kelly_fraction, notes) "
+            "VALUES ('2026-04-19', 50.0, 100.0, 0.25, 'external')"
+        )
+    assert kelly.get_bankroll_state()["balance"] == 100.0
+
+    kelly.update_bankroll_after_tournament(-10.0, "2026-04-26")
+    state = kelly.get_bankroll_state()
+    assert state["balance"] == 40.0 and state["peak_balance"] == 100.0
+
+
+def test_bankroll_state_returns_independent_copies(tmp_db):
+    kelly.update_bankroll_after_tournament(100.0, "2026-04-12")
+    kelly.get_bankroll_state()["balance"] = 0.0
+    assert kelly.get_bankroll_state()["balance"] == 100.0
+
+
+def test_units_for_bets_matches_scalar_sizing(tmp_db, monkeypatch):
+    monkeypatch.setattr(kelly, "is_enabled", lambda name: name == "kelly_sizing")
+    kelly.update_bankroll_after_tournament(100.0, "2026-04-12")
+    probs = [0.10, 0.50, 0.02, 0.0, 0.60, 0.30]
+    odds = [12.0, 3.0, 11.0, 5.0, 1.0, 2.5]
+
+    expected = [kelly.units_for_bet(p, o) for p, o in zip(probs, odds)]
+    assert kelly.units_for_bets(probs, odds) == expected
+    assert expected[2] == 0.01  # negative edge floors at the display minimum
+
+
+def test_units_for_bets_is_flat_when_sizing_disabled(monkeypatch):
+    monkeypatch.setattr(kelly, "is_enabled", lambda name: False)
+    assert kelly.units_for_bets([0.5, 0.2], [3.0, 6.0]) == [1.0, 1.0]
+
+
+def test_units_for_bets_clamps_to_stake_cap_like_scalar(tmp_db, monkeypatch):
+    monkeypatch.setattr(kelly, "is_enabled", lambda name: name == "kelly_stakes")
+    with tmp_db.transaction() as conn:
+        conn.execute(
+            "INSERT INTO bankroll (date, balance, peak_balance, kelly_fraction, notes) "
+            "VALUES ('2026-04-12', 100.0, 100.0, 1.0, 'full kelly')"
+        )
+    probs, odds = [0.9, 0.2], [11.0, 6.0]
+
+    assert kelly.units_for_bets(probs, odds) == [kelly.units_for_bet(p, o) for p, o in zip(probs, odds)]
+    assert kelly.units_for_bets(probs, odds)[0] == kelly.MAX_STAKE_FRACTION
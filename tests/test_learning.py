@@ -538,3 +538,49 @@ def test_update_prediction_outcomes_skips_unresolved_players(tmp_db):
 
     assert by_key["ghost_player"] is None
     assert by_key["ludvig_aberg"] == 1
+
+
+def test_store_results_accepts_generator(tmp_db):
+    tid = tmp_db.get_or_create_tournament("Generator Open", year=2025)
+    tmp_db.store_results(
+        tid,
+        (
+            {"player_key": key, "player_display": key.title(), "finish_position": pos}
+            for pos, key in enumerate(("a_one", "b_two"), start=1)
+        ),
+    )
+
+    conn = tmp_db.get_conn()
+    rows = conn.execute(
+        "SELECT player_key, finish_position FROM results WHERE tournament_id = ? ORDER BY player_key",
+        (tid,),
+    ).fetchall()
+    conn.close()
+    assert [tuple(r) for r in rows] == [("a_one", 1), ("b_two", 2)]
+
+
+def test_compute_calibration_buckets_and_brier(monkeypatch):
+    from src import learning
+
+    data = [
+        {"model_prob": 0.01, "dg_prob": 0.02, "market_implied_prob": 0.01, "actual_outcome": 0, "profit": -1.0},
+        {"model_prob": 0.03, "dg_prob": 0.04, "market_implied_prob": 0.03, "actual_outcome": 1, "profit": 30.0},
+        {"model_prob": 0.04, "dg_prob": None, "market_implied_prob": 0.05, "actual_outcome": None, "profit": None},
+        {"model_prob": 0.40, "dg_prob": 0.35, "market_implied_prob": 0.45, "actual_outcome": 0, "profit": -1.0},
+        {"model_prob": 1.00, "dg_prob": 0.9, "market_implied_prob": 0.9, "actual_outcome": 1, "profit": None},
+        {"model_prob": None, "dg_prob": 0.1, "market_implied_prob": 0.1, "actual_outcome": 1, "profit": None},
+    ]
+    monkeypatch.setattr(learning.db, "iter_calibration_data", lambda: iter(data))
+
+    result = learning.compute_calibration()
+
+    assert result["total_predictions"] == 6
+    assert result["calibration"] == [
+        {"bucket": "0-2%", "count": 1, "predicted_avg": 0.01, "actual_rate": 0.0, "gap": -0.01},
+        {"bucket": "2-5%", "count": 2, "predicted_avg": 0.035, "actual_rate": 1.0, "gap": 0.965},
+        {"bucket": "35-50%", "count": 1, "predicted_avg": 0.4, "actual_rate": 0.0, "gap": -0.4},
+    ]
+    expected_brier = (0.01 ** 2 + 0.97 ** 2 + 0.40 ** 2 + 0.0) / 4
+    assert result["brier_score"] == round(expected_brier, 6)
+    assert result["model_comparison"] is None  # fewer than 20 fully-populated rows
+    assert result["roi"] == {"total_bets": 3, "total_profit": 28.0, "roi_pct": 933.33}
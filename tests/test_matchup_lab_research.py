@@ -1,4 +1,5 @@
 import sqlite3
+from contextlib import nullcontext
 
 import scripts.run_matchup_lab_research as lab
 
@@ -77,7 +78,7 @@ def test_select_max_roi_trial_winners_prefers_robust_gate():
 
 def test_run_pit_audit_reports_event_level_failures(monkeypatch):
     conn = _seed_pit_audit_db()
-    monkeypatch.setattr("scripts.run_matchup_lab_research.db.get_conn", lambda: conn)
+    monkeypatch.setattr("scripts.run_matchup_lab_research.db.connection", lambda: nullcontext(conn))
 
     def _fake_assert(event_id: str, year: int, as_of_date: str) -> None:
         if event_id == "evt2":
@@ -26,6 +26,8 @@ def test_remove_stale_db_recovery_copies_skips_when_db_bad(tmp_db) -> None:
     stale = tmp_db.DB_PATH + ".pre_restore"
     with open(stale, "wb") as fh:
         fh.write(b"leftover")
+    # Release pooled connections so the WAL is checkpointed before clobbering the file.
+    tmp_db.close_all_connections()
     with open(tmp_db.DB_PATH, "wb") as fh:
         fh.write(b"not sqlite")
 
@@ -52,6 +54,7 @@ def test_run_storage_cleanup_idempotent(tmp_db, monkeypatch) -> None:
     assert first["ok"] is True
     assert second["ok"] is True
     assert "sidecar_sweep" in first["steps"]
+    assert "ai_memory_purge" in first["steps"]
     assert "retention" in first["steps"]
     assert first["steps"]["reclaim"]["skipped"] is True
 
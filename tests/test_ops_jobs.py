@@ -17,3 +17,16 @@ def test_ops_job_lifecycle(tmp_db):
     assert job["status"] == "complete"
     assert job["progress_pct"] == 100
     assert job.get("result", {}).get("status") == "ok"
+
+
+def test_update_job_keeps_omitted_fields(tmp_db):
+    conn = get_conn()
+    job_id = create_job(conn, "cleanup")
+    update_job(conn, job_id, progress_pct=40, message="scanning")
+    update_job(conn, job_id, status="failed", error="disk full")
+    job = get_job(conn, job_id)
+    conn.close()
+    assert (job["status"], job["progress_pct"], job["message"], job["error"]) == (
+        "failed", 40, "scanning", "disk full"
+    )
+    assert job["completed_at"] is not None
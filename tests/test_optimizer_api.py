@@ -4,6 +4,7 @@ import json
 import os
 import sqlite3
 import sys
+from contextlib import closing
 from pathlib import Path
 
 from fastapi.testclient import TestClient
@@ -276,7 +277,7 @@ def test_autoresearch_reset_archives_old_research_and_keeps_live_model(monkeypat
     reset_calls = {"count": 0}
 
     monkeypatch.setattr("src.db.ensure_initialized", lambda: None)
-    monkeypatch.setattr(app_module, "get_conn", _get_conn)
+    monkeypatch.setattr(app_module, "connection", lambda: closing(_get_conn()))
     monkeypatch.setattr(app_module, "_output_dir_absolute", lambda: str(output_dir))
     monkeypatch.setattr(settings_module, "_SETTINGS_DIR", settings_dir)
     monkeypatch.setattr(settings_module, "_SETTINGS_FILE", settings_file)
@@ -351,7 +352,7 @@ def test_autoresearch_reset_preserves_effective_prediction_strategy(monkeypatch,
     preserved = {}
 
     monkeypatch.setattr("src.db.ensure_initialized", lambda: None)
-    monkeypatch.setattr(app_module, "get_conn", _get_conn)
+    monkeypatch.setattr(app_module, "connection", lambda: closing(_get_conn()))
     monkeypatch.setattr(app_module, "_output_dir_absolute", lambda: str(output_dir))
     monkeypatch.setattr(settings_module, "_SETTINGS_DIR", settings_dir)
     monkeypatch.setattr(settings_module, "_SETTINGS_FILE", settings_file)
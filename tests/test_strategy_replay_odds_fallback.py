@@ -3,8 +3,15 @@ import sqlite3
 from backtester.strategy import StrategyConfig, replay_event
 
 
+class _PooledConnection(sqlite3.Connection):
+    """Stand-in for db.get_conn(): close() releases the handle, it stays open."""
+
+    def close(self):
+        pass
+
+
 def _seed_replay_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(":memory:")
+    conn = sqlite3.connect(":memory:", factory=_PooledConnection)
     conn.row_factory = sqlite3.Row
     conn.execute(
         """
@@ -306,66 +306,66 @@ def harvest_for_field(player_names: list[str],
     summary["items_found"] = len(all_items)
 
     # 4. Classify and store
-    conn = db.get_conn()
-    for item in all_items:
-        title = item.get("title", "")
-        snippet = item.get("snippet", "")
-        pkey = item.get("player_key", "")
-        source_url = item.get("source_url", "")
-
-        if not pkey or not source_url:
-            continue
-
-        category, relevance = _classify_intel(title, snippet)
-
-        try:
-            conn.execute("""
-                INSERT OR IGNORE INTO intel_events
-                (player_key, source, source_url, title, snippet,
-                 published_at, tournament_id, relevance_score, category)
-                VALUES (?,?,?,?,?,?,?,?,?)
-            """, (
-                pkey,
-                item.get("source", ""),
-                source_url,
-                title[:500],
-                snippet[:1000],
-                item.get("published_at", ""),
-                tournament_id,
-                relevance,
-                category,
-            ))
-            summary["items_stored"] += 1
-        except Exception as e:
-            summary["errors"].append(str(e))
-
-        # 5. Detect equipment changes
-        equip = _detect_equipment_change(title, snippet, item.get("player_name", ""))
-        if equip:
+    with db.connection() as conn:
+        for item in all_items:
+            title = item.get("title", "")
+            snippet = item.get("snippet", "")
+            pkey = item.get("player_key", "")
+            source_url = item.get("source_url", "")
+
+            if not pkey or not source_url:
+                continue
+
+            category, relevance = _classify_intel(title, snippet)
+
             try:
                 conn.execute("""
-                    INSERT OR IGNORE INTO equipment_changes
-                    (player_key, change_date, category, source)
-                    VALUES (?,?,?,?)
+                    INSERT OR IGNORE INTO intel_events
+                    (player_key, source, source_url, title, snippet,
+                     published_at, tournament_id, relevance_score, category)
+                    VALUES (?,?,?,?,?,?,?,?,?)
                 """, (
-                    equip["player_key"],
-                    equip["change_date"],
-                    equip["category"],
-                    "intel_harvester: " + source_url[:200],
+                    pkey,
+                    item.get("source", ""),
+                    source_url,
+                    title[:500],
+                    snippet[:1000],
+                    item.get("published_at", ""),
+                    tournament_id,
+                    relevance,
+                    category,
                 ))
-                summary["equipment_changes"] += 1
-            except Exception:
-                pass
+                summary["items_stored"] += 1
+            except Exception as e:
+                summary["errors"].append(str(e))
+
+            # 5. Detect equipment changes
+            equip = _detect_equipment_change(title, snippet, item.get("player_name", ""))
+            if equip:
+                try:
+                    conn.execute("""
+                        INSERT OR IGNORE INTO equipment_changes
+                        (player_key, change_date, category, source)
+                        VALUES (?,?,?,?)
+                    """, (
+                        equip["player_key"],
+                        equip["change_date"],
+                        equip["category"],
+                        "intel_harvester: " + source_url[:200],
+                    ))
+                    summary["equipment_changes"] += 1
+                except Exception:
+                    pass
 
-    conn.commit()
+        conn.commit()
 
-    # 6. Optional AI analysis
-    if use_ai and all_items:
-        _ai_analyze_intel(all_items[:20])
+        # 6. Optional AI analysis
+        if use_ai and all_items:
+            _ai_analyze_intel(all_items[:20])
 
-    logger.info("Intel harvest: %d items found, %d stored, %d equipment changes",
-                summary["items_found"], summary["items_stored"], summary["equipment_changes"])
-    return summary
+        logger.info("Intel harvest: %d items found, %d stored, %d equipment changes",
+                    summary["items_found"], summary["items_stored"], summary["equipment_changes"])
+        return summary
 
 
 def _ai_analyze_intel(items: list[dict]):
@@ -389,29 +389,29 @@ def _ai_analyze_intel(items: list[dict]):
             return
         parsed = json.loads(response[start:end])
 
-        conn = db.get_conn()
-        for analyzed in parsed.get("analyzed_items", []):
-            source_url = None
-            for item in items:
-                if item.get("title") == analyzed.get("original_title"):
-                    source_url = item.get("source_url")
-                    break
-
-            if source_url:
-                conn.execute("""
-                    UPDATE intel_events
-                    SET relevance_score = ?,
-                        category = ?,
-                        ai_summary = ?,
-                        analyzed_at = datetime('now')
-                    WHERE source_url = ?
-                """, (
-                    analyzed.get("relevance_score", 0.5),
-                    analyzed.get("category", "general"),
-                    analyzed.get("summary", ""),
-                    source_url,
-                ))
-        conn.commit()
+        with db.connection() as conn:
+            for analyzed in parsed.get("analyzed_items", []):
+                source_url = None
+                for item in items:
+                    if item.get("title") == analyzed.get("original_title"):
+                        source_url = item.get("source_url")
+                        break
+
+                if source_url:
+                    conn.execute("""
+                        UPDATE intel_events
+                        SET relevance_score = ?,
+                            category = ?,
+                            ai_summary = ?,
+                            analyzed_at = datetime('now')
+                        WHERE source_url = ?
+                    """, (
+                        analyzed.get("relevance_score", 0.5),
+                        analyzed.get("category", "general"),
+                        analyzed.get("summary", ""),
+                        source_url,
+                    ))
+            conn.commit()
     except Exception as e:
         logger.warning("AI intel analysis failed: %s", e)
 
@@ -425,19 +425,19 @@ def get_field_intel(player_keys: list[str],
     if not player_keys:
         return []
 
-    conn = db.get_conn()
-    placeholders = ",".join(["?"] * len(player_keys))
-    rows = conn.execute(f"""
-        SELECT player_key, title, snippet, source, category,
-               ai_summary, relevance_score, published_at
-        FROM intel_events
-        WHERE player_key IN ({placeholders})
-          AND relevance_score >= ?
-        ORDER BY relevance_score DESC
-        LIMIT 50
-    """, [*player_keys, min_relevance]).fetchall()
-
-    return [dict(r) for r in rows]
+    with db.connection() as conn:
+        placeholders = ",".join(["?"] * len(player_keys))
+        rows = conn.execute(f"""
+            SELECT player_key, title, snippet, source, category,
+                   ai_summary, relevance_score, published_at
+            FROM intel_events
+            WHERE player_key IN ({placeholders})
+              AND relevance_score >= ?
+            ORDER BY relevance_score DESC
+            LIMIT 50
+        """, [*player_keys, min_relevance]).fetchall()
+
+        return [dict(r) for r in rows]
 
 
 if __name__ == "__main__":
@@ -92,17 +92,16 @@ def hypothesis_generator_loop(interval_hours: float = 12.0):
 
             # Gather context for AI
             leaderboard = get_experiment_leaderboard(limit=10)
-            conn = db.get_conn()
-
-            # Recent outlier insights
-            outliers = conn.execute("""
-                SELECT root_cause, suggested_model_change, COUNT(*) as cnt
-                FROM outlier_investigations
-                WHERE actionable = 1 AND suggested_model_change IS NOT NULL
-                GROUP BY root_cause
-                ORDER BY cnt DESC
-                LIMIT 5
-            """).fetchall()
+            with db.connection() as conn:
+                # Recent outlier insights
+                outliers = conn.execute("""
+                    SELECT root_cause, suggested_model_change, COUNT(*) as cnt
+                    FROM outlier_investigations
+                    WHERE actionable = 1 AND suggested_model_change IS NOT NULL
+                    GROUP BY root_cause
+                    ORDER BY cnt DESC
+                    LIMIT 5
+                """).fetchall()
 
             outlier_insights = [
                 {"cause": o[0], "suggestion": o[1], "count": o[2]}
@@ -253,15 +252,14 @@ def experiment_runner_loop(interval_hours: float = 2.0):
 
     while not _shutdown.is_set():
         try:
-            conn = db.get_conn()
-
-            # Find pending experiments
-            pending = conn.execute("""
-                SELECT id FROM experiments
-                WHERE status = 'pending'
-                ORDER BY created_at ASC
-                LIMIT 3
-            """).fetchall()
+            with db.connection() as conn:
+                # Find pending experiments
+                pending = conn.execute("""
+                    SELECT id FROM experiments
+                    WHERE status = 'pending'
+                    ORDER BY created_at ASC
+                    LIMIT 3
+                """).fetchall()
 
             if not pending:
                 logger.info("[RUNNER] No pending experiments, sleeping")
@@ -301,18 +299,18 @@ def outlier_analyst_loop(interval_hours: float = 8.0):
 
     while not _shutdown.is_set():
         try:
-            conn = db.get_conn()
-            current_year = datetime.now().year
-
-            # Find events with PIT stats but no outlier investigations
-            events = conn.execute("""
-                SELECT DISTINCT p.event_id, p.year
-                FROM pit_rolling_stats p
-                LEFT JOIN outlier_investigations o
-                    ON p.event_id = o.event_id AND p.year = o.year
-                WHERE o.id IS NULL AND p.year >= ?
-                LIMIT 5
-            """, (current_year - 1,)).fetchall()
+            with db.connection() as conn:
+                current_year = datetime.now().year
+
+                # Find events with PIT stats but no outlier investigations
+                events = conn.execute("""
+                    SELECT DISTINCT p.event_id, p.year
+                    FROM pit_rolling_stats p
+                    LEFT JOIN outlier_investigations o
+                        ON p.event_id = o.event_id AND p.year = o.year
+                    WHERE o.id IS NULL AND p.year >= ?
+                    LIMIT 5
+                """, (current_year - 1,)).fetchall()
 
             for event_id, year in events:
                 if _shutdown.is_set():